@@ -2,8 +2,9 @@
 
 import asyncio
 import time
+from contextlib import aclosing
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 from claude_agent_sdk import (
     query,
@@ -15,6 +16,7 @@ from claude_agent_sdk import (
 )
 
 from sleepless_agent.chat.session import ChatSession, ChatSessionStatus
+from sleepless_agent.core.client_pool import ClaudeClientPool
 from sleepless_agent.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +37,7 @@ class ChatExecutor:
         workspace_root: str = "./workspace",
         default_model: str = "claude-sonnet-4-5-20250929",
         max_turns: int = 15,
+        client_pool: Optional[ClaudeClientPool] = None,
     ):
         """Initialize chat executor.
 
@@ -42,11 +45,14 @@ class ChatExecutor:
             workspace_root: Root directory for workspaces
             default_model: Claude model to use
             max_turns: Maximum tool-use turns per message
+            client_pool: Optional pool of pre-spawned CLI processes, used
+                on the chat event loop
         """
         self.workspace_root = Path(workspace_root)
         self.projects_dir = self.workspace_root / "projects"
         self.default_model = default_model
         self.max_turns = max_turns
+        self.client_pool = client_pool
 
         # Ensure directories exist
         self.projects_dir.mkdir(parents=True, exist_ok=True)
@@ -60,6 +66,49 @@ class ChatExecutor:
         workspace.mkdir(parents=True, exist_ok=True)
         return workspace
 
+    def _options(self, workspace: Path) -> ClaudeAgentOptions:
+        return ClaudeAgentOptions(
+            cwd=str(workspace),
+            allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
+            permission_mode="acceptEdits",
+            max_turns=self.max_turns,
+            model=self.default_model,
+        )
+
+    def prewarm(self, session: ChatSession) -> None:
+        """Start a pooled CLI for the session's project ahead of its first message."""
+        if self.client_pool is not None:
+            self.client_pool.prewarm(self._options(self._get_workspace_path(session)))
+
+    async def _messages(self, prompt: str, options: ClaudeAgentOptions, metrics: Dict) -> AsyncIterator[Any]:
+        """Yield the turn's SDK messages from a pooled client, or from query().
+
+        Iterate inside ``aclosing`` so the pooled client is released even if
+        the caller's loop raises.
+        """
+        started = time.monotonic()
+        pooled = None
+        if self.client_pool is not None and self.client_pool.active:
+            try:
+                pooled, metrics["warm_client"] = await self.client_pool.checkout(options)
+            except Exception as exc:
+                logger.warning("chat.executor.checkout_failed", error=str(exc))
+
+        stream = pooled.run("chat", prompt, self.max_turns) if pooled else query(prompt=prompt, options=options)
+        first = True
+        try:
+            async for message in stream:
+                if first:
+                    metrics["startup_ms"] = int((time.monotonic() - started) * 1000)
+                    first = False
+                yield message
+        except BaseException:
+            if pooled is not None:
+                await self.client_pool.release(pooled, healthy=False)
+            raise
+        if pooled is not None:
+            await self.client_pool.release(pooled)
+
     def _build_prompt(self, session: ChatSession, user_message: str) -> str:
         """Build the full prompt with conversation context.
 
@@ -122,13 +171,7 @@ class ChatExecutor:
         # Record user message in history
         session.add_message("user", user_message)
 
-        options = ClaudeAgentOptions(
-            cwd=str(workspace),
-            allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
-            permission_mode="acceptEdits",
-            max_turns=self.max_turns,
-            model=self.default_model,
-        )
+        options = self._options(workspace)
 
         response_parts = []
         tool_uses = []
@@ -149,35 +192,36 @@ class ChatExecutor:
                 message_preview=user_message[:100],
             )
 
-            async for message in query(prompt=prompt, options=options):
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            text = block.text.strip()
-                            if text:
-                                response_parts.append(text)
-                        elif isinstance(block, ToolUseBlock):
-                            # Track tool usage for logging
-                            tool_uses.append(block.name)
-                            logger.debug(
-                                "chat.executor.tool_use",
-                                tool=block.name,
+            async with aclosing(self._messages(prompt, options, metrics)) as messages:
+                async for message in messages:
+                    if isinstance(message, AssistantMessage):
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                text = block.text.strip()
+                                if text:
+                                    response_parts.append(text)
+                            elif isinstance(block, ToolUseBlock):
+                                # Track tool usage for logging
+                                tool_uses.append(block.name)
+                                logger.debug(
+                                    "chat.executor.tool_use",
+                                    tool=block.name,
+                                    session_id=session.session_id,
+                                )
+
+                    elif isinstance(message, ResultMessage):
+                        metrics["cost_usd"] = message.total_cost_usd
+                        metrics["duration_ms"] = message.duration_ms
+                        metrics["num_turns"] = message.num_turns
+                        metrics["is_error"] = message.is_error
+
+                        if message.is_error:
+                            logger.warning(
+                                "chat.executor.error_result",
                                 session_id=session.session_id,
+                                result=str(message.result)[:200],
                             )
 
-                elif isinstance(message, ResultMessage):
-                    metrics["cost_usd"] = message.total_cost_usd
-                    metrics["duration_ms"] = message.duration_ms
-                    metrics["num_turns"] = message.num_turns
-                    metrics["is_error"] = message.is_error
-
-                    if message.is_error:
-                        logger.warning(
-                            "chat.executor.error_result",
-                            session_id=session.session_id,
-                            result=str(message.result)[:200],
-                        )
-
             # Combine response
             full_response = "\n\n".join(response_parts) if response_parts else ""
 
@@ -200,6 +244,8 @@ class ChatExecutor:
                 tools_used=len(tool_uses),
                 cost_usd=metrics["cost_usd"],
                 duration_ms=elapsed_ms,
+                startup_ms=metrics.get("startup_ms"),
+                warm_client=metrics.get("warm_client"),
             )
 
             return full_response, metrics
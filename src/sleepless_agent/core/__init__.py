@@ -1,13 +1,30 @@
 """Core agent runtime and execution - the kernel of the agent OS."""
 
+from sleepless_agent.core.agent_session import AgentSession
+from sleepless_agent.core.client_pool import ClaudeClientPool
+from sleepless_agent.core.context_builder import WorkspaceContextBuilder
+from sleepless_agent.core.eval_policy import EvaluationDecision, EvaluationPolicy
+from sleepless_agent.core.events import EventBus, TaskEvent
 from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.leases import LeaseKeeper
 from sleepless_agent.core.models import Result, Task, TaskPriority, TaskStatus, init_db
 from sleepless_agent.core.queue import TaskQueue
 from sleepless_agent.core.task_runtime import TaskRuntime
+from sleepless_agent.core.tool_tracer import ToolCallStats, ToolCallTracer
+from sleepless_agent.core.turn_budget import TurnBudget, TurnBudgetAdvisor
 from sleepless_agent.core.timeout_manager import TaskTimeoutManager
+from sleepless_agent.core.verdict import Verdict, VerdictParser
+from sleepless_agent.core.worker_pool import TaskWorkerPool
 
 __all__ = [
+    "AgentSession",
+    "ClaudeClientPool",
     "ClaudeCodeExecutor",
+    "EvaluationDecision",
+    "EvaluationPolicy",
+    "EventBus",
+    "TaskEvent",
+    "LeaseKeeper",
     "Task",
     "Result",
     "TaskPriority",
@@ -16,4 +33,12 @@ __all__ = [
     "TaskQueue",
     "TaskRuntime",
     "TaskTimeoutManager",
+    "ToolCallStats",
+    "ToolCallTracer",
+    "TurnBudget",
+    "TurnBudgetAdvisor",
+    "TaskWorkerPool",
+    "Verdict",
+    "VerdictParser",
+    "WorkspaceContextBuilder",
 ]
@@ -0,0 +1,177 @@
+"""One Claude SDK client session shared by a task's planner, worker and evaluator."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    ClaudeSDKClient,
+    PermissionResultAllow,
+    PermissionResultDeny,
+    ResultMessage,
+    ToolPermissionContext,
+)
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tools each phase may use; mirrors the per-phase allowed_tools of query() mode
+PHASE_TOOLS: Dict[str, Set[str]] = {
+    "planner": {"Read", "Glob", "Grep"},
+    "worker": {"Read", "Write", "Edit", "Bash", "Glob", "Grep", "TodoWrite"},
+    "evaluator": {"Read", "Glob"},
+    "chat": {"Read", "Write", "Edit", "Bash", "Glob", "Grep"},
+}
+
+
+def cache_hit_ratio(cache_read_tokens: Optional[int], prompt_tokens: Optional[int]) -> Optional[float]:
+    """Share of prompt tokens read from the prompt cache."""
+    if not prompt_tokens or cache_read_tokens is None:
+        return None
+    return round(cache_read_tokens / prompt_tokens, 3)
+
+
+class AgentSession:
+    """Run the workflow phases as successive queries on one CLI process.
+
+    The CLI is spawned once per task, and later phases see the earlier
+    conversation, so the worker and evaluator prompts need not repeat the
+    task, plan and worker output. Tool permissions are switched per phase
+    through ``can_use_tool``: the session pre-approves nothing, and a tool
+    outside the current phase's set is denied. A phase that uses more
+    assistant turns than its cap is interrupted.
+
+    The CLI reports ``total_cost_usd`` and ``model_usage`` for the session so
+    far; results are re-emitted with the phase's own share so callers
+    account per phase.
+    """
+
+    def __init__(self, options: ClaudeAgentOptions, task_id: Optional[int] = None):
+        """Initialize the session.
+
+        Args:
+            options: Session options (cwd, add_dirs, model, hooks); tool
+                permissions and the permission mode are set here
+            task_id: Task ID, for logging
+        """
+        self.options = dataclasses.replace(
+            options,
+            allowed_tools=[],
+            permission_mode="default",
+            max_turns=None,
+            can_use_tool=self._can_use_tool,
+        )
+        self.task_id = task_id
+        self.phase: Optional[str] = None
+        self.completed_phases: Set[str] = set()
+        self.connect_ms: Optional[int] = None
+        self.uses = 0
+        self.denied: Dict[str, int] = {}
+        self._client: Optional[ClaudeSDKClient] = None
+        self._allowed: Set[str] = set()
+        self._session_cost = 0.0
+        self._session_models: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    def has_context(self, phases: Iterable[str]) -> bool:
+        """True if all ``phases`` ran in this session, so their output is in its context."""
+        return set(phases) <= self.completed_phases
+
+    async def _can_use_tool(
+        self, tool_name: str, tool_input: Dict[str, Any], context: ToolPermissionContext
+    ) -> PermissionResultAllow | PermissionResultDeny:
+        if tool_name in self._allowed:
+            return PermissionResultAllow()
+        self.denied[tool_name] = self.denied.get(tool_name, 0) + 1
+        logger.debug("session.tool.denied", task_id=self.task_id, phase=self.phase, tool=tool_name)
+        return PermissionResultDeny(message=f"{tool_name} is not available in the {self.phase} phase")
+
+    async def connect(self) -> None:
+        """Spawn the CLI process (no-op if already connected)."""
+        if self._client is not None:
+            return
+        started = time.monotonic()
+        client = ClaudeSDKClient(options=self.options)
+        await client.connect()
+        self._client = client
+        self.connect_ms = int((time.monotonic() - started) * 1000)
+        logger.debug("session.connected", task_id=self.task_id, connect_ms=self.connect_ms)
+
+    async def run(self, phase: str, prompt: str, max_turns: Optional[int] = None) -> AsyncIterator[Any]:
+        """Send ``prompt`` as the ``phase`` query and yield its messages up to the result."""
+        await self.connect()
+        self.phase = phase
+        self._allowed = PHASE_TOOLS.get(phase, set())
+        self.uses += 1
+        turns = 0
+        interrupted = False
+
+        await self._client.query(prompt)
+        async for message in self._client.receive_response():
+            if isinstance(message, AssistantMessage):
+                turns += 1
+                if max_turns and turns > max_turns and not interrupted:
+                    interrupted = True
+                    logger.info("session.phase.turn_cap", task_id=self.task_id, phase=phase, max_turns=max_turns)
+                    await self._client.interrupt()
+            elif isinstance(message, ResultMessage):
+                message = self._phase_result(message)
+                if not message.is_error:
+                    self.completed_phases.add(phase)
+            yield message
+
+    async def reset(self) -> None:
+        """Clear the conversation with ``/clear`` so the process can serve an unrelated query."""
+        if self._client is None:
+            return
+        self.phase = None
+        self._allowed = set()
+        await self._client.query("/clear")
+        async for message in self._client.receive_response():
+            if isinstance(message, ResultMessage):
+                message = self._phase_result(message)
+                if message.is_error:
+                    raise RuntimeError(f"/clear failed: {message.result}")
+        self.completed_phases.clear()
+
+    def _phase_result(self, message: ResultMessage) -> ResultMessage:
+        changes: Dict[str, Any] = {}
+        total = message.total_cost_usd
+        if total is not None:
+            changes["total_cost_usd"] = total - self._session_cost if total >= self._session_cost else total
+            self._session_cost = max(total, self._session_cost)
+        if message.model_usage:
+            changes["model_usage"] = {
+                model: self._model_delta(model, dict(entry)) for model, entry in message.model_usage.items()
+            }
+        return dataclasses.replace(message, **changes) if changes else message
+
+    def _model_delta(self, model: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        seen = self._session_models.get(model, {})
+        self._session_models[model] = entry
+        delta = dict(entry)
+        for key, value in entry.items():
+            before = seen.get(key)
+            # Limits such as contextWindow are not counters; a drop means the counters were reset
+            if isinstance(value, (int, float)) and isinstance(before, (int, float)) and value >= before:
+                if key not in ("contextWindow", "maxOutputTokens"):
+                    delta[key] = value - before
+        return delta
+
+    async def close(self) -> None:
+        """Disconnect and stop the CLI process."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except Exception as exc:
+            logger.debug("session.disconnect_failed", task_id=self.task_id, error=str(exc))
@@ -0,0 +1,221 @@
+"""Warm pool of pre-spawned Claude CLI processes for workflow phases and chat turns."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from claude_agent_sdk import ClaudeAgentOptions
+
+from sleepless_agent.core.agent_session import AgentSession
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+PoolKey = Tuple[Optional[str], Tuple[str, ...], Optional[str], bool]
+
+
+class ClaudeClientPool:
+    """Keep connected SDK clients ready so a query skips the CLI cold start.
+
+    Clients are :class:`AgentSession` objects keyed by what is fixed when the
+    CLI starts: working directory, extra directories, model and whether hooks
+    are set. Tool permissions and turn caps are applied per query. A checkout
+    takes an idle client for its key, or spawns one on demand, and then
+    starts a spare for the key in the background so the next checkout is
+    warm. A returned client is reset with ``/clear``, which also serves as its
+    health check. Clients are retired after ``max_uses`` queries or
+    ``idle_seconds`` unused, and at most ``size`` are kept idle.
+
+    A pool belongs to the event loop it is used on.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the pool.
+
+        Args:
+            config: ``claude_code.client_pool`` settings
+        """
+        config = dict(config or {})
+        self.enabled = bool(config.get("enabled", False))
+        self.size = max(0, int(config.get("size", 2)))
+        self.max_uses = max(1, int(config.get("max_uses", 10)))
+        self.idle_seconds = float(config.get("idle_seconds", 600))
+        self.reset_timeout_seconds = float(config.get("reset_timeout_seconds", 15))
+        # Oldest first: (key, monotonic time it went idle, session)
+        self._idle: List[Tuple[PoolKey, float, AgentSession]] = []
+        self._spawning: Dict[PoolKey, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self._closed = False
+        self.stats: Dict[str, Any] = {
+            "checkouts": 0,
+            "warm": 0,
+            "waited": 0,  # Waited for a spare that was still starting
+            "cold": 0,
+            "spawns": 0,
+            "spawn_failures": 0,
+            "spawn_ms_total": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "expired": 0,
+            "evicted": 0,
+        }
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and self.size > 0 and not self._closed
+
+    @staticmethod
+    def _key(options: ClaudeAgentOptions) -> PoolKey:
+        cwd = str(options.cwd) if options.cwd is not None else None
+        add_dirs = tuple(str(path) for path in options.add_dirs or ())
+        return cwd, add_dirs, options.model, bool(options.hooks)
+
+    # ------------------------------------------------------------------
+    # Checkout and release
+    # ------------------------------------------------------------------
+    async def checkout(self, options: ClaudeAgentOptions, task_id: Optional[int] = None) -> Tuple[AgentSession, bool]:
+        """Return a connected session for ``options`` and whether it was ready at once.
+
+        Spawns on demand when no warm client is available; spawn errors
+        propagate so the caller can fall back to ``query()``.
+        """
+        key = self._key(options)
+        session = self._take(key)
+        warm = session is not None
+        if session is None and key in self._spawning:
+            # A spare is already starting; waiting for it beats starting another
+            await asyncio.wait({self._spawning[key]})
+            session = self._take(key)
+            if session is not None:
+                self.stats["waited"] += 1
+
+        if session is None:
+            session = AgentSession(options, task_id=task_id)
+            await self._connect(session)
+            self.stats["cold"] += 1
+        elif warm:
+            self.stats["warm"] += 1
+        session.task_id = task_id
+        self.stats["checkouts"] += 1
+        logger.debug("client_pool.checkout", task_id=task_id, warm=warm, idle=len(self._idle))
+        self._prewarm(key, options)
+        return session, warm
+
+    async def release(self, session: AgentSession, healthy: bool = True) -> None:
+        """Return a session after its query; it is reset and kept, or retired."""
+        if not healthy:
+            self.stats["unhealthy"] += 1
+            await session.close()
+            return
+        if not self.active or session.uses >= self.max_uses:
+            if session.uses >= self.max_uses:
+                self.stats["recycled"] += 1
+            await session.close()
+            return
+        try:
+            await asyncio.wait_for(session.reset(), timeout=self.reset_timeout_seconds)
+        except Exception as exc:
+            self.stats["unhealthy"] += 1
+            logger.debug("client_pool.reset_failed", task_id=session.task_id, error=str(exc) or type(exc).__name__)
+            await session.close()
+            return
+        self._put(self._key(session.options), session)
+
+    def prewarm(self, options: ClaudeAgentOptions) -> None:
+        """Start a client for ``options`` in the background unless one is idle or starting."""
+        self._prewarm(self._key(options), options)
+
+    async def discard(self, cwd: str) -> None:
+        """Stop idle and starting clients for a working directory that will not be used again."""
+        for key, task in list(self._spawning.items()):
+            if key[0] == cwd:
+                task.cancel()
+        stale = [entry for entry in self._idle if entry[0][0] == cwd]
+        for entry in stale:
+            self._idle.remove(entry)
+            await entry[2].close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _take(self, key: PoolKey) -> Optional[AgentSession]:
+        now = time.monotonic()
+        found = None
+        for entry in list(self._idle):
+            entry_key, idle_since, session = entry
+            if now - idle_since > self.idle_seconds or not session.connected:
+                self._idle.remove(entry)
+                self.stats["expired"] += 1
+                self._close_later(session)
+            elif found is None and entry_key == key:
+                self._idle.remove(entry)
+                found = session
+        return found
+
+    def _put(self, key: PoolKey, session: AgentSession) -> None:
+        if not self.active:
+            self._close_later(session)
+            return
+        self._idle.append((key, time.monotonic(), session))
+        while len(self._idle) > self.size:
+            _, _, oldest = self._idle.pop(0)
+            self.stats["evicted"] += 1
+            self._close_later(oldest)
+
+    def _prewarm(self, key: PoolKey, options: ClaudeAgentOptions) -> None:
+        if not self.active or key in self._spawning or len(self._idle) >= self.size:
+            return
+        if any(entry_key == key for entry_key, _, _ in self._idle):
+            return
+        task = asyncio.create_task(self._spawn_spare(key, options))
+        self._spawning[key] = task
+        task.add_done_callback(lambda _: self._spawning.pop(key, None))
+
+    async def _spawn_spare(self, key: PoolKey, options: ClaudeAgentOptions) -> None:
+        session = AgentSession(options)
+        try:
+            await self._connect(session)
+        except Exception as exc:
+            logger.warning("client_pool.spawn_failed", cwd=key[0], error=str(exc))
+            return
+        self._put(key, session)
+
+    async def _connect(self, session: AgentSession) -> None:
+        try:
+            await session.connect()
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                self.stats["spawn_failures"] += 1
+            await session.close()
+            raise
+        self.stats["spawns"] += 1
+        self.stats["spawn_ms_total"] += session.connect_ms or 0
+
+    def _close_later(self, session: AgentSession) -> None:
+        task = asyncio.create_task(session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def close(self) -> None:
+        """Stop spares that are starting and every idle client."""
+        self._closed = True
+        for task in list(self._spawning.values()):
+            task.cancel()
+        idle, self._idle = self._idle, []
+        for _, _, session in idle:
+            await session.close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Checkouts by warm/cold, spawn time and the start-up time warm checkouts saved."""
+        stats = dict(self.stats)
+        spawns = stats.pop("spawn_ms_total")
+        average = spawns / stats["spawns"] if stats["spawns"] else None
+        stats["avg_spawn_ms"] = int(average) if average is not None else None
+        # Each warm checkout skipped one spawn
+        stats["estimated_saved_ms"] = int(average * stats["warm"]) if average is not None else 0
+        stats["idle"] = len(self._idle)
+        return stats
@@ -0,0 +1,269 @@
+"""Token-budgeted workspace context for the planner prompt."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.manifest import scan_workspace
+
+logger = get_logger(__name__)
+
+_HEADING = re.compile(r"^(#{1,3})\s+(.*)$", re.MULTILINE)
+_TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?)")
+# Template placeholders that carry no information
+_PLACEHOLDERS = {"(generated by planner agent)", "(updated by worker agent)", "(updated by evaluator)"}
+# Sections always worth keeping, in decreasing order of importance
+_PINNED = ("outstanding", "status", "description", "summary", "overview", "todo", "recommendation")
+
+
+def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Rough token count; good enough for budgeting without a tokenizer."""
+    return int(len(text) / chars_per_token) + 1 if text else 0
+
+
+@dataclass
+class _Section:
+    index: int
+    heading: str
+    body: str
+    pinned_rank: Optional[int]
+    timestamp: Optional[datetime]
+
+    @property
+    def text(self) -> str:
+        return f"{self.heading}\n{self.body}".rstrip() if self.heading else self.body.rstrip()
+
+
+class WorkspaceContextBuilder:
+    """Render README highlights and a summarized file tree within a token budget.
+
+    README sections are ranked rather than included wholesale: the preamble,
+    outstanding items, status and description first, then everything else
+    newest first (timestamped execution entries by their timestamp, other
+    sections by position). Sections that do not fit are dropped and noted.
+    A fixed share of the budget goes to a directory summary instead of a
+    flat listing.
+
+    Rendered context is cached per workspace and reused until a file in the
+    workspace changes (size or mtime), so repeated planner runs on a busy
+    project do not re-read or re-rank anything.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 6000,
+        tree_share: float = 0.25,
+        chars_per_token: float = 4.0,
+        cache_size: int = 64,
+    ):
+        """Initialize the builder.
+
+        Args:
+            token_budget: Upper bound on the rendered context, in estimated tokens
+            tree_share: Fraction of the budget reserved for the file tree
+            chars_per_token: Characters per token used for estimates
+            cache_size: Number of workspaces whose context is kept
+        """
+        self.token_budget = max(200, int(token_budget))
+        self.tree_share = min(max(float(tree_share), 0.05), 0.9)
+        self.chars_per_token = float(chars_per_token)
+        self.cache_size = max(1, int(cache_size))
+        self._cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "sections_dropped": 0, "last_tokens": 0}
+
+    def _tokens(self, text: str) -> int:
+        return estimate_tokens(text, self.chars_per_token)
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+    def build(self, workspace: Path) -> str:
+        """Return the planner context for ``workspace``."""
+        workspace = Path(workspace)
+        files = scan_workspace(workspace) if workspace.is_dir() else {}
+        key = self._fingerprint(files)
+        cache_key = str(workspace)
+
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] == key:
+                self._cache.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return cached[1]
+
+        context = self._render(workspace, files)
+        with self._lock:
+            self._cache[cache_key] = (key, context)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self.stats["misses"] += 1
+            self.stats["last_tokens"] = self._tokens(context)
+        return context
+
+    def invalidate(self, workspace: Path) -> None:
+        """Forget the cached context for ``workspace``."""
+        with self._lock:
+            self._cache.pop(str(workspace), None)
+
+    def _fingerprint(self, files: Dict[str, object]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.token_budget}:{self.tree_share}".encode())
+        for rel_path in sorted(files):
+            stat = files[rel_path]
+            digest.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def _render(self, workspace: Path, files: Dict[str, object]) -> str:
+        tree = self._render_tree(files, int(self.token_budget * self.tree_share))
+        readme_budget = self.token_budget - self._tokens(tree)
+
+        parts = []
+        readme_path = workspace / "README.md"
+        if readme_path.exists():
+            try:
+                readme = self._render_readme(readme_path.read_text(), readme_budget)
+                if readme:
+                    parts.append("## Project README\n" + readme)
+            except Exception as e:
+                logger.warning("executor.readme.read_failed", error=str(e), path=str(readme_path))
+        if tree:
+            parts.append("\n" + tree)
+        return "\n".join(parts) if parts else "Empty workspace"
+
+    # ------------------------------------------------------------------
+    # README
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _split_sections(text: str) -> List[_Section]:
+        sections: List[_Section] = []
+        matches = list(_HEADING.finditer(text))
+        if not matches or matches[0].start() > 0:
+            preamble = text[: matches[0].start()] if matches else text
+            if preamble.strip():
+                sections.append(_Section(0, "", preamble, 0, None))
+
+        for position, match in enumerate(matches):
+            end = matches[position + 1].start() if position + 1 < len(matches) else len(text)
+            heading = match.group(0)
+            body = text[match.end():end].strip("\n")
+            if body.strip().lower() in _PLACEHOLDERS:
+                continue
+            title = match.group(2).lower()
+            if len(match.group(1)) == 1:
+                pinned_rank: Optional[int] = 0  # document title
+            else:
+                pinned_rank = next((rank + 1 for rank, key in enumerate(_PINNED) if title.startswith(key)), None)
+            if not body.strip() and not title.startswith("status"):
+                continue  # empty heading, e.g. a repeated "## Execution Summary"
+            timestamp = None
+            stamp = _TIMESTAMP.search(match.group(2))
+            if stamp:
+                try:
+                    timestamp = datetime.fromisoformat(stamp.group(1).replace(" ", "T"))
+                except ValueError:
+                    timestamp = None
+            sections.append(_Section(len(sections), heading, body, pinned_rank, timestamp))
+        return sections
+
+    def _render_readme(self, text: str, budget: int) -> str:
+        if self._tokens(text) <= budget:
+            return text.strip()
+        sections = self._split_sections(text)
+
+        pinned = sorted((s for s in sections if s.pinned_rank is not None), key=lambda s: s.pinned_rank)
+        # Newest first: timestamped entries by time, the rest by position
+        rest = sorted(
+            (s for s in sections if s.pinned_rank is None),
+            key=lambda s: (s.timestamp is not None, s.timestamp or datetime.min, s.index),
+            reverse=True,
+        )
+
+        chosen: Dict[int, str] = {}
+        remaining = budget
+        for section in pinned + rest:
+            cost = self._tokens(section.text) + 1
+            if cost <= remaining:
+                chosen[section.index] = section.text
+                remaining -= cost
+            elif section.pinned_rank is not None and remaining > 50:
+                # Keep the head of an oversized pinned section
+                keep = int((remaining - 10) * self.chars_per_token)
+                chosen[section.index] = section.text[:keep].rstrip() + "\n[...truncated]"
+                remaining = 0
+
+        dropped = len(sections) - len(chosen)
+        self.stats["sections_dropped"] += dropped
+        rendered = [chosen[index] for index in sorted(chosen)]
+        if dropped:
+            rendered.append(f"[{dropped} older README section(s) omitted to fit the context budget]")
+        return "\n\n".join(rendered)
+
+    # ------------------------------------------------------------------
+    # File tree
+    # ------------------------------------------------------------------
+    def _render_tree(self, files: Dict[str, object], budget: int) -> str:
+        if not files:
+            return ""
+        # Per directory: number of files below it and its direct children
+        dir_counts: Dict[str, int] = {}
+        children: Dict[str, set] = {}
+        for rel_path in files:
+            parts = rel_path.split("/")
+            for depth in range(len(parts)):
+                parent = "/".join(parts[:depth])
+                child = "/".join(parts[: depth + 1])
+                children.setdefault(parent, set()).add(child)
+                if depth < len(parts) - 1:
+                    dir_counts[child] = dir_counts.get(child, 0) + 1
+
+        def _line(path: str, depth: int) -> str:
+            name = path.rsplit("/", 1)[-1]
+            if path in dir_counts:
+                return f"{'  ' * depth}- {name}/ ({dir_counts[path]} files)"
+            return f"{'  ' * depth}- {name}"
+
+        # Choose entries breadth first so the top levels always make it in
+        header = f"## Workspace Contents ({len(files)} files)"
+        used = self._tokens(header)
+        selected = set()
+        omitted = 0
+        queue = deque((child, 0) for child in sorted(children.get("", ())))
+        while queue:
+            path, depth = queue.popleft()
+            cost = self._tokens(_line(path, depth)) + 1
+            if used + cost > budget:
+                omitted += 1
+                continue
+            selected.add(path)
+            used += cost
+            if path in dir_counts and depth < 2:
+                queue.extend((child, depth + 1) for child in sorted(children.get(path, ())))
+
+        # ...then print them depth first
+        lines = [header]
+
+        def _walk(parent: str, depth: int) -> None:
+            for child in sorted(children.get(parent, ())):
+                if child in selected:
+                    lines.append(_line(child, depth))
+                    _walk(child, depth + 1)
+
+        _walk("", 0)
+        if omitted:
+            lines.append(f"- ... {omitted} more entries")
+        return "\n".join(lines)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache hits/misses and how much README content was dropped."""
+        with self._lock:
+            return dict(self.stats, cached_workspaces=len(self._cache))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import signal
 import sys
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -14,16 +15,35 @@ from sleepless_agent.utils.config import get_config
 from sleepless_agent.storage.results import ResultManager
 from sleepless_agent.scheduling.auto_generator import AutoTaskGenerator
 from sleepless_agent.scheduling.scheduler import BudgetManager, SmartScheduler
+from sleepless_agent.core.context_builder import WorkspaceContextBuilder
+from sleepless_agent.core.client_pool import ClaudeClientPool
+from sleepless_agent.core.eval_policy import EvaluationPolicy
+from sleepless_agent.core.turn_budget import TurnBudgetAdvisor
+from sleepless_agent.core.dispatch import DispatchNotifier
+from sleepless_agent.core.events import EventBus
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.core.leases import LeaseKeeper, default_worker_id, is_dead_local_worker
 from sleepless_agent.core.models import TaskPriority, init_db
+from sleepless_agent.core.pipeline import PlanPrefetcher
 from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.core.startup import StartupGraph
 from sleepless_agent.core.task_runtime import TaskRuntime
 from sleepless_agent.core.timeout_manager import TaskTimeoutManager
+from sleepless_agent.core.worker_pool import TaskWorkerPool
 from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.storage.checkpoints import CheckpointStore
 from sleepless_agent.storage.git import GitManager
-from sleepless_agent.utils.live_status import LiveStatusTracker
+from sleepless_agent.storage.outbox import EventOutbox
+from sleepless_agent.storage.phase_usage import PhaseUsageStore
+from sleepless_agent.storage.token_usage import TokenUsageStore
+from sleepless_agent.storage.plan_cache import PlanCache
+from sleepless_agent.storage.snapshots import SnapshotStore
+from sleepless_agent.utils.live_feed import SOCKET_NAME, LiveStatusFeed
+from sleepless_agent.utils.live_status import LiveStatusHub, remove_worker_status_files
 from sleepless_agent.storage.workspace import WorkspaceSetup
 from sleepless_agent.interfaces.bot import SlackBot
 from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.monitoring.loop_monitor import EventLoopMonitor
 from sleepless_agent.monitoring.monitor import HealthMonitor, PerformanceLogger
 from sleepless_agent.monitoring.report_generator import ReportGenerator
 
@@ -38,24 +58,129 @@ class SleeplessAgent:
         self.running = False
         self.last_daily_summarization: datetime | None = None
 
+        # Several daemons may share this database; each claims tasks under
+        # its own worker id with a renewable lease.
+        self.worker_id = str(getattr(self.config.agent, "worker_id", None) or default_worker_id())
+        self.lease_seconds = int(getattr(self.config.agent, "lease_seconds", 90))
+        self.max_parallel_tasks = max(1, int(getattr(self.config.agent, "max_parallel_tasks", 1) or 1))
+
+        self.io_pools = BlockingIOPools(getattr(self.config.agent, "io_pools", None))
+
+        # Independent components are built concurrently; slow probes (Claude
+        # CLI check, git repo init, usage command) are deferred until first use
+        # or run in the background once the loop is up.
+        startup = StartupGraph(max_workers=int(getattr(self.config.agent, "startup_workers", 4)))
+        startup.add("workspace", self._init_workspace)
+        startup.add("database", self._init_database, depends_on=["workspace"])
+        startup.add("live_status", self._init_live_status, depends_on=["workspace"])
+        startup.add("scheduler", self._init_scheduler, depends_on=["database"])
+        startup.add("auto_generator", self._init_auto_generator, depends_on=["database"])
+        startup.add("executor", self._init_executor, depends_on=["database", "live_status"])
+        startup.add("results", self._init_results, depends_on=["database"])
+        startup.add("git", self._init_git, depends_on=["workspace"])
+        startup.add("monitoring", self._init_monitoring, depends_on=["workspace"])
+        startup.add("slack", self._init_bot, depends_on=["scheduler", "monitoring", "live_status"])
+        startup.defer("claude_cli_check")
+        startup.defer("git_init_repo")
+        startup.defer("usage_window")
+        startup.run()
+        self.startup = startup
+
+        # Side effects of finished tasks are recorded in an outbox and
+        # replayed at the next start if this run dies before they land
+        self.event_bus = EventBus(
+            outbox=EventOutbox(str(self.config.agent.db_path)),
+            worker_id=self.worker_id,
+            io_pools=self.io_pools,
+        )
+        self.event_bus.add_settled_listener(lambda: self.dispatch_notifier.notify("task_settled"))
+
+        self.timeout_manager = TaskTimeoutManager(
+            config=self.config,
+            task_queue=self.task_queue,
+            claude=self.claude,
+            monitor=self.monitor,
+            perf_logger=self.perf_logger,
+            report_generator=self.report_generator,
+            bot=self.bot,
+            live_status_tracker=self.live_status_tracker,
+        )
+
+        self.task_runtime = TaskRuntime(
+            config=self.config,
+            task_queue=self.task_queue,
+            scheduler=self.scheduler,
+            claude=self.claude,
+            results=self.results,
+            git=self.git,
+            monitor=self.monitor,
+            perf_logger=self.perf_logger,
+            report_generator=self.report_generator,
+            bot=self.bot,
+            live_status_tracker=self.live_status_tracker,
+            io_pools=self.io_pools,
+            worker_id=self.worker_id,
+            lease_seconds=self.lease_seconds,
+            event_bus=self.event_bus,
+        )
+
+        self.worker_pool = TaskWorkerPool(
+            execute=self.task_runtime.execute,
+            max_parallel_tasks=self.max_parallel_tasks,
+            on_finished=lambda _task: self.dispatch_notifier.notify("task_finished"),
+        )
+        self.lease_keeper = LeaseKeeper(
+            task_queue=self.task_queue,
+            pool=self.worker_pool,
+            worker_id=self.worker_id,
+            lease_seconds=self.lease_seconds,
+            io_pools=self.io_pools,
+            heartbeat_source=self.claude.get_heartbeats,
+        )
+
+        pipelining = self.config.multi_agent_workflow.get("pipelining") or {}
+        self.plan_prefetcher = None
+        if pipelining.get("enabled", False):
+            self.plan_prefetcher = PlanPrefetcher(
+                executor=self.claude,
+                task_queue=self.task_queue,
+                scheduler=self.scheduler,
+                checkpoint_store=self.checkpoint_store,
+                busy_tasks=lambda: self.worker_pool.running_tasks() + self.event_bus.settling_tasks(),
+                io_pools=self.io_pools,
+                lookahead=pipelining.get("lookahead", 1),
+            )
+            self.claude.add_phase_listener(self.plan_prefetcher.on_phase_start)
+
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+    # ------------------------------------------------------------------
+    # Startup steps (run by StartupGraph, possibly on worker threads)
+    # ------------------------------------------------------------------
+    def _init_workspace(self) -> None:
         # Pass git config if it exists
-        git_config = getattr(self.config, 'git', None)
-        setup = WorkspaceSetup(self.config.agent, git_config=git_config)
+        self.git_config = getattr(self.config, "git", None)
+        setup = WorkspaceSetup(self.config.agent, git_config=self.git_config)
         setup_result = setup.run()
         self.use_remote_repo = setup_result.use_remote_repo
         self.remote_repo_url = setup_result.remote_repo_url
-
         self._init_directories()
 
+    def _init_database(self) -> None:
         engine = init_db(str(self.config.agent.db_path))
         self.task_queue = TaskQueue(str(self.config.agent.db_path))
+        self.dispatch_notifier = DispatchNotifier(
+            db_path=str(self.config.agent.db_path),
+            poll_interval_seconds=getattr(self.config.agent, "dispatch_poll_interval_seconds", 0.5),
+            io_pools=self.io_pools,
+        )
+        self.task_queue.add_listener(lambda _task: self.dispatch_notifier.notify("task_added"))
 
+        self.checkpoint_store = CheckpointStore(str(self.config.agent.db_path))
+        self._resume_interrupted_tasks()
         self._create_seed_task_if_needed()
 
-        live_status_path = Path(self.config.agent.db_path).parent / "live_status.json"
-        self.live_status_tracker = LiveStatusTracker(live_status_path)
-        self.live_status_tracker.clear_all()
-
         Session = sessionmaker(bind=engine)
         self.db_session = Session()
 
@@ -65,8 +190,24 @@ class SleeplessAgent:
             night_quota_percent=90.0,
         )
 
+    def _init_live_status(self) -> None:
+        live_status_path = Path(self.config.agent.db_path).parent / "live_status.json"
+        # Each daemon owns live_status.<worker_id>.json; readers merge them
+        self.live_status_tracker = LiveStatusHub(
+            live_status_path,
+            flush_interval=float(getattr(self.config.agent, "live_status_flush_seconds", 1.0)),
+            worker_id=self.worker_id,
+        )
+        self.live_status_tracker.clear_all()
+        remove_worker_status_files(live_status_path, is_dead_local_worker)
+        self.live_status_feed = None
+        if getattr(self.config.agent, "live_status_feed", True):
+            self.live_status_feed = LiveStatusFeed(self.live_status_tracker, live_status_path.parent / SOCKET_NAME)
+
+    def _init_scheduler(self) -> None:
         self.scheduler = SmartScheduler(
             task_queue=self.task_queue,
+            max_parallel_tasks=self.max_parallel_tasks,
             daily_budget_usd=10.0,
             night_quota_percent=90.0,
             usage_command=self.config.claude_code.usage_command,
@@ -74,8 +215,10 @@ class SleeplessAgent:
             threshold_night=self.config.claude_code.threshold_night,
             night_start_hour=self.config.claude_code.night_start_hour,
             night_end_hour=self.config.claude_code.night_end_hour,
+            worker_id=self.worker_id,
         )
 
+    def _init_auto_generator(self) -> None:
         self.auto_generator = AutoTaskGenerator(
             db_session=self.db_session,
             config=self.config.auto_generation,
@@ -88,43 +231,90 @@ class SleeplessAgent:
             night_end_hour=self.config.claude_code.night_end_hour,
         )
 
+    def _init_executor(self) -> None:
+        cache_config = self.config.multi_agent_workflow.planner.get("cache") or {}
+        self.plan_cache = None
+        if cache_config.get("enabled", True):
+            self.plan_cache = PlanCache(
+                str(self.config.agent.db_path),
+                max_age_seconds=float(cache_config.get("max_age_seconds", 86400)),
+                near_match_threshold=float(cache_config.get("near_match_threshold", 0.85)),
+                max_entries=int(cache_config.get("max_entries", 500)),
+            )
+        context_config = self.config.multi_agent_workflow.planner.get("context") or {}
+        self.context_builder = WorkspaceContextBuilder(
+            token_budget=int(context_config.get("token_budget", 6000)),
+            tree_share=float(context_config.get("tree_share", 0.25)),
+        )
+        # Phase usage is always recorded; it also feeds the evaluation policy
+        self.phase_usage = PhaseUsageStore(str(self.config.agent.db_path))
+        self.token_usage = TokenUsageStore(str(self.config.agent.db_path))
+        adaptive_config = self.config.multi_agent_workflow.get("adaptive_turns") or {}
+        self.turn_advisor = TurnBudgetAdvisor(self.phase_usage, adaptive_config)
+        policy_config = self.config.multi_agent_workflow.evaluator.get("policy") or {}
+        self.eval_policy = EvaluationPolicy(self.phase_usage, policy_config)
+        # Task phases and chat run on different event loops, so each gets its own pool
+        pool_config = self.config.claude_code.get("client_pool") or {}
+        self.client_pool = ClaudeClientPool(pool_config)
+        snapshot_config = getattr(self.config.agent, "refine_snapshots", None) or {}
+        self.snapshot_store = None
+        if snapshot_config.get("enabled", True):
+            self.snapshot_store = SnapshotStore(
+                Path(self.config.agent.workspace_root) / "data" / "snapshots",
+                link_mode=snapshot_config.get("link_mode", "auto"),
+            )
         self.claude = ClaudeCodeExecutor(
             workspace_root=str(self.config.agent.workspace_root),
             live_status_tracker=self.live_status_tracker,
             default_model=self.config.claude_code.model,
+            checkpoint_store=self.checkpoint_store,
+            plan_cache=self.plan_cache,
+            snapshot_store=self.snapshot_store,
+            context_builder=self.context_builder,
+            turn_advisor=self.turn_advisor,
+            eval_policy=self.eval_policy,
+            client_pool=self.client_pool,
+            token_usage=self.token_usage,
+            io_pools=self.io_pools,
         )
 
+    def _init_results(self) -> None:
         self.results = ResultManager(
             str(self.config.agent.db_path),
             str(self.config.agent.results_path),
         )
 
+    def _init_git(self) -> None:
+        git_config = self.git_config
         auto_create_repo = git_config.get("auto_create_repo", False) if git_config else False
-        git_enabled = git_config.get("enabled", True) if git_config else True
+        self.git_enabled = git_config.get("enabled", True) if git_config else True
         self.git = GitManager(
             workspace_root=str(self.config.agent.workspace_root),
             auto_create_repo=auto_create_repo,
-            enabled=git_enabled,
+            enabled=self.git_enabled,
         )
-        if git_enabled:
-            self.git.init_repo()
-            if self.use_remote_repo and self.remote_repo_url:
-                try:
-                    self.git.configure_remote(self.remote_repo_url)
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.error(f"Failed to configure remote repository: {exc}")
-        else:
+        if not self.git_enabled:
             logger.info("git.disabled", message="Git integration is disabled")
 
+    def _init_monitoring(self) -> None:
         self.monitor = HealthMonitor(
             db_path=str(self.config.agent.db_path),
             results_path=str(self.config.agent.results_path),
         )
+        loop_config = getattr(self.config.agent, "loop_monitor", None) or {}
+        self.loop_monitor = None
+        if loop_config.get("enabled", True):
+            self.loop_monitor = EventLoopMonitor(
+                sample_interval_seconds=loop_config.get("sample_interval_seconds", 0.25),
+                slow_callback_seconds=loop_config.get("slow_callback_ms", 250) / 1000,
+            )
+            self.monitor.register_probe("event_loop", self.loop_monitor.snapshot)
         self.perf_logger = PerformanceLogger(log_dir=str(self.config.agent.db_path.parent))
         self.report_generator = ReportGenerator(
             base_path=str(self.config.agent.db_path.parent / "reports")
         )
 
+    def _init_bot(self) -> None:
         self.bot = SlackBot(
             bot_token=self.config.slack.bot_token,
             app_token=self.config.slack.app_token,
@@ -134,35 +324,52 @@ class SleeplessAgent:
             report_generator=self.report_generator,
             live_status_tracker=self.live_status_tracker,
             workspace_root=str(self.config.agent.workspace_root),
+            chat_client_pool=ClaudeClientPool(self.config.claude_code.get("client_pool") or {}),
         )
 
-        self.timeout_manager = TaskTimeoutManager(
-            config=self.config,
-            task_queue=self.task_queue,
-            claude=self.claude,
-            monitor=self.monitor,
-            perf_logger=self.perf_logger,
-            report_generator=self.report_generator,
-            bot=self.bot,
-            live_status_tracker=self.live_status_tracker,
-        )
+    # ------------------------------------------------------------------
+    # Deferred startup work (runs once the event loop is up)
+    # ------------------------------------------------------------------
+    def _prepare_git_repo(self) -> None:
+        if not self.git_enabled:
+            return
+        self.git.init_repo()
+        if self.use_remote_repo and self.remote_repo_url:
+            try:
+                self.git.configure_remote(self.remote_repo_url)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error(f"Failed to configure remote repository: {exc}")
+
+    def _verify_claude_cli(self) -> None:
+        try:
+            self.claude.ensure_cli_available()
+        except Exception as exc:
+            logger.error("daemon.startup.claude_cli_unavailable", error=str(exc))
 
-        self.task_runtime = TaskRuntime(
-            config=self.config,
-            task_queue=self.task_queue,
-            scheduler=self.scheduler,
-            claude=self.claude,
-            results=self.results,
-            git=self.git,
-            monitor=self.monitor,
-            perf_logger=self.perf_logger,
-            report_generator=self.report_generator,
-            bot=self.bot,
-            live_status_tracker=self.live_status_tracker,
-        )
+    def _prune_snapshots(self) -> None:
+        if self.snapshot_store is None:
+            return
+        try:
+            self.snapshot_store.prune()
+        except Exception as exc:
+            logger.warning("daemon.startup.snapshot_prune_failed", error=str(exc))
 
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+    def _record_startup_timings(self) -> None:
+        extra = {"worker_id": self.worker_id}
+        try:
+            import psutil
+
+            extra["since_process_start_ms"] = round((time.time() - psutil.Process().create_time()) * 1000, 2)
+        except Exception:  # pragma: no cover - psutil is optional here
+            pass
+        report = self.startup.write_report(self.config.agent.db_path.parent / "startup_timings.json", extra)
+        logger.info(
+            "daemon.startup",
+            total_ms=report["total_ms"],
+            serial_ms=report["serial_ms"],
+            since_process_start_ms=report.get("since_process_start_ms"),
+            critical_path=report["critical_path"],
+        )
 
     def _init_directories(self) -> None:
         self.config.agent.workspace_root.mkdir(parents=True, exist_ok=True)
@@ -170,6 +377,26 @@ class SleeplessAgent:
         self.config.agent.results_path.mkdir(parents=True, exist_ok=True)
         self.config.agent.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _resume_interrupted_tasks(self) -> None:
+        if not getattr(self.config.agent, "resume_interrupted_tasks", True):
+            return
+        try:
+            tasks = self.task_queue.requeue_interrupted_tasks(
+                worker_id=self.worker_id, dead_worker=is_dead_local_worker
+            )
+        except Exception as exc:
+            logger.error(f"Failed to requeue interrupted tasks: {exc}")
+            return
+        if not tasks:
+            return
+        phases = self.checkpoint_store.get_phases([task.id for task in tasks])
+        for task in tasks:
+            logger.info(
+                "daemon.task.resume",
+                task_id=task.id,
+                checkpointed_phases=sorted(phases.get(task.id, [])),
+            )
+
     def _create_seed_task_if_needed(self) -> None:
         pending_count = len(self.task_queue.get_pending_tasks())
         if pending_count > 0:
@@ -225,60 +452,142 @@ class SleeplessAgent:
             import threading
             bot_thread = threading.Thread(target=self.bot.start, daemon=True, name="SlackBot")
             bot_thread.start()
-            await asyncio.sleep(0.5)  # Give bot time to initialize
             logger.info("Slack bot started in background thread")
         except Exception as exc:
             logger.error(f"Failed to start bot: {exc}")
             return
 
+        self._record_startup_timings()
+        # Git runs on a single-thread pool, so repo init is guaranteed to
+        # finish before the first task commit queued behind it.
+        self._background_startup = [
+            asyncio.create_task(self.io_pools.run("git", self._prepare_git_repo), name="startup-git"),
+            asyncio.create_task(self.io_pools.run("monitor", self._verify_claude_cli), name="startup-claude-cli"),
+            asyncio.create_task(self.io_pools.run("monitor", self._prune_snapshots), name="startup-snapshot-prune"),
+        ]
+
+        self.dispatch_notifier.start()
+        self.event_bus.start()
+        try:
+            await self.task_runtime.replay_pending_events(dead_worker=is_dead_local_worker)
+        except Exception as exc:
+            logger.error("daemon.events.replay_failed", error=str(exc))
+        if self.live_status_feed:
+            await self.live_status_feed.start()
+        self.lease_keeper.start()
+        logger.info("daemon.worker.start", worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+        if self.loop_monitor:
+            self.loop_monitor.start()
+        safety_interval = float(getattr(self.config.agent, "dispatch_safety_interval_seconds", 30.0))
+        last_autogen = 0.0
+        last_health_report = time.monotonic()
+
         try:
-            health_check_counter = 0
             while self.running:
                 await self._process_tasks()
 
+                now = time.monotonic()
                 pause_seconds = self.scheduler.get_pause_remaining_seconds()
-                if pause_seconds is None:
+                if pause_seconds is None and now - last_autogen >= 5.0:
+                    last_autogen = now
                     try:
-                        await self.auto_generator.check_and_generate()
+                        if await self.auto_generator.check_and_generate():
+                            self.dispatch_notifier.notify("task_generated")
                     except Exception as exc:
                         logger.error(f"Error in auto-generation: {exc}")
 
-                health_check_counter += 1
-                if health_check_counter >= 12:
-                    self.monitor.log_health_report()
-                    health_check_counter = 0
+                if now - last_health_report >= 60.0:
+                    await self.io_pools.run("monitor", self.monitor.log_health_report)
+                    self._log_pool_stats()
+                    last_health_report = now
 
-                self._check_and_summarize_daily_reports()
+                await self.io_pools.run("reports", self._check_and_summarize_daily_reports)
 
-                sleep_seconds = 5.0
+                # Sleep until something happens: an enqueue, a freed slot, a
+                # cross-process insert, or pause expiry. The timer is only a
+                # safety net.
+                wait_seconds = safety_interval
                 pause_seconds = self.scheduler.get_pause_remaining_seconds()
                 if pause_seconds:
-                    sleep_seconds = max(5.0, min(pause_seconds, 300.0))
-                await asyncio.sleep(sleep_seconds)
+                    wait_seconds = min(pause_seconds, 300.0)
+                reason = await self.dispatch_notifier.wait(timeout=max(0.1, wait_seconds))
+                if reason == "timer" and pause_seconds and self.scheduler.get_pause_remaining_seconds() is None:
+                    reason = "pause_expired"
+                logger.debug("daemon.dispatch.wake", reason=reason)
 
         except KeyboardInterrupt:
             logger.info("Agent interrupted by user")
         except Exception as exc:
             logger.error(f"Unexpected error in main loop: {exc}")
         finally:
+            await self.dispatch_notifier.stop()
+            await self.lease_keeper.stop()
+            if self.plan_prefetcher:
+                await self.plan_prefetcher.stop()
+            if self.loop_monitor:
+                await self.loop_monitor.stop()
+            await self.worker_pool.shutdown(timeout=10)
+            await self.client_pool.close()
+            # Let commits, reports and notifications of finished tasks land
+            await self.event_bus.stop(timeout=float(getattr(self.config.agent, "event_drain_timeout_seconds", 30)))
             self.monitor.log_health_report()
+            self._log_pool_stats()
+            if self.live_status_feed:
+                await self.live_status_feed.stop()
+            self.live_status_tracker.close()
+            self.io_pools.shutdown(wait=False)
             self.bot.stop()
             logger.info("Sleepless Agent stopped")
 
     async def _process_tasks(self) -> None:
         try:
-            self.timeout_manager.enforce()
-            tasks_to_execute = self.scheduler.get_next_tasks()
+            await self.io_pools.run("db", self.timeout_manager.enforce)
+            # Tasks whose owner stopped renewing (crashed daemon) become claimable again
+            reclaimed = await self.io_pools.run("db", self.task_queue.reclaim_expired_leases)
+            if reclaimed:
+                self.dispatch_notifier.notify("lease_reclaimed")
+            if self.worker_pool.available_slots == 0:
+                return
+
+            # Scheduling may shell out to the usage command; keep it off the loop
+            tasks_to_execute = await self.io_pools.run(
+                "scheduler",
+                self.scheduler.get_next_tasks,
+                running=self.worker_pool.running_tasks(),
+                settling=self.event_bus.settling_tasks(),
+            )
 
             for task in tasks_to_execute:
                 if not self.running:
                     break
-
-                await self.task_runtime.execute(task)
-                await asyncio.sleep(1)
+                if not self.worker_pool.submit(task):
+                    break
         except Exception as exc:
             logger.error(f"Error in task processing loop: {exc}")
 
+    def _log_pool_stats(self) -> None:
+        try:
+            logger.info(
+                "daemon.pool.stats",
+                worker_id=self.worker_id,
+                leases_renewed=self.lease_keeper.renewals,
+                leases_lost=self.lease_keeper.lost,
+                io_pools=self.io_pools.get_stats(),
+                events=self.event_bus.get_stats(),
+                prefetch=self.plan_prefetcher.get_stats() if self.plan_prefetcher else None,
+                plan_cache=self.plan_cache.get_stats() if self.plan_cache else None,
+                snapshots=self.snapshot_store.get_stats() if self.snapshot_store else None,
+                planner_context=self.context_builder.get_stats(),
+                evaluation_policy=self.eval_policy.get_stats(),
+                client_pool=self.client_pool.get_stats() if self.client_pool.enabled else None,
+                tool_calls=self.claude.tool_stats.get_stats(),
+                live_status=self.live_status_tracker.get_stats(),
+                live_feed=self.live_status_feed.get_stats() if self.live_status_feed else None,
+                **self.worker_pool.get_stats(),
+            )
+        except Exception as exc:
+            logger.debug(f"Failed to collect worker pool stats: {exc}")
+
     def _check_and_summarize_daily_reports(self) -> None:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         end_of_day = now.replace(hour=23, minute=59, second=0, microsecond=0)
@@ -0,0 +1,174 @@
+"""Event-driven wake-ups for the daemon's dispatch loop."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class DispatchNotifier:
+    """Wake the dispatcher as soon as there is something to do.
+
+    In-process producers (``TaskQueue.add_task``, the worker pool, pause
+    expiry) call :meth:`notify` directly; it is safe to call from any thread,
+    e.g. the Slack bot thread. Inserts made by other processes such as the
+    ``sle`` CLI are detected by polling SQLite's ``PRAGMA data_version``,
+    which only changes when another connection commits, and then confirming
+    with a cheap pending-task signature query. The signature includes the
+    newest ``updated_at``, so tasks put back to pending under their old ids
+    (expired leases, interrupted runs) wake the dispatcher too.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        poll_interval_seconds: float = 0.5,
+        io_pools: Optional[BlockingIOPools] = None,
+    ):
+        """Initialize the notifier.
+
+        Args:
+            db_path: Task database to watch for cross-process inserts (optional)
+            poll_interval_seconds: How often to read the database change counter
+            io_pools: Thread pools; the watcher's queries run on the ``db`` pool
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.poll_interval_seconds = max(0.05, float(poll_interval_seconds))
+        self.io_pools = io_pools or BlockingIOPools()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._event: Optional[asyncio.Event] = None
+        self._reasons: Set[str] = set()
+        self._lock = threading.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._pending_signature: Optional[Tuple[int, int, str]] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Bind to the running loop and start the database watcher."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._event = asyncio.Event()
+        with self._lock:
+            if self._reasons:
+                self._event.set()
+
+        if self.db_path and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch_database(), name="dispatch-db-watch")
+
+    async def stop(self) -> None:
+        """Stop the database watcher."""
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Notification
+    # ------------------------------------------------------------------
+    def notify(self, reason: str = "notify") -> None:
+        """Request a dispatch pass. Thread-safe."""
+        with self._lock:
+            self._reasons.add(reason)
+
+        if self._loop is None or self._event is None:
+            return  # picked up by start()
+        if threading.get_ident() == self._loop_thread_id:
+            self._event.set()
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._event.set)
+            except RuntimeError:
+                pass  # loop closed during shutdown
+
+    async def wait(self, timeout: Optional[float]) -> str:
+        """Wait for a notification or the safety-net timer.
+
+        Returns:
+            Comma-separated wake reasons, or ``"timer"`` if nothing notified.
+        """
+        if self._event is None:
+            await asyncio.sleep(timeout or 0)
+            return "timer"
+
+        if not self._event.is_set():
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        self._event.clear()
+        with self._lock:
+            reasons = sorted(self._reasons)
+            self._reasons.clear()
+        return ",".join(reasons) if reasons else "timer"
+
+    # ------------------------------------------------------------------
+    # Cross-process change detection
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), timeout=1.0, check_same_thread=False)
+        return self._conn
+
+    def _read_data_version(self) -> int:
+        return int(self._connect().execute("PRAGMA data_version").fetchone()[0])
+
+    def _read_pending_signature(self) -> Tuple[int, int, str]:
+        row = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(MAX(updated_at), '') "
+            "FROM tasks WHERE status = 'PENDING'"
+        ).fetchone()
+        return int(row[0]), int(row[1]), str(row[2])
+
+    def _poll(self) -> Optional[Tuple[Tuple[int, int, str], Tuple[int, int, str]]]:
+        """Previous and current pending signature if another connection committed."""
+        version = self._read_data_version()
+        if version == self._data_version:
+            return None
+        first_read = self._data_version is None
+        self._data_version = version
+        previous = self._pending_signature
+        self._pending_signature = self._read_pending_signature()
+        if first_read or previous is None:
+            return None
+        return previous, self._pending_signature
+
+    async def _watch_database(self) -> None:
+        while True:
+            try:
+                change = await self.io_pools.run("db", self._poll)
+                # Only wake for added or re-queued pending work, not for our own claims
+                if change is not None and any(now > before for before, now in zip(*change)):
+                    self.notify("db_change")
+            except sqlite3.Error as exc:
+                logger.debug("dispatch.db_watch.error", error=str(exc))
+                if self._conn is not None:
+                    try:
+                        self._conn.close()
+                    except Exception:
+                        pass
+                    self._conn = None
+            await asyncio.sleep(self.poll_interval_seconds)
@@ -0,0 +1,256 @@
+"""Decide per task whether the evaluator runs in full, locally, or as a sample."""
+
+from __future__ import annotations
+
+import json
+import random
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.phase_usage import PhaseUsageStore
+
+logger = get_logger(__name__)
+
+FULL = "full"  # Model-based evaluator
+LOCAL = "local"  # Local checks only, no model call
+SAMPLED = "sampled"  # Eligible for local checks but picked for a full audit
+
+_DOC_SUFFIXES = (".md", ".txt", ".rst")
+
+
+@dataclass
+class EvaluationDecision:
+    """How one task is evaluated, and why."""
+
+    mode: str
+    reason: str
+    complete_rate: Optional[float] = None
+    samples: int = 0
+    mean_cost_usd: Optional[float] = None
+
+
+@dataclass
+class LocalCheckResult:
+    """Outcome of the local evaluation checks."""
+
+    checked: List[str] = field(default_factory=list)
+    problems: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.problems
+
+
+class EvaluationPolicy:
+    """Choose between the full evaluator, local checks and sampled audits.
+
+    Serious tasks and failed workers always get the full evaluator. Tasks
+    whose worker changed nothing, and auto-generated tasks that only touched
+    documentation, are checked locally. Otherwise the historical COMPLETE
+    rate of full evaluations for the same task type, priority and project
+    decides: above ``complete_rate_threshold`` the task is checked locally,
+    except for a ``sample_rate`` fraction that still gets a full evaluation
+    so the rate stays honest.
+    """
+
+    def __init__(self, store: PhaseUsageStore, config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None):
+        """Initialize the policy.
+
+        Args:
+            store: Phase usage history (evaluator outcomes and costs)
+            config: ``multi_agent_workflow.evaluator.policy`` settings
+            seed: Optional seed for the audit sampling
+        """
+        config = dict(config or {})
+        self.store = store
+        self.enabled = bool(config.get("enabled", True))
+        self.full_priorities = set(config.get("always_full_priorities", ["serious"]))
+        self.min_samples = max(1, int(config.get("min_samples", 10)))
+        self.complete_rate_threshold = float(config.get("complete_rate_threshold", 0.9))
+        self.sample_rate = min(max(float(config.get("sample_rate", 0.2)), 0.0), 1.0)
+        self.history = max(self.min_samples, int(config.get("history", 100)))
+        self.run_tests = bool(config.get("run_tests", False))
+        self.test_timeout_seconds = float(config.get("test_timeout_seconds", 120))
+        self.cache_ttl_seconds = float(config.get("cache_ttl_seconds", 300))
+        self._random = random.Random(seed)
+        self._cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            FULL: 0,
+            LOCAL: 0,
+            SAMPLED: 0,
+            "escalated": 0,
+            "estimated_saved_usd": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Decision
+    # ------------------------------------------------------------------
+    def decide(
+        self,
+        *,
+        task_type: Optional[str],
+        priority: Optional[str],
+        project_id: Optional[str],
+        files_modified: Iterable[str],
+        worker_exit_code: int,
+    ) -> EvaluationDecision:
+        """Pick the evaluation mode for a task. Blocking (DB read)."""
+        files = list(files_modified)
+        if not self.enabled:
+            decision = EvaluationDecision(FULL, "policy_disabled")
+        elif worker_exit_code != 0:
+            decision = EvaluationDecision(FULL, "worker_failed")
+        elif priority in self.full_priorities:
+            decision = EvaluationDecision(FULL, f"priority_{priority}")
+        else:
+            history = self._history(task_type, priority, project_id)
+            samples = history["samples"]
+            complete = history["outcomes"].get("COMPLETE", 0)
+            rate = complete / samples if samples else None
+            decision = EvaluationDecision(
+                FULL, "default", complete_rate=rate, samples=samples, mean_cost_usd=history["mean_cost_usd"]
+            )
+            if not files:
+                decision.mode, decision.reason = LOCAL, "no_changes"
+            elif priority == "generated" and all(name.lower().endswith(_DOC_SUFFIXES) for name in files):
+                decision.mode, decision.reason = LOCAL, "generated_docs_only"
+            elif samples >= self.min_samples and rate >= self.complete_rate_threshold:
+                if self._random.random() < self.sample_rate:
+                    decision.mode, decision.reason = SAMPLED, "audit_sample"
+                else:
+                    decision.mode, decision.reason = LOCAL, "high_complete_rate"
+
+        with self._lock:
+            self.stats[decision.mode] += 1
+        logger.info(
+            "task.evaluation.policy",
+            mode=decision.mode,
+            reason=decision.reason,
+            complete_rate=round(decision.complete_rate, 3) if decision.complete_rate is not None else None,
+            samples=decision.samples,
+        )
+        return decision
+
+    def _history(self, task_type: Optional[str], priority: Optional[str], project_id: Optional[str]) -> Dict[str, Any]:
+        key = (task_type, priority, project_id)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached and now - cached[0] < self.cache_ttl_seconds:
+            return cached[1]
+        history = self.store.outcome_stats(
+            "evaluator", task_type=task_type, priority=priority, project_id=project_id, limit=self.history
+        )
+        with self._lock:
+            self._cache[key] = (now, history)
+        return history
+
+    def record_local(self, decision: EvaluationDecision, passed: bool) -> None:
+        """Count a local evaluation and, if it held, the evaluator cost it saved."""
+        with self._lock:
+            if not passed:
+                self.stats["escalated"] += 1
+            elif decision.mean_cost_usd:
+                self.stats["estimated_saved_usd"] += decision.mean_cost_usd
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Decisions per mode, escalations and estimated evaluator spend saved."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["estimated_saved_usd"] = round(stats["estimated_saved_usd"], 4)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Local checks
+    # ------------------------------------------------------------------
+    def run_local_checks(self, workspace: Path, files_modified: Iterable[str], worker_output: str) -> LocalCheckResult:
+        """Check that changed files exist and parse, and optionally run the tests. Blocking."""
+        result = LocalCheckResult()
+        if not worker_output.strip():
+            result.problems.append("worker produced no output")
+
+        python_changed = False
+        for name in sorted(set(files_modified)):
+            path = Path(name) if Path(name).is_absolute() else workspace / name
+            if not path.is_file():
+                result.problems.append(f"{name}: reported as modified but missing")
+                continue
+            suffix = path.suffix.lower()
+            try:
+                if suffix == ".py":
+                    python_changed = True
+                    compile(path.read_bytes(), str(path), "exec")
+                elif suffix == ".json":
+                    json.loads(path.read_text())
+                elif suffix in (".yaml", ".yml"):
+                    import yaml
+
+                    yaml.safe_load(path.read_text())
+                elif suffix == ".toml":
+                    import tomllib
+
+                    tomllib.loads(path.read_text())
+            except Exception as exc:  # SyntaxError, decode and parser errors
+                result.problems.append(f"{name}: {type(exc).__name__}: {exc}")
+            result.checked.append(name)
+
+        if self.run_tests and python_changed and not result.problems and _has_tests(workspace):
+            problem = self._run_tests(workspace)
+            result.checked.append("pytest")
+            if problem:
+                result.problems.append(problem)
+        return result
+
+    def _run_tests(self, workspace: Path) -> Optional[str]:
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-x", "--no-header", "-p", "no:cacheprovider"],
+                cwd=workspace,
+                capture_output=True,
+                text=True,
+                timeout=self.test_timeout_seconds,
+            )
+        except subprocess.TimeoutExpired:
+            return f"tests did not finish within {int(self.test_timeout_seconds)}s"
+        except OSError as exc:
+            logger.debug("evaluation.tests.unavailable", error=str(exc))
+            return None
+        # 5: no tests collected
+        if completed.returncode in (0, 5):
+            return None
+        tail = (completed.stdout or completed.stderr).strip().splitlines()[-5:]
+        return "tests failed: " + " | ".join(tail)
+
+
+def _has_tests(workspace: Path) -> bool:
+    if (workspace / "tests").is_dir():
+        return True
+    return any(workspace.glob("test_*.py")) or any(workspace.glob("*_test.py"))
+
+
+def format_local_evaluation(decision: EvaluationDecision, result: LocalCheckResult) -> str:
+    """Evaluator-style summary of a passed local evaluation."""
+    lines = [
+        f"Local evaluation ({decision.reason}); the model evaluator was skipped.",
+        "",
+        "## Checks",
+    ]
+    if result.checked:
+        lines.extend(f"- {name}: ok" for name in result.checked)
+    else:
+        lines.append("- worker output present; no files changed")
+    if decision.complete_rate is not None:
+        lines.append("")
+        lines.append(
+            f"Similar tasks were evaluated COMPLETE {decision.complete_rate:.0%} of the time ({decision.samples} runs)."
+        )
+    lines.append("")
+    lines.append("Status: COMPLETE")
+    return "\n".join(lines)
@@ -0,0 +1,364 @@
+"""In-process event bus for post-task side effects."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.monitoring.logging import get_logger
+
+if TYPE_CHECKING:
+    from sleepless_agent.storage.outbox import EventOutbox
+
+logger = get_logger(__name__)
+
+# Event kinds published by TaskRuntime and its consumers
+TASK_FINISHED = "task.finished"
+TASK_SETTLED = "task.settled"
+
+
+@dataclass
+class TaskEvent:
+    """Something that happened to a task, with everything consumers need.
+
+    ``task`` is a detached ORM snapshot; consumers must not write through it.
+    ``durable`` events have outbox rows that are removed as consumers finish.
+    """
+
+    kind: str
+    task: Any
+    payload: Dict[str, Any] = field(default_factory=dict)
+    event_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    published_at: float = field(default_factory=time.monotonic)
+    durable: bool = False
+
+    @property
+    def task_id(self) -> int:
+        return self.task.id
+
+
+Handler = Callable[[TaskEvent], Awaitable[None]]
+
+
+@dataclass
+class _Consumer:
+    name: str
+    kind: str
+    handler: Handler
+    retries: int
+    backoff_seconds: float
+    holds_workspace: bool
+    on_dead: Optional[Handler]
+    queue: "asyncio.Queue[TaskEvent]" = field(default_factory=asyncio.Queue)
+    worker: Optional[asyncio.Task] = None
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+    last_lag_ms: Optional[int] = None
+
+
+class EventBus:
+    """Fan events out to named background consumers.
+
+    Each consumer has its own queue and worker coroutine, so a slow git push
+    never delays a report append and events for one consumer are handled in
+    publish order. A handler that raises is retried with exponential backoff;
+    after ``retries`` attempts the event is logged as dead and dropped.
+    Handlers must therefore be safe to run more than once for the same event,
+    or be subscribed with ``retries=1``.
+
+    With an ``outbox``, :meth:`record` (or :meth:`publish_durable`) stores
+    the event for each consumer before it is queued, and each row is
+    removed once its consumer is done (delivered or dead). Events still
+    recorded after a crash or an undrained :meth:`stop` are replayed by the
+    next daemon run, so delivery is at least once: a consumer cut off
+    between its side effect and the acknowledgement runs again.
+
+    Consumers registered with ``holds_workspace=True`` keep the task's
+    workspace marked as *settling* until they are done with it, so the
+    scheduler does not start another task in the same directory meanwhile.
+    """
+
+    def __init__(
+        self,
+        outbox: Optional["EventOutbox"] = None,
+        worker_id: Optional[str] = None,
+        io_pools: Optional[BlockingIOPools] = None,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            outbox: Optional durable store of events not yet handled
+            worker_id: Daemon id recorded with outbox rows
+            io_pools: Thread pools used for the outbox writes
+        """
+        self.outbox = outbox
+        self.worker_id = worker_id
+        self.io_pools = io_pools or BlockingIOPools()
+        self._consumers: Dict[str, List[_Consumer]] = defaultdict(list)
+        self._settling: Dict[int, Any] = {}
+        self._settling_refs: Dict[int, int] = defaultdict(int)
+        self._started = False
+        self._pending = 0
+        self._dead: List[Dict[str, Any]] = []
+        self._listeners: Set[Callable[[], None]] = set()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def subscribe(
+        self,
+        kind: str,
+        name: str,
+        handler: Handler,
+        *,
+        retries: int = 3,
+        backoff_seconds: float = 1.0,
+        holds_workspace: bool = False,
+        on_dead: Optional[Handler] = None,
+    ) -> None:
+        """Register a consumer for events of ``kind``.
+
+        Args:
+            kind: Event kind to consume
+            name: Consumer name used in logs and stats
+            handler: Coroutine function handling one event
+            retries: Attempts before an event is declared dead
+            backoff_seconds: Initial delay between attempts (doubles each time)
+            holds_workspace: Keep the task's workspace busy until handled
+            on_dead: Called once with the event if every attempt failed
+        """
+        consumer = _Consumer(
+            name=name,
+            kind=kind,
+            handler=handler,
+            retries=max(1, int(retries)),
+            backoff_seconds=max(0.0, float(backoff_seconds)),
+            holds_workspace=holds_workspace,
+            on_dead=on_dead,
+        )
+        self._consumers[kind].append(consumer)
+        if self._started:
+            self._start_consumer(consumer)
+
+    def add_settled_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever a workspace stops settling."""
+        self._listeners.add(callback)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start consumer workers on the running loop."""
+        self._started = True
+        for consumers in self._consumers.values():
+            for consumer in consumers:
+                self._start_consumer(consumer)
+
+    def _start_consumer(self, consumer: _Consumer) -> None:
+        if consumer.worker is None:
+            consumer.worker = asyncio.create_task(
+                self._consume(consumer), name=f"events-{consumer.name}"
+            )
+
+    async def stop(self, timeout: Optional[float] = 30.0) -> None:
+        """Drain queued events (up to ``timeout``) and stop the workers."""
+        consumers = [consumer for group in self._consumers.values() for consumer in group]
+        # Poll rather than join the queues: consumers may publish follow-up
+        # events (e.g. task.settled) while draining.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending and any(consumer.worker for consumer in consumers):
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning("events.stop.undrained", pending=self._pending, replayed_next_start=bool(self.outbox))
+                break
+            await asyncio.sleep(0.05)
+        for consumer in consumers:
+            if consumer.worker is not None:
+                consumer.worker.cancel()
+                try:
+                    await consumer.worker
+                except asyncio.CancelledError:
+                    pass
+                consumer.worker = None
+        self._started = False
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    def publish(self, event: TaskEvent, consumers: Optional[Iterable[str]] = None) -> None:
+        """Queue ``event`` for every consumer of its kind (or only ``consumers``). Never blocks."""
+        targets = self._consumers.get(event.kind, [])
+        if consumers is not None:
+            names = set(consumers)
+            targets = [consumer for consumer in targets if consumer.name in names]
+        if not targets:
+            logger.debug("events.unconsumed", kind=event.kind, task_id=event.task_id)
+            return
+        for consumer in targets:
+            if consumer.holds_workspace:
+                self._settling[event.task_id] = event.task
+                self._settling_refs[event.task_id] += 1
+            self._pending += 1
+            consumer.queue.put_nowait(event)
+
+    async def record(self, event: TaskEvent) -> None:
+        """Write ``event`` to the outbox for each of its consumers without queueing it.
+
+        Lets a publisher make the side effects durable before it
+        acknowledges the outcome they follow from. If the record cannot be
+        written the event is still delivered once published, only not replayed.
+        """
+        names = [consumer.name for consumer in self._consumers.get(event.kind, [])]
+        if self.outbox is None or not names:
+            return
+        try:
+            await self.io_pools.run(
+                "db",
+                self.outbox.add,
+                event.event_id,
+                event.kind,
+                event.task_id,
+                names,
+                event.payload,
+                self.worker_id,
+            )
+            event.durable = True
+        except Exception as exc:
+            logger.error("events.outbox.write_failed", kind=event.kind, task_id=event.task_id, error=str(exc))
+
+    async def discard(self, event: TaskEvent) -> None:
+        """Drop a recorded event that will not be published after all."""
+        if not (event.durable and self.outbox is not None):
+            return
+        await self.io_pools.run("db", self.outbox.discard, event.event_id)
+        event.durable = False
+
+    async def publish_durable(self, event: TaskEvent) -> None:
+        """:meth:`record` and then :meth:`publish` ``event``."""
+        await self.record(event)
+        self.publish(event)
+
+    async def save_payload(self, event: TaskEvent) -> None:
+        """Persist changes a consumer made to a durable event's payload."""
+        if not (event.durable and self.outbox is not None):
+            return
+        try:
+            await self.io_pools.run("db", self.outbox.save_payload, event.event_id, event.payload)
+        except Exception as exc:
+            logger.warning("events.outbox.save_failed", event_id=event.event_id, error=str(exc))
+
+    # ------------------------------------------------------------------
+    # Consumption
+    # ------------------------------------------------------------------
+    async def _consume(self, consumer: _Consumer) -> None:
+        while True:
+            event = await consumer.queue.get()
+            try:
+                await self._deliver(consumer, event)
+                await self._ack(consumer, event)
+            finally:
+                self._pending -= 1
+                if consumer.holds_workspace:
+                    self._release(event.task_id)
+                consumer.queue.task_done()
+
+    async def _deliver(self, consumer: _Consumer, event: TaskEvent) -> None:
+        consumer.last_lag_ms = int((time.monotonic() - event.published_at) * 1000)
+        delay = consumer.backoff_seconds
+        for attempt in range(1, consumer.retries + 1):
+            try:
+                await consumer.handler(event)
+                consumer.delivered += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if attempt >= consumer.retries:
+                    consumer.failed += 1
+                    self._dead.append(
+                        {"consumer": consumer.name, "kind": event.kind, "task_id": event.task_id, "error": str(exc)}
+                    )
+                    del self._dead[:-50]
+                    logger.error(
+                        "events.consumer.dead",
+                        consumer=consumer.name,
+                        kind=event.kind,
+                        task_id=event.task_id,
+                        attempts=attempt,
+                        error=str(exc),
+                    )
+                    if consumer.on_dead is not None:
+                        try:
+                            await consumer.on_dead(event)
+                        except Exception as dead_exc:
+                            logger.debug("events.on_dead.failed", consumer=consumer.name, error=str(dead_exc))
+                    return
+                consumer.retried += 1
+                logger.warning(
+                    "events.consumer.retry",
+                    consumer=consumer.name,
+                    kind=event.kind,
+                    task_id=event.task_id,
+                    attempt=attempt,
+                    retry_in_s=delay,
+                    error=str(exc),
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _ack(self, consumer: _Consumer, event: TaskEvent) -> None:
+        if not (event.durable and self.outbox is not None):
+            return
+        try:
+            await self.io_pools.run("db", self.outbox.ack, event.event_id, consumer.name)
+        except Exception as exc:
+            # The event is replayed for this consumer on the next start
+            logger.warning("events.outbox.ack_failed", consumer=consumer.name, event_id=event.event_id, error=str(exc))
+
+    def _release(self, task_id: int) -> None:
+        self._settling_refs[task_id] -= 1
+        if self._settling_refs[task_id] > 0:
+            return
+        self._settling_refs.pop(task_id, None)
+        self._settling.pop(task_id, None)
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as exc:
+                logger.debug("events.listener.failed", error=str(exc))
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def settling_tasks(self) -> List[Any]:
+        """Tasks whose workspace is still held by a pending consumer."""
+        return list(self._settling.values())
+
+    def pending_count(self) -> int:
+        """Events queued or in flight across all consumers."""
+        return self._pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-consumer delivery counters and backlog."""
+        return {
+            "pending": self._pending,
+            "settling_task_ids": sorted(self._settling),
+            "dead_letters": list(self._dead[-5:]),
+            "consumers": {
+                consumer.name: {
+                    "kind": consumer.kind,
+                    "backlog": consumer.queue.qsize(),
+                    "delivered": consumer.delivered,
+                    "retried": consumer.retried,
+                    "failed": consumer.failed,
+                    "last_lag_ms": consumer.last_lag_ms,
+                }
+                for group in self._consumers.values()
+                for consumer in group
+            },
+        }
@@ -1,13 +1,15 @@
 """Claude Code SDK executor for task processing"""
 
 import asyncio
+import dataclasses
 import re
 import subprocess
 import time
 from collections import OrderedDict
+from contextlib import aclosing
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple, List, Dict, Iterable
 import shutil
 
 from claude_agent_sdk import (
@@ -21,12 +23,33 @@ from claude_agent_sdk import (
     ToolResultBlock,
     ResultMessage,
     TextBlock,
+    HookMatcher,
+    UserMessage,
 )
 from sleepless_agent.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
 
 from sleepless_agent.utils.live_status import LiveStatusEntry, LiveStatusTracker
+from sleepless_agent.utils.readme_manager import SIDECAR_NAME, ReadmeDocument
+from sleepless_agent.core.agent_session import AgentSession, cache_hit_ratio
+from sleepless_agent.core.client_pool import ClaudeClientPool
+from sleepless_agent.core.context_builder import WorkspaceContextBuilder
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.core.eval_policy import LOCAL, EvaluationDecision, EvaluationPolicy, format_local_evaluation
+from sleepless_agent.core.tool_tracer import ToolCallStats, ToolCallTracer, format_summary
+from sleepless_agent.core.turn_budget import TurnBudget, TurnBudgetAdvisor
+from sleepless_agent.core import prompts
+from sleepless_agent.core.verdict import Verdict, VerdictParser, strip_verdict_block
+from sleepless_agent.storage.checkpoints import CheckpointStore
+from sleepless_agent.storage.fingerprint import workspace_fingerprint
+from sleepless_agent.storage.manifest import WorkspaceManifest, scan_workspace
+from sleepless_agent.storage.plan_cache import PlanCache
+from sleepless_agent.storage.snapshots import SnapshotStore
+from sleepless_agent.storage.token_usage import TOKEN_FIELDS, TokenUsageStore, model_tokens
+
+# In-memory workspace manifests kept across tasks (project workspaces are reused)
+MAX_CACHED_MANIFESTS = 32
 
 
 class ClaudeCodeExecutor:
@@ -38,6 +61,15 @@ class ClaudeCodeExecutor:
         default_timeout: int = 3600,
         live_status_tracker: Optional[LiveStatusTracker] = None,
         default_model: str = "claude-sonnet-4-5-20250929",
+        checkpoint_store: Optional[CheckpointStore] = None,
+        plan_cache: Optional[PlanCache] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        context_builder: Optional[WorkspaceContextBuilder] = None,
+        turn_advisor: Optional[TurnBudgetAdvisor] = None,
+        eval_policy: Optional[EvaluationPolicy] = None,
+        client_pool: Optional[ClaudeClientPool] = None,
+        token_usage: Optional[TokenUsageStore] = None,
+        io_pools: Optional[BlockingIOPools] = None,
     ):
         """Initialize Claude Code executor
 
@@ -45,6 +77,22 @@ class ClaudeCodeExecutor:
             workspace_root: Root directory for task workspaces
             default_timeout: Default timeout in seconds (not used by SDK directly)
             default_model: Default Claude model to use for all agents
+            checkpoint_store: Optional store used to persist finished phases so an
+                interrupted task resumes from the last completed phase
+            plan_cache: Optional cache of planner output reused for the same
+                task description on an unchanged workspace
+            snapshot_store: Optional content-addressed store used to link the
+                project source into REFINE workspaces instead of copying it
+            context_builder: Builds the token-budgeted planner context; a
+                default-budget builder is used if omitted
+            turn_advisor: Optional advisor choosing per-phase turn caps and
+                deadlines from recorded phase usage; fixed caps if omitted
+            eval_policy: Optional policy replacing the model evaluator with
+                local checks for low-risk tasks; always evaluates in full if omitted
+            client_pool: Optional pool of pre-spawned CLI processes that phases
+                check out instead of spawning one per query()
+            token_usage: Optional store receiving each phase's token counts per model
+            io_pools: Thread pools for database, filesystem and CLI probe calls
         """
         self.workspace_root = Path(workspace_root)
         self.default_timeout = default_timeout
@@ -52,6 +100,31 @@ class ClaudeCodeExecutor:
         self.workspace_root.mkdir(parents=True, exist_ok=True)
         self.live_status_tracker = live_status_tracker
         self._live_context: Dict[int, Dict[str, Optional[str]]] = {}
+        self.checkpoint_store = checkpoint_store
+        self.plan_cache = plan_cache
+        self.snapshot_store = snapshot_store
+        self.context_builder = context_builder or WorkspaceContextBuilder()
+        self.turn_advisor = turn_advisor
+        self.eval_policy = eval_policy
+        self.client_pool = client_pool
+        self.token_usage = token_usage
+        self.io_pools = io_pools or BlockingIOPools()
+        # Shared so its usage cache is reused across tasks
+        self._usage_checker = None
+        self._usage_lock = asyncio.Lock()
+        # task_id -> SDK client session shared by the task's phases (session mode)
+        self._sessions: Dict[int, AgentSession] = {}
+        # task_id -> (monotonic, wall-clock UTC) of the last sign of progress
+        self._heartbeats: Dict[int, Tuple[float, datetime]] = {}
+        # Phase-start listeners (e.g. the plan prefetcher) and in-flight prefetches
+        self._phase_listeners: List[Callable[[int, str], None]] = []
+        self._prefetching: Dict[int, asyncio.Event] = {}
+        self.prefetch_stats: Dict[str, int] = {"used": 0, "discarded": 0}
+        # Worker tool-call histograms summed over all tasks
+        self.tool_stats = ToolCallStats()
+        # Per-workspace file manifests used to diff the worker phase
+        self.manifest_dir = self.workspace_root / "data" / "manifests"
+        self._manifests: "OrderedDict[str, WorkspaceManifest]" = OrderedDict()
 
         # Create workspace subdirectories
         self.tasks_dir = self.workspace_root / "tasks"
@@ -62,11 +135,19 @@ class ClaudeCodeExecutor:
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         self.shared_dir.mkdir(parents=True, exist_ok=True)
 
-        # Verify Claude Code is available
-        self._verify_claude_cli()
+        # Claude Code availability is verified on first use (or by a deferred
+        # startup probe) instead of spawning the CLI during construction.
+        self._cli_verified = False
 
         logger.info("executor.init", workspace=str(self.workspace_root))
 
+    def ensure_cli_available(self) -> None:
+        """Verify the Claude Code CLI once; later calls are no-ops."""
+        if self._cli_verified:
+            return
+        self._verify_claude_cli()
+        self._cli_verified = True
+
     def _verify_claude_cli(self):
         """Verify Claude Code CLI is available"""
         try:
@@ -90,6 +171,22 @@ class ClaudeCodeExecutor:
             logger.warning("executor.cli.verify_failed", error=str(e))
             # Don't fail initialization - let it fail on actual execution if needed
 
+    # ------------------------------------------------------------------ Heartbeats
+    def _heartbeat(self, task_id: int) -> None:
+        """Record that a task is making progress (an SDK message arrived)."""
+        self._heartbeats[task_id] = (time.monotonic(), datetime.now(timezone.utc).replace(tzinfo=None))
+
+    def seconds_since_heartbeat(self, task_id: int) -> Optional[float]:
+        """Seconds since the task's last heartbeat, or None if it has none."""
+        beat = self._heartbeats.get(task_id)
+        if beat is None:
+            return None
+        return time.monotonic() - beat[0]
+
+    def get_heartbeats(self) -> Dict[int, datetime]:
+        """Wall-clock time of the last heartbeat of every running task."""
+        return {task_id: beat[1] for task_id, beat in list(self._heartbeats.items())}
+
     # ------------------------------------------------------------------ Live status helpers
     def _live_update(
         self,
@@ -175,6 +272,170 @@ class ClaudeCodeExecutor:
             status="completed",
         )
 
+    # ------------------------------------------------------------------ Phase events
+    def add_phase_listener(self, callback: Callable[[int, str], None]) -> None:
+        """Call ``callback(task_id, phase)`` whenever a workflow phase starts."""
+        self._phase_listeners.append(callback)
+
+    def _notify_phase_start(self, task_id: int, phase: str) -> None:
+        for callback in list(self._phase_listeners):
+            try:
+                callback(task_id, phase)
+            except Exception as exc:
+                logger.debug("executor.phase_listener.failed", task_id=task_id, phase=phase, error=str(exc))
+
+    async def _load_checkpoints(self, task_id: int) -> Dict[str, Dict[str, Any]]:
+        """Load checkpoints of previously finished phases for a task."""
+        if not self.checkpoint_store:
+            return {}
+        try:
+            return await self.io_pools.run("db", self.checkpoint_store.load, task_id)
+        except Exception as exc:
+            logger.warning("executor.checkpoint.load_failed", task_id=task_id, error=str(exc))
+            return {}
+
+    async def _run_checkpointed_phase(
+        self,
+        task_id: int,
+        phase: str,
+        checkpoints: Dict[str, Dict[str, Any]],
+        run: Callable[[], Awaitable[tuple]],
+        budget: Optional[TurnBudget] = None,
+    ) -> tuple:
+        """Return a phase's result from its checkpoint, or run it and checkpoint the result.
+
+        Args:
+            task_id: Task ID
+            phase: Phase name (planner, worker, evaluator)
+            checkpoints: Checkpoints loaded for this task
+            run: Zero-argument coroutine factory executing the phase
+            budget: Turn budget the phase runs under; its deadline is enforced
+                and the run's usage is recorded for future budgets
+
+        Raises:
+            TimeoutError: If the phase overruns its budgeted deadline
+
+        Returns:
+            The phase's result tuple (sets are restored as sorted lists)
+        """
+        self._notify_phase_start(task_id, phase)
+        cached = checkpoints.get(phase)
+        if cached is not None and "result" in cached:
+            logger.info("task.phase.resumed", task_id=task_id, phase=phase, source="checkpoint")
+            self._live_update(
+                task_id,
+                phase=phase,
+                prompt=f"Resumed {phase} phase from checkpoint",
+                answer="",
+                status="running",
+            )
+            return tuple(cached["result"])
+
+        started = time.monotonic()
+        deadline = budget.deadline_seconds if budget and self.turn_advisor and self.turn_advisor.enforce_deadlines else None
+        try:
+            result = await asyncio.wait_for(run(), timeout=deadline) if deadline else await run()
+        except asyncio.TimeoutError:
+            logger.warning(
+                "task.phase.deadline_exceeded",
+                task_id=task_id,
+                phase=phase,
+                deadline_s=int(deadline),
+                source=budget.source,
+            )
+            await self._record_phase_usage(task_id, budget, {}, False, started)
+            raise TimeoutError(f"{phase} phase exceeded its {int(deadline)}s deadline") from None
+
+        metrics = result[-1] if result and isinstance(result[-1], dict) else {}
+        # Cached plans and local evaluations say nothing about turn usage
+        if metrics.get("plan_cache") != "hit" and metrics.get("evaluation_mode") != LOCAL:
+            # Worker results carry an exit code; the other phases succeed by returning
+            success = result[3] == 0 if phase == "worker" else True
+            await self._record_phase_usage(task_id, budget, metrics, success, started)
+
+        if self.checkpoint_store:
+            payload = {
+                "result": [sorted(item) if isinstance(item, set) else item for item in result],
+            }
+            try:
+                await self.io_pools.run("db", self.checkpoint_store.save, task_id, phase, payload)
+            except Exception as exc:
+                logger.warning("executor.checkpoint.save_failed", task_id=task_id, phase=phase, error=str(exc))
+        return result
+
+    async def _phase_budget(
+        self,
+        phase: str,
+        default_max_turns: int,
+        task_type: str,
+        priority: str,
+        project_id: Optional[str],
+    ) -> TurnBudget:
+        """Turn cap and deadline for a phase; the configured cap if there is no advisor."""
+        if self.turn_advisor is None:
+            return TurnBudget(phase=phase, max_turns=default_max_turns, default_max_turns=default_max_turns)
+        try:
+            return await self.io_pools.run(
+                "db",
+                self.turn_advisor.advise,
+                phase,
+                default_max_turns,
+                task_type=task_type,
+                priority=priority,
+                project_id=project_id,
+            )
+        except Exception as exc:
+            logger.warning("executor.turn_budget.failed", phase=phase, error=str(exc))
+            return TurnBudget(phase=phase, max_turns=default_max_turns, default_max_turns=default_max_turns)
+
+    async def _record_phase_usage(
+        self,
+        task_id: int,
+        budget: Optional[TurnBudget],
+        metrics: Dict[str, Any],
+        success: bool,
+        started: float,
+    ) -> None:
+        if self.turn_advisor is None or budget is None:
+            return
+        try:
+            await self.io_pools.run(
+                "db",
+                self.turn_advisor.record,
+                budget,
+                task_id,
+                metrics,
+                success=success,
+                duration_ms=int((time.monotonic() - started) * 1000),
+            )
+        except Exception as exc:
+            logger.warning("executor.phase_usage.record_failed", task_id=task_id, phase=budget.phase, error=str(exc))
+
+    def _checkpointed_phases(self, task_id: int) -> set:
+        """Phases of a task that have a checkpoint (empty without a checkpoint store)."""
+        if not self.checkpoint_store:
+            return set()
+        try:
+            return set(self.checkpoint_store.get_phases([task_id]).get(task_id, []))
+        except Exception as exc:
+            logger.warning("executor.checkpoint.load_failed", task_id=task_id, error=str(exc))
+            return set()
+
+    def _discard_checkpoints(self, task_id: int, phases: Iterable[str]) -> None:
+        # Not best-effort: resuming past these phases on a fresh copy would report lost work as done
+        phases = sorted(phases)
+        self.checkpoint_store.clear(task_id, phases)
+        logger.info("task.checkpoints.discarded", task_id=task_id, phases=phases, reason="workspace_recreated")
+
+    def clear_checkpoints(self, task_id: int) -> None:
+        """Drop a task's phase checkpoints once its outcome is recorded."""
+        if not self.checkpoint_store:
+            return
+        try:
+            self.checkpoint_store.clear(task_id)
+        except Exception as exc:
+            logger.debug(f"Failed to clear checkpoints for task {task_id}: {exc}")
+
     def _get_readme_template(self, template_type: str = "task") -> str:
         """Get README template content
 
@@ -229,10 +490,28 @@ class ClaudeCodeExecutor:
         Returns:
             Path to README.md
         """
-        readme_path = workspace / "README.md"
+        return self._open_readme(workspace, task_id, task_description, project_id, project_name).path
 
-        if readme_path.exists():
-            return readme_path
+    def _open_readme(self, workspace: Path, task_id: int, task_description: str,
+                     project_id: Optional[str] = None, project_name: Optional[str] = None) -> ReadmeDocument:
+        """Load the workspace README for in-memory editing, creating it if missing
+
+        A new README is written right away because the agents read it; later
+        edits stay in memory until :meth:`_flush_readme` at the end of the task.
+
+        Args:
+            workspace: Workspace path
+            task_id: Task ID
+            task_description: Task description
+            project_id: Optional project ID
+            project_name: Optional project name
+
+        Returns:
+            The parsed README document
+        """
+        readme = ReadmeDocument.load(workspace)
+        if readme.exists:
+            return readme
 
         try:
             template = self._get_readme_template("task")
@@ -246,111 +525,94 @@ class ClaudeCodeExecutor:
                 CREATED_AT=datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
             )
 
-            readme_path.write_text(content)
-            logger.debug("executor.readme.created", path=str(readme_path))
+            readme.set_text(content)
+            readme.save()
+            logger.debug("executor.readme.created", path=str(readme.path))
         except Exception as e:
-            logger.warning("executor.readme.create_failed", error=str(e), path=str(readme_path))
+            logger.warning("executor.readme.create_failed", error=str(e), path=str(readme.path))
 
-        return readme_path
+        return readme
 
-    def _update_readme_with_plan(self, workspace: Path, plan_content: str) -> None:
-        """Update README.md with plan content from planner phase
+    def _flush_readme(self, readme: ReadmeDocument) -> None:
+        """Write the task's buffered README edits and sidecar in one go"""
+        try:
+            if readme.save():
+                logger.debug("executor.readme.flushed", path=str(readme.path))
+        except Exception as e:
+            logger.warning("executor.readme.flush_failed", error=str(e), path=str(readme.path))
+
+    def _update_readme_with_plan(self, readme: ReadmeDocument, plan_content: str) -> None:
+        """Fill the README plan section with the planner output (buffered)
 
         Args:
-            workspace: Workspace path
+            readme: Task README document
             plan_content: Plan content from planner agent
         """
-        readme_path = workspace / "README.md"
-
-        if not readme_path.exists():
-            logger.warning("executor.readme.missing", path=str(readme_path))
-            return
-
-        try:
-            content = readme_path.read_text()
-
-            # Replace the Plan & Analysis placeholder with actual plan
-            content = re.sub(
-                r'## Plan & Analysis\n\(Generated by planner agent\)',
-                f'## Plan & Analysis\n{plan_content}',
-                content
-            )
-
-            readme_path.write_text(content)
-            logger.debug("executor.readme.plan_updated", path=str(readme_path))
-
-        except Exception as e:
-            logger.warning("executor.readme.plan_update_failed", error=str(e), path=str(readme_path))
+        # Only the placeholder is replaced; a project README keeps its first plan
+        readme.replace_body("Plan & Analysis", plan_content, only_if="(Generated by planner agent)")
 
     def _read_workspace_context(self, workspace: Path) -> str:
         """Read workspace context (README, existing files)
 
+        The README is trimmed to its most relevant sections and the file list
+        summarized so the result fits the configured token budget.
+
         Args:
             workspace: Workspace path
 
         Returns:
             Context string for planner
         """
-        context_parts = []
-
-        # Read README if exists
-        readme_path = workspace / "README.md"
-        if readme_path.exists():
-            try:
-                context_parts.append("## Project README\n" + readme_path.read_text())
-            except Exception as e:
-                logger.warning("executor.readme.read_failed", error=str(e), path=str(readme_path))
-
-        # List main files/directories
         try:
-            items = list(workspace.iterdir())
-            file_list = [item.name for item in items if item.name not in {".git", ".gitignore", "__pycache__"}]
-            if file_list:
-                context_parts.append(f"\n## Workspace Contents\n- " + "\n- ".join(sorted(file_list)))
+            return self.context_builder.build(workspace)
         except Exception as e:
-            logger.warning("executor.workspace.list_failed", error=str(e), workspace=str(workspace))
-
-        return "\n".join(context_parts) if context_parts else "Empty workspace"
-
-    def _update_readme_task_history(self, workspace: Path, task_id: int,
-                                    description: str, status: str,
+            logger.warning("executor.workspace.context_failed", error=str(e), workspace=str(workspace))
+            return "Empty workspace"
+
+    @staticmethod
+    def _refinement_context(task_context: Optional[Dict[str, Any]]) -> str:
+        """Planner context section with the refined task's evaluator verdict, if any"""
+        verdict = (task_context or {}).get("refines_verdict")
+        if not verdict:
+            return ""
+        lines = [
+            "",
+            f"## Previous Evaluation (task #{task_context.get('refines_task_id')})",
+            f"Status: {verdict.get('status')}",
+        ]
+        if verdict.get("outstanding_items"):
+            lines.append("Outstanding items:")
+            lines.extend(f"- {item}" for item in verdict["outstanding_items"])
+        if verdict.get("recommendations"):
+            lines.append("Recommendations:")
+            lines.extend(f"- {item}" for item in verdict["recommendations"])
+        return "\n".join(lines)
+
+    def _update_readme_task_history(self, readme: ReadmeDocument,
+                                    status: str,
                                     files_modified: int = 0,
                                     git_info: Optional[str] = None,
                                     execution_time: int = 0) -> None:
-        """Update README.md with task completion history
+        """Add a task completion entry to the README execution summary (buffered)
 
         Args:
-            workspace: Workspace path
-            task_id: Task ID
-            description: Task description
+            readme: Task README document
             status: 'completed' or 'failed'
             files_modified: Number of files modified
             git_info: Git commit/PR information
             execution_time: Execution time in seconds
         """
-        readme_path = workspace / "README.md"
-
-        try:
-            if not readme_path.exists():
-                return
-
-            content = readme_path.read_text()
-
-            # Add to execution summary
-            status_icon = "✅" if status == "completed" else "❌"
-            git_line = f"\n- Git: {git_info}" if git_info else ""
-
-            update = f"\n\n### Execution {datetime.now(timezone.utc).replace(tzinfo=None).strftime('%Y-%m-%d %H:%M:%S')}\n"
-            update += f"- Status: {status_icon} {status.upper()}\n"
-            update += f"- Files Modified: {files_modified}\n"
-            update += f"- Duration: {execution_time}s"
-            update += git_line
-
-            content = content.replace("## Execution Summary", f"## Execution Summary{update}\n\n## Execution Summary")
-            readme_path.write_text(content)
-            logger.debug("executor.readme.history_updated", path=str(readme_path))
-        except Exception as e:
-            logger.warning("executor.readme.history_failed", error=str(e), path=str(readme_path))
+        status_icon = "✅" if status == "completed" else "❌"
+        lines = [
+            f"- Status: {status_icon} {status.upper()}",
+            f"- Files Modified: {files_modified}",
+            f"- Duration: {execution_time}s",
+        ]
+        if git_info:
+            lines.append(f"- Git: {git_info}")
+
+        title = f"Execution {datetime.now(timezone.utc).replace(tzinfo=None).strftime('%Y-%m-%d %H:%M:%S')}"
+        readme.add_entry("Execution Summary", title, "\n".join(lines))
 
     def _extract_status_from_evaluation(self, evaluation_text: str) -> str:
         """Extract completion status from evaluator output
@@ -393,7 +655,7 @@ class ClaudeCodeExecutor:
             evaluation_text: Evaluator phase output
 
         Returns:
-            List of outstanding items
+            List of outstanding items, without their bullets
         """
         items = []
         lines = evaluation_text.split('\n')
@@ -407,7 +669,8 @@ class ClaudeCodeExecutor:
             if in_outstanding:
                 # Check if line is a list item or checkbox
                 if re.match(r'^\s*[-*❌✓]\s+', line) or re.match(r'^\s*\[\s*[x\s]\s*\]\s+', line):
-                    items.append(line.strip())
+                    # Bare items, like those of a verdict block
+                    items.append(re.sub(r'^\s*(?:[-*❌✓]\s+)?(?:\[\s*[x\s]\s*\]\s+)?', '', line).strip())
                 elif line.strip() == '':
                     in_outstanding = False
 
@@ -422,7 +685,7 @@ class ClaudeCodeExecutor:
             evaluation_text: Evaluator phase output
 
         Returns:
-            List of recommendations
+            List of recommendations, without their bullets
         """
         items = []
         lines = evaluation_text.split('\n')
@@ -436,7 +699,7 @@ class ClaudeCodeExecutor:
             if in_recommendations:
                 # Check if line is a list item
                 if re.match(r'^\s*[-*]\s+', line):
-                    items.append(line.strip())
+                    items.append(re.sub(r'^\s*[-*]\s+', '', line).strip())
                 elif line.strip() == '' or re.match(r'^##', line):
                     in_recommendations = False
 
@@ -444,12 +707,12 @@ class ClaudeCodeExecutor:
 
     def _update_readme_with_evaluation(
         self,
-        workspace: Path,
+        readme: ReadmeDocument,
         status: str,
         outstanding_items: list,
         recommendations: list,
     ) -> None:
-        """Update README.md with evaluation results
+        """Record evaluation results in the README (buffered)
 
         Replaces sections:
         - ## Status: PENDING → ## Status: PARTIAL
@@ -457,68 +720,15 @@ class ClaudeCodeExecutor:
         - ## Recommendations
 
         Args:
-            workspace: Workspace path
+            readme: Task README document
             status: Completion status
-            outstanding_items: List of outstanding items
-            recommendations: List of recommendations
+            outstanding_items: List of outstanding items (without bullets)
+            recommendations: List of recommendations (without bullets)
         """
-        readme_path = workspace / "README.md"
-
-        if not readme_path.exists():
-            logger.warning("executor.readme.missing", path=str(readme_path))
-            return
-
-        try:
-            content = readme_path.read_text()
-
-            # Update status heading
-            content = re.sub(
-                r'## Status: \w+',
-                f'## Status: {status}',
-                content
-            )
-
-            # Update outstanding items
-            if outstanding_items:
-                items_text = '\n'.join(outstanding_items)
-                content = re.sub(
-                    r'## Outstanding Items\n(.*?)(?=##)',
-                    f'## Outstanding Items\n{items_text}\n\n',
-                    content,
-                    flags=re.DOTALL
-                )
-            else:
-                # Clear items if none
-                content = re.sub(
-                    r'## Outstanding Items\n(.*?)(?=##)',
-                    f'## Outstanding Items\n(None)\n\n',
-                    content,
-                    flags=re.DOTALL
-                )
-
-            # Update recommendations
-            if recommendations:
-                rec_text = '\n'.join(recommendations)
-                content = re.sub(
-                    r'## Recommendations\n(.*?)(?=##)',
-                    f'## Recommendations\n{rec_text}\n\n',
-                    content,
-                    flags=re.DOTALL
-                )
-            else:
-                # Clear recommendations if none
-                content = re.sub(
-                    r'## Recommendations\n(.*?)(?=##)',
-                    f'## Recommendations\n(None)\n\n',
-                    content,
-                    flags=re.DOTALL
-                )
-
-            readme_path.write_text(content)
-            logger.debug("executor.readme.status_updated", status=status, path=str(readme_path))
-
-        except Exception as e:
-            logger.warning("executor.readme.evaluation_failed", error=str(e), path=str(readme_path))
+        readme.set_status(status)
+        readme.replace_body("Outstanding Items", "\n".join(f"- {item}" for item in outstanding_items) or "(None)")
+        readme.replace_body("Recommendations", "\n".join(f"- {item}" for item in recommendations) or "(None)")
+        logger.debug("executor.readme.status_updated", status=status, path=str(readme.path))
 
     def _generate_task_name_slug(self, description: str) -> str:
         """Generate a slug from task description
@@ -592,6 +802,131 @@ class ClaudeCodeExecutor:
 
         return allowed
 
+    def _client_options(
+        self,
+        workspace: Path,
+        workspace_task_type: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> ClaudeAgentOptions:
+        """Options shared by all phases of a task; phases add tools, mode and turn cap.
+
+        Every phase gets the copy-on-write hooks (inert for phases without
+        Write/Edit) so all of them match the same pooled or session client.
+        """
+        return ClaudeAgentOptions(
+            cwd=str(workspace),
+            # Workspace isolation
+            add_dirs=self._get_allowed_directories(
+                workspace=workspace,
+                workspace_task_type=workspace_task_type,
+                project_id=project_id,
+            ),
+            model=self.default_model,
+            hooks=self._copy_on_write_hooks(workspace, workspace_task_type),
+        )
+
+    async def _agent_messages(
+        self,
+        task_id: int,
+        phase: str,
+        prompt: str,
+        options: ClaudeAgentOptions,
+        metrics: Dict[str, Any],
+        session_prompt: Optional[str] = None,
+        session_needs: Iterable[str] = (),
+        project_id: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Yield a phase's SDK messages from the task's session, a pooled client, or query().
+
+        ``session_prompt`` replaces ``prompt`` when the session already holds
+        the output of ``session_needs``. A pooled client is returned to the
+        pool when the phase ends; iterate inside ``aclosing`` so that also
+        happens when the caller's loop raises or stops early. Time to the
+        first message (which includes spawning the CLI, unless a warm client
+        was used) and token counts are added to ``metrics``; token counts are
+        also stored per model.
+        """
+        started = time.monotonic()
+        session = self._sessions.get(task_id)
+        pooled = False
+        if session is not None:
+            try:
+                await session.connect()
+            except Exception as exc:
+                logger.warning("session.connect_failed", task_id=task_id, phase=phase, error=str(exc))
+                self._sessions.pop(task_id, None)
+                session = None
+        elif self.client_pool is not None and self.client_pool.active:
+            try:
+                session, warm = await self.client_pool.checkout(options, task_id)
+                pooled = True
+                metrics[f"{phase}_warm_client"] = warm
+            except Exception as exc:
+                logger.warning("client_pool.checkout_failed", task_id=task_id, phase=phase, error=str(exc))
+
+        if session is not None:
+            use_short = session_prompt is not None and session.has_context(session_needs)
+            sent = session_prompt if use_short else prompt
+            stream = session.run(phase, sent, options.max_turns)
+        else:
+            sent = prompt
+            stream = query(prompt=prompt, options=options)
+        metrics[f"{phase}_prompt_chars"] = len(sent)
+
+        first = True
+        try:
+            async for message in stream:
+                if first:
+                    metrics[f"{phase}_startup_ms"] = int((time.monotonic() - started) * 1000)
+                    first = False
+                if isinstance(message, ResultMessage):
+                    await self._record_tokens(task_id, phase, project_id, message, options, metrics)
+                yield message
+        except BaseException:
+            if pooled:
+                await self.client_pool.release(session, healthy=False)
+            elif session is not None:
+                # The conversation state is unknown; later phases fall back to query()
+                self._sessions.pop(task_id, None)
+            raise
+        if pooled:
+            await self.client_pool.release(session)
+
+    async def _record_tokens(
+        self,
+        task_id: int,
+        phase: str,
+        project_id: Optional[str],
+        message: ResultMessage,
+        options: ClaudeAgentOptions,
+        metrics: Dict[str, Any],
+    ) -> None:
+        """Add a phase result's token counts to ``metrics`` and store them per model."""
+        rows = model_tokens(message.usage, message.model_usage, options.model or self.default_model)
+        if not rows:
+            return
+        for name in TOKEN_FIELDS:
+            metrics[f"{phase}_{name}"] = sum(getattr(row, name) for row in rows)
+        prompt_tokens = sum(row.prompt_tokens for row in rows)
+        metrics[f"{phase}_prompt_tokens"] = prompt_tokens
+        metrics[f"{phase}_models"] = sorted(row.model for row in rows)
+        logger.debug(
+            "executor.prompt_cache",
+            task_id=task_id,
+            phase=phase,
+            prompt_tokens=prompt_tokens,
+            cache_read_tokens=metrics[f"{phase}_cache_read_tokens"],
+            hit_ratio=cache_hit_ratio(metrics[f"{phase}_cache_read_tokens"], prompt_tokens),
+        )
+        if self.token_usage is None:
+            return
+        try:
+            await self.io_pools.run(
+                "db", self.token_usage.record, task_id=task_id, phase=phase, project_id=project_id, tokens=rows
+            )
+        except Exception as exc:
+            logger.warning("executor.token_usage.record_failed", task_id=task_id, phase=phase, error=str(exc))
+
     async def _execute_planner_phase(
         self,
         task_id: int,
@@ -601,6 +936,7 @@ class ClaudeCodeExecutor:
         config_max_turns: int = 10,
         workspace_task_type: Optional[str] = None,
         project_id: Optional[str] = None,
+        prior_plan: Optional[str] = None,
     ) -> tuple[str, dict]:
         """Execute planner agent phase
 
@@ -611,56 +947,12 @@ class ClaudeCodeExecutor:
             config_max_turns: Maximum turns for this phase
             workspace_task_type: Task type ("new" or "refine")
             project_id: Optional project ID for access control
+            prior_plan: Plan for a closely matching earlier task, used as a starting point
 
         Returns:
             Tuple of (plan_text, usage_metrics)
         """
-        # Add workspace task type context
-        task_type_note = ""
-        if workspace_task_type == "refine":
-            task_type_note = """
-## 🔧 REFINE TASK
-This workspace contains a copy of the sleepless-agent source code. Your goal is to IMPROVE the existing codebase:
-- Analyze and understand the current implementation
-- Refactor, optimize, or enhance existing code
-- Fix bugs or issues
-- Improve code quality, tests, or documentation
-- Add missing features to existing modules
-
-The changes you make should enhance the existing codebase and can be merged back to the main project.
-"""
-        elif workspace_task_type == "new":
-            task_type_note = """
-## 🆕 NEW TASK
-This is a fresh workspace. Your goal is to BUILD new functionality from scratch:
-- Design and implement new features
-- Create new modules or tools
-- Build standalone projects or prototypes
-- Experiment with new ideas
-"""
-
-        planner_prompt = f"""You are a planning expert. Analyze the task and workspace context, then create a structured plan.
-{task_type_note}
-## Task
-{description}
-
-## Workspace Context
-{context}
-
-## Your Task
-1. Analyze the task requirements and workspace
-2. Identify what needs to be done
-3. Create a detailed TODO list with specific, actionable items
-4. Note any dependencies between tasks
-5. Estimate effort level for each TODO item
-
-Output should be:
-- Executive summary (2-3 sentences)
-- Analysis of the task
-- Structured TODO list (numbered, with clear descriptions)
-- Notes on approach and strategy
-- Any assumptions or potential blockers
-"""
+        planner_prompt = prompts.planner_prompt(description, context, workspace_task_type, prior_plan)
 
         prompt_preview = " ".join(planner_prompt.split())
 
@@ -682,48 +974,43 @@ Output should be:
                 status="running",
             )
 
-            # Get allowed directories for workspace isolation
-            allowed_dirs = self._get_allowed_directories(
-                workspace=workspace,
-                workspace_task_type=workspace_task_type,
-                project_id=project_id,
-            )
-
-            options = ClaudeAgentOptions(
-                cwd=str(workspace),
-                add_dirs=allowed_dirs,
+            options = dataclasses.replace(
+                self._client_options(workspace, workspace_task_type, project_id),
                 allowed_tools=["Read", "Glob", "Grep"],
                 permission_mode="acceptEdits",
                 max_turns=config_max_turns,
-                model=self.default_model,
             )
 
-            async for message in query(prompt=planner_prompt, options=options):
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            text = block.text.strip()
-                            if text:
-                                output_parts.append(text)
-                                self._live_update(
-                                    task_id,
-                                    phase="planner",
-                                    prompt=prompt_preview,
-                                    answer=text,
-                                    status="running",
-                                )
-
-                elif isinstance(message, ResultMessage):
-                    usage_metrics["planner_cost_usd"] = message.total_cost_usd
-                    usage_metrics["planner_duration_ms"] = message.duration_ms
-                    usage_metrics["planner_turns"] = message.num_turns
-
-                    logger.debug(
-                        "executor.planner.turn_metrics",
-                        duration_ms=message.duration_ms,
-                        turns=message.num_turns,
-                        cost_usd=message.total_cost_usd,
-                    )
+            async with aclosing(self._agent_messages(
+                task_id, "planner", planner_prompt, options, usage_metrics, project_id=project_id
+            )) as messages:
+                async for message in messages:
+                    self._heartbeat(task_id)
+                    if isinstance(message, AssistantMessage):
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                text = block.text.strip()
+                                if text:
+                                    output_parts.append(text)
+                                    self._live_update(
+                                        task_id,
+                                        phase="planner",
+                                        prompt=prompt_preview,
+                                        answer=text,
+                                        status="running",
+                                    )
+
+                    elif isinstance(message, ResultMessage):
+                        usage_metrics["planner_cost_usd"] = message.total_cost_usd
+                        usage_metrics["planner_duration_ms"] = message.duration_ms
+                        usage_metrics["planner_turns"] = message.num_turns
+
+                        logger.debug(
+                            "executor.planner.turn_metrics",
+                            duration_ms=message.duration_ms,
+                            turns=message.num_turns,
+                            cost_usd=message.total_cost_usd,
+                        )
 
             plan_text = "\n".join(output_parts)
             execution_time = int(time.time() - start_time)
@@ -742,6 +1029,85 @@ Output should be:
             logger.error("executor.planner.failed", error=str(e))
             raise
 
+    async def _plan_with_cache(
+        self,
+        task_id: int,
+        workspace: Path,
+        description: str,
+        context: str,
+        config_max_turns: int = 10,
+        workspace_task_type: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> tuple[str, dict]:
+        """Run the planner, reusing a cached plan for the same task and workspace.
+
+        A fresh cache hit is returned without calling the planner. A near hit
+        (similar description, or the same one on a changed workspace) is
+        passed to the planner as a prior plan to revise.
+        """
+        if self.plan_cache is None:
+            return await self._execute_planner_phase(
+                task_id=task_id,
+                workspace=workspace,
+                description=description,
+                context=context,
+                config_max_turns=config_max_turns,
+                workspace_task_type=workspace_task_type,
+                project_id=project_id,
+            )
+
+        # README.md (and its sidecar) is rewritten with the plan itself, so it must not count
+        fingerprint = await self.io_pools.run("fs", workspace_fingerprint, workspace, ("README.md", SIDECAR_NAME))
+        try:
+            hit = await self.io_pools.run(
+                "db", self.plan_cache.lookup, description, fingerprint, workspace_task_type
+            )
+        except Exception as exc:
+            logger.warning("task.plan.cache_lookup_failed", task_id=task_id, error=str(exc))
+            hit = None
+
+        if hit is not None and hit.fresh:
+            logger.info(
+                "task.plan.cache_hit",
+                task_id=task_id,
+                age_s=int(hit.age_seconds),
+                saved_cost_usd=hit.metrics.get("planner_cost_usd"),
+            )
+            self._live_update(
+                task_id,
+                phase="planner",
+                prompt="[cached plan]",
+                answer=hit.plan_text,
+                status="completed",
+            )
+            return hit.plan_text, {
+                "planner_cost_usd": 0.0,
+                "planner_duration_ms": 0,
+                "planner_turns": 0,
+                "plan_cache": "hit",
+            }
+
+        if hit is not None:
+            logger.info("task.plan.cache_near_hit", task_id=task_id, similarity=hit.similarity)
+        plan_text, planner_metrics = await self._execute_planner_phase(
+            task_id=task_id,
+            workspace=workspace,
+            description=description,
+            context=context,
+            config_max_turns=config_max_turns,
+            workspace_task_type=workspace_task_type,
+            project_id=project_id,
+            prior_plan=hit.plan_text if hit is not None else None,
+        )
+        try:
+            await self.io_pools.run(
+                "db", self.plan_cache.store, description, fingerprint, workspace_task_type, plan_text, planner_metrics
+            )
+        except Exception as exc:
+            logger.warning("task.plan.cache_store_failed", task_id=task_id, error=str(exc))
+        planner_metrics["plan_cache"] = "near_hit" if hit is not None else "miss"
+        return plan_text, planner_metrics
+
     async def _execute_worker_phase(
         self,
         task_id: int,
@@ -765,23 +1131,9 @@ Output should be:
         Returns:
             Tuple of (output_text, files_modified, commands_executed, exit_code, usage_metrics)
         """
-        worker_prompt = f"""You are an expert developer/engineer. Execute the plan below to complete the task.
-
-## Task
-{description}
-
-## Plan to Execute
-{plan_text}
-
-## Instructions
-1. Execute the TODO items from the plan
-2. Use TodoWrite to track progress on each item
-3. Make changes using available tools (Read, Write, Edit, Bash)
-4. Test your changes as needed
-5. Provide a summary of what you completed
-
-Please work through the plan systematically and update TodoWrite as you complete each item.
-"""
+        worker_prompt = prompts.worker_prompt(description, plan_text)
+        # In session mode the task and plan are already in the conversation
+        worker_session_prompt = prompts.worker_session_prompt()
 
         prompt_preview = " ".join(worker_prompt.split())
 
@@ -794,10 +1146,11 @@ Please work through the plan systematically and update TodoWrite as you complete
             "worker_duration_ms": None,
             "worker_turns": None,
         }
-        tool_usage_counts: "OrderedDict[str, int]" = OrderedDict()
+        tracer = ToolCallTracer(task_id)
 
         try:
-            files_before = self._get_workspace_files(workspace)
+            manifest = self._workspace_manifest(workspace)
+            await self.io_pools.run("fs", manifest.refresh)
             start_time = time.time()
 
             self._live_update(
@@ -808,91 +1161,115 @@ Please work through the plan systematically and update TodoWrite as you complete
                 status="running",
             )
 
-            # Get allowed directories for workspace isolation
-            allowed_dirs = self._get_allowed_directories(
-                workspace=workspace,
-                workspace_task_type=workspace_task_type,
-                project_id=project_id,
-            )
-
-            options = ClaudeAgentOptions(
-                cwd=str(workspace),
-                add_dirs=allowed_dirs,
+            options = dataclasses.replace(
+                self._client_options(workspace, workspace_task_type, project_id),
                 allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep", "TodoWrite"],
                 permission_mode="acceptEdits",
                 max_turns=config_max_turns,
-                model=self.default_model,
             )
 
-            async for message in query(prompt=worker_prompt, options=options):
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            text = block.text.strip()
-                            if text:
-                                output_parts.append(text)
-                                self._live_update(
-                                    task_id,
-                                    phase="worker",
-                                    prompt=prompt_preview,
-                                    answer=text,
-                                    status="running",
-                                )
-                        elif isinstance(block, ToolUseBlock):
-                            tool_name = block.name
-                            tool_usage_counts.setdefault(tool_name, 0)
-                            tool_usage_counts[tool_name] += 1
-
-                            if tool_name in ["Write", "Edit"]:
-                                file_path = block.input.get("file_path", "")
-                                if file_path:
-                                    files_modified.add(file_path)
-
-                            elif tool_name == "Bash":
-                                command = block.input.get("command", "")
-                                if command:
-                                    commands_executed.append(command)
-                                self._live_update(
-                                    task_id,
-                                    phase="worker",
-                                    prompt=prompt_preview,
-                                    answer=f"[Bash] {command}",
-                                    status="running",
-                                )
-
-                elif isinstance(message, ResultMessage):
-                    success = not message.is_error
-                    if message.result:
-                        output_parts.append(f"\n[Result: {message.result}]")
-                        self._live_update(
-                            task_id,
-                            phase="worker",
-                            prompt=prompt_preview,
-                            answer=message.result,
-                            status="running",
+            async with aclosing(self._agent_messages(
+                task_id,
+                "worker",
+                worker_prompt,
+                options,
+                usage_metrics,
+                session_prompt=worker_session_prompt,
+                session_needs=("planner",),
+                project_id=project_id,
+            )) as messages:
+                async for message in messages:
+                    self._heartbeat(task_id)
+                    if isinstance(message, AssistantMessage):
+                        tracer.assistant_message()
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                text = block.text.strip()
+                                if text:
+                                    output_parts.append(text)
+                                    self._live_update(
+                                        task_id,
+                                        phase="worker",
+                                        prompt=prompt_preview,
+                                        answer=text,
+                                        status="running",
+                                    )
+                            elif isinstance(block, ToolUseBlock):
+                                tool_name = block.name
+                                tracer.start(block)
+
+                                if tool_name in ["Write", "Edit"]:
+                                    file_path = block.input.get("file_path", "")
+                                    if file_path:
+                                        files_modified.add(file_path)
+
+                                elif tool_name == "Bash":
+                                    command = block.input.get("command", "")
+                                    if command:
+                                        commands_executed.append(command)
+                                    self._live_update(
+                                        task_id,
+                                        phase="worker",
+                                        prompt=prompt_preview,
+                                        answer=f"[Bash] {command}",
+                                        status="running",
+                                    )
+
+                    elif isinstance(message, UserMessage) and isinstance(message.content, list):
+                        for block in message.content:
+                            if isinstance(block, ToolResultBlock):
+                                tracer.finish(block)
+
+                    elif isinstance(message, ResultMessage):
+                        success = not message.is_error
+                        if message.result:
+                            output_parts.append(f"\n[Result: {message.result}]")
+                            self._live_update(
+                                task_id,
+                                phase="worker",
+                                prompt=prompt_preview,
+                                answer=message.result,
+                                status="running",
+                            )
+
+                        usage_metrics["worker_cost_usd"] = message.total_cost_usd
+                        usage_metrics["worker_duration_ms"] = message.duration_ms
+                        usage_metrics["worker_turns"] = message.num_turns
+
+                        logger.debug(
+                            "executor.worker.turn_metrics",
+                            duration_ms=message.duration_ms,
+                            turns=message.num_turns,
+                            cost_usd=message.total_cost_usd,
                         )
 
-                    usage_metrics["worker_cost_usd"] = message.total_cost_usd
-                    usage_metrics["worker_duration_ms"] = message.duration_ms
-                    usage_metrics["worker_turns"] = message.num_turns
-
-                    logger.debug(
-                        "executor.worker.turn_metrics",
-                        duration_ms=message.duration_ms,
-                        turns=message.num_turns,
-                        cost_usd=message.total_cost_usd,
-                    )
-
             output_text = "\n".join(output_parts)
-            files_after = self._get_workspace_files(workspace)
-            new_files = files_after - files_before
-            all_modified_files = files_modified.union(new_files)
+            workspace_diff = await self.io_pools.run("fs", manifest.refresh)
+            all_modified_files = workspace_diff.apply(files_modified, workspace)
+            usage_metrics["worker_files_deleted"] = sorted(workspace_diff.deleted)
+            logger.debug(
+                "executor.worker.workspace_diff",
+                added=len(workspace_diff.added),
+                modified=len(workspace_diff.modified),
+                deleted=len(workspace_diff.deleted),
+                files=workspace_diff.total_files,
+                scan_ms=workspace_diff.scan_ms,
+            )
 
-            if tool_usage_counts:
+            tool_calls = tracer.summary()
+            usage_metrics["worker_tool_calls"] = tool_calls
+            self.tool_stats.add(tool_calls)
+            if tool_calls["tools"]:
                 summary = ", ".join(
-                    f"{name} x{count}" for name, count in tool_usage_counts.items()
+                    f"{name} x{entry['calls']} ({entry['total_ms']}ms)"
+                    for name, entry in tool_calls["tools"].items()
+                )
+                logger.debug(
+                    "executor.worker.tools_summary",
+                    summary=summary,
+                    tool_ms=tool_calls["tool_ms"],
+                    model_ms=tool_calls["model_ms"],
                 )
-                logger.debug("executor.worker.tools_summary", summary=summary)
 
             exit_code = 0 if success else 1
 
@@ -940,35 +1317,11 @@ Please work through the plan systematically and update TodoWrite as you complete
         Returns:
             Tuple of (evaluation_text, status, outstanding_items, recommendations, usage_metrics)
         """
-        evaluator_prompt = f"""You are a quality assurance expert. Evaluate whether the task was completed successfully.
-
-## Task
-{description}
-
-## Original Plan
-{plan_text}
-
-## Worker Output
-{worker_output}
-
-## Changes Made
-- Files Modified: {len(files_modified)}
-- Commands Executed: {len(commands_executed)}
-
-## Your Task
-1. Review the worker output against the original plan
-2. Verify each TODO item was addressed
-3. Check if the task objectives were met
-4. Identify any incomplete items or issues
-5. Provide a comprehensive evaluation summary
-
-Output should include:
-- Completion status (COMPLETE / INCOMPLETE / PARTIAL)
-- Items successfully completed
-- Any outstanding items
-- Quality assessment
-- Recommendations (if any)
-"""
+        evaluator_prompt = prompts.evaluator_prompt(
+            description, plan_text, worker_output, len(files_modified), len(commands_executed)
+        )
+        # In session mode the task, plan and worker output are already in the conversation
+        evaluator_session_prompt = prompts.evaluator_session_prompt(len(files_modified), len(commands_executed))
 
         usage_metrics = {
             "evaluator_cost_usd": None,
@@ -978,6 +1331,7 @@ Output should include:
 
         try:
             output_parts = []
+            verdict_parser = VerdictParser()
             start_time = time.time()
 
             prompt_preview = " ".join(evaluator_prompt.split())
@@ -990,50 +1344,53 @@ Output should include:
                 status="running",
             )
 
-            # Get allowed directories for workspace isolation
-            allowed_dirs = self._get_allowed_directories(
-                workspace=workspace,
-                workspace_task_type=workspace_task_type,
-                project_id=project_id,
-            )
-
-            options = ClaudeAgentOptions(
-                cwd=str(workspace),
-                add_dirs=allowed_dirs,
+            options = dataclasses.replace(
+                self._client_options(workspace, workspace_task_type, project_id),
                 allowed_tools=["Read", "Glob"],
                 permission_mode="acceptEdits",
                 max_turns=config_max_turns,
-                model=self.default_model,
             )
 
-            async for message in query(prompt=evaluator_prompt, options=options):
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            text = block.text.strip()
-                            if text:
-                                output_parts.append(text)
-                                self._live_update(
-                                    task_id,
-                                    phase="evaluator",
-                                    prompt=prompt_preview,
-                                    answer=text,
-                                    status="running",
-                                )
-
-                elif isinstance(message, ResultMessage):
-                    usage_metrics["evaluator_cost_usd"] = message.total_cost_usd
-                    usage_metrics["evaluator_duration_ms"] = message.duration_ms
-                    usage_metrics["evaluator_turns"] = message.num_turns
-
-                    logger.debug(
-                        "executor.evaluator.turn_metrics",
-                        duration_ms=message.duration_ms,
-                        turns=message.num_turns,
-                        cost_usd=message.total_cost_usd,
-                    )
+            async with aclosing(self._agent_messages(
+                task_id,
+                "evaluator",
+                evaluator_prompt,
+                options,
+                usage_metrics,
+                session_prompt=evaluator_session_prompt,
+                session_needs=("worker",),
+                project_id=project_id,
+            )) as messages:
+                async for message in messages:
+                    self._heartbeat(task_id)
+                    if isinstance(message, AssistantMessage):
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                text = block.text.strip()
+                                if text:
+                                    output_parts.append(text)
+                                    verdict_parser.feed(text + "\n")
+                                    self._live_update(
+                                        task_id,
+                                        phase="evaluator",
+                                        prompt=prompt_preview,
+                                        answer=text,
+                                        status="running",
+                                    )
+
+                    elif isinstance(message, ResultMessage):
+                        usage_metrics["evaluator_cost_usd"] = message.total_cost_usd
+                        usage_metrics["evaluator_duration_ms"] = message.duration_ms
+                        usage_metrics["evaluator_turns"] = message.num_turns
+
+                        logger.debug(
+                            "executor.evaluator.turn_metrics",
+                            duration_ms=message.duration_ms,
+                            turns=message.num_turns,
+                            cost_usd=message.total_cost_usd,
+                        )
 
-            evaluation_text = "\n".join(output_parts)
+            evaluation_text = strip_verdict_block("\n".join(output_parts))
             execution_time = int(time.time() - start_time)
 
             self._live_update(
@@ -1044,69 +1401,153 @@ Output should include:
                 status="completed",
             )
 
-            # Extract evaluation status, outstanding items, and recommendations
-            status = self._extract_status_from_evaluation(evaluation_text)
-            outstanding_items = self._extract_outstanding_items(evaluation_text)
-            recommendations = self._extract_recommendations(evaluation_text)
+            # Status, outstanding items and recommendations come from the verdict
+            # block; the text heuristics only cover evaluators that omitted it
+            verdict = verdict_parser.verdict
+            if verdict is None:
+                verdict = Verdict(
+                    status=self._extract_status_from_evaluation(evaluation_text),
+                    outstanding_items=self._extract_outstanding_items(evaluation_text),
+                    recommendations=self._extract_recommendations(evaluation_text),
+                    source="text",
+                )
+            status = verdict.status
+            outstanding_items = verdict.outstanding_items
+            recommendations = verdict.recommendations
 
-            logger.debug("executor.evaluator.status", status=status)
+            logger.debug("executor.evaluator.status", status=status, source=verdict.source)
             if outstanding_items:
                 logger.debug("executor.evaluator.outstanding", count=len(outstanding_items))
             if recommendations:
                 logger.debug("executor.evaluator.recommendations", count=len(recommendations))
 
-            # Update README with evaluation results
-            # Note: We'll do this right before the usage check so we have access to task_id, project_id, etc.
-            # This is done in the execute_task orchestration method, not here
+            usage_metrics["evaluator_status"] = status
+            usage_metrics["evaluator_verdict"] = verdict.to_dict()
+            return evaluation_text, status, outstanding_items, recommendations, usage_metrics
 
-            # Check Pro plan usage after evaluation (mandatory)
-            try:
-                from sleepless_agent.utils.config import get_config
-                from sleepless_agent.monitoring.pro_plan_usage import ProPlanUsageChecker
-                from sleepless_agent.utils.exceptions import PauseException
-                from sleepless_agent.scheduling.time_utils import is_nighttime
+        except Exception as e:
+            logger.error("executor.evaluator.failed", error=str(e))
+            raise
 
-                config = get_config()
-                logger.debug("executor.usage.checking")
-                checker = ProPlanUsageChecker(
-                    command=config.claude_code.usage_command,
-                )
+    async def _evaluate_with_policy(
+        self,
+        task_id: int,
+        workspace: Path,
+        description: str,
+        plan_text: str,
+        worker_output: str,
+        files_modified: set,
+        commands_executed: list,
+        decision: Optional[EvaluationDecision],
+        config_max_turns: int = 10,
+        workspace_task_type: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> tuple[str, str, list, list, dict]:
+        """Evaluate locally when the policy allows it, otherwise run the evaluator.
 
-                # Use time-based threshold
-                threshold = config.claude_code.threshold_night if is_nighttime(night_start_hour=config.claude_code.night_start_hour, night_end_hour=config.claude_code.night_end_hour) else config.claude_code.threshold_day
-                should_pause, reset_time = checker.check_should_pause(
-                    threshold_percent=threshold
+        A local evaluation that finds a problem (a missing or unparsable file,
+        failing tests) escalates to the full evaluator.
+        """
+        if decision is not None and decision.mode == LOCAL:
+            started = time.monotonic()
+            check = await self.io_pools.run(
+                "fs", self.eval_policy.run_local_checks, workspace, files_modified, worker_output
+            )
+            self.eval_policy.record_local(decision, check.passed)
+            if check.passed:
+                evaluation_text = format_local_evaluation(decision, check)
+                logger.info(
+                    "task.evaluation.local",
+                    task_id=task_id,
+                    reason=decision.reason,
+                    checked=len(check.checked),
+                    saved_cost_usd=decision.mean_cost_usd,
                 )
+                self._live_update(
+                    task_id,
+                    phase="evaluator",
+                    prompt="[local evaluation]",
+                    answer=evaluation_text,
+                    status="completed",
+                )
+                return evaluation_text, "COMPLETE", [], [], {
+                    "evaluator_cost_usd": 0.0,
+                    "evaluator_duration_ms": int((time.monotonic() - started) * 1000),
+                    "evaluator_turns": 0,
+                    "evaluator_status": "COMPLETE",
+                    "evaluator_verdict": Verdict("COMPLETE", source=LOCAL).to_dict(),
+                    "evaluation_mode": LOCAL,
+                }
+            logger.info("task.evaluation.escalated", task_id=task_id, problems=check.problems[:5])
+
+        result = await self._execute_evaluator_phase(
+            task_id=task_id,
+            workspace=workspace,
+            description=description,
+            plan_text=plan_text,
+            worker_output=worker_output,
+            files_modified=files_modified,
+            commands_executed=commands_executed,
+            config_max_turns=config_max_turns,
+            workspace_task_type=workspace_task_type,
+            project_id=project_id,
+        )
+        if decision is not None:
+            result[-1]["evaluation_mode"] = decision.mode
+        return result
 
-                if should_pause:
-                    usage_percent, _ = checker.get_usage()
-                    logger.critical(
-                        "executor.usage.threshold_reached",
-                        usage_percent=usage_percent,
-                        threshold_percent=threshold,
-                    )
-                    raise PauseException(
-                        message=f"Pro plan usage limit reached at {usage_percent:.1f}%",
-                        reset_time=reset_time,
-                        usage_percent=usage_percent,
-                    )
-                else:
-                    logger.debug("executor.usage.ready")
+    async def _check_usage_limits(self) -> None:
+        """Pause task execution once Pro plan usage crosses the current threshold.
 
-            except PauseException:
-                # Re-raise PauseException to be caught by caller
-                raise
-            except ImportError:
-                logger.debug("executor.usage.monitoring_unavailable")
-            except Exception as e:
-                logger.warning("executor.usage.check_error", error=str(e))
-                # Don't fail the task due to usage check errors
+        The usage command runs off the event loop and its result is cached
+        (``claude_code.usage_cache_seconds``), so back-to-back tasks share one check.
 
-            return evaluation_text, status, outstanding_items, recommendations, usage_metrics
+        Raises:
+            PauseException: If usage is at or above the threshold
+        """
+        try:
+            from sleepless_agent.utils.config import get_config
+            from sleepless_agent.monitoring.pro_plan_usage import ProPlanUsageChecker
+            from sleepless_agent.scheduling.time_utils import is_nighttime
+        except ImportError:
+            logger.debug("executor.usage.monitoring_unavailable")
+            return
+        from sleepless_agent.utils.exceptions import PauseException
 
+        config = get_config()
+        try:
+            async with self._usage_lock:
+                if self._usage_checker is None:
+                    self._usage_checker = ProPlanUsageChecker(command=config.claude_code.usage_command)
+                    self._usage_checker.cache_duration_seconds = int(
+                        config.claude_code.get("usage_cache_seconds", 60)
+                    )
+                checker = self._usage_checker
+                logger.debug("executor.usage.checking")
+
+                # Use time-based threshold
+                threshold = config.claude_code.threshold_night if is_nighttime(night_start_hour=config.claude_code.night_start_hour, night_end_hour=config.claude_code.night_end_hour) else config.claude_code.threshold_day
+                should_pause, reset_time = await self.io_pools.run(
+                    "monitor", checker.check_should_pause, threshold_percent=threshold
+                )
+                usage_percent = (await self.io_pools.run("monitor", checker.get_usage))[0] if should_pause else None
         except Exception as e:
-            logger.error("executor.evaluator.failed", error=str(e))
-            raise
+            logger.warning("executor.usage.check_error", error=str(e))
+            # Don't fail the task due to usage check errors
+            return
+
+        if should_pause:
+            logger.critical(
+                "executor.usage.threshold_reached",
+                usage_percent=usage_percent,
+                threshold_percent=threshold,
+            )
+            raise PauseException(
+                message=f"Pro plan usage limit reached at {usage_percent:.1f}%",
+                reset_time=reset_time,
+                usage_percent=usage_percent,
+            )
+        logger.debug("executor.usage.ready")
 
     def _copy_source_to_workspace(
         self,
@@ -1146,6 +1587,20 @@ Output should include:
                 workspace=str(workspace)
             )
 
+            if self.snapshot_store is not None:
+                stats = self.snapshot_store.materialize(project_root, SOURCE_PATHS, workspace, EXCLUDE_PATTERNS)
+                logger.info(
+                    "executor.copy_source.complete",
+                    task_id=task_id,
+                    files=stats.files,
+                    reflinked=stats.reflinked,
+                    hardlinked=stats.hardlinked,
+                    copied=stats.copied,
+                    bytes_deduplicated=stats.bytes_deduplicated,
+                    workspace=str(workspace)
+                )
+                return
+
             copied_count = 0
 
             # Copy each source path
@@ -1191,6 +1646,171 @@ Output should include:
             )
             # Don't fail task creation due to copy errors - workspace is still usable
 
+    def _copy_on_write_hooks(self, workspace: Path, workspace_task_type: Optional[str]) -> Optional[dict]:
+        """PreToolUse hooks that unshare hardlinked snapshot files before they are written.
+
+        Only REFINE workspaces are materialized from the snapshot store, and
+        only its ``hardlink`` mode shares inodes, so other workspaces get no
+        hooks. A Bash command can write files it does not name (scripts,
+        build tools, in-place editors), so the whole workspace is unshared
+        before one runs.
+        """
+        if self.snapshot_store is None or workspace_task_type != "refine" or self.snapshot_store.link_mode != "hardlink":
+            return None
+        store = self.snapshot_store
+
+        async def _break_links(input_data, tool_use_id, context):
+            tool_input = input_data.get("tool_input") or {}
+            try:
+                if input_data.get("tool_name") == "Bash":
+                    await self.io_pools.run("fs", store.break_links_under, workspace)
+                else:
+                    target = tool_input.get("file_path") or tool_input.get("notebook_path")
+                    if target:
+                        path = Path(target)
+                        path = path if path.is_absolute() else workspace / path
+                        await self.io_pools.run("fs", store.break_link, path)
+            except Exception as exc:
+                logger.warning("executor.snapshot.break_link_failed", workspace=str(workspace), error=str(exc))
+            return {}
+
+        return {"PreToolUse": [HookMatcher(matcher="Write|Edit|MultiEdit|NotebookEdit|Bash", hooks=[_break_links])]}
+
+    # ------------------------------------------------------------------ Plan prefetching
+    def is_prefetching(self, task_id: int) -> bool:
+        """Whether a plan is currently being prefetched for the task."""
+        return task_id in self._prefetching
+
+    async def prefetch_plan(
+        self,
+        task_id: int,
+        description: str,
+        project_id: Optional[str] = None,
+        project_name: Optional[str] = None,
+        workspace_task_type: Optional[str] = None,
+        task_context: Optional[dict] = None,
+        priority: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Prepare the workspace and run the planner for a still-pending task.
+
+        The plan is stored as the task's planner checkpoint together with a
+        fingerprint of the workspace it was made from, so ``execute_task``
+        picks it up like a resumed phase, or replans if the workspace has
+        changed since.
+
+        The planner's phase usage is recorded here, since the plan may be
+        discarded or the task never run; its metrics are marked
+        ``planner_prefetched`` so ``execute_task`` does not count them again.
+
+        Returns:
+            The planner metrics if a plan was stored, for the caller to
+            record as usage; otherwise None
+        """
+        from sleepless_agent.utils.config import get_config
+
+        planner_config = get_config().multi_agent_workflow.planner
+        if not planner_config.enabled or not self.checkpoint_store or task_id in self._prefetching:
+            return None
+
+        done = asyncio.Event()
+        self._prefetching[task_id] = done
+        prefetch_context = {"description": f"[prefetch] {description}", "project_name": project_name}
+        self._live_context[task_id] = prefetch_context
+        started = time.monotonic()
+        try:
+            workspace = await self.io_pools.run(
+                "fs",
+                self.create_task_workspace,
+                task_id=task_id,
+                task_description=description,
+                init_git=False,
+                project_id=project_id,
+                project_name=project_name,
+                task_type=workspace_task_type,
+                task_context=task_context,
+            )
+            await self.io_pools.run(
+                "fs", self._ensure_readme_exists, workspace, task_id, description, project_id, project_name
+            )
+            workspace_context = await self.io_pools.run("fs", self._read_workspace_context, workspace)
+            workspace_context += self._refinement_context(task_context)
+            fingerprint = await self.io_pools.run("fs", workspace_fingerprint, workspace)
+
+            budget = await self._phase_budget(
+                "planner", planner_config.max_turns, workspace_task_type, priority, project_id
+            )
+            phase_started = time.monotonic()
+            plan_text, planner_metrics = await self._plan_with_cache(
+                task_id=task_id,
+                workspace=workspace,
+                description=description,
+                context=workspace_context,
+                config_max_turns=budget.max_turns,
+                workspace_task_type=workspace_task_type,
+                project_id=project_id,
+            )
+            if planner_metrics.get("plan_cache") != "hit":
+                await self._record_phase_usage(task_id, budget, planner_metrics, True, phase_started)
+            planner_metrics["planner_prefetched"] = True
+            payload = {
+                "result": [plan_text, planner_metrics],
+                "prefetch": {
+                    "fingerprint": fingerprint,
+                    "workspace": str(workspace),
+                    "created_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                },
+            }
+            await self.io_pools.run("db", self.checkpoint_store.save, task_id, "planner", payload)
+            logger.info(
+                "task.plan.prefetched",
+                task_id=task_id,
+                duration_ms=int((time.monotonic() - started) * 1000),
+                cost_usd=planner_metrics.get("planner_cost_usd"),
+            )
+            return planner_metrics
+        finally:
+            self._prefetching.pop(task_id, None)
+            done.set()
+            # Leave live status alone if the task started executing meanwhile
+            if self._live_context.get(task_id) is prefetch_context:
+                self._live_context.pop(task_id, None)
+                self._heartbeats.pop(task_id, None)
+                self._live_clear(task_id)
+
+    async def _validate_prefetched_plan(
+        self,
+        task_id: int,
+        workspace: Path,
+        checkpoints: Dict[str, Dict[str, Any]],
+        max_age_seconds: float,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Drop a prefetched plan whose workspace changed or that is too old."""
+        meta = (checkpoints.get("planner") or {}).get("prefetch")
+        if not meta:
+            return checkpoints
+
+        reason = None
+        try:
+            created_at = datetime.fromisoformat(meta["created_at"])
+            age_seconds = (datetime.now(timezone.utc).replace(tzinfo=None) - created_at).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            age_seconds = None
+        if age_seconds is None or (max_age_seconds > 0 and age_seconds > max_age_seconds):
+            reason = "expired"
+        elif meta.get("workspace") != str(workspace):
+            reason = "workspace_moved"
+        elif meta.get("fingerprint") != await self.io_pools.run("fs", workspace_fingerprint, workspace):
+            reason = "workspace_changed"
+
+        if reason:
+            self.prefetch_stats["discarded"] += 1
+            logger.info("task.plan.prefetch_discarded", task_id=task_id, reason=reason)
+            return {phase: data for phase, data in checkpoints.items() if phase != "planner"}
+
+        self.prefetch_stats["used"] += 1
+        logger.info("task.plan.prefetch_used", task_id=task_id, age_s=int(age_seconds))
+        return checkpoints
+
     def create_task_workspace(
         self,
         task_id: int,
@@ -1253,12 +1873,26 @@ Output should include:
 
         # For REFINE tasks without specific target, copy source code to workspace
         if task_type == "refine" and refines_task_id is None:
-            logger.info(
-                "workspace.refine_task",
-                task_id=task_id,
-                workspace=str(workspace)
-            )
-            self._copy_source_to_workspace(workspace, task_id)
+            resumed_phases = self._checkpointed_phases(task_id)
+            if resumed_phases and any(workspace.iterdir()):
+                # An interrupted run or a prefetched plan already populated it;
+                # copying again would undo the edits a worker checkpoint stands for
+                logger.info(
+                    "workspace.refine_resume",
+                    task_id=task_id,
+                    workspace=str(workspace),
+                    phases=sorted(resumed_phases),
+                )
+            else:
+                logger.info(
+                    "workspace.refine_task",
+                    task_id=task_id,
+                    workspace=str(workspace)
+                )
+                self._copy_source_to_workspace(workspace, task_id)
+                if resumed_phases - {"planner"}:
+                    # The worker's edits are gone with the old workspace; rerun from the worker
+                    self._discard_checkpoints(task_id, resumed_phases - {"planner"})
 
         # Move workspace setup to DEBUG - internal detail
         logger.debug(
@@ -1300,6 +1934,9 @@ Output should include:
             eval_status can be: "COMPLETE", "PARTIAL", "INCOMPLETE", "FAILED", or None if evaluator disabled
         """
         timeout = timeout or self.default_timeout
+        self._heartbeat(task_id)
+        if not self._cli_verified:
+            await self.io_pools.run("monitor", self.ensure_cli_available)
 
         self._live_context[task_id] = {
             "description": description,
@@ -1314,10 +1951,16 @@ Output should include:
             status="running",
         )
 
+        readme: Optional[ReadmeDocument] = None
+        session: Optional[AgentSession] = None
+        workspace: Optional[Path] = None
         try:
             # Create workspace (project-based if project_id provided)
             init_git = (priority == "serious")
-            workspace = self.create_task_workspace(
+            # Off the loop: a REFINE workspace may copy a whole source tree
+            workspace = await self.io_pools.run(
+                "fs",
+                self.create_task_workspace,
                 task_id=task_id,
                 task_description=description,
                 init_git=init_git,
@@ -1375,29 +2018,69 @@ Output should include:
             final_exit_code = 0
             evaluation_summary = ""
 
-            # Ensure README exists (mandatory)
-            self._ensure_readme_exists(workspace, task_id, description, project_id, project_name)
+            # Session mode: one CLI process serves all phases of this task
+            session_config = multi_agent_config.get("session") or {}
+            if session_config.get("enabled", False):
+                session = AgentSession(
+                    self._client_options(workspace, workspace_task_type, project_id),
+                    task_id=task_id,
+                )
+                self._sessions[task_id] = session
+            elif self.client_pool is not None:
+                # Start the planner's CLI while the README and context are prepared
+                self.client_pool.prewarm(self._client_options(workspace, workspace_task_type, project_id))
+            phase_metrics: Dict[str, Dict[str, Any]] = {}
+
+            # Ensure README exists (mandatory); edits are buffered until the task ends
+            readme = await self.io_pools.run(
+                "fs", self._open_readme, workspace, task_id, description, project_id, project_name
+            )
 
             # Read workspace context for planner
-            workspace_context = self._read_workspace_context(workspace)
+            workspace_context = await self.io_pools.run("fs", self._read_workspace_context, workspace)
+            workspace_context += self._refinement_context(task_context)
+
+            # Finished phases from an interrupted earlier run of this task, or
+            # a plan prefetched while the previous task was running
+            prefetch_done = self._prefetching.get(task_id)
+            if prefetch_done is not None:
+                await prefetch_done.wait()
+                self._heartbeat(task_id)
+            checkpoints = await self._load_checkpoints(task_id)
+            pipelining_config = multi_agent_config.get("pipelining") or {}
+            checkpoints = await self._validate_prefetched_plan(
+                task_id,
+                workspace,
+                checkpoints,
+                float(pipelining_config.get("max_plan_age_seconds", 1800)),
+            )
 
             # Phase 1: Planner
             if multi_agent_config.planner.enabled:
                 phase_log = task_log.bind(phase="planner")
+                planner_budget = await self._phase_budget(
+                    "planner", multi_agent_config.planner.max_turns, workspace_task_type or task_type, priority, project_id
+                )
                 # Move phase start to DEBUG - internal workflow detail
                 phase_log.debug(
                     "task.phase.start",
-                    max_turns=multi_agent_config.planner.max_turns,
+                    max_turns=planner_budget.max_turns,
                 )
                 try:
-                    plan_text, planner_metrics = await self._execute_planner_phase(
-                        task_id=task_id,
-                        workspace=workspace,
-                        description=description,
-                        context=workspace_context,
-                        config_max_turns=multi_agent_config.planner.max_turns,
-                        workspace_task_type=workspace_task_type,
-                        project_id=project_id,
+                    plan_text, planner_metrics = await self._run_checkpointed_phase(
+                        task_id,
+                        "planner",
+                        checkpoints,
+                        lambda: self._plan_with_cache(
+                            task_id=task_id,
+                            workspace=workspace,
+                            description=description,
+                            context=workspace_context,
+                            config_max_turns=planner_budget.max_turns,
+                            workspace_task_type=workspace_task_type,
+                            project_id=project_id,
+                        ),
+                        budget=planner_budget,
                     )
                     all_output_parts.append(f"## Planner Output\n{plan_text}")
 
@@ -1405,12 +2088,15 @@ Output should include:
                     combined_metrics["planner_cost_usd"] = planner_metrics.get("planner_cost_usd")
                     combined_metrics["planner_duration_ms"] = planner_metrics.get("planner_duration_ms")
                     combined_metrics["planner_turns"] = planner_metrics.get("planner_turns")
-                    if planner_metrics.get("planner_cost_usd"):
-                        combined_metrics["total_cost_usd"] += planner_metrics["planner_cost_usd"]
-                    if planner_metrics.get("planner_duration_ms"):
-                        combined_metrics["duration_api_ms"] += planner_metrics["planner_duration_ms"]
-                    if planner_metrics.get("planner_turns"):
-                        combined_metrics["num_turns"] += planner_metrics["planner_turns"]
+                    # A prefetched plan's usage was recorded when it was made
+                    if not planner_metrics.get("planner_prefetched"):
+                        if planner_metrics.get("planner_cost_usd"):
+                            combined_metrics["total_cost_usd"] += planner_metrics["planner_cost_usd"]
+                        if planner_metrics.get("planner_duration_ms"):
+                            combined_metrics["duration_api_ms"] += planner_metrics["planner_duration_ms"]
+                        if planner_metrics.get("planner_turns"):
+                            combined_metrics["num_turns"] += planner_metrics["planner_turns"]
+                    phase_metrics["planner"] = planner_metrics
 
                     # Move phase done to DEBUG - verbose internal metrics
                     phase_log.debug(
@@ -1421,7 +2107,7 @@ Output should include:
                     )
 
                     # Update README with plan
-                    self._update_readme_with_plan(workspace, plan_text)
+                    self._update_readme_with_plan(readme, plan_text)
 
                 except Exception as e:
                     phase_log.error("task.phase.failed", error=str(e))
@@ -1433,21 +2119,31 @@ Output should include:
             # Phase 2: Worker
             if multi_agent_config.worker.enabled and final_exit_code == 0:
                 phase_log = task_log.bind(phase="worker")
+                worker_budget = await self._phase_budget(
+                    "worker", multi_agent_config.worker.max_turns, workspace_task_type or task_type, priority, project_id
+                )
                 # Move phase start to DEBUG - internal workflow detail
                 phase_log.debug(
                     "task.phase.start",
-                    max_turns=multi_agent_config.worker.max_turns,
+                    max_turns=worker_budget.max_turns,
                 )
                 try:
-                    worker_output, files_modified, commands_executed, exit_code, worker_metrics = await self._execute_worker_phase(
-                        task_id=task_id,
-                        workspace=workspace,
-                        description=description,
-                        plan_text=plan_text,
-                        config_max_turns=multi_agent_config.worker.max_turns,
-                        workspace_task_type=workspace_task_type,
-                        project_id=project_id,
+                    worker_output, files_modified, commands_executed, exit_code, worker_metrics = await self._run_checkpointed_phase(
+                        task_id,
+                        "worker",
+                        checkpoints,
+                        lambda: self._execute_worker_phase(
+                            task_id=task_id,
+                            workspace=workspace,
+                            description=description,
+                            plan_text=plan_text,
+                            config_max_turns=worker_budget.max_turns,
+                            workspace_task_type=workspace_task_type,
+                            project_id=project_id,
+                        ),
+                        budget=worker_budget,
                     )
+                    files_modified = set(files_modified)
                     all_output_parts.append(f"## Worker Output\n{worker_output}")
                     all_files_modified = files_modified
                     all_commands_executed = commands_executed
@@ -1463,6 +2159,10 @@ Output should include:
                         combined_metrics["duration_api_ms"] += worker_metrics["worker_duration_ms"]
                     if worker_metrics.get("worker_turns"):
                         combined_metrics["num_turns"] += worker_metrics["worker_turns"]
+                    phase_metrics["worker"] = worker_metrics
+                    combined_metrics["files_deleted"] = worker_metrics.get("worker_files_deleted") or []
+                    if worker_metrics.get("worker_tool_calls"):
+                        combined_metrics["tool_calls"] = worker_metrics["worker_tool_calls"]
 
                     # Move phase done to DEBUG - verbose internal metrics
                     phase_log.debug(
@@ -1489,30 +2189,52 @@ Output should include:
 
             if multi_agent_config.evaluator.enabled:
                 phase_log = task_log.bind(phase="evaluator")
+                evaluator_budget = await self._phase_budget(
+                    "evaluator", multi_agent_config.evaluator.max_turns, workspace_task_type or task_type, priority, project_id
+                )
                 # Move phase start to DEBUG - internal workflow detail
                 phase_log.debug(
                     "task.phase.start",
-                    max_turns=multi_agent_config.evaluator.max_turns,
+                    max_turns=evaluator_budget.max_turns,
                 )
                 try:
-                    evaluation_summary, eval_status, eval_outstanding, eval_recommendations, evaluator_metrics = await self._execute_evaluator_phase(
-                        task_id=task_id,
-                        workspace=workspace,
-                        description=description,
-                        plan_text=plan_text,
-                        worker_output="\n".join(all_output_parts),
-                        files_modified=all_files_modified,
-                        commands_executed=all_commands_executed,
-                        config_max_turns=multi_agent_config.evaluator.max_turns,
-                        workspace_task_type=workspace_task_type,
-                        project_id=project_id,
+                    worker_output_text = "\n".join(all_output_parts)
+                    decision = None
+                    if self.eval_policy is not None and "evaluator" not in checkpoints:
+                        decision = await self.io_pools.run(
+                            "db",
+                            self.eval_policy.decide,
+                            task_type=workspace_task_type or task_type,
+                            priority=priority,
+                            project_id=project_id,
+                            files_modified=all_files_modified,
+                            worker_exit_code=final_exit_code,
+                        )
+                    evaluation_summary, eval_status, eval_outstanding, eval_recommendations, evaluator_metrics = await self._run_checkpointed_phase(
+                        task_id,
+                        "evaluator",
+                        checkpoints,
+                        lambda: self._evaluate_with_policy(
+                            task_id=task_id,
+                            workspace=workspace,
+                            description=description,
+                            plan_text=plan_text,
+                            worker_output=worker_output_text,
+                            files_modified=all_files_modified,
+                            commands_executed=all_commands_executed,
+                            decision=decision,
+                            config_max_turns=evaluator_budget.max_turns,
+                            workspace_task_type=workspace_task_type,
+                            project_id=project_id,
+                        ),
+                        budget=evaluator_budget,
                     )
                     all_output_parts.append(f"## Evaluator Output\n{evaluation_summary}")
 
                     # Update README with evaluation results (mandatory)
                     if eval_status:
                         self._update_readme_with_evaluation(
-                            workspace=workspace,
+                            readme=readme,
                             status=eval_status,
                             outstanding_items=eval_outstanding,
                             recommendations=eval_recommendations,
@@ -1522,12 +2244,14 @@ Output should include:
                     combined_metrics["evaluator_cost_usd"] = evaluator_metrics.get("evaluator_cost_usd")
                     combined_metrics["evaluator_duration_ms"] = evaluator_metrics.get("evaluator_duration_ms")
                     combined_metrics["evaluator_turns"] = evaluator_metrics.get("evaluator_turns")
+                    combined_metrics["eval_verdict"] = evaluator_metrics.get("evaluator_verdict")
                     if evaluator_metrics.get("evaluator_cost_usd"):
                         combined_metrics["total_cost_usd"] += evaluator_metrics["evaluator_cost_usd"]
                     if evaluator_metrics.get("evaluator_duration_ms"):
                         combined_metrics["duration_api_ms"] += evaluator_metrics["evaluator_duration_ms"]
                     if evaluator_metrics.get("evaluator_turns"):
                         combined_metrics["num_turns"] += evaluator_metrics["evaluator_turns"]
+                    phase_metrics["evaluator"] = evaluator_metrics
 
                     # Move phase done to DEBUG - verbose internal metrics
                     phase_log.debug(
@@ -1546,20 +2270,34 @@ Output should include:
             else:
                 all_output_parts.append("## Evaluator Output\n[Evaluator phase disabled]")
 
+            # Check Pro plan usage before the next task (mandatory)
+            await self._check_usage_limits()
+
             # Finalize execution
             execution_time = int(time.time() - start_time)
             combined_metrics["duration_ms"] = execution_time * 1000
+            # Process start-up and prompt size, to compare session and query() modes
+            combined_metrics["executor_mode"] = "session" if session is not None else "query"
+            for key in ("startup_ms", "prompt_tokens", *TOKEN_FIELDS):
+                values = [
+                    metrics[f"{phase}_{key}"]
+                    for phase, metrics in phase_metrics.items()
+                    if metrics.get(f"{phase}_{key}") is not None and not metrics.get(f"{phase}_prefetched")
+                ]
+                combined_metrics[key] = sum(values) if values else None
+            combined_metrics["cache_hit_ratio"] = cache_hit_ratio(
+                combined_metrics["cache_read_tokens"], combined_metrics["prompt_tokens"]
+            )
 
             # Combine output
-            output_text = "\n".join(all_output_parts)
+            tool_section = format_summary(combined_metrics.get("tool_calls") or {})
+            output_text = "\n".join(all_output_parts + ([tool_section] if tool_section else []))
 
             # Update README with execution history (mandatory)
             status = "completed" if final_exit_code == 0 else "failed"
             git_info = None  # Could be set by caller if needed
             self._update_readme_task_history(
-                workspace,
-                task_id,
-                description,
+                readme,
                 status,
                 files_modified=len(all_files_modified),
                 git_info=git_info,
@@ -1584,6 +2322,13 @@ Output should include:
                 duration_ms=combined_metrics.get("duration_ms"),
                 files=len(all_modified_files),
                 commands=len(all_commands_executed),
+                executor_mode=combined_metrics["executor_mode"],
+                startup_ms=combined_metrics["startup_ms"],
+                prompt_tokens=combined_metrics["prompt_tokens"],
+                output_tokens=combined_metrics["output_tokens"],
+                cache_hit_ratio=combined_metrics["cache_hit_ratio"],
+                tool_ms=(combined_metrics.get("tool_calls") or {}).get("tool_ms"),
+                model_ms=(combined_metrics.get("tool_calls") or {}).get("model_ms"),
             )
 
             return output_text, all_modified_files, all_commands_executed, final_exit_code, combined_metrics, eval_status
@@ -1642,7 +2387,19 @@ Output should include:
             logger.error("executor.task.failed", task_id=task_id, error=str(e))
             raise
         finally:
+            # The only README write after creation, whatever the outcome
+            if readme is not None:
+                await self.io_pools.run("fs", self._flush_readme, readme)
+            if session is not None:
+                self._sessions.pop(task_id, None)
+                await session.close()
+            if self.client_pool is not None and workspace is not None and not project_id:
+                # Task workspaces are not reused; project workspaces keep their clients
+                await self.client_pool.discard(str(workspace))
+            if workspace is not None and not project_id:
+                self._manifests.pop(str(workspace), None)
             self._live_context.pop(task_id, None)
+            self._heartbeats.pop(task_id, None)
 
 
     def _get_workspace_files(self, workspace: Path) -> set:
@@ -1654,39 +2411,25 @@ Output should include:
         Returns:
             Set of relative file paths
         """
-        files = set()
-        exclude_patterns = {
-            ".git",
-            ".gitignore",
-            "__pycache__",
-            ".DS_Store",
-            "node_modules",
-        }
-
         try:
-            for path in workspace.rglob("*"):
-                if path.is_file():
-                    # Check if any parent or the file itself should be excluded
-                    relative_path = path.relative_to(workspace)
-                    parts = set(relative_path.parts)
-
-                    # Check for excluded patterns
-                    should_exclude = False
-                    for pattern in exclude_patterns:
-                        if pattern in parts or relative_path.name == pattern:
-                            should_exclude = True
-                            break
-                        # Check for .git directory in path
-                        if any(part.startswith(".git") for part in parts):
-                            should_exclude = True
-                            break
-
-                    if not should_exclude:
-                        files.add(str(relative_path))
+            return set(scan_workspace(workspace))
         except Exception as e:
             logger.warning("executor.workspace.scan_failed", error=str(e), workspace=str(workspace))
-
-        return files
+            return set()
+
+    def _workspace_manifest(self, workspace: Path) -> WorkspaceManifest:
+        """Return the (cached) file manifest for a workspace."""
+        key = str(workspace)
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            manifest = WorkspaceManifest(workspace, self.manifest_dir, hash_max_bytes=1 << 20)
+            self._manifests[key] = manifest
+            # Manifests are persisted, so an evicted one reloads from disk
+            while len(self._manifests) > MAX_CACHED_MANIFESTS:
+                self._manifests.popitem(last=False)
+        else:
+            self._manifests.move_to_end(key)
+        return manifest
 
     def list_workspace_files(self, workspace: Path) -> set:
         """Public helper to list workspace files (excludes caches and metadata)."""
@@ -0,0 +1,134 @@
+"""Bounded thread pools that keep blocking I/O off the daemon event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class BlockingIOPools:
+    """Named, per-subsystem thread pools for blocking calls.
+
+    Each subsystem gets its own bounded pool so a slow git push cannot starve
+    database writes, and subsystems that are not safe to run concurrently
+    (git operates on a single working tree) are given a single thread.
+    """
+
+    DEFAULT_SIZES: Dict[str, int] = {
+        "db": 4,
+        "git": 1,
+        "fs": 2,
+        "results": 2,
+        "reports": 1,
+        "slack": 2,
+        "scheduler": 1,
+        "monitor": 1,
+    }
+
+    def __init__(self, sizes: Optional[Mapping[str, int]] = None):
+        """Initialize pools.
+
+        Args:
+            sizes: Optional overrides of worker count per pool name
+        """
+        self.sizes: Dict[str, int] = dict(self.DEFAULT_SIZES)
+        for name, size in (sizes or {}).items():
+            try:
+                self.sizes[name] = max(1, int(size))
+            except (TypeError, ValueError):
+                logger.warning("io_pools.invalid_size", pool=name, size=size)
+
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._submitted: Dict[str, int] = {}
+        self._completed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def executor(self, name: str) -> ThreadPoolExecutor:
+        """Return (creating on first use) the executor for a subsystem."""
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.sizes.get(name, 1),
+                    thread_name_prefix=f"io-{name}",
+                )
+                self._executors[name] = executor
+                self._submitted[name] = 0
+                self._completed[name] = 0
+            return executor
+
+    async def run(self, name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` on the named pool and await its result.
+
+        Context variables (e.g. structlog bindings) are propagated to the
+        worker thread.
+        """
+        executor = self.executor(name)
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+
+        with self._lock:
+            self._submitted[name] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, call)
+        finally:
+            with self._lock:
+                self._completed[name] += 1
+
+    def facade(self, target: Any, name: str) -> "AsyncFacade":
+        """Wrap ``target`` so its methods return awaitables run on ``name``."""
+        return AsyncFacade(target, self, name)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-pool size and backlog counters."""
+        with self._lock:
+            return {
+                name: {
+                    "size": self.sizes.get(name, 1),
+                    "pending": self._submitted[name] - self._completed[name],
+                    "completed": self._completed[name],
+                }
+                for name in self._executors
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down all pools."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class AsyncFacade:
+    """Async view of a synchronous component.
+
+    ``await facade.method(*args)`` runs ``target.method(*args)`` on the
+    facade's pool. Non-callable attributes are returned unchanged.
+    """
+
+    def __init__(self, target: Any, pools: BlockingIOPools, pool_name: str):
+        self._target = target
+        self._pools = pools
+        self._pool_name = pool_name
+
+    def __getattr__(self, item: str) -> Any:
+        attr = getattr(self._target, item)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await self._pools.run(self._pool_name, attr, *args, **kwargs)
+
+        return _call
@@ -0,0 +1,162 @@
+"""Lease renewal for tasks claimed by this daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.core.worker_pool import TaskWorkerPool
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_worker_id() -> str:
+    """Identifier for this daemon process: ``<hostname>:<pid>``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def is_dead_local_worker(worker_id: str) -> bool:
+    """True if ``worker_id`` is a default id of a process on this host that has exited.
+
+    Lets a restarted daemon take back the tasks of the run it replaced
+    without waiting for their leases to lapse, although its own default id
+    (with the new pid) differs.
+    """
+    host, _, pid = worker_id.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit() or int(pid) == os.getpid():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        # Exists but belongs to another user, or cannot be checked
+        return False
+    return False
+
+
+def heartbeat_inactivity_cutoff(config) -> int:
+    """Inactivity limit to apply to heartbeats persisted in the database.
+
+    Heartbeats are flushed together with lease renewals, so the stored value
+    may lag by up to one renewal interval; a full lease period is added as
+    grace. The in-process watchdog in ``TaskRuntime`` enforces the exact limit
+    for tasks running in this daemon.
+    """
+    inactivity_seconds = int(getattr(config.agent, "task_inactivity_timeout_seconds", 0) or 0)
+    if inactivity_seconds <= 0:
+        return 0
+    return inactivity_seconds + int(getattr(config.agent, "lease_seconds", 90))
+
+
+class LeaseKeeper:
+    """Keep the leases of in-flight tasks alive.
+
+    Several daemons may share one task database; each claims tasks with a
+    time-limited lease. While a task runs here, the keeper extends its lease
+    every ``lease_seconds / 3`` and persists the executor's latest
+    heartbeats. If a daemon dies its leases lapse and the survivors reclaim
+    the tasks. If this daemon finds it no longer owns a running task (its
+    lease expired during a stall and another worker took over), the local
+    run is cancelled so the work is not done twice.
+    """
+
+    def __init__(
+        self,
+        task_queue: TaskQueue,
+        pool: TaskWorkerPool,
+        worker_id: str,
+        lease_seconds: int = 90,
+        io_pools: Optional[BlockingIOPools] = None,
+        heartbeat_source: Optional[Callable[[], Dict[int, datetime]]] = None,
+    ):
+        """Initialize the lease keeper.
+
+        Args:
+            task_queue: Queue holding the task leases
+            pool: Worker pool whose running tasks are renewed
+            worker_id: Identifier of this daemon
+            lease_seconds: Lease duration granted on each renewal
+            io_pools: Thread pools used for the renewal writes
+            heartbeat_source: Returns the last in-memory heartbeat per task;
+                flushed to the database on every renewal
+        """
+        self.task_queue = task_queue
+        self.pool = pool
+        self.worker_id = worker_id
+        self.lease_seconds = max(3, int(lease_seconds))
+        self.io_pools = io_pools or BlockingIOPools()
+        self.heartbeat_source = heartbeat_source
+
+        self._task: Optional[asyncio.Task] = None
+        self.renewals = 0
+        self.lost = 0
+
+    @property
+    def renew_interval_seconds(self) -> float:
+        return self.lease_seconds / 3
+
+    def start(self) -> None:
+        """Start the renewal loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._renew_loop(), name="lease-keeper")
+
+    async def stop(self) -> None:
+        """Stop the renewal loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _renew_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval_seconds)
+            try:
+                await self.renew_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("lease.renew.failed", worker_id=self.worker_id, error=str(exc))
+
+    async def renew_once(self) -> None:
+        """Renew every running task's lease and cancel runs we no longer own."""
+        running_ids = [task.id for task in self.pool.running_tasks()]
+        if not running_ids:
+            return
+
+        owned = set(
+            await self.io_pools.run(
+                "db",
+                self.task_queue.renew_leases,
+                running_ids,
+                self.worker_id,
+                self.lease_seconds,
+            )
+        )
+        self.renewals += len(owned)
+
+        if self.heartbeat_source is not None:
+            heartbeats = {
+                task_id: beat
+                for task_id, beat in self.heartbeat_source().items()
+                if task_id in owned
+            }
+            await self.io_pools.run(
+                "db", self.task_queue.record_heartbeats, heartbeats, self.worker_id
+            )
+
+        for task_id in running_ids:
+            if task_id in owned or not self.pool.is_running(task_id):
+                continue
+            self.lost += 1
+            logger.warning("lease.lost", task_id=task_id, worker_id=self.worker_id)
+            self.pool.cancel(task_id)
@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, Index, Integer, String, Text, create_engine
+from sqlalchemy import Boolean, Column, DateTime, Enum as SQLEnum, Index, Integer, String, Text, create_engine, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 
@@ -66,6 +67,8 @@ class Task(Base):
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     deleted_at = Column(DateTime, nullable=True)
+    # Set on every change, so the dispatcher notices tasks put back to pending
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
 
     # Execution details
     attempt_count = Column(Integer, default=0, nullable=False)
@@ -81,6 +84,15 @@ class Task(Base):
     project_id = Column(String(255), nullable=True)  # Project identifier for context sharing
     project_name = Column(String(255), nullable=True)  # Human-readable project name
 
+    # Claim leases - lets several daemons share one database safely
+    worker_id = Column(String(255), nullable=True)  # Daemon that claimed (or last ran) the task
+    lease_expires_at = Column(DateTime, nullable=True)  # Claim is void after this unless renewed
+    heartbeat_at = Column(DateTime, nullable=True)  # Last sign of progress from the executor
+
+    # Evaluator verdict - queryable without reading the workspace README
+    eval_status = Column(String(20), nullable=True)  # COMPLETE, PARTIAL, INCOMPLETE, FAILED
+    eval_verdict = Column(Text, nullable=True)  # JSON: status, outstanding_items, recommendations, source
+
     def __repr__(self):
         return f"<Task(id={self.id}, type={self.task_type}, priority={self.priority}, status={self.status})>"
 
@@ -101,6 +113,13 @@ class Task(Base):
 
         # Optimizes filtering by task type and status
         Index('ix_task_type_status', 'task_type', 'status'),
+
+        # Optimizes expired-lease reclamation and per-worker stats
+        Index('ix_task_status_lease', 'status', 'lease_expires_at'),
+        Index('ix_task_worker_status', 'worker_id', 'status'),
+
+        # Finds partial/incomplete work for refinement and auto-generation
+        Index('ix_task_eval_status', 'eval_status'),
     )
 
 
@@ -144,6 +163,10 @@ class UsageMetric(Base):
     duration_ms = Column(Integer, nullable=True)  # Total duration in milliseconds
     duration_api_ms = Column(Integer, nullable=True)  # API call duration
     num_turns = Column(Integer, nullable=True)  # Number of conversation turns
+    input_tokens = Column(Integer, nullable=True)  # Uncached input tokens
+    output_tokens = Column(Integer, nullable=True)
+    cache_read_tokens = Column(Integer, nullable=True)
+    cache_creation_tokens = Column(Integer, nullable=True)
 
     # Timing
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -195,8 +218,150 @@ class TaskPool(Base):
         return f"<TaskPool(id={self.id}, priority={self.priority}, category={self.category})>"
 
 
+class TaskCheckpoint(Base):
+    """Output of a finished workflow phase, kept so interrupted tasks can resume"""
+    __tablename__ = "task_checkpoints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    phase = Column(String(20), nullable=False)  # planner, worker, evaluator
+    payload = Column(Text, nullable=False)  # JSON phase output and metrics
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_checkpoint_task_phase', 'task_id', 'phase'),
+    )
+
+    def __repr__(self):
+        return f"<TaskCheckpoint(task_id={self.task_id}, phase={self.phase})>"
+
+
+class OutboxEvent(Base):
+    """A post-task side effect one consumer has not handled yet, replayed after a restart"""
+    __tablename__ = "event_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(32), nullable=False)
+    consumer = Column(String(50), nullable=False)
+    kind = Column(String(30), nullable=False)  # task.finished, task.settled
+    task_id = Column(Integer, nullable=False)
+    worker_id = Column(String(255), nullable=True)  # daemon that published it
+    payload = Column(Text, nullable=False)  # JSON event payload
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_outbox_event_consumer', 'event_id', 'consumer', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent(event_id={self.event_id}, consumer={self.consumer}, task_id={self.task_id})>"
+
+
+class PhaseUsage(Base):
+    """Turns, duration and cost of one workflow phase run, for adaptive budgets"""
+    __tablename__ = "phase_usage"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    phase = Column(String(20), nullable=False)  # planner, worker, evaluator
+    task_type = Column(String(20), nullable=True)  # Workspace task type (new, refine)
+    priority = Column(String(20), nullable=True)
+    project_id = Column(String(255), nullable=True)
+    turns = Column(Integer, nullable=True)
+    max_turns = Column(Integer, nullable=True)  # Cap the phase ran with
+    duration_ms = Column(Integer, nullable=True)
+    cost_usd = Column(Text, nullable=True)  # Stored as text to preserve precision
+    success = Column(Boolean, default=True, nullable=False)
+    outcome = Column(String(20), nullable=True)  # Evaluator verdict (COMPLETE, PARTIAL, ...)
+    prompt_tokens = Column(Integer, nullable=True)  # All prompt tokens, cached or not
+    cache_read_tokens = Column(Integer, nullable=True)
+    cache_creation_tokens = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_phase_usage_phase_created', 'phase', 'created_at'),
+        Index('ix_phase_usage_task', 'task_id'),
+    )
+
+    def __repr__(self):
+        return f"<PhaseUsage(task_id={self.task_id}, phase={self.phase}, turns={self.turns})>"
+
+
+class TokenUsage(Base):
+    """Tokens one model used in one workflow phase run"""
+    __tablename__ = "token_usage"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    phase = Column(String(20), nullable=False)  # planner, worker, evaluator
+    project_id = Column(String(255), nullable=True)
+    model = Column(String(100), nullable=False)
+    input_tokens = Column(Integer, nullable=False, default=0)  # Uncached input tokens
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cache_read_tokens = Column(Integer, nullable=False, default=0)
+    cache_creation_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Text, nullable=True)  # Stored as text to preserve precision
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_token_usage_created', 'created_at'),
+        Index('ix_token_usage_project_created', 'project_id', 'created_at'),
+        Index('ix_token_usage_task', 'task_id'),
+    )
+
+    def __repr__(self):
+        return f"<TokenUsage(task_id={self.task_id}, phase={self.phase}, model={self.model})>"
+
+
+class PlanCacheEntry(Base):
+    """Planner output reusable for the same task on an unchanged workspace"""
+    __tablename__ = "plan_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(String(64), nullable=False, unique=True)  # hash of description + fingerprint + type
+    description = Column(Text, nullable=False)  # Normalized task description
+    fingerprint = Column(String(64), nullable=True)  # Workspace fingerprint the plan was made from
+    workspace_task_type = Column(String(20), nullable=True)
+    plan_text = Column(Text, nullable=False)
+    metrics = Column(Text, nullable=True)  # JSON planner usage metrics
+    hits = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_plan_cache_fingerprint', 'fingerprint'),
+        Index('ix_plan_cache_last_used', 'last_used_at'),
+    )
+
+    def __repr__(self):
+        return f"<PlanCacheEntry(id={self.id}, hits={self.hits})>"
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    """Add nullable columns and indexes introduced after a table was first created.
+
+    ``create_all`` only creates missing tables, so databases from older
+    versions would otherwise lack newer columns and their indexes.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
 def init_db(db_path: str) -> Session:
     """Initialize database and return session"""
     engine = create_engine(f"sqlite:///{db_path}", echo=False, future=True)
+    _add_missing_columns(engine)
     Base.metadata.create_all(engine)
     return engine
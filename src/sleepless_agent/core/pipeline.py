@@ -0,0 +1,182 @@
+"""Cross-task phase pipelining: plan upcoming tasks while the current one works."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.core.models import Task
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.scheduling.scheduler import SmartScheduler
+from sleepless_agent.storage.checkpoints import CheckpointStore
+from sleepless_agent.storage.token_usage import TOKEN_FIELDS
+
+logger = get_logger(__name__)
+
+
+class PlanPrefetcher:
+    """Run the read-only planner for the head of the queue ahead of time.
+
+    When a running task enters its worker phase, the planner for the next
+    pending task(s) is started in the background: workspace creation, README
+    bootstrap, context read and planning all overlap with the current
+    worker. The plan is stored as the task's planner checkpoint, so when the
+    task is dispatched the executor skips straight to the worker, unless the
+    workspace changed or the plan aged out, in which case it replans.
+
+    Tasks whose workspace is in use by a running or settling task are never
+    prefetched: the plan would be made from a workspace about to change.
+    """
+
+    def __init__(
+        self,
+        *,
+        executor: ClaudeCodeExecutor,
+        task_queue: TaskQueue,
+        scheduler: SmartScheduler,
+        checkpoint_store: CheckpointStore,
+        busy_tasks: Callable[[], List[Task]],
+        io_pools: Optional[BlockingIOPools] = None,
+        lookahead: int = 1,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            executor: Executor that runs the planner
+            task_queue: Queue to read upcoming tasks from
+            scheduler: Scheduler used for pause state and workspace keys
+            checkpoint_store: Store holding prefetched plans
+            busy_tasks: Returns tasks whose workspaces are currently in use
+            io_pools: Thread pools for database reads
+            lookahead: Number of queued tasks to keep planned ahead
+        """
+        self.executor = executor
+        self.task_queue = task_queue
+        self.scheduler = scheduler
+        self.checkpoint_store = checkpoint_store
+        self.busy_tasks = busy_tasks
+        self.io_pools = io_pools or BlockingIOPools()
+        self.lookahead = max(1, int(lookahead))
+
+        self._runner: Optional[asyncio.Task] = None
+        self._rerun = False
+        self.stats: Dict[str, int] = {
+            "triggered": 0,
+            "prefetched": 0,
+            "skipped_same_workspace": 0,
+            "skipped_already_planned": 0,
+            "failed": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Triggering
+    # ------------------------------------------------------------------
+    def on_phase_start(self, task_id: int, phase: str) -> None:
+        """Executor phase listener: prefetch once a task starts working."""
+        if phase == "worker":
+            self.trigger()
+
+    def trigger(self) -> None:
+        """Start a prefetch pass, or queue one if a pass is running."""
+        self.stats["triggered"] += 1
+        if self._runner is not None and not self._runner.done():
+            self._rerun = True
+            return
+        self._runner = asyncio.create_task(self._run(), name="plan-prefetch")
+
+    async def stop(self) -> None:
+        """Cancel an in-progress prefetch."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._runner = None
+
+    # ------------------------------------------------------------------
+    # Prefetching
+    # ------------------------------------------------------------------
+    async def _run(self) -> None:
+        while True:
+            self._rerun = False
+            try:
+                await self._prefetch_pass()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("pipeline.prefetch.pass_failed", error=str(exc))
+            if not self._rerun:
+                return
+
+    async def _prefetch_pass(self) -> None:
+        if self.scheduler.get_pause_remaining_seconds() is not None:
+            return  # don't spend usage while scheduling is paused
+
+        pending = await self.io_pools.run("db", self.task_queue.get_pending_tasks, limit=self.lookahead)
+        if not pending:
+            return
+
+        busy = list(self.busy_tasks())
+        busy.extend(await self.io_pools.run("db", self.task_queue.get_in_progress_tasks))
+        busy_workspaces: Set[str] = {self.scheduler.get_workspace_identifier(task) for task in busy}
+        planned = await self.io_pools.run(
+            "db", self.checkpoint_store.get_phases, [task.id for task in pending]
+        )
+
+        for task in pending:
+            workspace_key = self.scheduler.get_workspace_identifier(task)
+            if workspace_key in busy_workspaces:
+                self.stats["skipped_same_workspace"] += 1
+                logger.debug("pipeline.prefetch.skipped", task_id=task.id, reason="workspace_busy")
+                continue
+            if "planner" in planned.get(task.id, []) or self.executor.is_prefetching(task.id):
+                self.stats["skipped_already_planned"] += 1
+                continue
+
+            # Later candidates in this pass must not share the workspace either
+            busy_workspaces.add(workspace_key)
+            try:
+                metrics = await self.executor.prefetch_plan(
+                    task_id=task.id,
+                    description=task.description,
+                    project_id=task.project_id,
+                    project_name=task.project_name,
+                    workspace_task_type=task.task_type.value if task.task_type else None,
+                    task_context=await self.io_pools.run("db", self.task_queue.get_task_context, task),
+                    priority=task.priority.value if task.priority else None,
+                )
+                if metrics is not None:
+                    self.stats["prefetched"] += 1
+                    await self._record_usage(task, metrics)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.stats["failed"] += 1
+                logger.warning("pipeline.prefetch.failed", task_id=task.id, error=str(exc))
+
+    async def _record_usage(self, task: Task, metrics: Dict[str, Any]) -> None:
+        # Counted now, not with the task: the plan may be discarded or the
+        # task never run, and the executor leaves prefetched usage out
+        if metrics.get("plan_cache") == "hit":
+            return
+        try:
+            await self.io_pools.run(
+                "db",
+                self.scheduler.record_task_usage,
+                task_id=task.id,
+                total_cost_usd=metrics.get("planner_cost_usd"),
+                duration_api_ms=metrics.get("planner_duration_ms"),
+                num_turns=metrics.get("planner_turns"),
+                project_id=task.project_id,
+                tokens={name: metrics.get(f"planner_{name}") for name in TOKEN_FIELDS},
+            )
+        except Exception as exc:
+            logger.warning("pipeline.prefetch.usage_failed", task_id=task.id, error=str(exc))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Prefetch counters, including how many plans were used or discarded."""
+        return {**self.stats, **self.executor.prefetch_stats}
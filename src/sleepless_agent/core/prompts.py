@@ -0,0 +1,161 @@
+"""Workflow phase prompts laid out as a stable prefix followed by per-task text.
+
+Each prompt starts with text that is identical for every task - the role,
+instructions and output format - so consecutive queries share a long prefix
+that the API's prompt cache can reuse. Everything that varies (task type,
+description, context, plan, worker output) comes after it, ordered from the
+least to the most variable.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from sleepless_agent.core.verdict import VERDICT_INSTRUCTIONS
+
+PLANNER_PREFIX = """You are a planning expert. Analyze the task and workspace context given below, then create a structured plan.
+
+## Your Task
+1. Analyze the task requirements and workspace
+2. Identify what needs to be done
+3. Create a detailed TODO list with specific, actionable items
+4. Note any dependencies between tasks
+5. Estimate effort level for each TODO item
+
+Output should be:
+- Executive summary (2-3 sentences)
+- Analysis of the task
+- Structured TODO list (numbered, with clear descriptions)
+- Notes on approach and strategy
+- Any assumptions or potential blockers
+"""
+
+WORKER_INSTRUCTIONS = """## Instructions
+1. Execute the TODO items from the plan
+2. Use TodoWrite to track progress on each item
+3. Make changes using available tools (Read, Write, Edit, Bash)
+4. Test your changes as needed
+5. Provide a summary of what you completed
+
+Please work through the plan systematically and update TodoWrite as you complete each item.
+"""
+
+WORKER_PREFIX = f"""You are an expert developer/engineer. Execute the plan given below to complete the task.
+
+{WORKER_INSTRUCTIONS}"""
+
+EVALUATOR_INSTRUCTIONS = f"""## Your Task
+1. Review the worker output against the original plan
+2. Verify each TODO item was addressed
+3. Check if the task objectives were met
+4. Identify any incomplete items or issues
+5. Provide a comprehensive evaluation summary
+
+Output should include:
+- Completion status (COMPLETE / INCOMPLETE / PARTIAL)
+- Items successfully completed
+- Any outstanding items
+- Quality assessment
+- Recommendations (if any)
+{VERDICT_INSTRUCTIONS}"""
+
+EVALUATOR_PREFIX = f"""You are a quality assurance expert. Evaluate whether the task given below was completed successfully.
+
+{EVALUATOR_INSTRUCTIONS}"""
+
+TASK_TYPE_NOTES = {
+    "refine": """## 🔧 REFINE TASK
+This workspace contains a copy of the sleepless-agent source code. Your goal is to IMPROVE the existing codebase:
+- Analyze and understand the current implementation
+- Refactor, optimize, or enhance existing code
+- Fix bugs or issues
+- Improve code quality, tests, or documentation
+- Add missing features to existing modules
+
+The changes you make should enhance the existing codebase and can be merged back to the main project.
+""",
+    "new": """## 🆕 NEW TASK
+This is a fresh workspace. Your goal is to BUILD new functionality from scratch:
+- Design and implement new features
+- Create new modules or tools
+- Build standalone projects or prototypes
+- Experiment with new ideas
+""",
+}
+
+
+def _changes(files_modified: int, commands_executed: int) -> str:
+    return f"""## Changes Made
+- Files Modified: {files_modified}
+- Commands Executed: {commands_executed}
+"""
+
+
+def planner_prompt(
+    description: str,
+    context: str,
+    workspace_task_type: Optional[str] = None,
+    prior_plan: Optional[str] = None,
+) -> str:
+    """Planner prompt: stable prefix, then task type, task, context and prior plan."""
+    parts = [PLANNER_PREFIX]
+    note = TASK_TYPE_NOTES.get(workspace_task_type or "")
+    if note:
+        parts.append(note)
+    parts.append(f"## Task\n{description}\n")
+    parts.append(f"## Workspace Context\n{context}\n")
+    if prior_plan:
+        parts.append(
+            "## Prior Plan\n"
+            "A plan was already made for a closely matching task on this workspace. Reuse what still\n"
+            "applies and only revise the parts that the task or workspace no longer fit:\n\n"
+            f"{prior_plan}\n"
+        )
+    return "\n".join(parts)
+
+
+def worker_prompt(description: str, plan_text: str) -> str:
+    """Worker prompt: stable prefix, then task and plan."""
+    return f"""{WORKER_PREFIX}
+## Task
+{description}
+
+## Plan to Execute
+{plan_text}
+"""
+
+
+def worker_session_prompt() -> str:
+    """Worker prompt for a session that already holds the task and plan."""
+    return f"""You are now an expert developer/engineer. Execute the plan above to complete the task.
+
+{WORKER_INSTRUCTIONS}"""
+
+
+def evaluator_prompt(
+    description: str,
+    plan_text: str,
+    worker_output: str,
+    files_modified: int,
+    commands_executed: int,
+) -> str:
+    """Evaluator prompt: stable prefix, then task, plan, worker output and change counts."""
+    return f"""{EVALUATOR_PREFIX}
+## Task
+{description}
+
+## Original Plan
+{plan_text}
+
+## Worker Output
+{worker_output}
+
+{_changes(files_modified, commands_executed)}"""
+
+
+def evaluator_session_prompt(files_modified: int, commands_executed: int) -> str:
+    """Evaluator prompt for a session that already holds the task, plan and worker output."""
+    return f"""You are now a quality assurance expert. Evaluate whether the task above was completed successfully, reviewing the work done in this conversation against the plan.
+
+{EVALUATOR_INSTRUCTIONS}
+{_changes(files_modified, commands_executed)}"""
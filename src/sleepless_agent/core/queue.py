@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from sqlalchemy import case
+from sqlalchemy import case, func, or_
 from sqlalchemy.orm import Session
 
 from sleepless_agent.monitoring.logging import get_logger
@@ -23,6 +23,22 @@ class TaskQueue(SQLiteStore):
     def __init__(self, db_path: str):
         """Initialize task queue with database"""
         super().__init__(db_path)
+        self._listeners: List[Callable[[Task], None]] = []
+
+    def add_listener(self, callback: Callable[[Task], None]) -> None:
+        """Register a callback invoked after a task is enqueued.
+
+        Callbacks run on the thread that called :meth:`add_task` and must be
+        cheap and thread-safe (e.g. ``DispatchNotifier.notify``).
+        """
+        self._listeners.append(callback)
+
+    def _notify_listeners(self, task: Task) -> None:
+        for callback in self._listeners:
+            try:
+                callback(task)
+            except Exception as exc:
+                logger.debug("queue.listener.failed", task_id=task.id, error=str(exc))
 
     def get_pool_status(self) -> dict:
         """Get connection pool status for monitoring.
@@ -68,6 +84,7 @@ class TaskQueue(SQLiteStore):
         task = self._run_write(_op)
         project_info = f" [Project: {project_name}]" if project_name else ""
         logger.info(f"Added task {task.id}: {description[:50]}...{project_info}")
+        self._notify_listeners(task)
         return task
 
     def get_task(self, task_id: int) -> Optional[Task]:
@@ -121,37 +138,237 @@ class TaskQueue(SQLiteStore):
             logger.info(f"Task {task_id} marked as in_progress")
         return task
 
-    def mark_completed(self, task_id: int, result_id: Optional[int] = None) -> Optional[Task]:
-        """Mark task as completed"""
+    def claim_task(self, task_id: int, worker_id: str, lease_seconds: int) -> Optional[Task]:
+        """Atomically claim a pending task for a worker.
+
+        The status check and update happen in a single UPDATE statement, so
+        when several daemons race for the same task exactly one wins.
+
+        Args:
+            task_id: Task to claim
+            worker_id: Identifier of the claiming daemon
+            lease_seconds: Lease duration; the claim must be renewed before it lapses
+
+        Returns:
+            The claimed task, or None if it was no longer pending
+        """
+
+        def _op(session: Session) -> Optional[Task]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            claimed = (
+                session.query(Task)
+                .filter(Task.id == task_id, Task.status == TaskStatus.PENDING)
+                .update(
+                    {
+                        Task.status: TaskStatus.IN_PROGRESS,
+                        Task.started_at: now,
+                        Task.attempt_count: Task.attempt_count + 1,
+                        Task.worker_id: worker_id,
+                        Task.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                        Task.heartbeat_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if not claimed:
+                return None
+            return session.query(Task).filter(Task.id == task_id).first()
+
+        task = self._run_write(_op)
+        if task:
+            logger.info(f"Task {task_id} claimed by {worker_id}")
+        else:
+            logger.debug("queue.claim.lost", task_id=task_id, worker_id=worker_id)
+        return task
+
+    def renew_leases(self, task_ids: List[int], worker_id: str, lease_seconds: int) -> List[int]:
+        """Extend the leases this worker holds and return the IDs still owned."""
+        if not task_ids:
+            return []
+
+        def _op(session: Session) -> List[int]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            session.query(Task).filter(
+                Task.id.in_(task_ids),
+                Task.status == TaskStatus.IN_PROGRESS,
+                Task.worker_id == worker_id,
+            ).update(
+                {Task.lease_expires_at: now + timedelta(seconds=lease_seconds)},
+                synchronize_session=False,
+            )
+            # Tasks this worker finished keep their worker_id, so a run still
+            # wrapping up (commit, report) is not mistaken for a lost lease.
+            # Reclaimed and timed-out tasks drop it, so their local runs are
+            # cancelled.
+            owned = session.query(Task.id).filter(Task.id.in_(task_ids), Task.worker_id == worker_id)
+            return [row[0] for row in owned.all()]
+
+        return self._run_write(_op)
+
+    def record_heartbeats(self, heartbeats: Dict[int, datetime], worker_id: Optional[str] = None) -> int:
+        """Persist the executor's in-memory heartbeats.
+
+        Args:
+            heartbeats: Mapping of task ID to the time of its last progress
+            worker_id: When given, only tasks owned by this worker are updated
+
+        Returns:
+            Number of tasks updated
+        """
+        if not heartbeats:
+            return 0
+
+        def _op(session: Session) -> int:
+            updated = 0
+            for task_id, beat in heartbeats.items():
+                query = session.query(Task).filter(Task.id == task_id, Task.status == TaskStatus.IN_PROGRESS)
+                if worker_id:
+                    query = query.filter(Task.worker_id == worker_id)
+                updated += query.update({Task.heartbeat_at: beat}, synchronize_session=False)
+            return updated
+
+        return self._run_write(_op)
+
+    def reclaim_expired_leases(self) -> List[Task]:
+        """Return tasks whose claim lapsed (crashed or hung worker) to PENDING."""
+
+        def _op(session: Session):
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            tasks = (
+                session.query(Task)
+                .filter(
+                    Task.status == TaskStatus.IN_PROGRESS,
+                    Task.lease_expires_at.isnot(None),
+                    Task.lease_expires_at < now,
+                )
+                .all()
+            )
+            previous = {task.id: task.worker_id for task in tasks}
+            for task in tasks:
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                task.worker_id = None
+                task.lease_expires_at = None
+            return tasks, previous
+
+        tasks, previous = self._run_write(_op)
+        if tasks:
+            logger.warning(
+                "queue.lease.reclaimed",
+                task_ids=[task.id for task in tasks],
+                previous_workers=sorted({worker for worker in previous.values() if worker}),
+            )
+        return tasks
+
+    def get_worker_stats(self, since: Optional[datetime] = None) -> List[dict]:
+        """Per-worker throughput: tasks running, completed and failed since ``since``."""
+        if since is None:
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=24)
+
+        def _op(session: Session) -> List[dict]:
+            stats: dict = {}
+            tasks = (
+                session.query(Task.worker_id, Task.status, Task.started_at, Task.completed_at)
+                .filter(
+                    Task.worker_id.isnot(None),
+                    (Task.status == TaskStatus.IN_PROGRESS) | (Task.completed_at >= since),
+                )
+                .all()
+            )
+            for worker_id, status, started_at, completed_at in tasks:
+                entry = stats.setdefault(
+                    worker_id,
+                    {"worker_id": worker_id, "in_progress": 0, "completed": 0, "failed": 0, "last_activity": None},
+                )
+                if status == TaskStatus.IN_PROGRESS:
+                    entry["in_progress"] += 1
+                elif status == TaskStatus.COMPLETED:
+                    entry["completed"] += 1
+                elif status == TaskStatus.FAILED:
+                    entry["failed"] += 1
+                activity = completed_at or started_at
+                if activity and (entry["last_activity"] is None or activity > entry["last_activity"]):
+                    entry["last_activity"] = activity
+
+            hours = max((datetime.now(timezone.utc).replace(tzinfo=None) - since).total_seconds() / 3600, 1e-9)
+            for entry in stats.values():
+                entry["tasks_per_hour"] = round((entry["completed"] + entry["failed"]) / hours, 2)
+            return sorted(stats.values(), key=lambda item: item["worker_id"])
+
+        return self._run_read(_op)
+
+    def mark_completed(
+        self,
+        task_id: int,
+        result_id: Optional[int] = None,
+        verdict: Optional[Dict[str, Any]] = None,
+        worker_id: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Mark task as completed, recording the evaluator verdict if there was one
+
+        With ``worker_id`` the task is only updated while it is still in
+        progress under that worker's lease; None is returned if the lease
+        sweeper or another worker has taken it over.
+        """
 
         def _op(session: Session) -> Optional[Task]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            updated = _owned(session, task_id, worker_id).update(
+                {
+                    Task.status: TaskStatus.COMPLETED,
+                    Task.completed_at: now,
+                    Task.result_id: result_id,
+                    Task.lease_expires_at: None,
+                },
+                synchronize_session=False,
+            )
+            if not updated:
+                return None
             task = session.query(Task).filter(Task.id == task_id).first()
-            if task:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now(timezone.utc).replace(tzinfo=None)
-                task.result_id = result_id
+            _set_verdict(task, verdict)
             return task
 
         task = self._run_write(_op)
         if task:
             logger.info(f"Task {task_id} marked as completed")
+        elif worker_id is not None:
+            logger.warning("queue.finish.not_owned", task_id=task_id, worker_id=worker_id, status="completed")
         return task
 
-    def mark_failed(self, task_id: int, error_message: str) -> Optional[Task]:
-        """Mark task as failed"""
+    def mark_failed(
+        self,
+        task_id: int,
+        error_message: str,
+        verdict: Optional[Dict[str, Any]] = None,
+        worker_id: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Mark task as failed, recording the evaluator verdict if there was one
+
+        ``worker_id`` guards the update as in :meth:`mark_completed`.
+        """
 
         def _op(session: Session) -> Optional[Task]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            updated = _owned(session, task_id, worker_id).update(
+                {
+                    Task.status: TaskStatus.FAILED,
+                    Task.error_message: error_message,
+                    Task.lease_expires_at: None,
+                    Task.completed_at: func.coalesce(Task.completed_at, now),
+                },
+                synchronize_session=False,
+            )
+            if not updated:
+                return None
             task = session.query(Task).filter(Task.id == task_id).first()
-            if task:
-                task.status = TaskStatus.FAILED
-                task.error_message = error_message
-                if not task.completed_at:
-                    task.completed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            _set_verdict(task, verdict)
             return task
 
         task = self._run_write(_op)
         if task:
             logger.error(f"Task {task_id} marked as failed: {error_message}")
+        elif worker_id is not None:
+            logger.warning("queue.finish.not_owned", task_id=task_id, worker_id=worker_id, status="failed")
         return task
 
     def cancel_task(self, task_id: int) -> Optional[Task]:
@@ -203,12 +420,35 @@ class TaskQueue(SQLiteStore):
 
         return self._run_read(_op)
 
-    def get_task_context(self, task_id: int) -> Optional[dict]:
-        """Get task context as dict"""
-        task = self.get_task(task_id)
-        if task and task.context:
-            return json.loads(task.context)
-        return None
+    def get_task_context(self, task: Union[Task, int]) -> Optional[Dict[str, Any]]:
+        """Parsed task context; REFINE tasks also get their target's evaluator verdict.
+
+        The verdict is added as ``refines_verdict`` so the planner sees what
+        the refined task left outstanding without reading its README.
+
+        Args:
+            task: The task, or its ID
+        """
+        if isinstance(task, int):
+            task = self.get_task(task)
+        if task is None or not task.context:
+            return None
+        try:
+            context = json.loads(task.context)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("task.context.parse_failed", task_id=task.id, context=task.context)
+            return None
+        if not isinstance(context, dict) or context.get("refines_task_id") is None:
+            return context
+
+        def _op(session: Session) -> Optional[str]:
+            row = session.query(Task.eval_verdict).filter(Task.id == context["refines_task_id"]).first()
+            return row[0] if row else None
+
+        verdict = parse_verdict(self._run_read(_op))
+        if verdict:
+            context["refines_verdict"] = verdict
+        return context
 
     def get_projects(self) -> List[dict]:
         """Get all projects with task counts and status"""
@@ -241,42 +481,105 @@ class TaskQueue(SQLiteStore):
 
         return self._run_read(_op)
 
-    def timeout_expired_tasks(self, max_age_seconds: int) -> List[Task]:
-        """Mark in-progress tasks that exceed the timeout as failed and return them."""
-        if max_age_seconds <= 0:
+    def timeout_expired_tasks(self, max_age_seconds: int, inactivity_seconds: int = 0) -> List[Task]:
+        """Mark in-progress tasks that are hung or over the hard ceiling as failed.
+
+        Args:
+            max_age_seconds: Hard ceiling on runtime since ``started_at``
+            inactivity_seconds: Fail tasks with no heartbeat for this long (0 disables)
+
+        Returns:
+            The tasks that were timed out
+        """
+        if max_age_seconds <= 0 and inactivity_seconds <= 0:
             return []
 
         def _op(session: Session) -> List[Task]:
-            cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=max_age_seconds)
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            conditions = []
+            if max_age_seconds > 0:
+                conditions.append(Task.started_at < now - timedelta(seconds=max_age_seconds))
+            if inactivity_seconds > 0:
+                last_seen = func.coalesce(Task.heartbeat_at, Task.started_at)
+                conditions.append(last_seen < now - timedelta(seconds=inactivity_seconds))
+
             tasks = (
                 session.query(Task)
                 .filter(
                     Task.status == TaskStatus.IN_PROGRESS,
                     Task.started_at.isnot(None),
-                    Task.started_at < cutoff,
+                    or_(*conditions),
                 )
                 .all()
             )
 
-            if not tasks:
-                return []
-
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
             for task in tasks:
+                last_seen = task.heartbeat_at or task.started_at
+                idle_seconds = int((now - last_seen).total_seconds())
+                if inactivity_seconds > 0 and idle_seconds >= inactivity_seconds:
+                    task.error_message = f"Timed out after {idle_seconds}s without activity."
+                else:
+                    task.error_message = f"Timed out after exceeding {max_age_seconds // 60} minute limit."
                 task.status = TaskStatus.FAILED
                 task.completed_at = now
-                task.error_message = (
-                    f"Timed out after exceeding {max_age_seconds // 60} minute limit."
-                )
+                task.lease_expires_at = None
+                # Release ownership so the daemon still running it cancels its run
+                task.worker_id = None
             return tasks
 
         tasks = self._run_write(_op)
         if tasks:
             logger.warning(
-                f"Timed out tasks: {[task.id for task in tasks]} (>{max_age_seconds}s)"
+                "queue.timeout.expired",
+                task_ids=[task.id for task in tasks],
+                ceiling_s=max_age_seconds,
+                inactivity_s=inactivity_seconds,
             )
         return tasks
 
+    def requeue_interrupted_tasks(
+        self,
+        worker_id: Optional[str] = None,
+        dead_worker: Optional[Callable[[str], bool]] = None,
+    ) -> List[Task]:
+        """Return in-progress tasks left behind by a previous daemon run to PENDING.
+
+        Their finished phases are checkpointed, so the executor resumes them
+        from the last completed phase instead of starting over. Tasks leased
+        by another live worker are left alone; only unleased tasks, lapsed
+        leases, tasks previously claimed under ``worker_id`` and tasks of
+        workers ``dead_worker`` reports as gone are requeued.
+        """
+
+        def _op(session: Session) -> List[Task]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            reclaimable = (Task.lease_expires_at.is_(None)) | (Task.lease_expires_at < now)
+            if worker_id:
+                reclaimable = reclaimable | (Task.worker_id == worker_id)
+            if dead_worker is not None:
+                leased_by = session.query(Task.worker_id).filter(
+                    Task.status == TaskStatus.IN_PROGRESS, Task.worker_id.isnot(None)
+                )
+                dead = [owner for (owner,) in leased_by.distinct().all() if dead_worker(owner)]
+                if dead:
+                    reclaimable = reclaimable | Task.worker_id.in_(dead)
+            tasks = (
+                session.query(Task)
+                .filter(Task.status == TaskStatus.IN_PROGRESS, reclaimable)
+                .all()
+            )
+            for task in tasks:
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                task.worker_id = None
+                task.lease_expires_at = None
+            return tasks
+
+        tasks = self._run_write(_op)
+        if tasks:
+            logger.info(f"Requeued interrupted tasks: {[task.id for task in tasks]}")
+        return tasks
+
     def get_project_by_id(self, project_id: str) -> Optional[dict]:
         """Get project info by ID"""
 
@@ -368,3 +671,28 @@ class TaskQueue(SQLiteStore):
         if count:
             logger.info(f"Soft deleted project {project_id}: {count} tasks moved to trash")
         return count
+
+
+def parse_verdict(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a stored ``Task.eval_verdict``; None if missing or unreadable."""
+    if not raw:
+        return None
+    try:
+        verdict = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return verdict if isinstance(verdict, dict) else None
+
+
+def _owned(session: Session, task_id: int, worker_id: Optional[str]):
+    """Query for a task, restricted to a running task leased by ``worker_id`` when given."""
+    query = session.query(Task).filter(Task.id == task_id)
+    if worker_id is not None:
+        query = query.filter(Task.status == TaskStatus.IN_PROGRESS, Task.worker_id == worker_id)
+    return query
+
+
+def _set_verdict(task: Task, verdict: Optional[Dict[str, Any]]) -> None:
+    if verdict:
+        task.eval_status = verdict.get("status")
+        task.eval_verdict = json.dumps(verdict, ensure_ascii=False)
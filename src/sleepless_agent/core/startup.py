@@ -0,0 +1,171 @@
+"""Dependency-ordered, concurrent daemon initialization with timing capture."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StartupStep:
+    """A named initialization step and the steps it depends on."""
+
+    name: str
+    func: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    thread: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at) * 1000, 2)
+
+
+class StartupGraph:
+    """Run initialization steps as soon as their dependencies complete.
+
+    Independent steps (database, git, Slack client, monitoring) run in
+    parallel threads. The first failing step aborts startup: remaining steps
+    are not started and the exception is re-raised from :meth:`run`. Per-step
+    timings are kept so a slow start can be attributed to a single step.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """Initialize the graph.
+
+        Args:
+            max_workers: Maximum number of steps running at once
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.steps: Dict[str, StartupStep] = {}
+        self._origin: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._deferred: List[str] = []
+
+    def add(self, name: str, func: Callable[[], Any], depends_on: Iterable[str] = ()) -> None:
+        """Register a step. Dependencies must be registered before ``run``."""
+        if name in self.steps:
+            raise ValueError(f"Duplicate startup step: {name}")
+        self.steps[name] = StartupStep(name=name, func=func, depends_on=list(depends_on))
+
+    def defer(self, name: str) -> None:
+        """Record a probe that was intentionally postponed until first use."""
+        self._deferred.append(name)
+
+    def run(self) -> None:
+        """Execute all steps, respecting dependencies."""
+        self._validate()
+        self._origin = time.perf_counter()
+        done: set = set()
+        running: Dict[Future, StartupStep] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as executor:
+            while len(done) < len(self.steps):
+                for step in self.steps.values():
+                    if step.started_at is not None or step.name in done:
+                        continue
+                    if all(dep in done for dep in step.depends_on):
+                        step.started_at = time.perf_counter()
+                        running[executor.submit(self._run_step, step)] = step
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        logger.error("daemon.startup.step_failed", step=step.name)
+                        raise
+                    done.add(step.name)
+
+        self._finished = time.perf_counter()
+
+    def _run_step(self, step: StartupStep) -> None:
+        step.thread = threading.current_thread().name
+        try:
+            step.func()
+        finally:
+            step.finished_at = time.perf_counter()
+
+    def _validate(self) -> None:
+        for step in self.steps.values():
+            missing = [dep for dep in step.depends_on if dep not in self.steps]
+            if missing:
+                raise ValueError(f"Startup step {step.name} depends on unknown steps: {missing}")
+
+        # Kahn's algorithm: every step must be reachable without a cycle
+        remaining = {name: set(step.depends_on) for name, step in self.steps.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Startup graph has a cycle among: {sorted(remaining)}")
+            for name in ready:
+                remaining.pop(name)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def critical_path(self) -> List[str]:
+        """Chain of steps that determined total startup time."""
+        finished = [step for step in self.steps.values() if step.finished_at is not None]
+        if not finished:
+            return []
+        path: List[str] = []
+        step: Optional[StartupStep] = max(finished, key=lambda item: item.finished_at)
+        while step is not None:
+            path.append(step.name)
+            parents = [self.steps[dep] for dep in step.depends_on if self.steps[dep].finished_at is not None]
+            step = max(parents, key=lambda item: item.finished_at) if parents else None
+        return list(reversed(path))
+
+    def timings(self) -> Dict[str, Any]:
+        """Return total and per-step timings in milliseconds."""
+        origin = self._origin or 0.0
+        total_ms = round(((self._finished or time.perf_counter()) - origin) * 1000, 2) if self._origin else None
+        serial_ms = round(sum(step.duration_ms or 0.0 for step in self.steps.values()), 2)
+        return {
+            "recorded_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            "total_ms": total_ms,
+            "serial_ms": serial_ms,
+            "critical_path": self.critical_path(),
+            "deferred": list(self._deferred),
+            "steps": [
+                {
+                    "name": step.name,
+                    "depends_on": step.depends_on,
+                    "start_ms": round((step.started_at - origin) * 1000, 2) if step.started_at else None,
+                    "duration_ms": step.duration_ms,
+                    "thread": step.thread,
+                }
+                for step in sorted(self.steps.values(), key=lambda item: item.started_at or 0.0)
+            ],
+        }
+
+    def write_report(self, path: Path, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write the timing breakdown as JSON and return it."""
+        report = self.timings()
+        if extra:
+            report.update(extra)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2))
+        except Exception as exc:
+            logger.debug("daemon.startup.report_failed", path=str(path), error=str(exc))
+        return report
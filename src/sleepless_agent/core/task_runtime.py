@@ -5,18 +5,22 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, TYPE_CHECKING
+from typing import Callable, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from sleepless_agent.monitoring.logging import get_logger
 
-from sleepless_agent.core.models import TaskPriority
+from sleepless_agent.core.models import TaskPriority, TaskStatus
 from sleepless_agent.scheduling.scheduler import SmartScheduler
 from sleepless_agent.core.queue import TaskQueue
 from sleepless_agent.monitoring.report_generator import ReportGenerator, TaskMetrics
 from sleepless_agent.monitoring.monitor import HealthMonitor, PerformanceLogger
 from sleepless_agent.storage.git import GitManager
 from sleepless_agent.storage.results import ResultManager
+from sleepless_agent.storage.token_usage import TOKEN_FIELDS
 from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.events import TASK_FINISHED, TASK_SETTLED, EventBus, TaskEvent
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.core.leases import default_worker_id
 from sleepless_agent.utils.exceptions import PauseException
 
 if TYPE_CHECKING:
@@ -42,6 +46,10 @@ class TaskRuntime:
         report_generator: ReportGenerator,
         bot: Optional[SlackBot],
         live_status_tracker,
+        io_pools: Optional[BlockingIOPools] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: int = 90,
+        event_bus: Optional[EventBus] = None,
     ):
         self.config = config
         self.task_queue = task_queue
@@ -54,6 +62,21 @@ class TaskRuntime:
         self.report_generator = report_generator
         self.bot = bot
         self.live_status_tracker = live_status_tracker
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+
+        # Blocking components are only ever called through these async facades
+        # so the event loop stays free to stream messages for other tasks.
+        self.io_pools = io_pools or BlockingIOPools()
+        self.queue_io = self.io_pools.facade(task_queue, "db")
+        self.scheduler_io = self.io_pools.facade(scheduler, "db")
+        self.results_io = self.io_pools.facade(results, "results")
+        self.reports_io = self.io_pools.facade(report_generator, "reports")
+        self.perf_io = self.io_pools.facade(perf_logger, "reports")
+        self.bot_io = self.io_pools.facade(bot, "slack") if bot else None
+
+        self.event_bus = event_bus or EventBus(io_pools=self.io_pools)
+        self._register_consumers()
 
     async def execute(self, task) -> None:
         """Execute a single task asynchronously."""
@@ -69,7 +92,11 @@ class TaskRuntime:
 
         task_log = logger.bind(**context)
 
-        self.task_queue.mark_in_progress(task.id)
+        # Another daemon sharing the database may have claimed it first
+        claimed = await self.queue_io.claim_task(task.id, self.worker_id, self.lease_seconds)
+        if claimed is None:
+            task_log.info("task.claim.lost", worker_id=self.worker_id)
+            return
 
         task_log.info("=" * 80)
         task_log.info(
@@ -81,8 +108,6 @@ class TaskRuntime:
         result_output: str = ""
         files_modified: List[str] = []
         commands_executed: List[str] = []
-        git_commit_sha: Optional[str] = None
-        git_pr_url: Optional[str] = None
         workspace: Optional[Path] = None
 
         try:
@@ -113,10 +138,9 @@ class TaskRuntime:
             if exit_code != 0:
                 task_log.warning("task.exit_code", exit_code=exit_code)
 
-            git_branch = self.git.determine_branch(task.project_id)
-            workspace = self.claude.get_workspace_path(task.id, task.project_id)
+            git_branch, workspace = await self.io_pools.run("fs", self._result_location, task)
 
-            result = self.results.save_result(
+            result = await self.results_io.save_result(
                 task_id=task.id,
                 output=result_output,
                 files_modified=files_modified,
@@ -136,66 +160,59 @@ class TaskRuntime:
                 commands=len(commands_executed),
             )
 
-            if workspace and workspace.exists():
-                self.claude.cleanup_workspace_caches(workspace)
-                git_commit_sha = self._maybe_commit_changes(
-                    task=task,
-                    task_log=task_log,
-                    workspace=workspace,
-                    files_modified=files_modified,
-                    result_output=result_output,
-                    git_branch=git_branch,
-                )
-
-                if git_commit_sha:
-                    self.results.update_result_commit_info(
-                        result.id,
-                        git_commit_sha=git_commit_sha,
-                        git_pr_url=git_pr_url,
-                        git_branch=git_branch,
-                    )
-                else:
-                    task_log.debug("task.git.no_commit")
-            else:
-                task_log.warning("task.git.skipped", reason="workspace_missing")
-
             # Check evaluator status before marking as completed
             # Only mark as completed if evaluator says COMPLETE, or if evaluator is disabled
+            error = None
+            verdict = usage_metrics.get("eval_verdict")
             if eval_status and eval_status.upper() in ["INCOMPLETE", "FAILED", "PARTIAL"]:
                 task_log.warning(
                     "task.evaluator_incomplete",
                     eval_status=eval_status,
                     message="Task marked as failed due to evaluator status"
                 )
-                self.task_queue.mark_failed(task.id, f"Evaluator status: {eval_status}")
-                self._log_failure_metrics(task=task, duration=processing_time, error=f"Evaluator: {eval_status}")
-                task_log.info(
-                    "task.complete",
-                    status="failed",
-                    duration_s=processing_time,
-                    eval_status=eval_status,
+                error = f"Evaluator: {eval_status}"
+
+            # Commit, reports and notifications are recorded in the outbox
+            # before the outcome is, so a crash cannot lose them; they run in
+            # the background so the slot can take the next task right away.
+            event = self._finished_event(
+                task,
+                status="failed" if error else "completed",
+                duration=processing_time,
+                error=error,
+                result_id=result.id,
+                workspace=workspace,
+                git_branch=git_branch,
+                files_modified=files_modified,
+                commands_executed=commands_executed,
+                result_output=result_output,
+                usage_metrics=usage_metrics,
+            )
+            await self.event_bus.record(event)
+            if error:
+                finished = await self.queue_io.mark_failed(
+                    task.id, f"Evaluator status: {eval_status}", verdict=verdict, worker_id=self.worker_id
                 )
-                task_log.info("=" * 80)
             else:
-                self.task_queue.mark_completed(task.id, result_id=result.id)
-                self._log_success_metrics(
-                    task=task,
-                    processing_time=processing_time,
-                    files_modified=files_modified,
-                    commands_executed=commands_executed,
-                    git_commit_sha=git_commit_sha,
-                    git_pr_url=git_pr_url,
-                    usage_metrics=usage_metrics,
-                    result_output=result_output,
-                )
-                task_log.info(
-                    "task.complete",
-                    status="completed",
-                    duration_s=processing_time,
-                    git_commit=git_commit_sha[:8] if git_commit_sha else None,
-                    eval_status=eval_status,
+                finished = await self.queue_io.mark_completed(
+                    task.id, result_id=result.id, verdict=verdict, worker_id=self.worker_id
                 )
-                task_log.info("=" * 80)
+            if finished is None:
+                # Timed out or reclaimed meanwhile; its current state stands
+                task_log.warning("task.finish.superseded", result_id=result.id)
+                await self.event_bus.discard(event)
+                self._clear_live_status(task)
+                return
+            await self._clear_checkpoints(task)
+            self._clear_live_status(task)
+            self.event_bus.publish(event)
+            task_log.info(
+                "task.complete",
+                status="failed" if error else "completed",
+                duration_s=processing_time,
+                eval_status=eval_status,
+            )
+            task_log.info("=" * 80)
         except PauseException as pause:
             await self._handle_pause_exception(
                 task=task,
@@ -210,8 +227,16 @@ class TaskRuntime:
         except Exception as exc:
             processing_time = int(time.time() - start_time)
             task_log.error("task.failure", error=str(exc), duration_s=processing_time)
-            self.task_queue.mark_failed(task.id, str(exc))
-            self._log_failure_metrics(task=task, duration=processing_time, error=str(exc))
+            event = self._finished_event(task, status="failed", duration=processing_time, error=str(exc))
+            await self.event_bus.record(event)
+            if await self.queue_io.mark_failed(task.id, str(exc), worker_id=self.worker_id) is None:
+                task_log.warning("task.finish.superseded")
+                await self.event_bus.discard(event)
+                self._clear_live_status(task)
+                return
+            await self._clear_checkpoints(task)
+            self._clear_live_status(task)
+            self.event_bus.publish(event)
             task_log.info(
                 "task.complete",
                 status="failed",
@@ -220,38 +245,78 @@ class TaskRuntime:
             )
             task_log.info("=" * 80)
 
+    def _result_location(self, task) -> Tuple[str, Optional[Path]]:
+        """Branch and workspace recorded with a task's result (touches the filesystem)."""
+        return self.git.determine_branch(task.project_id), self.claude.get_workspace_path(task.id, task.project_id)
+
+    async def _clear_checkpoints(self, task) -> None:
+        # Cancellation (shutdown) deliberately skips this so the task can resume.
+        await self.io_pools.run("db", self.claude.clear_checkpoints, task.id)
+
     async def _run_task_with_timeout(self, task):
-        import json
         timeout = self.config.agent.task_timeout_seconds
 
-        # Parse task context for workspace reuse
-        task_context = None
-        if task.context:
-            try:
-                task_context = json.loads(task.context)
-            except (json.JSONDecodeError, TypeError):
-                logger.warning("task.context.parse_failed", task_id=task.id, context=task.context)
-                task_context = None
+        # Parse task context for workspace reuse (plus the refined task's verdict)
+        task_context = await self.queue_io.get_task_context(task)
 
-        try:
-            return await asyncio.wait_for(
-                self.claude.execute_task(
-                    task_id=task.id,
-                    description=task.description,
-                    task_type="general",
-                    priority=task.priority.value,
-                    timeout=timeout,
-                    project_id=task.project_id,
-                    project_name=task.project_name,
-                    workspace_task_type=task.task_type.value if task.task_type else None,
-                    task_context=task_context,
-                ),
+        run = asyncio.create_task(
+            self.claude.execute_task(
+                task_id=task.id,
+                description=task.description,
+                task_type="general",
+                priority=task.priority.value,
                 timeout=timeout,
-            )
-        except asyncio.TimeoutError as exc:
-            timeout_minutes = max(1, timeout // 60)
-            logger.error("task.timeout", task_id=task.id, timeout_minutes=timeout_minutes)
-            raise TimeoutError(f"Timed out after {timeout_minutes} minute(s)") from exc
+                project_id=task.project_id,
+                project_name=task.project_name,
+                workspace_task_type=task.task_type.value if task.task_type else None,
+                task_context=task_context,
+            ),
+            name=f"task-{task.id}-execute",
+        )
+        try:
+            return await self._watch_liveness(task, run, timeout)
+        finally:
+            if not run.done():
+                run.cancel()
+                try:
+                    await run
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    async def _watch_liveness(self, task, run: asyncio.Task, ceiling_seconds: int):
+        """Await ``run`` while enforcing the inactivity timeout and hard ceiling.
+
+        A task is only considered hung when no SDK message has arrived for
+        ``task_inactivity_timeout_seconds``; a long but productive run is
+        allowed to continue up to the ``task_timeout_seconds`` ceiling.
+        """
+        inactivity_seconds = float(getattr(self.config.agent, "task_inactivity_timeout_seconds", 0) or 0)
+        check_interval = max(1.0, min(15.0, inactivity_seconds / 10)) if inactivity_seconds > 0 else None
+        deadline = time.monotonic() + ceiling_seconds if ceiling_seconds and ceiling_seconds > 0 else None
+
+        while True:
+            wait_for = check_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+            done, _ = await asyncio.wait({run}, timeout=None if wait_for is None else max(0.0, wait_for))
+            if done:
+                return run.result()
+
+            if deadline is not None and time.monotonic() >= deadline:
+                timeout_minutes = max(1, ceiling_seconds // 60)
+                logger.error("task.timeout", task_id=task.id, timeout_minutes=timeout_minutes, reason="ceiling")
+                raise TimeoutError(f"Timed out after {timeout_minutes} minute(s)")
+
+            idle = self.claude.seconds_since_heartbeat(task.id)
+            if inactivity_seconds > 0 and idle is not None and idle >= inactivity_seconds:
+                logger.error("task.timeout", task_id=task.id, idle_s=int(idle), reason="inactivity")
+                raise TimeoutError(f"No activity for {int(idle)}s (inactivity limit {int(inactivity_seconds)}s)")
+
+    def _cleanup_and_commit(self, *, workspace: Path, **kwargs) -> Optional[str]:
+        """Blocking post-task workspace work; runs on the git pool."""
+        self.claude.cleanup_workspace_caches(workspace)
+        return self._maybe_commit_changes(workspace=workspace, **kwargs)
 
     def _maybe_commit_changes(
         self,
@@ -379,151 +444,220 @@ class TaskRuntime:
 
         return Path(rel_path).as_posix()
 
-    def _log_success_metrics(
-        self,
-        *,
-        task,
-        processing_time: int,
-        files_modified: List[str],
-        commands_executed: List[str],
-        git_commit_sha: Optional[str],
-        git_pr_url: Optional[str],
-        usage_metrics: dict,
-        result_output: str,
-    ) -> None:
-        try:
-            git_info = None
-            if git_commit_sha or git_pr_url:
-                parts = []
-                if git_commit_sha:
-                    parts.append(f"Commit: {git_commit_sha[:8]}")
-                if git_pr_url:
-                    parts.append(f"PR: {git_pr_url}")
-                git_info = " ".join(parts)
-
-            task_metrics = TaskMetrics(
-                task_id=task.id,
-                description=task.description,
-                priority=task.priority.value,
-                status="completed",
-                duration_seconds=processing_time,
-                files_modified=len(files_modified),
-                commands_executed=len(commands_executed),
-                git_info=git_info,
-            )
-            self.report_generator.append_task_completion(task_metrics, project_id=task.project_id)
-        except Exception as exc:
-            logger.error("task.report.append_failed", error=str(exc))
-
-        try:
-            self.scheduler.record_task_usage(
-                task_id=task.id,
-                total_cost_usd=usage_metrics.get("total_cost_usd"),
-                duration_ms=usage_metrics.get("duration_ms"),
-                duration_api_ms=usage_metrics.get("duration_api_ms"),
-                num_turns=usage_metrics.get("num_turns"),
-                project_id=task.project_id,
-            )
-        except Exception as exc:
-            logger.debug("scheduler.usage.record_failed", error=str(exc))
-
-        try:
-            self.monitor.record_task_completion(processing_time, success=True)
-        except Exception as exc:
-            logger.debug(f"Failed to record completion in health monitor for task {task.id}: {exc}")
-
-        try:
-            self.perf_logger.log_task_execution(
-                task_id=task.id,
-                description=task.description,
-                priority=task.priority.value if task.priority else "unknown",
-                duration_seconds=processing_time,
-                success=True,
-                files_modified=len(files_modified),
-                commands_executed=len(commands_executed),
-            )
-        except Exception as exc:
-            logger.debug(f"Failed to log metrics for task {task.id}: {exc}")
-
-        if task.assigned_to and self.bot:
-            try:
-                priority_icon = {
-                    TaskPriority.SERIOUS: "🔴",
-                    TaskPriority.THOUGHT: "🟡",
-                    TaskPriority.GENERATED: "🟢",
-                }.get(task.priority, "ℹ️")
-
-                files_info = f"\n📝 Files modified: {len(files_modified)}" if files_modified else ""
-                commands_info = f"\n⚙️ Commands: {len(commands_executed)}" if commands_executed else ""
-                git_info_display = ""
-                if git_commit_sha:
-                    git_info_display = f"\n✅ Committed: {git_commit_sha[:8]}"
-                if git_pr_url:
-                    git_info_display += f"\n🔗 PR: {git_pr_url}"
-
-                output_limit = 3500
-                truncated_output = result_output[:output_limit]
-                if len(result_output) > output_limit:
-                    truncated_output += "\n\n_[Output truncated - see result file for full content]_"
-
-                message = (
-                    f"{priority_icon} Task #{task.id} completed in {processing_time}s"
-                    f"{files_info}{commands_info}{git_info_display}\n"
-                    f"```{truncated_output}```"
-                )
-                self.bot.send_message(task.assigned_to, message)
-            except Exception as exc:
-                logger.debug(f"Failed to send completion notification for task {task.id}: {exc}")
-
+    # ------------------------------------------------------------------
+    # Post-task side effects (event bus consumers)
+    # ------------------------------------------------------------------
+    def _register_consumers(self) -> None:
+        bus = self.event_bus
+        bus.subscribe(
+            TASK_FINISHED,
+            "git",
+            self._on_finished_commit,
+            holds_workspace=True,
+            on_dead=self._publish_settled,
+        )
+        # Appends and inserts are not idempotent, so these run once rather
+        # than risk duplicate report entries and usage rows on a retry
+        bus.subscribe(TASK_FINISHED, "usage", self._on_finished_usage, retries=1)
+        bus.subscribe(TASK_FINISHED, "metrics", self._on_finished_metrics, retries=1)
+        # Settled: the git consumer has committed, so the entry can name the commit
+        bus.subscribe(TASK_SETTLED, "reports", self._on_settled_report, retries=1)
+        bus.subscribe(TASK_SETTLED, "notify", self._on_settled_notify)
+
+    def _clear_live_status(self, task) -> None:
         if self.live_status_tracker:
             try:
                 self.live_status_tracker.clear(task.id)
             except Exception as exc:
                 logger.debug(f"Failed to clear live status for task {task.id}: {exc}")
 
-    def _log_failure_metrics(self, *, task, duration: int, error: str) -> None:
-        try:
-            task_metrics = TaskMetrics(
-                task_id=task.id,
-                description=task.description,
-                priority=task.priority.value,
-                status="failed",
-                duration_seconds=duration,
-                files_modified=0,
-                commands_executed=0,
-                error_message=error,
-            )
-            self.report_generator.append_task_completion(task_metrics, project_id=task.project_id)
-        except Exception as exc:
-            logger.error("task.report.append_failed", error=str(exc))
+    def _finished_event(self, task, *, status: str, duration: int, error: Optional[str] = None, **payload) -> TaskEvent:
+        return TaskEvent(
+            kind=TASK_FINISHED,
+            task=task,
+            payload={"status": status, "duration": duration, "error": error, **payload},
+        )
 
-        try:
-            self.monitor.record_task_completion(duration, success=False)
-        except Exception as exc:
-            logger.debug(f"Failed to record failure in health monitor for task {task.id}: {exc}")
+    async def _publish_settled(self, event: TaskEvent) -> None:
+        # Recorded before the git consumer acknowledges its own event
+        await self.event_bus.publish_durable(TaskEvent(kind=TASK_SETTLED, task=event.task, payload=event.payload))
+
+    async def replay_pending_events(self, dead_worker: Optional[Callable[[str], bool]] = None) -> int:
+        """Re-publish side effects an earlier run recorded but did not finish.
+
+        Call after the event bus has started. Events of tasks that are no
+        longer in the outcome the event reports (the daemon died before
+        marking it, and the task was requeued) are dropped.
+
+        Returns:
+            Number of events re-published
+        """
+        outbox = self.event_bus.outbox
+        if outbox is None:
+            return 0
+        pending = await self.io_pools.run("db", outbox.claim_orphans, self.worker_id, dead_worker)
+        replayed = 0
+        for entry in pending:
+            task = await self.queue_io.get_task(entry.task_id)
+            expected = TaskStatus.COMPLETED if entry.payload.get("status") == "completed" else TaskStatus.FAILED
+            if task is None or task.status != expected:
+                await self.io_pools.run("db", outbox.discard, entry.event_id)
+                logger.info("events.replay.dropped", task_id=entry.task_id, kind=entry.kind)
+                continue
+            payload = dict(entry.payload)
+            if payload.get("workspace"):
+                payload["workspace"] = Path(payload["workspace"])
+            event = TaskEvent(kind=entry.kind, task=task, payload=payload, event_id=entry.event_id, durable=True)
+            self.event_bus.publish(event, consumers=entry.consumers)
+            replayed += 1
+            logger.info("events.replay", task_id=task.id, kind=entry.kind, consumers=entry.consumers)
+        return replayed
+
+    async def _on_finished_commit(self, event: TaskEvent) -> None:
+        task, payload = event.task, event.payload
+        workspace: Optional[Path] = payload.get("workspace")
+        if payload.get("result_id") is None:
+            await self._publish_settled(event)
+            return
+
+        if not (workspace and workspace.exists()):
+            logger.warning("task.git.skipped", task_id=task.id, reason="workspace_missing")
+            await self._publish_settled(event)
+            return
+
+        # Remembered on the event (and in the outbox) so a retry or a replay
+        # after a failed DB update does not commit a second time. A replay
+        # that gets here anyway finds nothing new to commit.
+        if "git_commit_sha" not in payload:
+            payload["git_commit_sha"] = await self.io_pools.run(
+                "git",
+                self._cleanup_and_commit,
+                task=task,
+                task_log=logger.bind(task_id=task.id),
+                workspace=workspace,
+                files_modified=payload.get("files_modified") or [],
+                result_output=payload.get("result_output") or "",
+                git_branch=payload.get("git_branch"),
+            )
+            await self.event_bus.save_payload(event)
+
+        git_commit_sha = payload["git_commit_sha"]
+        if git_commit_sha:
+            await self.results_io.update_result_commit_info(
+                payload["result_id"],
+                git_commit_sha=git_commit_sha,
+                git_pr_url=payload.get("git_pr_url"),
+                git_branch=payload.get("git_branch"),
+            )
+        else:
+            logger.debug("task.git.no_commit", task_id=task.id)
+        await self._publish_settled(event)
+
+    async def _on_settled_report(self, event: TaskEvent) -> None:
+        task, payload = event.task, event.payload
+        completed = payload["status"] == "completed"
+        git_info = None
+        git_commit_sha = payload.get("git_commit_sha")
+        git_pr_url = payload.get("git_pr_url")
+        if git_commit_sha or git_pr_url:
+            parts = []
+            if git_commit_sha:
+                parts.append(f"Commit: {git_commit_sha[:8]}")
+            if git_pr_url:
+                parts.append(f"PR: {git_pr_url}")
+            git_info = " ".join(parts)
+        task_metrics = TaskMetrics(
+            task_id=task.id,
+            description=task.description,
+            priority=task.priority.value,
+            status=payload["status"],
+            duration_seconds=payload["duration"],
+            files_modified=len(payload.get("files_modified") or []) if completed else 0,
+            commands_executed=len(payload.get("commands_executed") or []) if completed else 0,
+            git_info=git_info,
+            error_message=None if completed else payload.get("error"),
+        )
+        await self.reports_io.append_task_completion(task_metrics, project_id=task.project_id)
+
+    async def _on_finished_usage(self, event: TaskEvent) -> None:
+        task, payload = event.task, event.payload
+        if payload["status"] != "completed":
+            return
+        usage_metrics = payload.get("usage_metrics") or {}
+        await self.scheduler_io.record_task_usage(
+            task_id=task.id,
+            total_cost_usd=usage_metrics.get("total_cost_usd"),
+            duration_ms=usage_metrics.get("duration_ms"),
+            duration_api_ms=usage_metrics.get("duration_api_ms"),
+            num_turns=usage_metrics.get("num_turns"),
+            project_id=task.project_id,
+            tokens={name: usage_metrics.get(name) for name in TOKEN_FIELDS},
+        )
 
+    async def _on_finished_metrics(self, event: TaskEvent) -> None:
+        task, payload = event.task, event.payload
+        success = payload["status"] == "completed"
         try:
-            self.perf_logger.log_task_execution(
-                task_id=task.id,
-                description=task.description,
-                priority=task.priority.value if task.priority else "unknown",
-                duration_seconds=duration,
-                success=False,
-            )
+            self.monitor.record_task_completion(payload["duration"], success=success)
         except Exception as exc:
-            logger.debug(f"Failed to log failure metrics for task {task.id}: {exc}")
+            logger.debug(f"Failed to record completion in health monitor for task {task.id}: {exc}")
 
-        if task.assigned_to and self.bot:
-            try:
-                self.bot.send_message(task.assigned_to, f"❌ Task #{task.id} failed: {error}")
-            except Exception as exc:
-                logger.debug(f"Failed to send failure notification for task {task.id}: {exc}")
+        extra = {}
+        if success:
+            extra = {
+                "files_modified": len(payload.get("files_modified") or []),
+                "commands_executed": len(payload.get("commands_executed") or []),
+                "tool_calls": (payload.get("usage_metrics") or {}).get("tool_calls"),
+            }
+        await self.perf_io.log_task_execution(
+            task_id=task.id,
+            description=task.description,
+            priority=task.priority.value if task.priority else "unknown",
+            duration_seconds=payload["duration"],
+            success=success,
+            **extra,
+        )
 
-        if self.live_status_tracker:
-            try:
-                self.live_status_tracker.clear(task.id)
-            except Exception as exc:
-                logger.debug(f"Failed to clear live status for failed task {task.id}: {exc}")
+    async def _on_settled_notify(self, event: TaskEvent) -> None:
+        task, payload = event.task, event.payload
+        if not (task.assigned_to and self.bot):
+            return
+
+        if payload["status"] != "completed":
+            await self.bot_io.send_message(task.assigned_to, f"❌ Task #{task.id} failed: {payload.get('error')}")
+            return
+
+        files_modified = payload.get("files_modified") or []
+        commands_executed = payload.get("commands_executed") or []
+        git_commit_sha = payload.get("git_commit_sha")
+        git_pr_url = payload.get("git_pr_url")
+        result_output = payload.get("result_output") or ""
+
+        priority_icon = {
+            TaskPriority.SERIOUS: "🔴",
+            TaskPriority.THOUGHT: "🟡",
+            TaskPriority.GENERATED: "🟢",
+        }.get(task.priority, "ℹ️")
+
+        files_info = f"\n📝 Files modified: {len(files_modified)}" if files_modified else ""
+        commands_info = f"\n⚙️ Commands: {len(commands_executed)}" if commands_executed else ""
+        git_info_display = ""
+        if git_commit_sha:
+            git_info_display = f"\n✅ Committed: {git_commit_sha[:8]}"
+        if git_pr_url:
+            git_info_display += f"\n🔗 PR: {git_pr_url}"
+
+        output_limit = 3500
+        truncated_output = result_output[:output_limit]
+        if len(result_output) > output_limit:
+            truncated_output += "\n\n_[Output truncated - see result file for full content]_"
+
+        message = (
+            f"{priority_icon} Task #{task.id} completed in {payload['duration']}s"
+            f"{files_info}{commands_info}{git_info_display}\n"
+            f"```{truncated_output}```"
+        )
+        await self.bot_io.send_message(task.assigned_to, message)
 
     async def _handle_pause_exception(
         self,
@@ -541,7 +675,7 @@ class TaskRuntime:
         task_log.warning("task.pause.limit", usage_percent=pause.usage_percent, reset_at=reset_time_iso)
 
         try:
-            result = self.results.save_result(
+            result = await self.results_io.save_result(
                 task_id=task.id,
                 output=result_output or "[Task completed before pause]",
                 files_modified=files_modified,
@@ -552,7 +686,8 @@ class TaskRuntime:
                 git_branch=None,
                 workspace_path=str(workspace) if workspace else "",
             )
-            self.task_queue.mark_completed(task.id, result_id=result.id)
+            if await self.queue_io.mark_completed(task.id, result_id=result.id, worker_id=self.worker_id):
+                await self._clear_checkpoints(task)
         except Exception as save_error:
             task_log.warning("task.pause.save_failed", error=str(save_error))
 
@@ -562,41 +697,28 @@ class TaskRuntime:
             except Exception as exc:
                 logger.debug(f"Failed to clear live status for paused task {task.id}: {exc}")
 
-        sleep_seconds = 0.0
+        # Halt dispatch instead of sleeping here, which would hold this
+        # worker slot (and the task's lease) until the limit resets
+        resume_at = self.scheduler.pause_until(pause.reset_time)
+        pause_seconds = max(0.0, (resume_at - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds())
         if pause.reset_time:
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
-            sleep_seconds = max(0.0, (pause.reset_time - now).total_seconds())
             task_log.info("task.pause.reset_time", reset_at=reset_time_iso)
         else:
             task_log.info("task.pause.reset_time_missing")
+        task_log.critical(
+            "task.pause.dispatch_halted",
+            pause_minutes=round(pause_seconds / 60, 2),
+            resume_at=resume_at.isoformat(),
+        )
 
         if task.assigned_to and self.bot:
             try:
                 pause_message = (
                     f"⏸️  Pro plan usage limit reached ({pause.usage_percent:.0f}%)\n"
                     f"Task #{task.id} completed successfully\n"
+                    f"Pausing execution until {resume_at.strftime('%H:%M:%S')}\n"
+                    f"Will resume automatically in ~{pause_seconds / 60:.0f} minutes"
                 )
-                if pause.reset_time:
-                    pause_message += (
-                        f"Pausing execution until {pause.reset_time.strftime('%H:%M:%S')}\n"
-                        f"Will resume automatically in ~{sleep_seconds / 60:.0f} minutes"
-                    )
-                else:
-                    pause_message += "Pausing execution until credits refresh."
-                self.bot.send_message(task.assigned_to, pause_message)
+                await self.bot_io.send_message(task.assigned_to, pause_message)
             except Exception as exc:
                 logger.debug(f"Failed to send pause notification for task {task.id}: {exc}")
-
-        if sleep_seconds > 0 and pause.reset_time:
-            task_log.critical(
-                "task.pause.sleep",
-                sleep_minutes=round(sleep_seconds / 60, 2),
-                resume_at=reset_time_iso,
-            )
-            await asyncio.sleep(sleep_seconds)
-            task_log.info("task.pause.resume")
-            if task.assigned_to and self.bot:
-                try:
-                    self.bot.send_message(task.assigned_to, "▶️  Pro plan usage limit reset - resuming tasks")
-                except Exception as exc:
-                    logger.debug(f"Failed to send resume notification for task {task.id}: {exc}")
@@ -5,6 +5,7 @@ from typing import Optional, TYPE_CHECKING
 
 from sleepless_agent.monitoring.logging import get_logger
 
+from sleepless_agent.core.leases import heartbeat_inactivity_cutoff
 from sleepless_agent.core.queue import TaskQueue
 from sleepless_agent.monitoring.monitor import HealthMonitor, PerformanceLogger
 from sleepless_agent.monitoring.report_generator import ReportGenerator, TaskMetrics
@@ -42,10 +43,11 @@ class TaskTimeoutManager:
 
     def enforce(self) -> None:
         timeout_seconds = self.config.agent.task_timeout_seconds
-        if timeout_seconds <= 0:
+        inactivity_seconds = heartbeat_inactivity_cutoff(self.config)
+        if timeout_seconds <= 0 and inactivity_seconds <= 0:
             return
 
-        timed_out_tasks = self.task_queue.timeout_expired_tasks(timeout_seconds)
+        timed_out_tasks = self.task_queue.timeout_expired_tasks(timeout_seconds, inactivity_seconds)
         if not timed_out_tasks:
             return
 
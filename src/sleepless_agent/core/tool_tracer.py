@@ -0,0 +1,237 @@
+"""Per-tool latency and payload histograms for the worker phase."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+from claude_agent_sdk import ToolResultBlock, ToolUseBlock
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (100, 500, 1000, 5000, 30000, 120000)
+BUCKET_LABELS = tuple(f"<={bound}ms" for bound in LATENCY_BUCKETS_MS) + (f">{LATENCY_BUCKETS_MS[-1]}ms",)
+COMMAND_CHARS = 200
+SLOWEST_CALLS = 5
+
+
+def payload_bytes(payload: Any) -> int:
+    """Size of a tool input or result as the CLI would send it."""
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    try:
+        return len(json.dumps(payload, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(payload).encode("utf-8"))
+
+
+@dataclass
+class ToolCall:
+    """One tool use paired with its result."""
+
+    tool_use_id: str
+    name: str
+    started: float
+    input_bytes: int
+    command: Optional[str] = None  # Bash only
+    latency_ms: Optional[int] = None
+    result_bytes: int = 0
+    is_error: bool = False
+
+
+@dataclass
+class ToolHistogram:
+    """Latency histogram and payload totals for one tool name."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: int = 0
+    max_ms: int = 0
+    input_bytes: int = 0
+    result_bytes: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(BUCKET_LABELS))
+
+    def add(self, call: ToolCall) -> None:
+        latency = call.latency_ms or 0
+        self.calls += 1
+        self.errors += int(call.is_error)
+        self.total_ms += latency
+        self.max_ms = max(self.max_ms, latency)
+        self.input_bytes += call.input_bytes
+        self.result_bytes += call.result_bytes
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency <= bound), len(LATENCY_BUCKETS_MS))
+        self.buckets[index] += 1
+
+    def merge(self, entry: Mapping[str, Any]) -> None:
+        """Add a histogram previously exported with :meth:`to_dict`."""
+        self.calls += int(entry.get("calls") or 0)
+        self.errors += int(entry.get("errors") or 0)
+        self.total_ms += int(entry.get("total_ms") or 0)
+        self.max_ms = max(self.max_ms, int(entry.get("max_ms") or 0))
+        self.input_bytes += int(entry.get("input_bytes") or 0)
+        self.result_bytes += int(entry.get("result_bytes") or 0)
+        counts = entry.get("buckets") or {}
+        for index, label in enumerate(BUCKET_LABELS):
+            self.buckets[index] += int(counts.get(label) or 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": self.total_ms,
+            "avg_ms": int(self.total_ms / self.calls) if self.calls else None,
+            "max_ms": self.max_ms,
+            "input_bytes": self.input_bytes,
+            "result_bytes": self.result_bytes,
+            "buckets": dict(zip(BUCKET_LABELS, self.buckets)),
+        }
+
+
+class ToolCallTracer:
+    """Pair a phase's tool uses with their results and time them.
+
+    Tool uses arrive in assistant messages and their results in the user
+    message that follows, matched by ``tool_use_id``. Latency is wall-clock
+    from the tool use to its result, so it includes permission checks and
+    hooks. Time from the phase start or the last tool result to the next
+    assistant message is counted as model time, which separates slow tools
+    from slow generation.
+    """
+
+    def __init__(self, task_id: Optional[int] = None):
+        self.task_id = task_id
+        self.started = time.monotonic()
+        self.model_ms = 0
+        self.histograms: Dict[str, ToolHistogram] = {}
+        self._pending: Dict[str, ToolCall] = {}
+        self._finished: List[ToolCall] = []
+        self._waiting_since: Optional[float] = self.started
+
+    def assistant_message(self) -> None:
+        """Note an assistant message; closes the model-time interval if one is open."""
+        if self._waiting_since is not None:
+            self.model_ms += int((time.monotonic() - self._waiting_since) * 1000)
+            self._waiting_since = None
+
+    def start(self, block: ToolUseBlock) -> None:
+        """Start timing a tool use."""
+        command = None
+        if block.name == "Bash":
+            command = str(block.input.get("command", ""))[:COMMAND_CHARS] or None
+        self._pending[block.id] = ToolCall(
+            tool_use_id=block.id,
+            name=block.name,
+            started=time.monotonic(),
+            input_bytes=payload_bytes(block.input),
+            command=command,
+        )
+
+    def finish(self, block: ToolResultBlock) -> Optional[ToolCall]:
+        """Record the result of a tool use; returns the finished call, if it was started here."""
+        call = self._pending.pop(block.tool_use_id, None)
+        now = time.monotonic()
+        if not self._pending:
+            self._waiting_since = now
+        if call is None:
+            return None
+        call.latency_ms = int((now - call.started) * 1000)
+        call.result_bytes = payload_bytes(block.content)
+        call.is_error = bool(block.is_error)
+        self.histograms.setdefault(call.name, ToolHistogram()).add(call)
+        self._finished.append(call)
+        if call.command is not None:
+            logger.debug(
+                "tool_call.bash",
+                task_id=self.task_id,
+                latency_ms=call.latency_ms,
+                result_bytes=call.result_bytes,
+                is_error=call.is_error,
+                command=call.command,
+            )
+        return call
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-tool histograms, model time and the slowest calls, as plain data."""
+        # Sum of call latencies; calls that ran in parallel overlap, so it can exceed elapsed_ms
+        tool_ms = sum(histogram.total_ms for histogram in self.histograms.values())
+        slowest = sorted(self._finished, key=lambda call: call.latency_ms or 0, reverse=True)[:SLOWEST_CALLS]
+        return {
+            "calls": len(self._finished),
+            "unfinished": len(self._pending),
+            "tool_ms": tool_ms,
+            "model_ms": self.model_ms,
+            "elapsed_ms": int((time.monotonic() - self.started) * 1000),
+            "tools": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            "slowest": [
+                {
+                    "tool": call.name,
+                    "latency_ms": call.latency_ms,
+                    "result_bytes": call.result_bytes,
+                    "is_error": call.is_error,
+                    "command": call.command,
+                }
+                for call in slowest
+            ],
+        }
+
+
+def format_summary(summary: Mapping[str, Any]) -> str:
+    """Markdown section for the task result; empty if no tool calls were recorded."""
+    tools = summary.get("tools") or {}
+    if not tools:
+        return ""
+    lines = [
+        "## Tool Calls",
+        f"{summary.get('calls', 0)} calls, {summary.get('tool_ms', 0) / 1000:.1f}s in tools, "
+        f"{summary.get('model_ms', 0) / 1000:.1f}s in the model",
+        "",
+        "| Tool | Calls | Errors | Total | Avg | Max | Result size |",
+        "|------|------:|-------:|------:|----:|----:|------------:|",
+    ]
+    ordered = sorted(tools.items(), key=lambda item: item[1].get("total_ms") or 0, reverse=True)
+    for name, entry in ordered:
+        lines.append(
+            f"| {name} | {entry['calls']} | {entry['errors']} | {entry['total_ms'] / 1000:.1f}s "
+            f"| {entry['avg_ms'] or 0}ms | {entry['max_ms']}ms | {entry['result_bytes']} B |"
+        )
+    slow_commands = [call for call in summary.get("slowest") or [] if call.get("command")]
+    if slow_commands:
+        lines.append("")
+        lines.append("Slowest commands:")
+        for call in slow_commands:
+            lines.append(f"- {call['latency_ms']}ms `{call['command']}`")
+    return "\n".join(lines) + "\n"
+
+
+class ToolCallStats:
+    """Tool histograms summed over all tasks since start-up; thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, ToolHistogram] = {}
+        self._tasks = 0
+        self._model_ms = 0
+
+    def add(self, summary: Mapping[str, Any]) -> None:
+        """Fold one task's :meth:`ToolCallTracer.summary` into the totals."""
+        with self._lock:
+            self._tasks += 1
+            self._model_ms += int(summary.get("model_ms") or 0)
+            for name, entry in (summary.get("tools") or {}).items():
+                self._histograms.setdefault(name, ToolHistogram()).merge(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tasks": self._tasks,
+                "model_ms": self._model_ms,
+                "tools": {name: histogram.to_dict() for name, histogram in self._histograms.items()},
+            }
@@ -0,0 +1,207 @@
+"""Adaptive per-phase turn caps and deadlines learned from recorded phase usage."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.phase_usage import PhaseSample, PhaseUsageStore
+
+logger = get_logger(__name__)
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Linear-interpolated percentile of ``values`` (``fraction`` in 0..1)."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile of empty sequence")
+    position = (len(ordered) - 1) * min(max(fraction, 0.0), 1.0)
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return float(ordered[lower])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class TurnBudget:
+    """Turn cap and optional deadline chosen for one phase run."""
+
+    phase: str
+    max_turns: int
+    default_max_turns: int
+    deadline_seconds: Optional[float] = None
+    source: str = "default"  # which history key the numbers came from
+    samples: int = 0
+    task_type: Optional[str] = None
+    priority: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+class TurnBudgetAdvisor:
+    """Pick ``max_turns`` and a phase deadline from similar past runs.
+
+    History is looked up from the most to the least specific key - task type,
+    priority and project; then task type and priority; then task type; then
+    the phase alone - and the first key with at least ``min_samples`` runs is
+    used. The cap is the chosen percentile of turns times ``headroom``,
+    clamped between ``min_turns`` and ``max_multiplier`` times the configured
+    default. Runs that hit their cap are censored (they would have used more
+    turns), so when too many of them did, the cap is raised instead.
+    """
+
+    def __init__(self, store: PhaseUsageStore, config: Optional[Dict[str, Any]] = None):
+        """Initialize the advisor.
+
+        Args:
+            store: Phase usage history
+            config: ``multi_agent_workflow.adaptive_turns`` settings
+        """
+        config = dict(config or {})
+        self.store = store
+        self.enabled = bool(config.get("enabled", True))
+        self.percentile = float(config.get("percentile", 0.9))
+        self.headroom = float(config.get("headroom", 1.25))
+        self.min_samples = max(1, int(config.get("min_samples", 8)))
+        self.min_turns = max(1, int(config.get("min_turns", 3)))
+        self.max_multiplier = max(1.0, float(config.get("max_multiplier", 2.0)))
+        self.history = max(self.min_samples, int(config.get("history", 200)))
+        self.capped_fraction = float(config.get("capped_fraction", 0.2))
+        self.deadline_percentile = float(config.get("deadline_percentile", 0.95))
+        self.deadline_headroom = float(config.get("deadline_headroom", 2.0))
+        self.min_deadline_seconds = float(config.get("min_deadline_seconds", 120))
+        self.enforce_deadlines = bool(config.get("enforce_deadlines", True))
+        self.cache_ttl_seconds = float(config.get("cache_ttl_seconds", 60))
+        self._cache: Dict[Tuple, Tuple[float, TurnBudget]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Advice
+    # ------------------------------------------------------------------
+    def advise(
+        self,
+        phase: str,
+        default_max_turns: int,
+        *,
+        task_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> TurnBudget:
+        """Return the turn cap and deadline for a phase run. Blocking (DB read)."""
+        budget = TurnBudget(
+            phase=phase,
+            max_turns=default_max_turns,
+            default_max_turns=default_max_turns,
+            task_type=task_type,
+            priority=priority,
+            project_id=project_id,
+        )
+        if not self.enabled:
+            return budget
+
+        cache_key = (phase, default_max_turns, task_type, priority, project_id)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(cache_key)
+        if cached and now - cached[0] < self.cache_ttl_seconds:
+            return cached[1]
+
+        samples, source = self._find_samples(phase, task_type, priority, project_id)
+        if samples is not None:
+            self._apply(budget, samples, source)
+        logger.info(
+            "task.turn_budget",
+            phase=phase,
+            max_turns=budget.max_turns,
+            default_max_turns=default_max_turns,
+            deadline_s=int(budget.deadline_seconds) if budget.deadline_seconds else None,
+            source=budget.source,
+            samples=budget.samples,
+            percentile=self.percentile,
+        )
+        with self._lock:
+            self._cache[cache_key] = (now, budget)
+        return budget
+
+    def _find_samples(
+        self,
+        phase: str,
+        task_type: Optional[str],
+        priority: Optional[str],
+        project_id: Optional[str],
+    ) -> Tuple[Optional[List[PhaseSample]], str]:
+        candidates = []
+        if project_id is not None:
+            candidates.append(("type+priority+project", dict(task_type=task_type, priority=priority, project_id=project_id)))
+        candidates.append(("type+priority", dict(task_type=task_type, priority=priority)))
+        candidates.append(("type", dict(task_type=task_type)))
+        candidates.append(("phase", {}))
+
+        for source, filters in candidates:
+            if any(value is None for value in filters.values()):
+                continue
+            samples = [
+                sample
+                for sample in self.store.recent_samples(phase, limit=self.history, **filters)
+                if sample.turns is not None
+            ]
+            if len(samples) >= self.min_samples:
+                return samples, source
+        return None, "default"
+
+    def _apply(self, budget: TurnBudget, samples: List[PhaseSample], source: str) -> None:
+        default = budget.default_max_turns
+        ceiling = max(default, int(round(default * self.max_multiplier)))
+        turns = [sample.turns for sample in samples]
+        capped = sum(1 for sample in samples if sample.hit_cap)
+
+        if capped / len(samples) > self.capped_fraction:
+            # Many runs were cut off: their true usage is unknown but higher
+            highest_cap = max(sample.max_turns or default for sample in samples)
+            cap = int(math.ceil(highest_cap * 1.5))
+            source = f"{source}:censored"
+        else:
+            cap = int(math.ceil(percentile(turns, self.percentile) * self.headroom))
+        budget.max_turns = min(max(cap, self.min_turns), ceiling)
+        budget.source = source
+        budget.samples = len(samples)
+
+        durations = [sample.duration_ms / 1000 for sample in samples if sample.duration_ms]
+        if len(durations) >= self.min_samples:
+            deadline = percentile(durations, self.deadline_percentile) * self.deadline_headroom
+            budget.deadline_seconds = max(deadline, self.min_deadline_seconds)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record(
+        self,
+        budget: TurnBudget,
+        task_id: int,
+        metrics: Dict[str, Any],
+        *,
+        success: bool = True,
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """Record a finished phase run against the key its budget was chosen for."""
+        phase = budget.phase
+        self.store.record(
+            task_id=task_id,
+            phase=phase,
+            task_type=budget.task_type,
+            priority=budget.priority,
+            project_id=budget.project_id,
+            turns=metrics.get(f"{phase}_turns"),
+            max_turns=budget.max_turns,
+            duration_ms=metrics.get(f"{phase}_duration_ms") or duration_ms,
+            cost_usd=metrics.get(f"{phase}_cost_usd"),
+            success=success,
+            outcome=metrics.get(f"{phase}_status"),
+            prompt_tokens=metrics.get(f"{phase}_prompt_tokens"),
+            cache_read_tokens=metrics.get(f"{phase}_cache_read_tokens"),
+            cache_creation_tokens=metrics.get(f"{phase}_cache_creation_tokens"),
+        )
@@ -0,0 +1,143 @@
+"""Machine-readable evaluator verdicts, parsed while the evaluator streams."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+OPEN_TAG = "<verdict>"
+CLOSE_TAG = "</verdict>"
+STATUSES = ("COMPLETE", "PARTIAL", "INCOMPLETE", "FAILED")
+
+VERDICT_INSTRUCTIONS = f"""
+## Verdict Block
+End your answer with exactly one verdict block containing a single JSON object:
+{OPEN_TAG}
+{{"status": "COMPLETE | PARTIAL | INCOMPLETE | FAILED", "outstanding_items": ["..."], "recommendations": ["..."]}}
+{CLOSE_TAG}
+Use empty lists when there is nothing outstanding or to recommend.
+"""
+
+
+@dataclass
+class Verdict:
+    """Evaluator status with its outstanding items and recommendations."""
+
+    status: str
+    outstanding_items: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    source: str = "block"  # "block" (verdict block), "text" (regex fallback) or "local"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional["Verdict"]:
+        """Validate a decoded verdict object; None if it is not usable."""
+        if not isinstance(payload, dict):
+            return None
+        status = str(payload.get("status", "")).strip().upper()
+        if status not in STATUSES:
+            return None
+
+        def _items(key: str) -> List[str]:
+            value = payload.get(key) or []
+            if isinstance(value, str):
+                value = [value]
+            if not isinstance(value, list):
+                return []
+            return [str(item).strip() for item in value if str(item).strip()]
+
+        return cls(status, _items("outstanding_items"), _items("recommendations"))
+
+
+class VerdictParser:
+    """Find and decode the ``<verdict>`` block in streamed evaluator text.
+
+    Text is fed chunk by chunk as assistant messages arrive. Outside a block
+    only a tag-sized tail is kept (a tag may be split across chunks); inside
+    a block its content is buffered until the closing tag. Each character is
+    examined a bounded number of times, however long the output. The last
+    valid block wins.
+    """
+
+    def __init__(self, max_block_chars: int = 20000):
+        self.max_block_chars = max_block_chars
+        self._pending = ""
+        self._block: Optional[List[str]] = None
+        self._block_chars = 0
+        self.verdict: Optional[Verdict] = None
+        self.invalid_blocks = 0
+
+    def feed(self, text: str) -> None:
+        """Consume the next chunk of evaluator output."""
+        data = self._pending + text
+        self._pending = ""
+        while data:
+            if self._block is None:
+                start = data.find(OPEN_TAG)
+                if start < 0:
+                    # Keep only what could be the start of a split tag
+                    self._pending = data[-(len(OPEN_TAG) - 1):]
+                    return
+                self._block, self._block_chars = [], 0
+                data = data[start + len(OPEN_TAG):]
+            else:
+                end = data.find(CLOSE_TAG)
+                if end < 0:
+                    keep = len(CLOSE_TAG) - 1
+                    self._append(data[:-keep] if len(data) > keep else "")
+                    self._pending = data[-keep:]
+                    return
+                self._append(data[:end])
+                self._finish()
+                data = data[end + len(CLOSE_TAG):]
+
+    def _append(self, chunk: str) -> None:
+        if self._block is None or not chunk:
+            return
+        self._block_chars += len(chunk)
+        if self._block_chars > self.max_block_chars:
+            self._block = None  # runaway block; wait for the next opening tag
+            self.invalid_blocks += 1
+            return
+        self._block.append(chunk)
+
+    def _finish(self) -> None:
+        raw = "".join(self._block or ())
+        self._block = None
+        try:
+            verdict = Verdict.from_payload(json.loads(_strip_fence(raw)))
+        except ValueError:
+            verdict = None
+        if verdict is None:
+            self.invalid_blocks += 1
+            logger.debug("evaluator.verdict.invalid", preview=raw[:120])
+            return
+        self.verdict = verdict
+
+
+def _strip_fence(raw: str) -> str:
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[1] if "\n" in raw else ""
+        if raw.rstrip().endswith("```"):
+            raw = raw.rstrip()[:-3]
+    return raw
+
+
+def strip_verdict_block(text: str) -> str:
+    """Evaluator text without its verdict block(s), for humans."""
+    while True:
+        start = text.find(OPEN_TAG)
+        if start < 0:
+            return text
+        end = text.find(CLOSE_TAG, start)
+        if end < 0:
+            return text[:start].rstrip()
+        text = (text[:start].rstrip() + "\n" + text[end + len(CLOSE_TAG):].lstrip()).strip()
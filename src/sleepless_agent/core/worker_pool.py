@@ -0,0 +1,219 @@
+"""Bounded asyncio worker pool that keeps several tasks in flight."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from sleepless_agent.core.models import Task
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TaskWorkerPool:
+    """Run up to ``max_parallel_tasks`` tasks concurrently on the event loop.
+
+    The pool owns the in-flight ``asyncio.Task`` handles. A slot is freed as
+    soon as its task finishes, so the daemon can refill it on the next dispatch
+    pass instead of waiting for the whole batch to drain.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[Task], Awaitable[None]],
+        max_parallel_tasks: int = 1,
+        on_finished: Optional[Callable[[Task], None]] = None,
+    ):
+        """Initialize the worker pool.
+
+        Args:
+            execute: Coroutine function that runs a single task end to end
+            max_parallel_tasks: Maximum number of tasks in flight at once
+            on_finished: Callback invoked when a task frees its slot
+        """
+        self.execute = execute
+        self.max_parallel_tasks = max(1, int(max_parallel_tasks))
+        self.on_finished = on_finished
+
+        self._in_flight: Dict[int, Task] = {}
+        self._handles: Dict[int, asyncio.Task] = {}
+
+        # Slot utilization bookkeeping (busy slot-seconds integrated over time)
+        self._started_at = time.monotonic()
+        self._last_sample = self._started_at
+        self._busy_slot_seconds = 0.0
+        self._peak_in_flight = 0
+        self._dispatched = 0
+        self._finished = 0
+        self._failed = 0
+
+        # Enqueue-to-start latency of recently dispatched tasks (milliseconds)
+        self._queue_latencies_ms: Deque[float] = deque(maxlen=500)
+
+    # ------------------------------------------------------------------
+    # Slot accounting
+    # ------------------------------------------------------------------
+    def _accumulate(self) -> None:
+        now = time.monotonic()
+        self._busy_slot_seconds += len(self._in_flight) * (now - self._last_sample)
+        self._last_sample = now
+
+    @property
+    def available_slots(self) -> int:
+        """Number of free slots."""
+        return max(0, self.max_parallel_tasks - len(self._in_flight))
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of tasks currently running."""
+        return len(self._in_flight)
+
+    def running_tasks(self) -> List[Task]:
+        """Tasks currently executing in this pool."""
+        return list(self._in_flight.values())
+
+    def is_running(self, task_id: int) -> bool:
+        """Check whether a task is already in flight."""
+        return task_id in self._in_flight
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    def submit(self, task: Task) -> bool:
+        """Start executing a task if a slot is free.
+
+        Returns:
+            True if the task was started, False if the pool is full or the task
+            is already running.
+        """
+        if task.id in self._in_flight or self.available_slots == 0:
+            return False
+
+        self._accumulate()
+        self._in_flight[task.id] = task
+        self._dispatched += 1
+        self._peak_in_flight = max(self._peak_in_flight, len(self._in_flight))
+
+        handle = asyncio.create_task(self._run(task), name=f"task-{task.id}")
+        # A done callback (not a finally block) frees the slot, so a task
+        # cancelled before its coroutine ever started still releases it.
+        handle.add_done_callback(lambda _: self._release(task))
+        self._handles[task.id] = handle
+
+        queue_latency_ms = self._record_queue_latency(task)
+        logger.info(
+            "pool.task.started",
+            task_id=task.id,
+            queue_latency_ms=queue_latency_ms,
+            in_flight=len(self._in_flight),
+            capacity=self.max_parallel_tasks,
+        )
+        return True
+
+    def _record_queue_latency(self, task: Task) -> Optional[int]:
+        created_at = getattr(task, "created_at", None)
+        if created_at is None:
+            return None
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        latency_ms = max(0.0, (now - created_at).total_seconds() * 1000)
+        self._queue_latencies_ms.append(latency_ms)
+        return int(latency_ms)
+
+    async def _run(self, task: Task) -> None:
+        try:
+            await self.execute(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # TaskRuntime handles its own failures; anything reaching here is a bug.
+            self._failed += 1
+            logger.error("pool.task.crashed", task_id=task.id, error=str(exc))
+
+    def _release(self, task: Task) -> None:
+        self._accumulate()
+        self._in_flight.pop(task.id, None)
+        self._handles.pop(task.id, None)
+        self._finished += 1
+        logger.debug(
+            "pool.task.finished",
+            task_id=task.id,
+            in_flight=len(self._in_flight),
+            capacity=self.max_parallel_tasks,
+        )
+        if self.on_finished:
+            try:
+                self.on_finished(task)
+            except Exception as exc:
+                logger.debug("pool.on_finished.failed", task_id=task.id, error=str(exc))
+
+    def cancel(self, task_id: int) -> bool:
+        """Cancel a single in-flight task.
+
+        Returns:
+            True if the task was running and has been asked to stop.
+        """
+        handle = self._handles.get(task_id)
+        if handle is None or handle.done():
+            return False
+        handle.cancel()
+        logger.info("pool.task.cancel_requested", task_id=task_id)
+        return True
+
+    async def wait_for_slot(self, timeout: Optional[float] = None) -> None:
+        """Block until at least one in-flight task finishes (or timeout)."""
+        if not self._handles:
+            return
+        await asyncio.wait(
+            list(self._handles.values()),
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Cancel in-flight tasks and wait for them to unwind."""
+        handles = list(self._handles.values())
+        if not handles:
+            return
+        for handle in handles:
+            handle.cancel()
+        await asyncio.wait(handles, timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """Return live slot-utilization metrics."""
+        self._accumulate()
+        elapsed = max(1e-9, self._last_sample - self._started_at)
+        utilization = self._busy_slot_seconds / (elapsed * self.max_parallel_tasks)
+        return {
+            "capacity": self.max_parallel_tasks,
+            "in_flight": len(self._in_flight),
+            "available_slots": self.available_slots,
+            "peak_in_flight": self._peak_in_flight,
+            "slot_utilization": round(utilization, 4),
+            "dispatched": self._dispatched,
+            "finished": self._finished,
+            "crashed": self._failed,
+            "running_task_ids": sorted(self._in_flight),
+            **self._queue_latency_summary(),
+        }
+
+    def _queue_latency_summary(self) -> Dict[str, Optional[int]]:
+        samples = sorted(self._queue_latencies_ms)
+        if not samples:
+            return {"queue_latency_p50_ms": None, "queue_latency_p95_ms": None, "queue_latency_max_ms": None}
+
+        def _pct(p: float) -> int:
+            index = min(len(samples) - 1, int(round(p * (len(samples) - 1))))
+            return int(samples[index])
+
+        return {
+            "queue_latency_p50_ms": _pct(0.50),
+            "queue_latency_p95_ms": _pct(0.95),
+            "queue_latency_max_ms": int(samples[-1]),
+        }
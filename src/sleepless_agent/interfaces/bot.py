@@ -17,6 +17,7 @@ from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
 from sleepless_agent.utils.display import format_age_seconds, format_duration, relative_time, shorten
+from sleepless_agent.core.client_pool import ClaudeClientPool
 from sleepless_agent.core.models import TaskPriority, TaskStatus
 from sleepless_agent.core.queue import TaskQueue
 from sleepless_agent.tasks.utils import prepare_task_creation, slugify_project
@@ -38,6 +39,7 @@ class SlackBot:
         report_generator=None,
         live_status_tracker: Optional[LiveStatusTracker] = None,
         workspace_root: str = "./workspace",
+        chat_client_pool: Optional[ClaudeClientPool] = None,
     ):
         """Initialize Slack bot"""
         self.bot_token = bot_token
@@ -54,7 +56,7 @@ class SlackBot:
         # Initialize chat mode components
         chat_sessions_path = self.workspace_root / "data" / "chat_sessions.json"
         self.chat_session_manager = ChatSessionManager(storage_path=chat_sessions_path)
-        self.chat_executor = ChatExecutor(workspace_root=str(self.workspace_root))
+        self.chat_executor = ChatExecutor(workspace_root=str(self.workspace_root), client_pool=chat_client_pool)
         self.chat_handler = ChatHandler(
             session_manager=self.chat_session_manager,
             chat_executor=self.chat_executor,
@@ -73,6 +75,12 @@ class SlackBot:
     def stop(self):
         """Stop bot"""
         self.socket_mode_client.close()
+        pool = self.chat_executor.client_pool
+        if pool is not None and self._async_loop is not None and self._async_loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(pool.close(), self._async_loop).result(timeout=30)
+            except Exception as e:
+                logger.debug(f"Could not close chat client pool: {e}")
         logger.info("Slack bot stopped")
 
     def handle_event(self, client: SocketModeClient, req: SocketModeRequest):
@@ -312,6 +320,9 @@ class SlackBot:
             logger.info(
                 f"Chat session started: user={user_id}, project={project_name}, thread={thread_ts}"
             )
+            if self.chat_executor.client_pool is not None:
+                # Warm a CLI for the project while the user types
+                self._ensure_async_loop().call_soon_threadsafe(self.chat_executor.prewarm, session)
 
             # Send first instruction message in the thread
             self.client.chat_postMessage(
@@ -339,7 +350,14 @@ class SlackBot:
         thread_ts: str,
     ):
         """Handle chat message asynchronously using a background event loop."""
-        # Ensure we have an event loop running in a background thread
+        # Schedule the async handler
+        asyncio.run_coroutine_threadsafe(
+            self.chat_handler.handle_chat_message(session, text, channel, thread_ts),
+            self._ensure_async_loop(),
+        )
+
+    def _ensure_async_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop used for chat, starting it if needed."""
         if self._async_loop is None or not self._async_loop.is_running():
             self._async_loop = asyncio.new_event_loop()
 
@@ -349,12 +367,7 @@ class SlackBot:
 
             self._async_thread = threading.Thread(target=run_loop, daemon=True)
             self._async_thread.start()
-
-        # Schedule the async handler
-        asyncio.run_coroutine_threadsafe(
-            self.chat_handler.handle_chat_message(session, text, channel, thread_ts),
-            self._async_loop,
-        )
+        return self._async_loop
 
     def _create_task(
         self,
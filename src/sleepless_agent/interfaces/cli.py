@@ -27,8 +27,10 @@ from rich.text import Text
 
 from sleepless_agent.utils.config import get_config
 from sleepless_agent.core.models import TaskPriority, TaskStatus, init_db
+from sleepless_agent.core.leases import heartbeat_inactivity_cutoff
 from sleepless_agent.core.queue import TaskQueue
 from sleepless_agent.utils.display import format_age_seconds, format_duration, relative_time, shorten
+from sleepless_agent.utils.live_feed import SOCKET_NAME, watch_live_status
 from sleepless_agent.utils.live_status import LiveStatusTracker
 from sleepless_agent.tasks.utils import prepare_task_creation
 from sleepless_agent.monitoring.monitor import HealthMonitor
@@ -121,19 +123,18 @@ def command_check(ctx: CLIContext) -> int:
 
     config = get_config()
     timeout_seconds = getattr(config.agent, "task_timeout_seconds", 0)
+    inactivity_seconds = heartbeat_inactivity_cutoff(config)
     timed_out_tasks = []
-    if timeout_seconds and timeout_seconds > 0:
+    if (timeout_seconds and timeout_seconds > 0) or inactivity_seconds > 0:
         try:
-            timed_out_tasks = ctx.task_queue.timeout_expired_tasks(timeout_seconds)
+            timed_out_tasks = ctx.task_queue.timeout_expired_tasks(timeout_seconds, inactivity_seconds)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.debug(f"Failed to enforce task timeout during check: {exc}")
 
     if timed_out_tasks:
-        timeout_minutes = max(1, timeout_seconds // 60)
-        console.print(
-            f"[yellow]⏱️ Marked {len(timed_out_tasks)} task(s) as timed out "
-            f"after exceeding {timeout_minutes} minute limit.[/]"
-        )
+        console.print(f"[yellow]⏱️ Marked {len(timed_out_tasks)} task(s) as timed out:[/]")
+        for task in timed_out_tasks:
+            console.print(f"[yellow]   #{task.id}: {task.error_message}[/]")
 
     health = ctx.monitor.check_health()
     queue_status = ctx.task_queue.get_queue_status()
@@ -354,6 +355,37 @@ def command_check(ctx: CLIContext) -> int:
             )
         project_panel = Panel(project_table, border_style="bright_blue")
 
+    # Per-worker throughput when several daemons share this database
+    workers_panel = None
+    try:
+        worker_stats = ctx.task_queue.get_worker_stats()
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.debug(f"Failed to load worker stats: {exc}")
+        worker_stats = []
+    if worker_stats:
+        workers_table = Table(
+            title=f"Workers ({len(worker_stats)}, last 24h)",
+            box=box.ROUNDED,
+            expand=True,
+        )
+        workers_table.add_column("Worker", style="bold cyan")
+        workers_table.add_column("Running", justify="right")
+        workers_table.add_column("Completed", justify="right", style="green")
+        workers_table.add_column("Failed", justify="right", style="red")
+        workers_table.add_column("Tasks/h", justify="right")
+        workers_table.add_column("Last Activity", style="dim")
+
+        for worker in worker_stats:
+            workers_table.add_row(
+                worker["worker_id"],
+                str(worker["in_progress"]),
+                str(worker["completed"]),
+                str(worker["failed"]),
+                f"{worker['tasks_per_hour']:.2f}",
+                relative_time(worker["last_activity"]) if worker["last_activity"] else "—",
+            )
+        workers_panel = Panel(workers_table, border_style="bright_green")
+
     # Adaptive Details panel: show errors if present, otherwise recent tasks
     failed_tasks = ctx.task_queue.get_failed_tasks(limit=5)
     details_panel = None
@@ -498,6 +530,9 @@ def command_check(ctx: CLIContext) -> int:
     if project_panel:
         console.print()
         console.print(project_panel)
+    if workers_panel:
+        console.print()
+        console.print(workers_panel)
     console.print()
     console.print(recent_panel)
 
@@ -924,6 +959,119 @@ def command_usage(ctx: CLIContext) -> int:
         return 1
 
 
+def command_tokens(ctx: CLIContext, by: str = "day", days: int = 7, project: Optional[str] = None) -> int:
+    """Show token usage grouped by day, project, phase or model."""
+
+    from sleepless_agent.storage.token_usage import TokenUsageStore
+
+    console = Console()
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+    project_id = slugify_project(project) if project else None
+    rows = TokenUsageStore(str(ctx.db_path)).aggregate(by, since=since, project_id=project_id)
+    if not rows:
+        console.print(f"[dim]No token usage recorded in the last {days} days.[/]")
+        return 0
+
+    table = Table(box=box.SIMPLE_HEAVY, title=f"Token usage by {by} (last {days} days)")
+    table.add_column(by.title(), style="bold cyan", no_wrap=True)
+    table.add_column("Records", justify="right")
+    table.add_column("Input", justify="right")
+    table.add_column("Output", justify="right")
+    table.add_column("Cache read", justify="right")
+    table.add_column("Cache write", justify="right")
+    table.add_column("Cache hit", justify="right")
+    table.add_column("Cost", justify="right")
+
+    totals = {"records": 0, "input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0, "cache_creation_tokens": 0}
+    cost_total = 0.0
+
+    def _add(label: str, row: dict, cost: Optional[float], style: Optional[str] = None) -> None:
+        prompt = row["input_tokens"] + row["cache_read_tokens"] + row["cache_creation_tokens"]
+        hit = f"{row['cache_read_tokens'] / prompt:.0%}" if prompt else "-"
+        table.add_row(
+            label,
+            str(row["records"]),
+            f"{row['input_tokens']:,}",
+            f"{row['output_tokens']:,}",
+            f"{row['cache_read_tokens']:,}",
+            f"{row['cache_creation_tokens']:,}",
+            hit,
+            f"${cost:.2f}" if cost is not None else "-",
+            style=style,
+        )
+
+    for row in rows:
+        _add(str(row["key"]) if row["key"] is not None else "(none)", row, row["cost_usd"])
+        for name in totals:
+            totals[name] += row[name]
+        cost_total += row["cost_usd"] or 0.0
+    table.add_section()
+    _add("Total", totals, cost_total, style="bold")
+
+    console.print()
+    console.print(table)
+    console.print()
+    return 0
+
+
+def command_watch(task_id: Optional[int] = None) -> int:
+    """Stream live phase, prompt and answer updates from the running daemon."""
+
+    console = Console()
+    config = get_config()
+    socket_path = Path(config.agent.workspace_root).expanduser().resolve() / "data" / SOCKET_NAME
+    phase_styles = {"planner": "cyan", "worker": "green", "evaluator": "magenta"}
+    last_seen: dict[int, tuple] = {}
+
+    def _show(entry: dict) -> None:
+        task = int(entry.get("task_id", 0))
+        phase = entry.get("phase", "")
+        status = entry.get("status", "")
+        previous = last_seen.get(task)
+        last_seen[task] = (phase, status, entry.get("answer_preview"))
+        if previous == last_seen[task]:
+            return
+        stamp = str(entry.get("updated_at", ""))[11:19]
+        style = phase_styles.get(phase, "white")
+        if previous is None or previous[:2] != (phase, status):
+            console.print(
+                f"[dim]{stamp}[/] [bold]#{task}[/] [{style}]{phase}[/] {status} "
+                f"[dim]{shorten(entry.get('description', ''), 60)}[/]"
+            )
+            if entry.get("prompt_preview"):
+                console.print(f"    [dim]prompt:[/] {shorten(entry['prompt_preview'], 160)}")
+        if entry.get("answer_preview") and (previous is None or previous[2] != entry["answer_preview"]):
+            console.print(f"    [{style}]›[/] {shorten(entry['answer_preview'], 200)}")
+
+    target = f"task #{task_id}" if task_id is not None else "all tasks"
+    try:
+        events = watch_live_status(socket_path, task_id)
+        console.print(f"[bold]Watching {target}[/] [dim](Ctrl+C to stop)[/]")
+        for event in events:
+            kind = event.get("type")
+            if kind == "snapshot":
+                if not event.get("entries"):
+                    console.print("[dim]No running tasks yet.[/]")
+                for entry in reversed(event.get("entries", [])):
+                    _show(entry)
+            elif kind == "update":
+                _show(event.get("entry") or {})
+            elif kind == "clear":
+                last_seen.pop(int(event.get("task_id", 0)), None)
+                console.print(f"[dim]#{event.get('task_id')} finished[/]")
+            elif kind == "clear_all":
+                last_seen.clear()
+                console.print("[dim]Daemon cleared live status[/]")
+    except ConnectionError:
+        console.print(f"[red]No live status feed at {socket_path}. Is the daemon running?[/]")
+        return 1
+    except KeyboardInterrupt:
+        return 0
+
+    console.print("[dim]Daemon closed the feed.[/]")
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Construct the CLI argument parser."""
 
@@ -938,6 +1086,14 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("check", help="Show comprehensive system overview with rich output")
     subparsers.add_parser("usage", help="Show Claude Code Pro plan usage")
 
+    tokens_parser = subparsers.add_parser("tokens", help="Show token usage by day, project, phase or model")
+    tokens_parser.add_argument("--by", choices=["day", "project", "phase", "model"], default="day", help="Grouping (default: day)")
+    tokens_parser.add_argument("--days", type=int, default=7, help="Look back this many days (default: 7)")
+    tokens_parser.add_argument("-p", "--project", help="Only this project")
+
+    watch_parser = subparsers.add_parser("watch", help="Stream live task progress from the running daemon")
+    watch_parser.add_argument("task_id", nargs="?", type=int, help="Only follow this task (default: all tasks)")
+
     cancel_parser = subparsers.add_parser("cancel", help="Move a task or project to trash")
     cancel_parser.add_argument("identifier", help="Task ID (integer) or project name/ID (string)")
 
@@ -960,6 +1116,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    # Reads only from the daemon's socket; no database or files needed
+    if args.command == "watch":
+        return command_watch(args.task_id)
+
     ctx = build_context(args)
 
     if args.command == "think":
@@ -976,6 +1136,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.command == "usage":
         return command_usage(ctx)
 
+    if args.command == "tokens":
+        return command_tokens(ctx, args.by, args.days, args.project)
+
     if args.command == "cancel":
         return command_cancel(ctx, args.identifier)
 
@@ -1,8 +1,9 @@
 """Observability - monitoring, logging, and reporting."""
 
 from .logging import get_logger
+from .loop_monitor import EventLoopMonitor
 from .monitor import HealthMonitor, PerformanceLogger
 from .pro_plan_usage import ProPlanUsageChecker
 from .report_generator import ReportGenerator, TaskMetrics
 
-__all__ = ["get_logger", "HealthMonitor", "PerformanceLogger", "ProPlanUsageChecker", "ReportGenerator", "TaskMetrics"]
+__all__ = ["get_logger", "EventLoopMonitor", "HealthMonitor", "PerformanceLogger", "ProPlanUsageChecker", "ReportGenerator", "TaskMetrics"]
@@ -0,0 +1,178 @@
+"""Event-loop lag sampling and slow-callback stack reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventLoopMonitor:
+    """Measure how late the event loop runs scheduled callbacks.
+
+    A sampler coroutine sleeps for ``sample_interval_seconds`` and records how
+    much later than requested it woke up; that overshoot is the time the loop
+    spent blocked in some other callback. A watchdog thread notices when the
+    sampler has not checked in for longer than ``slow_callback_seconds`` and
+    logs the loop thread's current stack, which points straight at the
+    blocking call.
+    """
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(
+        self,
+        sample_interval_seconds: float = 0.25,
+        slow_callback_seconds: float = 0.25,
+        history_size: int = 2400,
+        stack_limit: int = 25,
+    ):
+        """Initialize the loop monitor.
+
+        Args:
+            sample_interval_seconds: Delay between lag samples
+            slow_callback_seconds: Blocking time that triggers a stack report
+            history_size: Number of recent samples kept for percentiles
+            stack_limit: Maximum stack frames included in a report
+        """
+        self.sample_interval_seconds = max(0.01, float(sample_interval_seconds))
+        self.slow_callback_seconds = max(0.01, float(slow_callback_seconds))
+        self.stack_limit = stack_limit
+
+        self._bucket_counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self._recent_ms: Deque[float] = deque(maxlen=history_size)
+        self._samples = 0
+        self._max_lag_ms = 0.0
+        self._slow_callbacks = 0
+        self._last_slow: Optional[Dict[str, Any]] = None
+
+        self._lock = threading.Lock()
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._sampler is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._sampler = asyncio.create_task(self._sample_loop(), name="loop-lag-sampler")
+        self._watchdog = threading.Thread(target=self._watch, name="LoopWatchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the sampler and watchdog."""
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except asyncio.CancelledError:
+                pass
+            self._sampler = None
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+    async def _sample_loop(self) -> None:
+        interval = self.sample_interval_seconds
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self._record((now - started - interval) * 1000)
+
+    def _record(self, lag_ms: float) -> None:
+        lag_ms = max(0.0, lag_ms)
+        with self._lock:
+            self._samples += 1
+            self._recent_ms.append(lag_ms)
+            self._bucket_counts[bisect.bisect_left(self.BUCKETS_MS, lag_ms)] += 1
+            if lag_ms > self._max_lag_ms:
+                self._max_lag_ms = lag_ms
+
+    def _watch(self) -> None:
+        threshold = self.sample_interval_seconds + self.slow_callback_seconds
+        reported_heartbeat: Optional[float] = None
+        while not self._stopped.wait(self.slow_callback_seconds / 2):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat
+            if blocked < threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat  # one report per stall
+            self._report_stall(blocked - self.sample_interval_seconds)
+
+    def _report_stall(self, blocked_seconds: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id else None
+        stack = traceback.format_stack(frame, limit=self.stack_limit) if frame else []
+        culprit = stack[-1].strip().splitlines()[0] if stack else None
+
+        report = {
+            "blocked_ms": int(blocked_seconds * 1000),
+            "at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            "culprit": culprit,
+        }
+        with self._lock:
+            self._slow_callbacks += 1
+            self._last_slow = report
+
+        logger.warning(
+            "loop.slow_callback",
+            blocked_ms=report["blocked_ms"],
+            threshold_ms=int(self.slow_callback_seconds * 1000),
+            culprit=culprit,
+            stack="".join(stack),
+        )
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """Return lag percentiles, histogram and slow-callback counters."""
+        with self._lock:
+            recent = sorted(self._recent_ms)
+            buckets = list(self._bucket_counts)
+            samples = self._samples
+            max_lag = self._max_lag_ms
+            slow = self._slow_callbacks
+            last_slow = dict(self._last_slow) if self._last_slow else None
+
+        def _pct(p: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(round(p * (len(recent) - 1))))], 2)
+
+        histogram = {f"le_{bound}ms": count for bound, count in zip(self.BUCKETS_MS, buckets)}
+        histogram[f"gt_{self.BUCKETS_MS[-1]}ms"] = buckets[-1]
+
+        p99 = _pct(0.99)
+        status = "degraded" if p99 is not None and p99 >= self.slow_callback_seconds * 1000 else "ok"
+        return {
+            "status": status,
+            "samples": samples,
+            "lag_p50_ms": _pct(0.50),
+            "lag_p95_ms": _pct(0.95),
+            "lag_p99_ms": p99,
+            "lag_max_ms": round(max_lag, 2),
+            "slow_callbacks": slow,
+            "last_slow_callback": last_slow,
+            "histogram": histogram,
+        }
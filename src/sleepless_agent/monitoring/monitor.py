@@ -4,7 +4,7 @@ import json
 import psutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from sleepless_agent.monitoring.logging import get_logger
 logger = get_logger(__name__)
@@ -24,6 +24,17 @@ class HealthMonitor:
             "total_processing_time": 0,
             "uptime_seconds": 0,
         }
+        self._probes: Dict[str, Callable[[], dict]] = {}
+
+    def register_probe(self, name: str, probe: Callable[[], dict]) -> None:
+        """Include an extra component's health snapshot in health reports.
+
+        Args:
+            name: Key under which the snapshot appears in ``check_health()``
+            probe: Callable returning a dict; a ``"status": "degraded"`` entry
+                degrades overall health
+        """
+        self._probes[name] = probe
 
     def check_health(self) -> dict:
         """Check overall system health"""
@@ -40,10 +51,20 @@ class HealthMonitor:
             "storage": self._check_storage(),
         }
 
+        for name, probe in self._probes.items():
+            try:
+                health[name] = probe()
+            except Exception as e:
+                logger.debug(f"Health probe {name} failed: {e}")
+                health[name] = {"error": str(e)}
+
         # Determine overall status
         if health["system"]["memory_percent"] > 90 or health["system"]["cpu_percent"] > 80:
             health["status"] = "degraded"
 
+        if any(health[name].get("status") == "degraded" for name in self._probes):
+            health["status"] = "degraded"
+
         if not health["database"]["accessible"] or not health["storage"]["accessible"]:
             health["status"] = "unhealthy"
 
@@ -161,6 +182,19 @@ class HealthMonitor:
             f"Memory: {health['system'].get('memory_percent', 'N/A')}%"
         )
 
+        loop_health = health.get("event_loop")
+        if loop_health and "error" not in loop_health:
+            log = logger.warning if loop_health.get("status") == "degraded" else logger.info
+            log(
+                "loop.lag",
+                p50_ms=loop_health.get("lag_p50_ms"),
+                p95_ms=loop_health.get("lag_p95_ms"),
+                p99_ms=loop_health.get("lag_p99_ms"),
+                max_ms=loop_health.get("lag_max_ms"),
+                slow_callbacks=loop_health.get("slow_callbacks"),
+                histogram=loop_health.get("histogram"),
+            )
+
     def get_uptime(self) -> str:
         """Get formatted uptime"""
         uptime = (datetime.now(timezone.utc).replace(tzinfo=None) - self.start_time).total_seconds()
@@ -185,8 +219,9 @@ class PerformanceLogger:
         success: bool,
         files_modified: int = 0,
         commands_executed: int = 0,
+        tool_calls: Optional[dict] = None,
     ):
-        """Log task execution metrics"""
+        """Log task execution metrics, with the worker's tool-call histograms if given"""
         try:
             metric = {
                 "timestamp": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
@@ -198,6 +233,8 @@ class PerformanceLogger:
                 "files_modified": files_modified,
                 "commands_executed": commands_executed,
             }
+            if tool_calls:
+                metric["tool_calls"] = tool_calls
 
             with open(self.metrics_file, "a") as f:
                 f.write(json.dumps(metric) + "\n")
@@ -1,4 +1,5 @@
 """Daily report generation system - append-only updates with end-of-day summarization"""
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, List
@@ -40,6 +41,8 @@ class ReportGenerator:
         self.projects_dir = self.base_path / "projects"
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         self.recent_index = self.base_path / "RECENT.md"
+        # Reports are read-modify-write files; serialize writers across threads
+        self._lock = threading.RLock()
 
     def append_task_completion(self, task_metrics: TaskMetrics, project_id: Optional[str] = None):
         """Append task completion entry to daily report
@@ -50,9 +53,10 @@ class ReportGenerator:
         if project_id:
             task_metrics.project_id = project_id
         timestamp = task_metrics.timestamp or datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        self._append_to_daily_report(task_metrics, timestamp)
-        if task_metrics.project_id:
-            self._append_to_project_report(task_metrics, timestamp)
+        with self._lock:
+            self._append_to_daily_report(task_metrics, timestamp)
+            if task_metrics.project_id:
+                self._append_to_project_report(task_metrics, timestamp)
 
     def _append_to_daily_report(self, task_metrics: TaskMetrics, timestamp: str):
         """Append entry to today's daily report"""
@@ -126,6 +130,10 @@ class ReportGenerator:
         Args:
             date: Report date in YYYY-MM-DD format (default: today)
         """
+        with self._lock:
+            self._summarize_daily_report_unlocked(date)
+
+    def _summarize_daily_report_unlocked(self, date: Optional[str] = None):
         if not date:
             date = datetime.now(timezone.utc).replace(tzinfo=None).strftime("%Y-%m-%d")
 
@@ -161,6 +169,10 @@ class ReportGenerator:
 
     def summarize_project_report(self, project_id: str):
         """Summarize a project-level report."""
+        with self._lock:
+            self._summarize_project_report_unlocked(project_id)
+
+    def _summarize_project_report_unlocked(self, project_id: str):
         report_file = self.projects_dir / f"{project_id}.md"
         if not report_file.exists():
             logger.debug("report.project.missing", project=project_id)
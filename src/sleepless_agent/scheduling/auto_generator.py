@@ -27,6 +27,8 @@ from typing import TypeAlias
 
 from sleepless_agent.scheduling.scheduler import BudgetManager
 from sleepless_agent.utils.config import ConfigNode
+from sleepless_agent.core.queue import parse_verdict
+from sleepless_agent.utils.readme_manager import read_readme_summary
 
 AutoGenerationConfig: TypeAlias = ConfigNode
 AutoTaskPromptConfig: TypeAlias = ConfigNode
@@ -146,7 +148,6 @@ class AutoTaskGenerator:
             Dictionary with aggregated information
         """
         from pathlib import Path
-        import re
 
         analysis = {
             'partial_or_incomplete': [],
@@ -157,55 +158,30 @@ class AutoTaskGenerator:
         workspace_root = Path("./workspace")
         tasks_dir = workspace_root / "tasks"
 
-        if not tasks_dir.exists():
-            return analysis
-
         for task in tasks:
-            # Find task workspace
-            task_workspace = None
-            for item in tasks_dir.iterdir():
-                if item.is_dir() and item.name.startswith(f"{task.id}_"):
-                    task_workspace = item
-                    break
-
-            if not task_workspace:
-                continue
-
-            readme_path = task_workspace / "README.md"
-            if not readme_path.exists():
-                continue
-
             try:
-                content = readme_path.read_text()
-
-                # Extract status
-                status_match = re.search(r'## Status:\s*(\w+)', content)
-                if status_match:
-                    status = status_match.group(1)
-                    if status in ['PARTIAL', 'INCOMPLETE']:
-                        analysis['partial_or_incomplete'].append({
-                            'task_id': task.id,
-                            'description': task.description[:100],
-                            'status': status
-                        })
-
-                # Extract outstanding items
-                outstanding_section = re.search(r'## Outstanding Items\n(.*?)(?=##|$)', content, re.DOTALL)
-                if outstanding_section:
-                    items_text = outstanding_section.group(1).strip()
-                    if items_text and items_text != '(None)':
-                        # Extract list items
-                        items = re.findall(r'^[-*]\s+(.+)$', items_text, re.MULTILINE)
-                        analysis['outstanding_items'].extend(items[:3])  # Limit to 3 items
-
-                # Extract recommendations
-                rec_section = re.search(r'## Recommendations\n(.*?)(?=##|$)', content, re.DOTALL)
-                if rec_section:
-                    rec_text = rec_section.group(1).strip()
-                    if rec_text and rec_text != '(None)':
-                        # Extract list items
-                        recs = re.findall(r'^[-*]\s+(.+)$', rec_text, re.MULTILINE)
-                        analysis['recommendations'].extend(recs[:3])  # Limit to 3 items
+                # The stored verdict first; the README sidecar only for older tasks
+                summary = parse_verdict(task.eval_verdict)
+                if summary is None and tasks_dir.exists():
+                    task_workspace = next(
+                        (item for item in tasks_dir.iterdir() if item.is_dir() and item.name.startswith(f"{task.id}_")),
+                        None,
+                    )
+                    if task_workspace is not None:
+                        # Parses README.md only if the sidecar is stale
+                        summary = read_readme_summary(task_workspace)
+                if summary is None:
+                    continue
+
+                status = summary.get("status")
+                if status in ['PARTIAL', 'INCOMPLETE']:
+                    analysis['partial_or_incomplete'].append({
+                        'task_id': task.id,
+                        'description': task.description[:100],
+                        'status': status
+                    })
+                analysis['outstanding_items'].extend(summary.get("outstanding_items", [])[:3])  # Limit to 3 items
+                analysis['recommendations'].extend(summary.get("recommendations", [])[:3])  # Limit to 3 items
 
             except Exception as e:
                 logger.debug("autogen.readme_analysis.failed", task_id=task.id, error=str(e))
@@ -281,6 +257,8 @@ class AutoTaskGenerator:
         lines = []
         for task in tasks:
             status = task.status.value.upper() if task.status else "UNKNOWN"
+            if task.eval_status:
+                status += f", evaluated {task.eval_status}"
             desc = task.description[:100]
             if len(task.description) > 100:
                 desc += "..."
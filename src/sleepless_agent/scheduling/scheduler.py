@@ -196,6 +196,7 @@ class SmartScheduler:
         threshold_night: float = 80.0,
         night_start_hour: int = 20,
         night_end_hour: int = 8,
+        worker_id: Optional[str] = None,
     ):
         """Initialize scheduler
 
@@ -209,9 +210,12 @@ class SmartScheduler:
             threshold_night: Pause threshold during nighttime (default: 80%)
             night_start_hour: Hour when night starts (default: 20 for 8 PM)
             night_end_hour: Hour when night ends (default: 8 for 8 AM)
+            worker_id: This daemon's lease identity; when set, only tasks it
+                holds count against ``max_parallel_tasks``
         """
         self.task_queue = task_queue
         self.max_parallel_tasks = max_parallel_tasks
+        self.worker_id = worker_id
         self.usage_command = usage_command
         self.threshold_day = threshold_day
         self.threshold_night = threshold_night
@@ -240,8 +244,9 @@ class SmartScheduler:
 
         # Legacy credit window support
         self.active_windows: List[CreditWindow] = []
+        # Opened lazily on first use: it queries the usage command, which is
+        # too slow to run during daemon startup.
         self.current_window: Optional[CreditWindow] = None
-        self._init_current_window()
         self._last_budget_exhausted_log: Optional[datetime] = None
         self._budget_exhausted_logged = False
         self.usage_pause_until: Optional[datetime] = None
@@ -363,6 +368,19 @@ class SmartScheduler:
             parts.append(f"{seconds}s")
         return " ".join(parts) if parts else "0s"
 
+    def pause_until(self, reset_time: Optional[datetime]) -> datetime:
+        """Halt dispatch until ``reset_time`` (plus grace), or for the default pause if it is unknown.
+
+        Used when a running task hits the usage limit; an existing longer
+        pause is kept. Returns the time dispatch resumes.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        pause_base = reset_time if reset_time and reset_time > now else now + self._usage_pause_default
+        pause_until = pause_base + self._usage_pause_grace
+        if self.usage_pause_until is None or pause_until > self.usage_pause_until:
+            self.usage_pause_until = pause_until
+        return self.usage_pause_until
+
     def get_pause_remaining_seconds(self) -> Optional[float]:
         """Return remaining pause duration in seconds if scheduling is halted."""
         if not self.usage_pause_until:
@@ -370,8 +388,22 @@ class SmartScheduler:
         remaining = (self.usage_pause_until - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
         return remaining if remaining > 0 else None
 
-    def get_next_tasks(self) -> List[Task]:
-        """Get next tasks to execute respecting concurrency, priorities, and budget"""
+    def get_next_tasks(
+        self,
+        running: Optional[List[Task]] = None,
+        settling: Optional[List[Task]] = None,
+    ) -> List[Task]:
+        """Get next tasks to execute respecting concurrency, priorities, and budget
+
+        Args:
+            running: Tasks already dispatched by the caller that may not be
+                marked IN_PROGRESS in the database yet. They count against
+                the slot limit and their workspaces are treated as busy.
+                When given, only these count against the slot limit, so
+                tasks run by other daemons sharing the database do not.
+            settling: Finished tasks whose post-task work (git commit) is
+                still pending. They take no slot but their workspaces are busy.
+        """
         self._init_current_window()
 
         # Check if we should schedule tasks using live usage or budget
@@ -403,15 +435,28 @@ class SmartScheduler:
             self._budget_exhausted_logged = False
             self._last_budget_exhausted_log = None
 
-        # Get in-progress tasks
+        # Get in-progress tasks (database view merged with caller's in-flight tasks)
         in_progress = self.task_queue.get_in_progress_tasks()
-        available_slots = max(0, self.max_parallel_tasks - len(in_progress))
+        if running is not None:
+            available_slots = max(0, self.max_parallel_tasks - len(running))
+        elif self.worker_id is not None:
+            # Tasks leased by other daemons sharing the database use their slots, not ours
+            held = [task for task in in_progress if task.worker_id == self.worker_id]
+            available_slots = max(0, self.max_parallel_tasks - len(held))
+        else:
+            available_slots = max(0, self.max_parallel_tasks - len(in_progress))
+        known_ids = {task.id for task in in_progress}
+        for task in list(running or []) + list(settling or []):
+            if task.id not in known_ids:
+                known_ids.add(task.id)
+                in_progress.append(task)
 
         if available_slots == 0:
             return []
 
-        # Get pending tasks in priority order
-        pending = self.task_queue.get_pending_tasks(limit=available_slots)
+        # Get pending tasks in priority order. Over-fetch a little so that
+        # candidates blocked by a busy workspace don't leave slots idle.
+        pending = self.task_queue.get_pending_tasks(limit=available_slots * 4)
 
         # Enhanced dispatch log with detailed decision-making context
         if pending:
@@ -424,7 +469,7 @@ class SmartScheduler:
 
             # Build comprehensive log payload explaining the scheduling decision
             payload: Dict[str, Any] = {
-                "dispatching_tasks": len(pending),
+                "dispatching_tasks": min(len(pending), available_slots),
                 "time_period": time_label,
                 "is_nighttime": is_night,
             }
@@ -460,10 +505,11 @@ class SmartScheduler:
 
         # Filter out tasks that would conflict with currently executing tasks
         # (e.g., REFINE tasks targeting a workspace that's already in use)
-        non_conflicting_tasks = self._filter_workspace_conflicts(in_progress, pending)
+        non_conflicting_tasks = self._filter_workspace_conflicts(in_progress, pending)[:available_slots]
 
-        if len(non_conflicting_tasks) < len(pending):
-            filtered_count = len(pending) - len(non_conflicting_tasks)
+        wanted = min(len(pending), available_slots)
+        if len(non_conflicting_tasks) < wanted:
+            filtered_count = wanted - len(non_conflicting_tasks)
             logger.debug(
                 "scheduler.workspace_conflict",
                 filtered_count=filtered_count,
@@ -472,6 +518,10 @@ class SmartScheduler:
 
         return non_conflicting_tasks
 
+    def get_workspace_identifier(self, task: Task) -> str:
+        """Public form of the workspace key used for conflict detection."""
+        return self._get_task_workspace_identifier(task)
+
     def _get_task_workspace_identifier(self, task: Task) -> str:
         """Get workspace identifier for a task
 
@@ -574,6 +624,7 @@ class SmartScheduler:
         duration_api_ms: Optional[int] = None,
         num_turns: Optional[int] = None,
         project_id: Optional[str] = None,
+        tokens: Optional[Dict[str, Optional[int]]] = None,
     ):
         """Record API usage metrics for a completed task
 
@@ -584,7 +635,10 @@ class SmartScheduler:
             duration_api_ms: API call duration
             num_turns: Number of conversation turns
             project_id: Optional project ID for aggregation
+            tokens: Optional input, output, cache_read and cache_creation
+                token totals (keys as on UsageMetric)
         """
+        tokens = tokens or {}
         session = self.task_queue.SessionLocal()
         try:
             usage = UsageMetric(
@@ -594,6 +648,10 @@ class SmartScheduler:
                 duration_api_ms=duration_api_ms,
                 num_turns=num_turns,
                 project_id=project_id,
+                input_tokens=tokens.get("input_tokens"),
+                output_tokens=tokens.get("output_tokens"),
+                cache_read_tokens=tokens.get("cache_read_tokens"),
+                cache_creation_tokens=tokens.get("cache_creation_tokens"),
             )
             session.add(usage)
             session.commit()
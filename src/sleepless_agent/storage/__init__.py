@@ -1,8 +1,16 @@
 """Storage layer - persistence, git, and workspace management."""
 
+from sleepless_agent.storage.checkpoints import CheckpointStore
+from sleepless_agent.storage.fingerprint import workspace_fingerprint
 from sleepless_agent.storage.git import GitManager
+from sleepless_agent.storage.manifest import ManifestDiff, WorkspaceManifest, scan_workspace
+from sleepless_agent.storage.outbox import EventOutbox, PendingEvent
+from sleepless_agent.storage.phase_usage import PhaseSample, PhaseUsageStore
+from sleepless_agent.storage.plan_cache import PlanCache, PlanCacheHit, normalize_description
 from sleepless_agent.storage.workspace import WorkspaceSetup, WorkspaceConfigResult
 from sleepless_agent.storage.results import ResultManager
+from sleepless_agent.storage.snapshots import SnapshotStats, SnapshotStore
 from sleepless_agent.storage.sqlite import SQLiteStore
+from sleepless_agent.storage.token_usage import ModelTokens, TokenUsageStore
 
-__all__ = ["GitManager", "WorkspaceSetup", "WorkspaceConfigResult", "ResultManager", "SQLiteStore"]
+__all__ = ["CheckpointStore", "workspace_fingerprint", "GitManager", "ManifestDiff", "WorkspaceManifest", "scan_workspace", "EventOutbox", "PendingEvent", "PhaseSample", "PhaseUsageStore", "PlanCache", "PlanCacheHit", "normalize_description", "WorkspaceSetup", "WorkspaceConfigResult", "ResultManager", "SnapshotStats", "SnapshotStore", "SQLiteStore", "ModelTokens", "TokenUsageStore"]
@@ -0,0 +1,92 @@
+"""Phase checkpoint persistence for resumable task execution."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from sleepless_agent.core.models import TaskCheckpoint
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.sqlite import SQLiteStore
+
+logger = get_logger(__name__)
+
+
+class CheckpointStore(SQLiteStore):
+    """Persist the output of each completed workflow phase per task."""
+
+    def save(self, task_id: int, phase: str, payload: Dict[str, Any]) -> None:
+        """Store (or replace) the checkpoint for a task phase.
+
+        Args:
+            task_id: Task ID
+            phase: Workflow phase name (planner, worker, evaluator)
+            payload: JSON-serializable phase output and metrics
+        """
+
+        def _op(session: Session) -> None:
+            session.query(TaskCheckpoint).filter(
+                TaskCheckpoint.task_id == task_id,
+                TaskCheckpoint.phase == phase,
+            ).delete(synchronize_session=False)
+            session.add(
+                TaskCheckpoint(
+                    task_id=task_id,
+                    phase=phase,
+                    payload=json.dumps(payload, default=str),
+                )
+            )
+
+        self._run_write(_op)
+        logger.debug("checkpoint.saved", task_id=task_id, phase=phase)
+
+    def load(self, task_id: int) -> Dict[str, Dict[str, Any]]:
+        """Return checkpoints for a task keyed by phase name."""
+
+        def _op(session: Session) -> Dict[str, Dict[str, Any]]:
+            rows = (
+                session.query(TaskCheckpoint)
+                .filter(TaskCheckpoint.task_id == task_id)
+                .order_by(TaskCheckpoint.created_at)
+                .all()
+            )
+            checkpoints: Dict[str, Dict[str, Any]] = {}
+            for row in rows:
+                try:
+                    checkpoints[row.phase] = json.loads(row.payload)
+                except (json.JSONDecodeError, TypeError):
+                    logger.warning("checkpoint.corrupt", task_id=task_id, phase=row.phase)
+            return checkpoints
+
+        return self._run_read(_op)
+
+    def clear(self, task_id: int, phases: Optional[Iterable[str]] = None) -> int:
+        """Delete a task's checkpoints, or only those of ``phases``, returning the number removed."""
+
+        def _op(session: Session) -> int:
+            query = session.query(TaskCheckpoint).filter(TaskCheckpoint.task_id == task_id)
+            if phases is not None:
+                query = query.filter(TaskCheckpoint.phase.in_(list(phases)))
+            return query.delete(synchronize_session=False)
+
+        return self._run_write(_op)
+
+    def get_phases(self, task_ids: list[int]) -> Dict[int, list[str]]:
+        """Return the checkpointed phases for several tasks."""
+        if not task_ids:
+            return {}
+
+        def _op(session: Session) -> Dict[int, list[str]]:
+            phases: Dict[int, list[str]] = {}
+            rows = (
+                session.query(TaskCheckpoint.task_id, TaskCheckpoint.phase)
+                .filter(TaskCheckpoint.task_id.in_(task_ids))
+                .all()
+            )
+            for task_id, phase in rows:
+                phases.setdefault(task_id, []).append(phase)
+            return phases
+
+        return self._run_read(_op)
@@ -0,0 +1,58 @@
+"""Cheap content fingerprints of workspace directories."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Directories that never influence what an agent sees or produces
+IGNORED_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv", ".mypy_cache", ".pytest_cache"})
+
+
+def workspace_fingerprint(root: Path, exclude: Optional[Iterable[str]] = None) -> Optional[str]:
+    """Hash the path, size and mtime of every file under ``root``.
+
+    File contents are not read, so this stays fast on large workspaces; any
+    write that touches a file changes its mtime and therefore the result.
+
+    Args:
+        root: Workspace directory
+        exclude: Relative POSIX paths to leave out (e.g. ``README.md``)
+
+    Returns:
+        Hex digest, or None if ``root`` does not exist
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return None
+
+    excluded = set(exclude or ())
+    digest = hashlib.blake2b(digest_size=16)
+    stack = [(root, "")]
+    entries = []
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    rel_path = f"{prefix}{entry.name}"
+                    if rel_path in excluded:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in IGNORED_DIRS:
+                                stack.append((Path(entry.path), f"{rel_path}/"))
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}")
+        except OSError:
+            continue
+
+    for line in sorted(entries):
+        digest.update(line.encode("utf-8", "surrogateescape"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -2,17 +2,57 @@
 
 from __future__ import annotations
 
+import functools
 import subprocess
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
 
 from sleepless_agent.monitoring.logging import get_logger
 logger = get_logger(__name__)
 
+_F = TypeVar("_F", bound=Callable)
+
+
+def _repo_locked(method: _F) -> _F:
+    """Run a GitManager operation under its cross-process repository lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "GitManager", *args, **kwargs):
+        with self._lock:
+            if self._lock_held or not self.enabled or fcntl is None:
+                return method(self, *args, **kwargs)
+            lock_path = self.repo_path / ".git" / self.LOCK_NAME
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(lock_path, "a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                self._lock_held = True
+                try:
+                    return method(self, *args, **kwargs)
+                finally:
+                    self._lock_held = False
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class GitManager:
-    """Manage a single workspace repository with branch-per-project workflow."""
+    """Manage a single workspace repository with branch-per-project workflow.
+
+    Daemons that share a ``workspace_root`` share this repository, so the
+    public operations hold an exclusive ``flock`` on
+    ``.git/sleepless-agent.lock`` for their whole checkout, stage, commit and
+    merge sequence; the single-thread git pool only orders calls within one
+    process.
+    """
+
+    LOCK_NAME = "sleepless-agent.lock"
 
     def __init__(
         self,
@@ -28,10 +68,14 @@ class GitManager:
         self.auto_create_repo = auto_create_repo
         self.enabled = enabled
         self._push_warning_logged = False
+        # Operations call each other; nested calls run under the lock already held
+        self._lock = threading.RLock()
+        self._lock_held = False
 
     # ------------------------------------------------------------------
     # Repository bootstrap
     # ------------------------------------------------------------------
+    @_repo_locked
     def init_repo(self) -> bool:
         """Ensure workspace repo exists with an initial commit."""
         if not self.enabled:
@@ -71,6 +115,7 @@ class GitManager:
     # ------------------------------------------------------------------
     # Public branch helpers
     # ------------------------------------------------------------------
+    @_repo_locked
     def ensure_branch(self, branch: str):
         """Create branch from main if it does not exist."""
         if self._branch_exists(branch):
@@ -80,6 +125,7 @@ class GitManager:
         self._run_git("branch", branch, self.main_branch)
         logger.debug(f"Created branch '{branch}' from {self.main_branch}")
 
+    @_repo_locked
     def commit_workspace_changes(
         self,
         branch: str,
@@ -117,6 +163,7 @@ class GitManager:
             logger.error(f"Git workflow failed for branch '{branch}': {exc}")
             raise
 
+    @_repo_locked
     def push_all(self):
         """Push all branches to remote origin if configured."""
         if not self._has_remote("origin"):
@@ -163,6 +210,7 @@ class GitManager:
             logger.error(f"Failed to push branches to origin: {exc}")
             raise
 
+    @_repo_locked
     def configure_remote(self, remote_url: str, remote_name: str = "origin"):
         """Ensure a remote is set up for pushing updates."""
         self.init_repo()
@@ -282,7 +330,8 @@ class GitManager:
             gitignore_path.write_text("\n".join(updated_lines) + "\n")
 
     def _repo_exists(self) -> bool:
-        return (self.repo_path / ".git").exists()
+        # The lock file may have created .git before ``git init`` ran
+        return (self.repo_path / ".git" / "HEAD").exists()
 
     def _has_commits(self) -> bool:
         try:
@@ -0,0 +1,229 @@
+"""Fast workspace scanning with a persisted per-workspace file manifest."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Set
+
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.utils.readme_manager import SIDECAR_NAME
+
+logger = get_logger(__name__)
+
+# Directories never descended into
+EXCLUDED_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv", ".mypy_cache", ".pytest_cache"})
+# Files never reported
+EXCLUDED_FILES = frozenset({".gitignore", ".DS_Store", SIDECAR_NAME, ".README.md.tmp"})
+
+_MANIFEST_VERSION = 1
+
+
+class FileEntry(NamedTuple):
+    """What the manifest remembers about one file."""
+
+    size: int
+    mtime_ns: int
+    digest: Optional[str] = None
+
+
+@dataclass
+class ManifestDiff:
+    """Changes between two scans of a workspace."""
+
+    added: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+    deleted: Set[str] = field(default_factory=set)
+    total_files: int = 0
+    scan_ms: float = 0.0
+
+    @property
+    def changed(self) -> Set[str]:
+        """Files that exist and differ from the previous scan."""
+        return self.added | self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+    def apply(self, reported: Iterable[str], root: Path) -> Set[str]:
+        """Merge paths reported by tools with this diff.
+
+        Changed files are added, and reported files that have since been
+        deleted are dropped. Reported paths may be absolute or relative to
+        ``root``; absolute paths and ``root`` are both resolved, so a
+        workspace reached through a symlink still matches. Paths inside
+        ``root`` are returned relative to it, like the diff's own, so a file
+        both reported and detected is counted once.
+        """
+        root = Path(root).resolve()
+        result = set(self.changed)
+        for path in reported:
+            candidate = Path(path)
+            rel_path = candidate.as_posix()
+            if candidate.is_absolute():
+                candidate = candidate.resolve()
+                if candidate.is_relative_to(root):
+                    rel_path = candidate.relative_to(root).as_posix()
+            if rel_path not in self.deleted:
+                result.add(rel_path)
+        return result
+
+
+def scan_workspace(
+    root: Path,
+    excluded_dirs: Iterable[str] = EXCLUDED_DIRS,
+    excluded_files: Iterable[str] = EXCLUDED_FILES,
+) -> Dict[str, os.stat_result]:
+    """Stat every file under ``root`` with ``os.scandir``.
+
+    Excluded directories are pruned before descending, so a large
+    ``node_modules`` or ``.git`` costs a single directory entry. Symlinks are
+    reported but not followed.
+
+    Returns:
+        Mapping of relative POSIX path to its stat result
+    """
+    root = Path(root)
+    excluded_dirs = frozenset(excluded_dirs)
+    excluded_files = frozenset(excluded_files)
+    files: Dict[str, os.stat_result] = {}
+    stack = [(str(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            iterator = os.scandir(directory)
+        except OSError:
+            continue
+        with iterator:
+            for entry in iterator:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in excluded_dirs and not name.startswith(".git"):
+                            stack.append((entry.path, f"{prefix}{name}/"))
+                        continue
+                    if name in excluded_files:
+                        continue
+                    files[f"{prefix}{name}"] = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+    return files
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class WorkspaceManifest:
+    """Track which files in a workspace were added, modified or deleted.
+
+    Each :meth:`refresh` stats the tree and compares it against the manifest
+    from the previous call, which is kept in memory and persisted as JSON so
+    a restarted daemon diffs against the last known state instead of
+    rescanning from nothing. Files whose size and mtime are unchanged are not
+    opened. When ``hash_max_bytes`` is set, small files whose metadata changed
+    are hashed so a touch without a content change is not reported.
+    """
+
+    def __init__(
+        self,
+        workspace: Path,
+        store_dir: Optional[Path] = None,
+        *,
+        hash_max_bytes: int = 0,
+    ):
+        """Initialize the manifest.
+
+        Args:
+            workspace: Workspace directory to track
+            store_dir: Directory for the persisted manifest; memory only if None
+            hash_max_bytes: Hash changed files up to this size (0 disables hashing)
+        """
+        self.workspace = Path(workspace)
+        self.hash_max_bytes = max(0, int(hash_max_bytes))
+        self.path: Optional[Path] = None
+        if store_dir is not None:
+            key = hashlib.sha1(str(self.workspace.resolve()).encode("utf-8")).hexdigest()[:16]
+            self.path = Path(store_dir) / f"{key}.json"
+        self._entries: Optional[Dict[str, FileEntry]] = None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> Dict[str, FileEntry]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get("version") == _MANIFEST_VERSION and data.get("workspace") == str(self.workspace):
+                    self._entries = {rel: FileEntry(*values) for rel, values in data.get("files", {}).items()}
+            except (OSError, ValueError, TypeError) as exc:
+                logger.debug("workspace.manifest.load_failed", path=str(self.path), error=str(exc))
+        return self._entries
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "workspace": str(self.workspace),
+            "files": self._entries or {},  # FileEntry tuples serialize as arrays
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.debug("workspace.manifest.save_failed", path=str(self.path), error=str(exc))
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+    def files(self) -> Set[str]:
+        """Relative paths recorded by the last refresh."""
+        return set(self._load())
+
+    def refresh(self) -> ManifestDiff:
+        """Rescan the workspace, update the manifest and return what changed."""
+        started = time.perf_counter()
+        previous = self._load()
+        current = scan_workspace(self.workspace)
+        entries: Dict[str, FileEntry] = {}
+        diff = ManifestDiff(total_files=len(current))
+
+        for rel_path, stat in current.items():
+            old = previous.get(rel_path)
+            if old is not None and old.size == stat.st_size and old.mtime_ns == stat.st_mtime_ns:
+                entries[rel_path] = old
+                continue
+
+            digest = None
+            if self.hash_max_bytes and stat.st_size <= self.hash_max_bytes:
+                digest = _hash_file(self.workspace / rel_path)
+            entries[rel_path] = FileEntry(stat.st_size, stat.st_mtime_ns, digest)
+
+            if old is None:
+                diff.added.add(rel_path)
+            elif digest is None or old.digest is None or digest != old.digest:
+                diff.modified.add(rel_path)
+
+        diff.deleted = set(previous) - set(current)
+        self._entries = entries
+        if diff or (self.path is not None and not self.path.exists()):
+            self._save()
+        diff.scan_ms = round((time.perf_counter() - started) * 1000, 2)
+        return diff
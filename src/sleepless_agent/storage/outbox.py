@@ -0,0 +1,148 @@
+"""Durable record of post-task side effects that have not run yet."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from sleepless_agent.core.models import OutboxEvent
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.sqlite import SQLiteStore
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PendingEvent:
+    """An event with the consumers that still have to handle it."""
+
+    event_id: str
+    kind: str
+    task_id: int
+    payload: Dict[str, Any]
+    consumers: List[str] = field(default_factory=list)
+
+
+class EventOutbox(SQLiteStore):
+    """Keep one row per (event, consumer) until the consumer is done with it.
+
+    Rows are written before a task's outcome is acknowledged and deleted as
+    each consumer finishes, so a commit, usage record or report entry cut
+    off by a crash or an undrained shutdown is replayed on the next start.
+    """
+
+    def add(
+        self,
+        event_id: str,
+        kind: str,
+        task_id: int,
+        consumers: Iterable[str],
+        payload: Dict[str, Any],
+        worker_id: Optional[str] = None,
+    ) -> None:
+        """Record ``event_id`` as pending for each of ``consumers``."""
+        encoded = json.dumps(payload, default=str)
+
+        def _op(session: Session) -> None:
+            for consumer in consumers:
+                session.add(
+                    OutboxEvent(
+                        event_id=event_id,
+                        consumer=consumer,
+                        kind=kind,
+                        task_id=task_id,
+                        worker_id=worker_id,
+                        payload=encoded,
+                    )
+                )
+
+        self._run_write(_op)
+
+    def save_payload(self, event_id: str, payload: Dict[str, Any]) -> None:
+        """Replace the stored payload of an event, e.g. once a commit SHA is known."""
+        encoded = json.dumps(payload, default=str)
+
+        def _op(session: Session) -> None:
+            session.query(OutboxEvent).filter(OutboxEvent.event_id == event_id).update(
+                {OutboxEvent.payload: encoded}, synchronize_session=False
+            )
+
+        self._run_write(_op)
+
+    def ack(self, event_id: str, consumer: str) -> None:
+        """Forget an event for one consumer."""
+
+        def _op(session: Session) -> None:
+            session.query(OutboxEvent).filter(
+                OutboxEvent.event_id == event_id,
+                OutboxEvent.consumer == consumer,
+            ).delete(synchronize_session=False)
+
+        self._run_write(_op)
+
+    def discard(self, event_id: str) -> int:
+        """Forget an event for every consumer, returning the number of rows removed."""
+
+        def _op(session: Session) -> int:
+            return (
+                session.query(OutboxEvent)
+                .filter(OutboxEvent.event_id == event_id)
+                .delete(synchronize_session=False)
+            )
+
+        return self._run_write(_op)
+
+    def claim_orphans(
+        self,
+        worker_id: str,
+        dead_worker: Optional[Callable[[str], bool]] = None,
+    ) -> List[PendingEvent]:
+        """Take over the pending events of an earlier run of this daemon.
+
+        Events published under ``worker_id`` (a fixed worker id from before a
+        restart) and those of workers ``dead_worker`` reports as gone are
+        reassigned to ``worker_id`` and returned, oldest first.
+        """
+
+        def _op(session: Session) -> List[PendingEvent]:
+            owners = [owner for (owner,) in session.query(OutboxEvent.worker_id).distinct().all()]
+            orphaned = [
+                owner
+                for owner in owners
+                if owner is None or owner == worker_id or (dead_worker is not None and dead_worker(owner))
+            ]
+            if not orphaned:
+                return []
+            owned_by = OutboxEvent.worker_id.in_([owner for owner in orphaned if owner is not None])
+            if None in orphaned:
+                owned_by = owned_by | OutboxEvent.worker_id.is_(None)
+            rows = session.query(OutboxEvent).filter(owned_by).order_by(OutboxEvent.id).all()
+
+            events: Dict[str, PendingEvent] = {}
+            for row in rows:
+                row.worker_id = worker_id
+                event = events.get(row.event_id)
+                if event is None:
+                    try:
+                        payload = json.loads(row.payload)
+                    except (json.JSONDecodeError, TypeError):
+                        logger.warning("outbox.corrupt", event_id=row.event_id, task_id=row.task_id)
+                        session.delete(row)
+                        continue
+                    event = events[row.event_id] = PendingEvent(
+                        event_id=row.event_id,
+                        kind=row.kind,
+                        task_id=row.task_id,
+                        payload=payload,
+                    )
+                event.consumers.append(row.consumer)
+            return list(events.values())
+
+        return self._run_write(_op)
+
+    def pending_count(self) -> int:
+        """Number of (event, consumer) rows not handled yet."""
+        return self._run_read(lambda session: session.query(OutboxEvent).count())
@@ -0,0 +1,143 @@
+"""Per-phase usage history (turns, duration, cost, tokens) for workflow phases."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from sleepless_agent.core.models import PhaseUsage
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.sqlite import SQLiteStore
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PhaseSample:
+    """One recorded phase run."""
+
+    turns: Optional[int]
+    max_turns: Optional[int]
+    duration_ms: Optional[int]
+    success: bool
+
+    @property
+    def hit_cap(self) -> bool:
+        return bool(self.turns and self.max_turns and self.turns >= self.max_turns)
+
+
+class PhaseUsageStore(SQLiteStore):
+    """Record every phase run and query recent runs by task class."""
+
+    def record(
+        self,
+        *,
+        task_id: int,
+        phase: str,
+        task_type: Optional[str],
+        priority: Optional[str],
+        project_id: Optional[str],
+        turns: Optional[int],
+        max_turns: Optional[int],
+        duration_ms: Optional[int],
+        cost_usd: Optional[float],
+        success: bool = True,
+        outcome: Optional[str] = None,
+        prompt_tokens: Optional[int] = None,
+        cache_read_tokens: Optional[int] = None,
+        cache_creation_tokens: Optional[int] = None,
+    ) -> None:
+        """Store one phase run."""
+
+        def _op(session: Session) -> None:
+            session.add(
+                PhaseUsage(
+                    task_id=task_id,
+                    phase=phase,
+                    task_type=task_type,
+                    priority=priority,
+                    project_id=project_id,
+                    turns=turns,
+                    max_turns=max_turns,
+                    duration_ms=duration_ms,
+                    cost_usd=str(cost_usd) if cost_usd is not None else None,
+                    success=success,
+                    outcome=outcome,
+                    prompt_tokens=prompt_tokens,
+                    cache_read_tokens=cache_read_tokens,
+                    cache_creation_tokens=cache_creation_tokens,
+                )
+            )
+
+        self._run_write(_op)
+
+    def recent_samples(
+        self,
+        phase: str,
+        *,
+        task_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 200,
+    ) -> List[PhaseSample]:
+        """Most recent runs of ``phase``, filtered by whichever keys are given."""
+
+        def _op(session: Session) -> List[PhaseSample]:
+            query = session.query(
+                PhaseUsage.turns, PhaseUsage.max_turns, PhaseUsage.duration_ms, PhaseUsage.success
+            ).filter(PhaseUsage.phase == phase)
+            if task_type is not None:
+                query = query.filter(PhaseUsage.task_type == task_type)
+            if priority is not None:
+                query = query.filter(PhaseUsage.priority == priority)
+            if project_id is not None:
+                query = query.filter(PhaseUsage.project_id == project_id)
+            rows = query.order_by(PhaseUsage.created_at.desc()).limit(limit).all()
+            return [PhaseSample(turns, max_turns, duration_ms, bool(success)) for turns, max_turns, duration_ms, success in rows]
+
+        return self._run_read(_op)
+
+    def outcome_stats(
+        self,
+        phase: str,
+        *,
+        task_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 200,
+    ) -> Dict[str, object]:
+        """Outcome counts and mean cost over the most recent runs with an outcome.
+
+        Returns:
+            ``{"samples": n, "outcomes": {outcome: count}, "mean_cost_usd": float | None}``
+        """
+
+        def _op(session: Session) -> Dict[str, object]:
+            query = session.query(PhaseUsage.outcome, PhaseUsage.cost_usd).filter(
+                PhaseUsage.phase == phase, PhaseUsage.outcome.isnot(None)
+            )
+            if task_type is not None:
+                query = query.filter(PhaseUsage.task_type == task_type)
+            if priority is not None:
+                query = query.filter(PhaseUsage.priority == priority)
+            if project_id is not None:
+                query = query.filter(PhaseUsage.project_id == project_id)
+            rows = query.order_by(PhaseUsage.created_at.desc()).limit(limit).all()
+
+            outcomes: Dict[str, int] = {}
+            costs: List[float] = []
+            for outcome, cost in rows:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                try:
+                    costs.append(float(cost))
+                except (TypeError, ValueError):
+                    pass
+            return {
+                "samples": len(rows),
+                "outcomes": outcomes,
+                "mean_cost_usd": sum(costs) / len(costs) if costs else None,
+            }
+
+        return self._run_read(_op)
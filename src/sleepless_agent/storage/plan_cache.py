@@ -0,0 +1,224 @@
+"""Persistent cache of planner output keyed by task and workspace state."""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from sleepless_agent.core.models import PlanCacheEntry
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.sqlite import SQLiteStore
+
+logger = get_logger(__name__)
+
+_REFINE_TAG = re.compile(r"\*?\*?\[REFINE(?::#\d+)?\]\*?\*?", re.IGNORECASE)
+_TASK_REF = re.compile(r"#\d+")
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(description: str) -> str:
+    """Reduce a task description to the words that matter for planning.
+
+    Drops ``[REFINE:#id]`` tags, task references, punctuation, case and
+    whitespace differences, so a retried or re-queued task maps to the same
+    key as the original.
+    """
+    text = _REFINE_TAG.sub(" ", description or "")
+    text = _TASK_REF.sub(" ", text)
+    text = _NON_WORD.sub(" ", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class PlanCacheHit:
+    """A cached plan and how closely it matches the current task."""
+
+    plan_text: str
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    fresh: bool = False  # exact description and workspace match
+    similarity: float = 1.0
+    age_seconds: float = 0.0
+
+
+class PlanCache(SQLiteStore):
+    """Map (normalized description, workspace fingerprint, task type) to a plan.
+
+    An exact, unexpired match is a *fresh* hit and can be reused as is. A
+    *near* hit - a similar description on the same workspace, or the same
+    description on a workspace that has since changed - is handed to the
+    planner as a starting point instead of planning from scratch.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        max_age_seconds: float = 86400,
+        near_match_threshold: float = 0.85,
+        max_entries: int = 500,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: Task database path
+            max_age_seconds: Entries older than this are never fresh hits
+            near_match_threshold: Minimum description similarity for a near hit
+            max_entries: Least recently used entries beyond this are pruned
+        """
+        super().__init__(db_path)
+        self.max_age_seconds = max_age_seconds
+        self.near_match_threshold = near_match_threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "stores": 0, "saved_cost_usd": 0.0}
+
+    @staticmethod
+    def make_key(description: str, fingerprint: Optional[str], workspace_task_type: Optional[str]) -> str:
+        raw = "\0".join([normalize_description(description), fingerprint or "", workspace_task_type or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def lookup(
+        self,
+        description: str,
+        fingerprint: Optional[str],
+        workspace_task_type: Optional[str] = None,
+    ) -> Optional[PlanCacheHit]:
+        """Return a fresh or near hit for the task, or None on a miss."""
+        normalized = normalize_description(description)
+        key = self.make_key(description, fingerprint, workspace_task_type)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        cutoff = now - timedelta(seconds=self.max_age_seconds)
+
+        def _op(session: Session) -> Optional[PlanCacheHit]:
+            entry = session.query(PlanCacheEntry).filter(PlanCacheEntry.cache_key == key).first()
+            if entry is not None and entry.created_at >= cutoff:
+                entry.hits += 1
+                entry.last_used_at = now
+                return self._to_hit(entry, now, fresh=True, similarity=1.0)
+
+            # Near candidates: same workspace state or same wording
+            candidates = (
+                session.query(PlanCacheEntry)
+                .filter(
+                    PlanCacheEntry.workspace_task_type == workspace_task_type,
+                    or_(
+                        PlanCacheEntry.fingerprint == fingerprint,
+                        PlanCacheEntry.description == normalized,
+                    ),
+                )
+                .order_by(PlanCacheEntry.last_used_at.desc())
+                .limit(50)
+                .all()
+            )
+            best, best_ratio = None, 0.0
+            for candidate in candidates:
+                ratio = difflib.SequenceMatcher(None, normalized, candidate.description).ratio()
+                if ratio > best_ratio:
+                    best, best_ratio = candidate, ratio
+            if best is None or best_ratio < self.near_match_threshold:
+                return None
+            best.last_used_at = now
+            return self._to_hit(best, now, fresh=False, similarity=best_ratio)
+
+        hit = self._run_write(_op)
+        with self._lock:
+            if hit is None:
+                self._stats["misses"] += 1
+            elif hit.fresh:
+                self._stats["hits"] += 1
+                self._stats["saved_cost_usd"] += float(hit.metrics.get("planner_cost_usd") or 0.0)
+            else:
+                self._stats["near_hits"] += 1
+        return hit
+
+    @staticmethod
+    def _to_hit(entry: PlanCacheEntry, now: datetime, *, fresh: bool, similarity: float) -> PlanCacheHit:
+        try:
+            metrics = json.loads(entry.metrics) if entry.metrics else {}
+        except (json.JSONDecodeError, TypeError):
+            metrics = {}
+        return PlanCacheHit(
+            plan_text=entry.plan_text,
+            metrics=metrics,
+            fresh=fresh,
+            similarity=round(similarity, 3),
+            age_seconds=(now - entry.created_at).total_seconds(),
+        )
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+    def store(
+        self,
+        description: str,
+        fingerprint: Optional[str],
+        workspace_task_type: Optional[str],
+        plan_text: str,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Insert or refresh the entry for this task and workspace state."""
+        if not plan_text or not plan_text.strip():
+            return
+        key = self.make_key(description, fingerprint, workspace_task_type)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        metrics_json = json.dumps(metrics or {}, default=str)
+
+        def _op(session: Session) -> None:
+            entry = session.query(PlanCacheEntry).filter(PlanCacheEntry.cache_key == key).first()
+            if entry is None:
+                session.add(
+                    PlanCacheEntry(
+                        cache_key=key,
+                        description=normalize_description(description),
+                        fingerprint=fingerprint,
+                        workspace_task_type=workspace_task_type,
+                        plan_text=plan_text,
+                        metrics=metrics_json,
+                        created_at=now,
+                        last_used_at=now,
+                    )
+                )
+            else:
+                entry.plan_text = plan_text
+                entry.metrics = metrics_json
+                entry.created_at = now
+                entry.last_used_at = now
+
+            session.flush()
+            stale_ids = [
+                row[0]
+                for row in session.query(PlanCacheEntry.id)
+                .order_by(PlanCacheEntry.last_used_at.desc())
+                .offset(self.max_entries)
+                .all()
+            ]
+            if stale_ids:
+                session.query(PlanCacheEntry).filter(PlanCacheEntry.id.in_(stale_ids)).delete(
+                    synchronize_session=False
+                )
+
+        self._run_write(_op)
+        with self._lock:
+            self._stats["stores"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters since startup, with the hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["near_hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else None
+        stats["saved_cost_usd"] = round(stats["saved_cost_usd"], 4)
+        return stats
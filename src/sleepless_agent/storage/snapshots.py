@@ -0,0 +1,364 @@
+"""Content-addressed snapshots for materializing source trees into workspaces."""
+
+from __future__ import annotations
+
+import errno
+import fnmatch
+import hashlib
+import os
+import shutil
+import stat as stat_module
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from sleepless_agent.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:  # POSIX only; without it concurrent pruning is not guarded
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Linux FICLONE ioctl: share extents copy-on-write (btrfs, xfs, overlayfs on those)
+_FICLONE = 0x40049409
+_LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+_NO_LINK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EINVAL}
+
+
+@dataclass
+class SnapshotStats:
+    """What a materialization did, and how many bytes were not duplicated."""
+
+    files: int = 0
+    reflinked: int = 0
+    hardlinked: int = 0
+    copied: int = 0
+    objects_created: int = 0
+    bytes_total: int = 0
+    bytes_deduplicated: int = 0
+
+    def add(self, other: "SnapshotStats") -> None:
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+class SnapshotStore:
+    """Store files once by content hash and link them into workspaces.
+
+    Each source file is hashed (cached by path, size and mtime) and kept once
+    under ``objects/``; workspaces receive a reflink of the object when the
+    filesystem supports it, otherwise a copy. Reflinks are copy-on-write in
+    the kernel. Hardlinks are not, so they are only used when ``link_mode``
+    is ``hardlink``, and callers must then unshare files before anything may
+    write them in place: :meth:`break_link` for a known file, and
+    :meth:`break_links_under` for the whole workspace before a command that
+    can write files it does not name. Objects are also re-verified before
+    reuse, so a linked file that was modified anyway is never handed to
+    another workspace.
+
+    Creation is atomic (write to a temp file, then rename) and safe across
+    daemons sharing the store; :meth:`prune` takes an exclusive lock so it
+    never races a materialization.
+    """
+
+    def __init__(self, root: Path, link_mode: str = "auto"):
+        """Initialize the store.
+
+        Args:
+            root: Store directory (``objects/`` and a lock file live here)
+            link_mode: ``auto`` or ``reflink`` (reflink, then copy), ``hardlink``
+                (hardlink, then copy) or ``copy``
+        """
+        if link_mode not in _LINK_MODES:
+            raise ValueError(f"Unknown link_mode {link_mode!r}; expected one of {_LINK_MODES}")
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.link_mode = link_mode
+        self._reflink_ok = link_mode in ("auto", "reflink") and fcntl is not None and sys.platform.startswith("linux")
+        # Hardlinks share inodes with the store and every other workspace, so
+        # they are never picked automatically
+        self._hardlink_ok = link_mode == "hardlink"
+
+        self._lock = threading.Lock()
+        # source path -> (size, mtime_ns, inode, digest)
+        self._source_digests: Dict[str, Tuple[int, int, int, str]] = {}
+        # object name -> (size, mtime_ns) last verified against its digest
+        self._verified: Dict[str, Tuple[int, int]] = {}
+        self._totals = SnapshotStats()
+        self._materializations = 0
+
+    # ------------------------------------------------------------------
+    # Locking
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _store_lock(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self.root / ".lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _source_digest(self, path: Path, st: os.stat_result) -> str:
+        key = str(path)
+        cached = self._source_digests.get(key)
+        if cached and cached[:3] == (st.st_size, st.st_mtime_ns, st.st_ino):
+            return cached[3]
+        digest = self._hash_file(path)
+        self._source_digests[key] = (st.st_size, st.st_mtime_ns, st.st_ino, digest)
+        return digest
+
+    def _object_path(self, name: str) -> Path:
+        return self.objects_dir / name[:2] / name
+
+    def _object_is_valid(self, obj: Path, name: str) -> bool:
+        try:
+            st = obj.stat()
+        except FileNotFoundError:
+            return False
+        if self._verified.get(name) == (st.st_size, st.st_mtime_ns):
+            return True
+        # Unknown to this process, or changed since: check the content
+        if self._hash_file(obj) != name.split(".", 1)[0]:
+            logger.warning("snapshot.object.corrupt", object=name)
+            return False
+        self._verified[name] = (st.st_size, st.st_mtime_ns)
+        return True
+
+    def _ensure_object(self, source: Path, st: os.stat_result, stats: SnapshotStats) -> Tuple[Path, bool]:
+        """Return the object holding ``source``'s content and whether it was just created."""
+        executable = bool(st.st_mode & stat_module.S_IXUSR)
+        name = self._source_digest(source, st) + (".x" if executable else "")
+        obj = self._object_path(name)
+        if self._object_is_valid(obj, name):
+            return obj, False
+
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=obj.parent, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            os.chmod(tmp_name, 0o555 if executable else 0o444)
+            os.replace(tmp_name, obj)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        obj_stat = obj.stat()
+        self._verified[name] = (obj_stat.st_size, obj_stat.st_mtime_ns)
+        stats.objects_created += 1
+        return obj, True
+
+    # ------------------------------------------------------------------
+    # Linking
+    # ------------------------------------------------------------------
+    def _reflink(self, obj: Path, dest: Path, executable: bool) -> bool:
+        try:
+            with open(obj, "rb") as src, open(dest, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError as exc:
+            try:
+                dest.unlink()
+            except OSError:
+                pass
+            if exc.errno in _NO_LINK_ERRNOS or exc.errno == errno.ENOTTY:
+                self._reflink_ok = False
+                logger.debug("snapshot.reflink.unsupported", error=str(exc))
+                return False
+            raise
+        os.chmod(dest, 0o755 if executable else 0o644)
+        return True
+
+    def _hardlink(self, obj: Path, dest: Path) -> bool:
+        try:
+            os.link(obj, dest)
+        except OSError as exc:
+            if exc.errno in _NO_LINK_ERRNOS:
+                self._hardlink_ok = False
+                logger.debug("snapshot.hardlink.unsupported", error=str(exc))
+                return False
+            raise
+        return True
+
+    def _place(self, obj: Path, dest: Path, executable: bool, created: bool, stats: SnapshotStats) -> None:
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+        size = obj.stat().st_size
+        stats.files += 1
+        stats.bytes_total += size
+        if self._reflink_ok and self._reflink(obj, dest, executable):
+            stats.reflinked += 1
+        elif self._hardlink_ok and self._hardlink(obj, dest):
+            stats.hardlinked += 1
+        else:
+            shutil.copyfile(obj, dest)
+            os.chmod(dest, 0o755 if executable else 0o644)
+            stats.copied += 1
+            return
+        if not created:  # the store's own copy was already paid for
+            stats.bytes_deduplicated += size
+
+    def materialize(
+        self,
+        source_root: Path,
+        paths: Iterable[str],
+        dest_root: Path,
+        exclude: Iterable[str] = (),
+    ) -> SnapshotStats:
+        """Reproduce ``paths`` (relative to ``source_root``) under ``dest_root``.
+
+        Args:
+            source_root: Directory the paths are relative to
+            paths: Files or directories to materialize; missing ones are skipped
+            dest_root: Destination directory
+            exclude: ``fnmatch`` patterns matched against each entry name
+
+        Returns:
+            Counts for this materialization
+        """
+        patterns = tuple(exclude)
+        stats = SnapshotStats()
+        source_root = Path(source_root)
+        dest_root = Path(dest_root)
+
+        def _excluded(name: str) -> bool:
+            return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+        with self._lock, self._store_lock(exclusive=False):
+            for rel in paths:
+                source = source_root / rel
+                if not source.exists():
+                    logger.debug("snapshot.source.missing", source=str(source))
+                    continue
+                if source.is_file():
+                    pairs = [(source, dest_root / rel)]
+                else:
+                    pairs = []
+                    for directory, dirnames, filenames in os.walk(source):
+                        dirnames[:] = [name for name in dirnames if not _excluded(name)]
+                        rel_dir = Path(directory).relative_to(source_root)
+                        pairs.extend(
+                            (Path(directory) / name, dest_root / rel_dir / name)
+                            for name in filenames
+                            if not _excluded(name)
+                        )
+
+                for src_file, dest in pairs:
+                    st = src_file.stat()
+                    if not stat_module.S_ISREG(st.st_mode):
+                        continue
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    obj, created = self._ensure_object(src_file, st, stats)
+                    self._place(obj, dest, bool(st.st_mode & stat_module.S_IXUSR), created, stats)
+
+            self._totals.add(stats)
+            self._materializations += 1
+        return stats
+
+    # ------------------------------------------------------------------
+    # Copy on write
+    # ------------------------------------------------------------------
+    @staticmethod
+    def break_link(path: Path) -> bool:
+        """Give a hardlinked file its own writable copy before it is modified.
+
+        Returns:
+            True if the file was shared and has been copied
+        """
+        path = Path(path)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return False
+        if not stat_module.S_ISREG(st.st_mode) or st.st_nlink <= 1:
+            return False
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.cow-")
+        os.close(fd)
+        try:
+            shutil.copyfile(path, tmp_name)
+            os.chmod(tmp_name, 0o755 if st.st_mode & stat_module.S_IXUSR else 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return True
+
+    def break_links_under(self, path: Path) -> int:
+        """Break every shared link at or below ``path``; returns how many."""
+        path = Path(path)
+        if path.is_file():
+            return int(self.break_link(path))
+        broken = 0
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = [name for name in dirnames if name != ".git"]
+            for name in filenames:
+                broken += self.break_link(Path(directory) / name)
+        return broken
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def prune(self, min_age_seconds: float = 7 * 86400) -> int:
+        """Delete objects that no workspace links to; returns how many.
+
+        Reflinked and copied files do not raise an object's link count, so
+        only objects older than ``min_age_seconds`` are removed; anything
+        pruned too eagerly is simply recreated on next use.
+        """
+        removed = 0
+        cutoff = time.time() - min_age_seconds
+        with self._lock, self._store_lock(exclusive=True):
+            for obj in self.objects_dir.glob("*/*"):
+                if obj.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = obj.stat()
+                    if st.st_nlink <= 1 and st.st_mtime < cutoff:
+                        obj.unlink()
+                        self._verified.pop(obj.name, None)
+                        removed += 1
+                except OSError:
+                    continue
+        if removed:
+            logger.info("snapshot.prune.done", removed=removed)
+        return removed
+
+    def get_stats(self) -> Dict[str, object]:
+        """Cumulative counters since startup, with the effective link mode."""
+        with self._lock:
+            totals = asdict(self._totals)
+            materializations = self._materializations
+        if self._reflink_ok:
+            effective = "reflink"
+        elif self._hardlink_ok:
+            effective = "hardlink"
+        else:
+            effective = "copy"
+        return {"materializations": materializations, "link_mode": effective, **totals}
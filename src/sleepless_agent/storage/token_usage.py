@@ -0,0 +1,165 @@
+"""Token usage per task, phase and model, with aggregate views for capacity planning."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from sleepless_agent.core.models import TokenUsage
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.sqlite import SQLiteStore
+
+logger = get_logger(__name__)
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens")
+GROUPINGS = ("day", "project", "phase", "model")
+
+
+@dataclass
+class ModelTokens:
+    """Tokens one model used in one phase run; ``input_tokens`` excludes cached input."""
+
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: Optional[float] = None
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_creation_tokens
+
+
+def model_tokens(
+    usage: Optional[Mapping[str, Any]],
+    model_usage: Optional[Mapping[str, Mapping[str, Any]]],
+    default_model: Optional[str],
+) -> List[ModelTokens]:
+    """Per-model token counts of a result message.
+
+    ``model_usage`` (the CLI's per-model breakdown) is preferred; without it
+    the aggregate ``usage`` is attributed to ``default_model``.
+    """
+    if model_usage:
+        return [
+            ModelTokens(
+                model=model,
+                input_tokens=int(entry.get("inputTokens") or 0),
+                output_tokens=int(entry.get("outputTokens") or 0),
+                cache_read_tokens=int(entry.get("cacheReadInputTokens") or 0),
+                cache_creation_tokens=int(entry.get("cacheCreationInputTokens") or 0),
+                cost_usd=entry.get("costUSD"),
+            )
+            for model, entry in model_usage.items()
+        ]
+    if not usage:
+        return []
+    return [
+        ModelTokens(
+            model=default_model or "unknown",
+            input_tokens=int(usage.get("input_tokens") or 0),
+            output_tokens=int(usage.get("output_tokens") or 0),
+            cache_read_tokens=int(usage.get("cache_read_input_tokens") or 0),
+            cache_creation_tokens=int(usage.get("cache_creation_input_tokens") or 0),
+        )
+    ]
+
+
+class TokenUsageStore(SQLiteStore):
+    """Record token usage per phase and model, and aggregate it."""
+
+    def record(
+        self,
+        *,
+        task_id: int,
+        phase: str,
+        project_id: Optional[str],
+        tokens: Iterable[ModelTokens],
+    ) -> None:
+        """Store one row per model used by a phase run."""
+        rows = list(tokens)
+        if not rows:
+            return
+
+        def _op(session: Session) -> None:
+            for row in rows:
+                session.add(
+                    TokenUsage(
+                        task_id=task_id,
+                        phase=phase,
+                        project_id=project_id,
+                        model=row.model,
+                        input_tokens=row.input_tokens,
+                        output_tokens=row.output_tokens,
+                        cache_read_tokens=row.cache_read_tokens,
+                        cache_creation_tokens=row.cache_creation_tokens,
+                        cost_usd=str(row.cost_usd) if row.cost_usd is not None else None,
+                    )
+                )
+
+        self._run_write(_op)
+
+    def aggregate(
+        self,
+        by: str = "day",
+        *,
+        since: Optional[datetime] = None,
+        project_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Token totals grouped by ``day``, ``project``, ``phase`` or ``model``.
+
+        Returns:
+            One dict per group with ``key``, ``records`` (one per phase run
+            and model), the token totals and ``cost_usd``; largest prompt
+            volume first, days in date order
+        """
+        if by not in GROUPINGS:
+            raise ValueError(f"Unknown grouping {by!r}; expected one of {', '.join(GROUPINGS)}")
+
+        def _op(session: Session) -> List[Dict[str, Any]]:
+            key = {
+                "day": func.date(TokenUsage.created_at),
+                "project": TokenUsage.project_id,
+                "phase": TokenUsage.phase,
+                "model": TokenUsage.model,
+            }[by]
+            columns = [func.sum(getattr(TokenUsage, name)) for name in TOKEN_FIELDS]
+            query = session.query(key, func.count(TokenUsage.id), *columns).group_by(key)
+            if since is not None:
+                query = query.filter(TokenUsage.created_at >= since)
+            if project_id is not None:
+                query = query.filter(TokenUsage.project_id == project_id)
+            # cost_usd is text; summing it in Python keeps its precision
+            costs: Dict[Any, float] = {}
+            cost_query = session.query(key, TokenUsage.cost_usd).filter(TokenUsage.cost_usd.isnot(None))
+            if since is not None:
+                cost_query = cost_query.filter(TokenUsage.created_at >= since)
+            if project_id is not None:
+                cost_query = cost_query.filter(TokenUsage.project_id == project_id)
+            for group, cost in cost_query.all():
+                try:
+                    costs[group] = costs.get(group, 0.0) + float(cost)
+                except ValueError:
+                    pass
+
+            rows = []
+            for group, records, *sums in query.all():
+                row: Dict[str, Any] = {"key": group, "records": records}
+                row.update({name: int(value or 0) for name, value in zip(TOKEN_FIELDS, sums)})
+                row["cost_usd"] = round(costs[group], 4) if group in costs else None
+                rows.append(row)
+            if by == "day":
+                rows.sort(key=lambda row: str(row["key"]))
+            else:
+                rows.sort(
+                    key=lambda row: row["input_tokens"] + row["cache_read_tokens"] + row["cache_creation_tokens"],
+                    reverse=True,
+                )
+            return rows
+
+        return self._run_read(_op)
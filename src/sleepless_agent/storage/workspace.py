@@ -28,7 +28,20 @@ class WorkspaceSetup:
         self.state_path = Path.home() / ".sleepless_agent_setup.json"
         self.default_workspace = agent_config.workspace_root.expanduser().resolve()
         self.repo_root = Path.cwd()
-        self.default_remote_url = self._detect_default_remote_url()
+        self._default_remote_url: Optional[str] = None
+        self._default_remote_detected = False
+
+    @property
+    def default_remote_url(self) -> Optional[str]:
+        """Remote URL suggested during interactive setup.
+
+        Detected on first use: it shells out to git and is only needed when
+        the user is prompted, never on a normal daemon start.
+        """
+        if not self._default_remote_detected:
+            self._default_remote_url = self._detect_default_remote_url()
+            self._default_remote_detected = True
+        return self._default_remote_url
 
     def run(self) -> WorkspaceConfigResult:
         """Load configuration from config.yaml first, then fall back to JSON file or prompts."""
@@ -1,7 +1,7 @@
 """Utility functions and helpers."""
 
 from .display import format_age_seconds, format_duration, relative_time, shorten
-from .live_status import LiveStatusTracker, LiveStatusEntry
+from .live_status import LiveStatusHub, LiveStatusTracker, LiveStatusEntry
 from .exceptions import PauseException
 from .config import Config, ConfigNode, get_config
 
@@ -10,6 +10,7 @@ __all__ = [
     "format_duration",
     "relative_time",
     "shorten",
+    "LiveStatusHub",
     "LiveStatusTracker",
     "LiveStatusEntry",
     "PauseException",
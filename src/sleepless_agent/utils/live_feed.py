@@ -0,0 +1,201 @@
+"""Push live status changes to local subscribers over a Unix socket."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.utils.live_status import LiveStatusHub
+
+logger = get_logger(__name__)
+
+# Created next to live_status.json in the data directory
+SOCKET_NAME = "live_status.sock"
+# Linux sun_path is 108 bytes including the terminator (104 on macOS)
+_MAX_SOCKET_PATH = 103
+
+
+@dataclass
+class _Subscriber:
+    task_id: Optional[int]
+    queue: "asyncio.Queue[Dict[str, Any]]"
+    dropped: int = 0
+    handler: Optional["asyncio.Task[Any]"] = field(default=None, repr=False)
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        if self.task_id is None or event["type"] == "clear_all":
+            return True
+        task_id = event.get("task_id", (event.get("entry") or {}).get("task_id"))
+        return task_id == self.task_id
+
+
+class LiveStatusFeed:
+    """Serve :class:`LiveStatusHub` changes as newline-delimited JSON.
+
+    A client connects to the socket and sends one JSON line, ``{"task_id": n}``
+    to follow a single task or ``{}`` for all tasks. It receives a
+    ``snapshot`` event with the current entries, then every ``update``,
+    ``clear`` and ``clear_all`` event as the hub sees it. Nothing is read
+    from disk or the database.
+
+    Each subscriber has a bounded queue; a subscriber that falls behind
+    loses its oldest events rather than slowing the daemon down.
+    """
+
+    def __init__(self, hub: LiveStatusHub, socket_path: Path | str, max_backlog: int = 1000):
+        """Initialize the feed.
+
+        Args:
+            hub: Live status hub to publish
+            socket_path: Unix socket path (created on start, removed on stop)
+            max_backlog: Events buffered per subscriber before old ones are dropped
+        """
+        self.hub = hub
+        self.socket_path = Path(socket_path)
+        self.max_backlog = max(1, int(max_backlog))
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._subscribers: List[_Subscriber] = []
+        self.stats: Dict[str, int] = {"connections": 0, "events": 0, "dropped": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self) -> bool:
+        """Bind the socket and start publishing. Returns False if unavailable."""
+        if not hasattr(asyncio, "start_unix_server"):
+            logger.info("live_feed.unsupported", reason="no unix sockets on this platform")
+            return False
+        if len(os.fsencode(str(self.socket_path))) > _MAX_SOCKET_PATH:
+            logger.warning("live_feed.path_too_long", path=str(self.socket_path))
+            return False
+        if self.socket_path.exists():
+            if _socket_is_live(self.socket_path):
+                logger.warning("live_feed.in_use", path=str(self.socket_path))
+                return False
+            self.socket_path.unlink()  # stale socket from a crashed daemon
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        self.hub.add_listener(self._on_change)
+        logger.info("live_feed.started", path=str(self.socket_path))
+        return True
+
+    async def stop(self) -> None:
+        """Disconnect subscribers and remove the socket."""
+        self.hub.remove_listener(self._on_change)
+        if self._server is None:
+            return
+        self._server.close()
+        handlers = [subscriber.handler for subscriber in self._subscribers if subscriber.handler is not None]
+        for handler in handlers:
+            handler.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    def _on_change(self, event: Dict[str, Any]) -> None:
+        # Hub listeners run on whichever thread updated the hub
+        if self._loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._broadcast(event)
+        else:
+            self._loop.call_soon_threadsafe(self._broadcast, event)
+
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        self.stats["events"] += 1
+        for subscriber in self._subscribers:
+            if not subscriber.wants(event):
+                continue
+            if subscriber.queue.full():
+                subscriber.queue.get_nowait()
+                subscriber.dropped += 1
+                self.stats["dropped"] += 1
+            subscriber.queue.put_nowait(event)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        try:
+            request = json.loads((await asyncio.wait_for(reader.readline(), timeout=5)) or b"{}")
+            task_id = request.get("task_id") if isinstance(request, dict) else None
+            task_id = int(task_id) if task_id is not None else None
+        except (asyncio.TimeoutError, ValueError, TypeError):
+            writer.close()
+            return
+
+        subscriber = _Subscriber(
+            task_id=task_id, queue=asyncio.Queue(self.max_backlog), handler=asyncio.current_task()
+        )
+        self._subscribers.append(subscriber)
+        try:
+            entries = [entry.to_dict() for entry in self.hub.entries()]
+            if task_id is not None:
+                entries = [entry for entry in entries if entry["task_id"] == task_id]
+            await self._send(writer, {"type": "snapshot", "entries": entries})
+            while True:
+                event = await subscriber.queue.get()
+                await self._send(writer, event)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscribers.remove(subscriber)
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, event: Dict[str, Any]) -> None:
+        writer.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats, subscribers=len(self._subscribers))
+
+
+def _socket_is_live(path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(0.5)
+        probe.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def watch_live_status(socket_path: Path | str, task_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield live status events from a running daemon's feed.
+
+    Raises:
+        ConnectionError: If no daemon is serving the socket
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except OSError as exc:
+        client.close()
+        raise ConnectionError(f"No live status feed at {socket_path}: {exc}") from exc
+
+    with client, client.makefile("rb") as stream:
+        request = {"task_id": task_id} if task_id is not None else {}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
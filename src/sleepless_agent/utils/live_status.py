@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from sleepless_agent.monitoring.logging import get_logger
 logger = get_logger(__name__)
@@ -17,6 +19,36 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
 
 
+def worker_status_path(storage_path: Path | str, worker_id: str) -> Path:
+    """Per-daemon status file next to ``storage_path``: ``live_status.<worker_id>.json``."""
+    storage_path = Path(storage_path)
+    safe_id = worker_id.replace("/", "_").replace(os.sep, "_")
+    return storage_path.with_name(f"{storage_path.stem}.{safe_id}{storage_path.suffix}")
+
+
+def worker_status_files(storage_path: Path | str) -> Dict[str, Path]:
+    """Map worker id to the per-daemon status files present next to ``storage_path``."""
+    storage_path = Path(storage_path)
+    prefix = f"{storage_path.stem}."
+    files = {}
+    for path in storage_path.parent.glob(f"{prefix}*{storage_path.suffix}"):
+        files[path.name[len(prefix): len(path.name) - len(storage_path.suffix)]] = path
+    return files
+
+
+def remove_worker_status_files(storage_path: Path | str, dead_worker: Callable[[str], bool]) -> int:
+    """Delete the status files of workers ``dead_worker`` reports as gone; returns how many."""
+    removed = 0
+    for worker_id, path in worker_status_files(storage_path).items():
+        if dead_worker(worker_id):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as exc:
+                logger.debug(f"Failed to remove live status file {path}: {exc}")
+    return removed
+
+
 def _truncate(text: str, max_length: int = 240) -> str:
     if len(text) <= max_length:
         return text
@@ -66,7 +98,12 @@ class LiveStatusEntry:
 
 
 class LiveStatusTracker:
-    """Persist and retrieve live task execution updates."""
+    """Persist and retrieve live task execution updates.
+
+    :meth:`entries` also merges the per-daemon files that
+    :class:`LiveStatusHub` instances write next to ``storage_path``, so a
+    reader of ``live_status.json`` sees the tasks of every daemon.
+    """
 
     def __init__(self, storage_path: Path | str):
         self.storage_path = Path(storage_path)
@@ -76,18 +113,7 @@ class LiveStatusTracker:
     # Public API -----------------------------------------------------------------
     def update(self, entry: LiveStatusEntry | Dict[str, Any]) -> None:
         """Upsert the status for a task."""
-        payload = entry.to_dict() if isinstance(entry, LiveStatusEntry) else dict(entry)
-        task_id = payload.get("task_id")
-        if task_id is None:
-            raise ValueError("LiveStatusTracker.update requires task_id")
-
-        payload["task_id"] = int(task_id)
-        payload.setdefault("updated_at", _utc_now_iso())
-
-        payload["description"] = _truncate(payload.get("description", ""))
-        payload["prompt_preview"] = _truncate(payload.get("prompt_preview", ""))
-        payload["answer_preview"] = _truncate(payload.get("answer_preview", ""))
-
+        payload = self._normalize(entry)
         with self._lock:
             data = self._read_all()
             data[str(payload["task_id"])] = payload
@@ -134,24 +160,48 @@ class LiveStatusTracker:
         """Return all entries sorted by most recent update."""
         with self._lock:
             data = self._read_all()
+        for path in worker_status_files(self.storage_path).values():
+            for key, value in self._read_file(path).items():
+                # A task requeued to another daemon may appear twice; keep the newest
+                if key not in data or str(value.get("updated_at", "")) > str(data[key].get("updated_at", "")):
+                    data[key] = value
 
         result = [LiveStatusEntry.from_dict({"task_id": key, **value}) for key, value in data.items()]
         result.sort(key=lambda entry: entry.updated_at, reverse=True)
         return result
 
     # Internal helpers -----------------------------------------------------------
+    @staticmethod
+    def _normalize(entry: LiveStatusEntry | Dict[str, Any]) -> Dict[str, Any]:
+        payload = entry.to_dict() if isinstance(entry, LiveStatusEntry) else dict(entry)
+        task_id = payload.get("task_id")
+        if task_id is None:
+            raise ValueError("LiveStatusTracker.update requires task_id")
+
+        payload["task_id"] = int(task_id)
+        payload.setdefault("updated_at", _utc_now_iso())
+
+        payload["description"] = _truncate(payload.get("description", ""))
+        payload["prompt_preview"] = _truncate(payload.get("prompt_preview", ""))
+        payload["answer_preview"] = _truncate(payload.get("answer_preview", ""))
+        return payload
+
     def _read_all(self) -> Dict[str, Dict[str, Any]]:
-        if not self.storage_path.exists():
+        return self._read_file(self.storage_path)
+
+    @staticmethod
+    def _read_file(path: Path) -> Dict[str, Dict[str, Any]]:
+        if not path.exists():
             return {}
         try:
-            with self.storage_path.open("r", encoding="utf-8") as fh:
+            with path.open("r", encoding="utf-8") as fh:
                 payload = json.load(fh)
                 if isinstance(payload, dict):
                     return payload
         except json.JSONDecodeError as exc:
-            logger.warning(f"Corrupted live status file {self.storage_path}: {exc}")
+            logger.warning(f"Corrupted live status file {path}: {exc}")
         except OSError as exc:
-            logger.debug(f"Failed to read live status file {self.storage_path}: {exc}")
+            logger.debug(f"Failed to read live status file {path}: {exc}")
         return {}
 
     def _atomic_write(self, data: Dict[str, Any]) -> None:
@@ -166,4 +216,183 @@ class LiveStatusTracker:
                 if tmp_path.exists():
                     tmp_path.unlink()
             except OSError:
-                pass
\ No newline at end of file
+                pass
+
+
+class LiveStatusHub(LiveStatusTracker):
+    """In-memory live status with debounced writes to the tracker's file.
+
+    Updates only touch an in-process dict. The file is rewritten at most once
+    per ``flush_interval`` with everything that changed in between, except
+    that a new task, a phase change, a status change or a clear is written
+    immediately so file readers (``sle check``, other processes) never miss
+    a transition. Readers in this process see every update instantly through
+    :meth:`entries` or a listener. The file format is unchanged.
+
+    With a ``worker_id`` the hub owns ``live_status.<worker_id>.json`` rather
+    than the shared file, so daemons sharing a data directory never
+    overwrite or clear each other's entries; :class:`LiveStatusTracker`
+    readers merge the files.
+    """
+
+    def __init__(self, storage_path: Path | str, flush_interval: float = 1.0, worker_id: Optional[str] = None):
+        """Initialize the hub.
+
+        Args:
+            storage_path: JSON file read by :class:`LiveStatusTracker` readers
+            flush_interval: Maximum seconds an in-memory update waits to be written
+            worker_id: Daemon id; entries are then written to this daemon's own file
+        """
+        if worker_id:
+            storage_path = worker_status_path(storage_path, worker_id)
+        super().__init__(storage_path)
+        self.flush_interval = max(0.0, float(flush_interval))
+        self._entries: Dict[str, Dict[str, Any]] = self._read_all()
+        self._write_lock = Lock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        self.stats: Dict[str, int] = {"updates": 0, "writes": 0, "immediate_writes": 0}
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    # Listeners ------------------------------------------------------------------
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call ``callback`` with every change event, on the updating thread.
+
+        Events are ``{"type": "update", "entry": {...}}``, ``{"type": "clear",
+        "task_id": n}`` or ``{"type": "clear_all"}``. Callbacks must not block.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(event)
+            except Exception as exc:  # pragma: no cover - listener bug
+                logger.debug(f"Live status listener failed: {exc}")
+
+    # Public API -----------------------------------------------------------------
+    def update(self, entry: LiveStatusEntry | Dict[str, Any]) -> None:
+        """Upsert the status for a task."""
+        payload = self._normalize(entry)
+        key = str(payload["task_id"])
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = payload
+            self._dirty = True
+            self.stats["updates"] += 1
+            transition = (
+                previous is None
+                or previous.get("phase") != payload.get("phase")
+                or previous.get("status") != payload.get("status")
+            )
+        self._emit({"type": "update", "entry": dict(payload)})
+        if transition or self.flush_interval == 0:
+            self.stats["immediate_writes"] += 1
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def clear(self, task_id: int) -> None:
+        """Remove a task from tracking."""
+        with self._lock:
+            if self._entries.pop(str(task_id), None) is None:
+                return
+            self._dirty = True
+        self._emit({"type": "clear", "task_id": int(task_id)})
+        self.flush()
+
+    def clear_all(self) -> None:
+        """Remove all tracked entries."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = False
+        self._emit({"type": "clear_all"})
+        super().clear_all()
+
+    def prune_older_than(self, max_age: timedelta) -> None:
+        """Drop entries older than the provided age."""
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - max_age
+        with self._lock:
+            for key, value in list(self._entries.items()):
+                try:
+                    stamp = datetime.fromisoformat(str(value.get("updated_at")))
+                except Exception:
+                    stamp = None
+                if not stamp or stamp < cutoff:
+                    del self._entries[key]
+                    self._dirty = True
+        self.flush()
+
+    def entries(self) -> List[LiveStatusEntry]:
+        """Return all entries sorted by most recent update."""
+        with self._lock:
+            data = {key: dict(value) for key, value in self._entries.items()}
+        result = [LiveStatusEntry.from_dict({"task_id": key, **value}) for key, value in data.items()]
+        result.sort(key=lambda entry: entry.updated_at, reverse=True)
+        return result
+
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        # Serialize writers so an older snapshot never replaces a newer one
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {key: dict(value) for key, value in self._entries.items()}
+                self._dirty = False
+            self._atomic_write(snapshot)
+            self.stats["writes"] += 1
+
+    def close(self) -> None:
+        """Stop the debounce timer and write any pending changes."""
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Update and write counters; ``writes / updates`` is the write amplification."""
+        stats: Dict[str, Any] = dict(self.stats)
+        stats["coalesced"] = max(0, stats["updates"] - stats["writes"])
+        return stats
+
+    # Internal helpers -----------------------------------------------------------
+    def _schedule_flush(self) -> None:
+        with self._lock:
+            if self._timer is not None or self._closed:
+                return
+            self._timer = threading.Timer(self.flush_interval, self._timer_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timer_flush(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception as exc:  # pragma: no cover - background thread
+            logger.debug(f"Failed to flush live status: {exc}")
+
+    def _atomic_write(self, data: Dict[str, Any]) -> None:
+        # Compact output: the file is rewritten often and only read by programs
+        tmp_path = self.storage_path.with_suffix(".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, separators=(",", ":"))
+            tmp_path.replace(self.storage_path)
+        except OSError as exc:
+            logger.error(f"Failed to persist live status file {self.storage_path}: {exc}")
+            try:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            except OSError:
+                pass
@@ -2,15 +2,279 @@
 
 from __future__ import annotations
 
+import json
+import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sleepless_agent.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structured summary written next to README.md on every document save
+SIDECAR_NAME = ".readme.json"
+SIDECAR_VERSION = 1
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_LIST_ITEM = re.compile(r"^[-*]\s+(.+)$")
+_FIELD = re.compile(r"^[-*]\s+([^:]+):\s*(.*)$")
+_STATUS_TITLE = re.compile(r"^Status:\s*(\w+)")
+
+
+@dataclass
+class ReadmeSection:
+    """One heading and the raw text up to the next heading.
+
+    ``level`` is 0 for the preamble before the first heading. ``body`` keeps
+    its original line breaks so an unmodified document renders byte for byte.
+    """
+
+    level: int
+    title: str
+    body: str = ""
+
+    def render(self) -> str:
+        if self.level == 0:
+            return self.body
+        return f"{'#' * self.level} {self.title}\n{self.body}"
+
+    def items(self) -> List[str]:
+        """Bulleted list items of the section, without their bullets."""
+        found = []
+        for line in self.body.splitlines():
+            match = _LIST_ITEM.match(line.strip())
+            if match:
+                found.append(match.group(1).strip())
+        return found
+
+
+def parse_sections(text: str) -> List[ReadmeSection]:
+    """Split markdown into sections at headings outside fenced code blocks."""
+    sections: List[ReadmeSection] = [ReadmeSection(0, "")]
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING.match(line.rstrip("\n"))
+        if match:
+            sections.append(ReadmeSection(len(match.group(1)), match.group(2)))
+        else:
+            sections[-1].body += line
+    if not sections[0].body:
+        sections.pop(0)
+    return sections
+
+
+class ReadmeDocument:
+    """README.md held in memory as sections and written back once.
+
+    Edits are applied to the parsed sections and also kept in an operation
+    log. :meth:`save` writes the file only if something changed; if the
+    README was modified on disk since it was loaded (an agent edited it
+    during the task), the file is re-read and the logged operations are
+    replayed on top, so those edits are kept. Every save also writes a
+    :data:`SIDECAR_NAME` JSON summary for readers that need the status,
+    outstanding items or recommendations without parsing markdown.
+    """
+
+    def __init__(self, path: Path, text: str = "", *, exists: bool = False):
+        self.path = Path(path)
+        self.sections = parse_sections(text)
+        self.exists = exists
+        self._loaded_stat = self._stat()
+        self._ops: List[Tuple[str, tuple]] = []
+
+    @classmethod
+    def load(cls, workspace: Path) -> "ReadmeDocument":
+        """Parse ``workspace/README.md`` (an empty document if it does not exist)."""
+        path = Path(workspace) / "README.md"
+        try:
+            return cls(path, path.read_text(), exists=True)
+        except FileNotFoundError:
+            return cls(path)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def dirty(self) -> bool:
+        return bool(self._ops)
+
+    def find(self, title_prefix: str, level: Optional[int] = None) -> Optional[ReadmeSection]:
+        """First section whose title starts with ``title_prefix``."""
+        for section in self.sections:
+            if section.level and section.title.startswith(title_prefix) and level in (None, section.level):
+                return section
+        return None
+
+    def status(self) -> Optional[str]:
+        """Value of the ``## Status: X`` heading, if any."""
+        for section in self.sections:
+            match = _STATUS_TITLE.match(section.title) if section.level else None
+            if match:
+                return match.group(1)
+        return None
+
+    def render(self) -> str:
+        return "".join(section.render() for section in self.sections)
+
+    def summary(self) -> Dict[str, Any]:
+        """Structured view of the task README (the sidecar payload)."""
+        outstanding = self.find("Outstanding Items", level=2)
+        recommendations = self.find("Recommendations", level=2)
+        executions = []
+        for section in self.sections:
+            if section.level == 3 and section.title.startswith("Execution "):
+                fields = {}
+                for line in section.body.splitlines():
+                    match = _FIELD.match(line.strip())
+                    if match:
+                        fields[match.group(1).strip().lower().replace(" ", "_")] = match.group(2).strip()
+                executions.append({"title": section.title, **fields})
+        return {
+            "version": SIDECAR_VERSION,
+            "status": self.status(),
+            "outstanding_items": outstanding.items() if outstanding else [],
+            "recommendations": recommendations.items() if recommendations else [],
+            "executions": executions,
+            "sections": [section.title for section in self.sections if section.level],
+        }
+
+    # ------------------------------------------------------------------
+    # Edits (logged for replay)
+    # ------------------------------------------------------------------
+    def _apply(self, op: str, *args: Any) -> bool:
+        changed = getattr(self, f"_op_{op}")(*args)
+        if changed:
+            self._ops.append((op, args))
+        return changed
+
+    def set_text(self, text: str) -> bool:
+        """Replace the whole document (e.g. a freshly rendered template)."""
+        return self._apply("set_text", text)
+
+    def replace_body(self, title_prefix: str, body: str, *, only_if: Optional[str] = None) -> bool:
+        """Replace a level-2 section's body, optionally only while it still reads ``only_if``."""
+        return self._apply("replace_body", title_prefix, body, only_if)
+
+    def set_status(self, status: str) -> bool:
+        """Rewrite the ``## Status: X`` heading."""
+        return self._apply("set_status", status)
+
+    def add_entry(self, parent_prefix: str, title: str, body: str) -> bool:
+        """Insert a level-3 entry right below the ``parent_prefix`` heading (newest first)."""
+        return self._apply("add_entry", parent_prefix, title, body)
+
+    def _op_set_text(self, text: str) -> bool:
+        self.sections = parse_sections(text)
+        return True
+
+    def _op_replace_body(self, title_prefix: str, body: str, only_if: Optional[str]) -> bool:
+        section = self.find(title_prefix, level=2)
+        if section is None:
+            return False
+        if only_if is not None and section.body.strip() != only_if:
+            return False
+        section.body = body.rstrip("\n") + "\n\n"
+        return True
+
+    def _op_set_status(self, status: str) -> bool:
+        for section in self.sections:
+            if section.level and _STATUS_TITLE.match(section.title):
+                section.title = _STATUS_TITLE.sub(f"Status: {status}", section.title, count=1)
+                return True
+        return False
+
+    def _op_add_entry(self, parent_prefix: str, title: str, body: str) -> bool:
+        parent = self.find(parent_prefix, level=2)
+        if parent is None:
+            return False
+        if parent.body.strip():
+            parent.body = parent.body.rstrip("\n") + "\n\n"
+        else:
+            parent.body = "\n"
+        entry = ReadmeSection(3, title, body.rstrip("\n") + "\n\n")
+        self.sections.insert(self.sections.index(parent) + 1, entry)
+        return True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, *, force: bool = False) -> bool:
+        """Write README.md and the sidecar if anything changed. Returns True if written."""
+        if not self._ops and not force:
+            return False
+        if self.exists and self._stat() != self._loaded_stat:
+            # Edited on disk since load: replay our edits on the current text
+            try:
+                current = self.path.read_text()
+            except FileNotFoundError:
+                current = ""
+            ops, self._ops = self._ops, []
+            self.sections = parse_sections(current)
+            for op, args in ops:
+                getattr(self, f"_op_{op}")(*args)
+            logger.debug("readme.replayed", path=str(self.path), ops=len(ops))
+
+        _atomic_write(self.path, self.render())
+        self._write_sidecar()
+        self.exists = True
+        self._loaded_stat = self._stat()
+        self._ops = []
+        return True
+
+    def _write_sidecar(self) -> None:
+        payload = self.summary()
+        stat = self._stat()
+        payload["readme_mtime_ns"], payload["readme_size"] = stat if stat else (None, None)
+        payload["updated_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        try:
+            _atomic_write(self.path.parent / SIDECAR_NAME, json.dumps(payload, ensure_ascii=False, indent=1))
+        except OSError as exc:
+            logger.debug("readme.sidecar.write_failed", path=str(self.path), error=str(exc))
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def read_readme_summary(workspace: Path) -> Optional[Dict[str, Any]]:
+    """Structured README summary of a workspace, from the sidecar when it is current.
+
+    Falls back to parsing README.md when the sidecar is missing or older than
+    the README (e.g. the README was edited by hand). Returns None if the
+    workspace has no README.
+    """
+    workspace = Path(workspace)
+    readme_path = workspace / "README.md"
+    try:
+        stat = readme_path.stat()
+    except OSError:
+        return None
+    try:
+        payload = json.loads((workspace / SIDECAR_NAME).read_text())
+        if (
+            payload.get("version") == SIDECAR_VERSION
+            and payload.get("readme_mtime_ns") == stat.st_mtime_ns
+            and payload.get("readme_size") == stat.st_size
+        ):
+            return payload
+    except (OSError, ValueError):
+        pass
+    return ReadmeDocument.load(workspace).summary()
+
 
 class ReadmeManager:
     """Manages README file operations with consistent error handling."""
@@ -23,6 +287,23 @@ class ReadmeManager:
         """
         self.workspace = Path(workspace)
         self.readme_path = self.workspace / "README.md"
+        self._document: Optional[ReadmeDocument] = None
+
+    def document(self) -> ReadmeDocument:
+        """Parsed README kept in memory until :meth:`flush`."""
+        if self._document is None:
+            self._document = ReadmeDocument.load(self.workspace)
+        return self._document
+
+    def flush(self) -> bool:
+        """Write pending document edits (README.md and its sidecar) in one go."""
+        if self._document is None:
+            return False
+        return self._document.save()
+
+    def read_summary(self) -> Optional[Dict[str, Any]]:
+        """Status, outstanding items and recommendations without re-parsing when possible."""
+        return read_readme_summary(self.workspace)
 
     def ensure_exists(
         self,
@@ -0,0 +1,27 @@
+"""Shared fixtures."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# The logging module opens its JSONL file sink on import, under
+# SLEEPLESS_LOG_DIR. Point it at a scratch directory before any test module
+# imports sleepless_agent, so running the suite never writes logs into the tree.
+_LOG_DIR = tempfile.mkdtemp(prefix="sleepless-test-logs-")
+os.environ["SLEEPLESS_LOG_DIR"] = _LOG_DIR
+
+from sleepless_agent.core.models import init_db  # noqa: E402
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_LOG_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a freshly initialized task database."""
+    path = tmp_path / "tasks.db"
+    init_db(str(path)).dispose()
+    return str(path)
@@ -0,0 +1,145 @@
+"""Workflow phases run on one CLI session, with the SDK client replaced by a fake."""
+
+import asyncio
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    PermissionResultAllow,
+    PermissionResultDeny,
+    ResultMessage,
+    TextBlock,
+    ToolPermissionContext,
+)
+
+from sleepless_agent.core import agent_session
+from sleepless_agent.core.agent_session import AgentSession
+
+
+class ScriptedClient:
+    """Stands in for ``ClaudeSDKClient``; each query replays the next script."""
+
+    scripts = []
+    instances = []
+
+    def __init__(self, options):
+        self.options = options
+        self.prompts = []
+        self.interrupts = 0
+        self.connects = 0
+        ScriptedClient.instances.append(self)
+
+    async def connect(self):
+        self.connects += 1
+
+    async def disconnect(self):
+        pass
+
+    async def query(self, prompt):
+        self.prompts.append(prompt)
+
+    async def interrupt(self):
+        self.interrupts += 1
+
+    async def receive_response(self):
+        for message in ScriptedClient.scripts.pop(0):
+            yield message
+
+
+@pytest.fixture(autouse=True)
+def scripted_client(monkeypatch):
+    ScriptedClient.scripts = []
+    ScriptedClient.instances = []
+    monkeypatch.setattr(agent_session, "ClaudeSDKClient", ScriptedClient)
+
+
+def _assistant(text="ok"):
+    return AssistantMessage(content=[TextBlock(text=text)], model="m")
+
+
+def _result(cost=None, model_usage=None, is_error=False):
+    return ResultMessage(
+        subtype="success",
+        duration_ms=1,
+        duration_api_ms=1,
+        is_error=is_error,
+        num_turns=1,
+        session_id="s",
+        total_cost_usd=cost,
+        model_usage=model_usage,
+    )
+
+
+async def _collect(session, phase, prompt="go", max_turns=None):
+    return [message async for message in session.run(phase, prompt, max_turns=max_turns)]
+
+
+def test_tools_are_limited_to_the_current_phase(tmp_path):
+    session = AgentSession(ClaudeAgentOptions(cwd=str(tmp_path), allowed_tools=["Bash"]), task_id=1)
+    ScriptedClient.scripts = [[_result()], [_result()]]
+    context = ToolPermissionContext()
+
+    async def scenario():
+        await _collect(session, "planner")
+        planner = [await session._can_use_tool(tool, {}, context) for tool in ("Read", "Write")]
+        await _collect(session, "worker")
+        worker = await session._can_use_tool("Write", {}, context)
+        return planner, worker
+
+    (read, write), worker_write = asyncio.run(scenario())
+
+    assert session.options.allowed_tools == []
+    assert isinstance(read, PermissionResultAllow)
+    assert isinstance(write, PermissionResultDeny)
+    assert "planner phase" in write.message
+    assert isinstance(worker_write, PermissionResultAllow)
+    assert session.denied == {"Write": 1}
+    assert session.has_context(["planner", "worker"])
+    assert ScriptedClient.instances[0].connects == 1
+
+
+def test_results_report_each_phases_own_cost_and_usage(tmp_path):
+    session = AgentSession(ClaudeAgentOptions(cwd=str(tmp_path)))
+    ScriptedClient.scripts = [
+        [_result(0.25, {"m": {"inputTokens": 100, "outputTokens": 10, "contextWindow": 200000}})],
+        [_result(0.75, {"m": {"inputTokens": 160, "outputTokens": 25, "contextWindow": 200000}})],
+    ]
+
+    async def scenario():
+        first = (await _collect(session, "planner"))[-1]
+        second = (await _collect(session, "worker"))[-1]
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.total_cost_usd == 0.25
+    assert second.total_cost_usd == 0.5
+    assert second.model_usage["m"] == {"inputTokens": 60, "outputTokens": 15, "contextWindow": 200000}
+
+
+def test_phase_over_its_turn_cap_is_interrupted_once(tmp_path):
+    session = AgentSession(ClaudeAgentOptions(cwd=str(tmp_path)))
+    ScriptedClient.scripts = [[_assistant(), _assistant(), _assistant(), _assistant(), _result(is_error=True)]]
+
+    messages = asyncio.run(_collect(session, "worker", max_turns=2))
+
+    assert len(messages) == 5
+    assert ScriptedClient.instances[0].interrupts == 1
+    assert not session.has_context(["worker"])
+
+
+def test_reset_clears_the_conversation(tmp_path):
+    session = AgentSession(ClaudeAgentOptions(cwd=str(tmp_path)))
+    ScriptedClient.scripts = [[_result()], [_result()]]
+
+    async def scenario():
+        await _collect(session, "planner")
+        await session.reset()
+        await session.close()
+
+    asyncio.run(scenario())
+
+    assert ScriptedClient.instances[0].prompts == ["go", "/clear"]
+    assert session.completed_phases == set()
+    assert not session.connected
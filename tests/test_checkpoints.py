@@ -0,0 +1,74 @@
+"""Resuming tasks from phase checkpoints."""
+
+import asyncio
+
+import pytest
+
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.storage.checkpoints import CheckpointStore
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project root with a source tree; workspaces live under ``workspace/``."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("VALUE = 1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def executor(project, db_path):
+    return ClaudeCodeExecutor(workspace_root=str(project / "workspace"), checkpoint_store=CheckpointStore(db_path))
+
+
+def test_store_roundtrip_and_partial_clear(db_path):
+    store = CheckpointStore(db_path)
+    store.save(1, "planner", {"result": ["plan"]})
+    store.save(1, "worker", {"result": ["old"]})
+    store.save(1, "worker", {"result": ["new"]})
+
+    assert store.load(1) == {"planner": {"result": ["plan"]}, "worker": {"result": ["new"]}}
+    assert store.clear(1, ["worker"]) == 1
+    assert store.get_phases([1]) == {1: ["planner"]}
+
+
+def test_checkpointed_phase_is_not_rerun(executor):
+    runs = []
+
+    async def run_planner():
+        runs.append("planner")
+        return "the plan", {"files"}, {"planner_turns": 2}
+
+    async def scenario():
+        first = await executor._run_checkpointed_phase(1, "planner", {}, run_planner)
+        checkpoints = await executor._load_checkpoints(1)
+        resumed = await executor._run_checkpointed_phase(1, "planner", checkpoints, run_planner)
+        return first, resumed
+
+    first, resumed = asyncio.run(scenario())
+
+    assert runs == ["planner"]
+    assert first[0] == resumed[0] == "the plan"
+    # Sets come back as sorted lists
+    assert resumed[1] == ["files"]
+
+
+def test_refine_resume_keeps_worker_edits(executor, project):
+    workspace = executor.create_task_workspace(5, "tune app", task_type="refine")
+    (workspace / "src" / "app.py").write_text("VALUE = 2\n")
+    executor.checkpoint_store.save(5, "planner", {"result": ["plan"]})
+    executor.checkpoint_store.save(5, "worker", {"result": ["done"]})
+
+    assert executor.create_task_workspace(5, "tune app", task_type="refine") == workspace
+    assert (workspace / "src" / "app.py").read_text() == "VALUE = 2\n"
+    assert sorted(executor.checkpoint_store.load(5)) == ["planner", "worker"]
+
+
+def test_recreated_refine_workspace_reruns_worker(executor, project):
+    executor.checkpoint_store.save(6, "planner", {"result": ["plan"]})
+    executor.checkpoint_store.save(6, "worker", {"result": ["done"]})
+
+    workspace = executor.create_task_workspace(6, "tune app", task_type="refine")
+
+    assert (workspace / "src" / "app.py").read_text() == "VALUE = 1\n"
+    assert list(executor.checkpoint_store.load(6)) == ["planner"]
@@ -0,0 +1,141 @@
+"""Warm pool of CLI sessions, with the SDK client replaced by a fake, and its release by phases."""
+
+import asyncio
+
+import pytest
+from claude_agent_sdk import AssistantMessage, ClaudeAgentOptions, TextBlock
+
+from sleepless_agent.core import agent_session
+from sleepless_agent.core.client_pool import ClaudeClientPool
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+
+
+class FakeClient:
+    """Stands in for ``ClaudeSDKClient``; ``/clear`` fails when ``broken``."""
+
+    instances = []
+
+    def __init__(self, options):
+        self.options = options
+        self.connected = False
+        self.broken = False
+        FakeClient.instances.append(self)
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def query(self, prompt):
+        if self.broken:
+            raise RuntimeError("CLI exited")
+
+    async def receive_response(self):
+        return
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    FakeClient.instances = []
+    monkeypatch.setattr(agent_session, "ClaudeSDKClient", FakeClient)
+
+
+def _options(cwd):
+    return ClaudeAgentOptions(cwd=str(cwd), model="m")
+
+
+def test_released_session_is_reused_warm(tmp_path):
+    async def scenario():
+        pool = ClaudeClientPool({"enabled": True, "size": 1})
+        session, warm = await pool.checkout(_options(tmp_path), task_id=1)
+        await pool.release(session)
+        again, warm_again = await pool.checkout(_options(tmp_path), task_id=2)
+        await pool.release(again)
+        await pool.close()
+        return warm, warm_again, again is session, pool.get_stats()
+
+    warm, warm_again, reused, stats = asyncio.run(scenario())
+
+    assert (warm, warm_again, reused) == (False, True, True)
+    assert stats["cold"] == 1 and stats["warm"] == 1
+    assert all(not client.connected for client in FakeClient.instances)
+
+
+def test_unhealthy_and_worn_out_sessions_are_retired(tmp_path):
+    async def scenario():
+        pool = ClaudeClientPool({"enabled": True, "size": 2, "max_uses": 1})
+        broken, _ = await pool.checkout(_options(tmp_path))
+        broken._client.broken = True
+        await pool.release(broken)
+        await asyncio.sleep(0)
+
+        worn, _ = await pool.checkout(_options(tmp_path / "other"))
+        worn.uses = 1
+        await pool.release(worn)
+        stats = pool.get_stats()
+        await pool.close()
+        return broken, worn, stats
+
+    broken, worn, stats = asyncio.run(scenario())
+
+    assert not broken.connected and not worn.connected
+    assert stats["unhealthy"] == 1
+    assert stats["recycled"] == 1
+
+
+def test_disabled_pool_keeps_nothing(tmp_path):
+    async def scenario():
+        pool = ClaudeClientPool({"enabled": False})
+        session, _ = await pool.checkout(_options(tmp_path))
+        await pool.release(session)
+        return session, pool.get_stats()
+
+    session, stats = asyncio.run(scenario())
+
+    assert not session.connected
+    assert stats["idle"] == 0
+
+
+class RecordingPool:
+    """Hands out one scripted session and records how it came back."""
+
+    active = True
+
+    def __init__(self):
+        self.released = []
+
+    async def checkout(self, options, task_id=None):
+        return self, False
+
+    def run(self, phase, prompt, max_turns):
+        async def stream():
+            yield AssistantMessage(content=[TextBlock(text="step one")], model="m")
+            yield AssistantMessage(content=[TextBlock(text="step two")], model="m")
+
+        return stream()
+
+    def has_context(self, needs):
+        return False
+
+    async def release(self, session, healthy=True):
+        self.released.append(healthy)
+
+
+def test_client_is_released_when_the_phase_loop_raises(tmp_path):
+    pool = RecordingPool()
+    executor = ClaudeCodeExecutor(workspace_root=str(tmp_path / "workspace"), client_pool=pool)
+
+    def live_update(task_id, answer="", **kwargs):
+        if answer:
+            raise RuntimeError("status write failed")
+
+    executor._live_update = live_update
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await executor._execute_planner_phase(1, tmp_path, "plan it", "")
+        return list(pool.released)
+
+    assert asyncio.run(scenario()) == [False]
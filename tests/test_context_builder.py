@@ -0,0 +1,83 @@
+"""Token-budgeted planner context built from the workspace."""
+
+from sleepless_agent.core.context_builder import WorkspaceContextBuilder, estimate_tokens
+
+
+def _readme(entries):
+    lines = ["# Project", "", "## Status", "In progress", "", "## Outstanding Items", "- finish docs", ""]
+    for stamp in entries:
+        lines += [f"### Execution {stamp}", "Long notes " * 40, ""]
+    return "\n".join(lines)
+
+
+def test_small_readme_is_included_verbatim(tmp_path):
+    (tmp_path / "README.md").write_text("# Project\n\nShort description\n")
+    (tmp_path / "main.py").write_text("print()\n")
+
+    context = WorkspaceContextBuilder().build(tmp_path)
+
+    assert "## Project README\n# Project\n\nShort description" in context
+    assert "## Workspace Contents (2 files)" in context
+    assert "- main.py" in context
+
+
+def test_empty_workspace(tmp_path):
+    assert WorkspaceContextBuilder().build(tmp_path / "missing") == "Empty workspace"
+
+
+def test_oversized_readme_keeps_pinned_sections_and_newest_entries(tmp_path):
+    stamps = [f"2026-01-{day:02d} 10:00" for day in range(1, 21)]
+    (tmp_path / "README.md").write_text(_readme(stamps))
+    builder = WorkspaceContextBuilder(token_budget=1200)
+
+    context = builder.build(tmp_path)
+
+    assert "## Status\nIn progress" in context
+    assert "- finish docs" in context
+    assert f"### Execution {stamps[-1]}" in context
+    assert f"### Execution {stamps[0]}" not in context
+    assert "older README section(s) omitted" in context
+    assert estimate_tokens(context) <= 1200
+    assert builder.get_stats()["sections_dropped"] > 0
+
+
+def test_placeholder_sections_are_skipped(tmp_path):
+    readme = _readme([f"2026-01-{day:02d} 10:00" for day in range(1, 21)])
+    (tmp_path / "README.md").write_text(readme + "\n## Plan\n(generated by planner agent)\n")
+
+    context = WorkspaceContextBuilder(token_budget=1200).build(tmp_path)
+
+    assert "older README section(s) omitted" in context
+    assert "(generated by planner agent)" not in context
+
+
+def test_large_tree_is_summarized_by_directory(tmp_path):
+    for package in range(30):
+        for module in range(10):
+            path = tmp_path / "src" / f"pkg{package:02d}" / f"mod{module}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+    context = WorkspaceContextBuilder(token_budget=800).build(tmp_path)
+
+    assert "## Workspace Contents (300 files)" in context
+    assert "- src/ (300 files)" in context
+    assert "more entries" in context
+    assert "mod9.py" not in context
+
+
+def test_context_is_cached_until_a_file_changes(tmp_path):
+    (tmp_path / "README.md").write_text("# Project\n")
+    builder = WorkspaceContextBuilder()
+
+    first = builder.build(tmp_path)
+    assert builder.build(tmp_path) == first
+    (tmp_path / "new.py").write_text("x = 1\n")
+    updated = builder.build(tmp_path)
+
+    assert "- new.py" in updated
+    stats = builder.get_stats()
+    assert (stats["hits"], stats["misses"], stats["cached_workspaces"]) == (1, 2, 1)
+
+    builder.invalidate(tmp_path)
+    assert builder.get_stats()["cached_workspaces"] == 0
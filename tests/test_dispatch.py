@@ -0,0 +1,93 @@
+"""Dispatcher wake-ups: direct notifications, threads and other processes."""
+
+import asyncio
+import threading
+
+from sleepless_agent.core.dispatch import DispatchNotifier
+from sleepless_agent.core.queue import TaskQueue
+
+
+def test_wait_returns_the_collected_reasons():
+    async def scenario():
+        notifier = DispatchNotifier()
+        notifier.notify("before_start")
+        notifier.start()
+        first = await notifier.wait(timeout=5)
+
+        notifier.notify("task_added")
+        notifier.notify("task_finished")
+        notifier.notify("task_added")
+        second = await notifier.wait(timeout=5)
+
+        third = await notifier.wait(timeout=0.01)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == ("before_start", "task_added,task_finished", "timer")
+
+
+def test_notify_from_another_thread_wakes_the_loop():
+    async def scenario():
+        notifier = DispatchNotifier()
+        notifier.start()
+        loop = asyncio.get_running_loop()
+        thread = threading.Thread(target=notifier.notify, args=("slack",))
+        loop.call_later(0.01, thread.start)
+        started = loop.time()
+        reason = await notifier.wait(timeout=5)
+        thread.join()
+        return reason, loop.time() - started
+
+    reason, waited = asyncio.run(scenario())
+
+    assert reason == "slack"
+    assert waited < 1
+
+
+def test_insert_from_another_connection_is_detected(db_path):
+    async def scenario():
+        notifier = DispatchNotifier(db_path, poll_interval_seconds=0.05)
+        notifier.start()
+        await asyncio.sleep(0.1)
+
+        TaskQueue(db_path).add_task("queued by the CLI")
+        reason = await notifier.wait(timeout=5)
+        await notifier.stop()
+        return reason
+
+    assert asyncio.run(scenario()) == "db_change"
+
+
+def test_status_updates_do_not_wake_the_dispatcher(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("already queued")
+
+    async def scenario():
+        notifier = DispatchNotifier(db_path, poll_interval_seconds=0.05)
+        notifier.start()
+        await asyncio.sleep(0.1)
+
+        queue.mark_in_progress(task.id)
+        reason = await notifier.wait(timeout=0.3)
+        await notifier.stop()
+        return reason
+
+    assert asyncio.run(scenario()) == "timer"
+
+
+def test_task_put_back_to_pending_wakes_the_dispatcher(db_path):
+    queue = TaskQueue(db_path)
+    lapsed = queue.add_task("claimed by a daemon that died")
+    queue.add_task("newer task still waiting")
+    assert queue.claim_task(lapsed.id, "other-host:1", lease_seconds=0)
+
+    async def scenario():
+        notifier = DispatchNotifier(db_path, poll_interval_seconds=0.05)
+        notifier.start()
+        await asyncio.sleep(0.1)
+
+        queue.reclaim_expired_leases()
+        reason = await notifier.wait(timeout=5)
+        await notifier.stop()
+        return reason
+
+    assert asyncio.run(scenario()) == "db_change"
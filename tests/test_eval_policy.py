@@ -0,0 +1,69 @@
+"""Evaluation policy decisions and local checks."""
+
+import pytest
+
+from sleepless_agent.core.eval_policy import FULL, LOCAL, SAMPLED, EvaluationPolicy
+from sleepless_agent.storage.phase_usage import PhaseUsageStore
+
+
+@pytest.fixture
+def store(db_path):
+    return PhaseUsageStore(db_path)
+
+
+def _record_evaluations(store, outcomes):
+    for task_id, outcome in enumerate(outcomes, start=1):
+        store.record(
+            task_id=task_id, phase="evaluator", task_type="new", priority="thought", project_id=None,
+            turns=2, max_turns=5, duration_ms=1000, cost_usd=0.02, outcome=outcome,
+        )
+
+
+def _decide(policy, files=("app.py",), priority="thought", exit_code=0):
+    return policy.decide(
+        task_type="new", priority=priority, project_id=None, files_modified=files, worker_exit_code=exit_code
+    )
+
+
+def test_full_evaluation_without_history(store):
+    policy = EvaluationPolicy(store)
+
+    assert _decide(policy).mode == FULL
+    assert _decide(policy, exit_code=1).reason == "worker_failed"
+    assert _decide(policy, priority="serious").mode == FULL
+    assert _decide(policy, files=()).mode == LOCAL
+
+
+def test_reliable_task_class_is_checked_locally_or_sampled(store):
+    _record_evaluations(store, ["COMPLETE"] * 10)
+
+    local = _decide(EvaluationPolicy(store, {"sample_rate": 0.0}))
+    audited = _decide(EvaluationPolicy(store, {"sample_rate": 1.0}))
+
+    assert (local.mode, local.reason) == (LOCAL, "high_complete_rate")
+    assert local.mean_cost_usd == pytest.approx(0.02)
+    assert audited.mode == SAMPLED
+
+
+def test_unreliable_task_class_gets_full_evaluation(store):
+    _record_evaluations(store, ["COMPLETE"] * 8 + ["PARTIAL"] * 2)
+
+    decision = _decide(EvaluationPolicy(store, {"sample_rate": 0.0}))
+
+    assert decision.mode == FULL
+    assert decision.complete_rate == pytest.approx(0.8)
+
+
+def test_local_checks_report_broken_files(store, tmp_path):
+    (tmp_path / "good.py").write_text("x = 1\n")
+    (tmp_path / "bad.py").write_text("def broken(:\n")
+    (tmp_path / "data.json").write_text("{}")
+
+    result = EvaluationPolicy(store).run_local_checks(
+        tmp_path, ["good.py", "bad.py", "data.json", "gone.txt"], "done"
+    )
+
+    assert not result.passed
+    assert any(problem.startswith("bad.py: SyntaxError") for problem in result.problems)
+    assert "gone.txt: reported as modified but missing" in result.problems
+    assert sorted(result.checked) == ["bad.py", "data.json", "good.py"]
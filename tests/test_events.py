@@ -0,0 +1,197 @@
+"""EventBus delivery, retries, dead events, workspace settling and the outbox."""
+
+import asyncio
+from types import SimpleNamespace
+
+from sleepless_agent.core.events import TASK_FINISHED, EventBus, TaskEvent
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.core.task_runtime import TaskRuntime
+from sleepless_agent.storage.outbox import EventOutbox
+
+
+def _event(task_id: int = 1) -> TaskEvent:
+    return TaskEvent(TASK_FINISHED, SimpleNamespace(id=task_id))
+
+
+def test_failing_handler_is_retried_until_it_succeeds():
+    attempts = []
+
+    async def flaky(event):
+        attempts.append(event.task_id)
+        if len(attempts) < 3:
+            raise RuntimeError("try again")
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe(TASK_FINISHED, "flaky", flaky, retries=3, backoff_seconds=0)
+        bus.start()
+        bus.publish(_event())
+        await bus.stop(timeout=5)
+        return bus.get_stats()["consumers"]["flaky"]
+
+    stats = asyncio.run(scenario())
+
+    assert attempts == [1, 1, 1]
+    assert stats["delivered"] == 1
+    assert stats["retried"] == 2
+    assert stats["failed"] == 0
+
+
+def test_event_is_dead_after_last_attempt():
+    attempts = []
+    dead = []
+
+    async def broken(event):
+        attempts.append(event.task_id)
+        raise RuntimeError("always")
+
+    async def on_dead(event):
+        dead.append(event.task_id)
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe(TASK_FINISHED, "broken", broken, retries=2, backoff_seconds=0, on_dead=on_dead)
+        bus.start()
+        bus.publish(_event(7))
+        await bus.stop(timeout=5)
+        return bus.get_stats()
+
+    stats = asyncio.run(scenario())
+
+    assert attempts == [7, 7]
+    assert dead == [7]
+    assert stats["consumers"]["broken"]["failed"] == 1
+    assert stats["dead_letters"][0]["task_id"] == 7
+
+
+def test_non_idempotent_handler_runs_once():
+    attempts = []
+
+    async def append_report(event):
+        attempts.append(event.task_id)
+        raise RuntimeError("disk full")
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe(TASK_FINISHED, "reports", append_report, retries=1, backoff_seconds=0)
+        bus.start()
+        bus.publish(_event())
+        await bus.stop(timeout=5)
+
+    asyncio.run(scenario())
+
+    assert attempts == [1]
+
+
+def test_workspace_settles_after_holding_consumer_finishes():
+    settled = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def commit(event):
+            await release.wait()
+
+        bus = EventBus()
+        bus.subscribe(TASK_FINISHED, "git", commit, holds_workspace=True)
+        bus.add_settled_listener(lambda: settled.append(True))
+        bus.start()
+        bus.publish(_event(3))
+        await asyncio.sleep(0)
+        held = [task.id for task in bus.settling_tasks()]
+        release.set()
+        await bus.stop(timeout=5)
+        return held, bus.settling_tasks()
+
+    held, remaining = asyncio.run(scenario())
+
+    assert held == [3]
+    assert remaining == []
+    assert settled == [True]
+
+
+def test_undelivered_event_stays_in_the_outbox(db_path):
+    handled = []
+
+    async def slow_commit(event):
+        await asyncio.sleep(60)
+
+    async def usage(event):
+        handled.append(event.task_id)
+
+    async def scenario():
+        bus = EventBus(outbox=EventOutbox(db_path), worker_id="a:1")
+        bus.subscribe(TASK_FINISHED, "git", slow_commit)
+        bus.subscribe(TASK_FINISHED, "usage", usage, retries=1)
+        bus.start()
+        await bus.publish_durable(_event(4))
+        await bus.stop(timeout=0.2)
+
+    asyncio.run(scenario())
+
+    assert handled == [4]
+    pending = EventOutbox(db_path).claim_orphans("a:1")
+    assert [(event.task_id, event.consumers) for event in pending] == [(4, ["git"])]
+
+
+def test_discarded_event_is_not_replayed(db_path):
+    async def scenario():
+        bus = EventBus(outbox=EventOutbox(db_path), worker_id="a:1")
+        bus.subscribe(TASK_FINISHED, "git", lambda event: asyncio.sleep(0))
+        event = _event(5)
+        await bus.record(event)
+        await bus.discard(event)
+
+    asyncio.run(scenario())
+
+    assert EventOutbox(db_path).pending_count() == 0
+
+
+def test_orphans_of_live_workers_are_left_alone(db_path):
+    outbox = EventOutbox(db_path)
+    outbox.add("e1", TASK_FINISHED, 1, ["git", "usage"], {"status": "completed"}, worker_id="gone:1")
+    outbox.add("e2", TASK_FINISHED, 2, ["git"], {"status": "failed"}, worker_id="elsewhere:2")
+
+    claimed = outbox.claim_orphans("me:3", dead_worker=lambda owner: owner == "gone:1")
+
+    assert [(event.event_id, event.consumers) for event in claimed] == [("e1", ["git", "usage"])]
+    assert claimed[0].payload == {"status": "completed"}
+    assert outbox.claim_orphans("me:3") == claimed
+
+
+class RecordingBus(EventBus):
+    def __init__(self, outbox):
+        super().__init__(outbox=outbox)
+        self.published = []
+
+    def publish(self, event, consumers=None):
+        self.published.append((event, consumers))
+
+
+def test_runtime_replays_only_events_of_finished_tasks(db_path, tmp_path):
+    queue = TaskQueue(db_path)
+    done = queue.add_task("finished before the crash")
+    queue.claim_task(done.id, "old:1", lease_seconds=60)
+    queue.mark_completed(done.id, worker_id="old:1")
+    requeued = queue.add_task("crashed before its outcome was saved")
+
+    outbox = EventOutbox(db_path)
+    payload = {"status": "completed", "workspace": str(tmp_path), "result_id": 1}
+    outbox.add("done", TASK_FINISHED, done.id, ["git", "usage"], payload, worker_id="old:1")
+    outbox.add("lost", TASK_FINISHED, requeued.id, ["git"], payload, worker_id="old:1")
+
+    bus = RecordingBus(outbox)
+    runtime = TaskRuntime(
+        config=None, task_queue=queue, scheduler=None, claude=None, results=None, git=None,
+        monitor=None, perf_logger=None, report_generator=None, bot=None, live_status_tracker=None,
+        worker_id="new:2", event_bus=bus,
+    )
+
+    replayed = asyncio.run(runtime.replay_pending_events(dead_worker=lambda owner: owner == "old:1"))
+
+    assert replayed == 1
+    event, consumers = bus.published[0]
+    assert (event.event_id, event.task_id, event.durable) == ("done", done.id, True)
+    assert event.payload["workspace"] == tmp_path
+    assert consumers == ["git", "usage"]
+    assert outbox.pending_count() == 2
@@ -0,0 +1,48 @@
+"""Heartbeat-based timeouts of running tasks."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sleepless_agent.core.leases import heartbeat_inactivity_cutoff
+from sleepless_agent.core.models import TaskStatus
+from sleepless_agent.core.queue import TaskQueue
+
+
+def _config(**agent):
+    return SimpleNamespace(agent=SimpleNamespace(**agent))
+
+
+def test_timed_out_task_is_released(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("hangs")
+    queue.claim_task(task.id, "a:1", lease_seconds=60)
+    queue.record_heartbeats({task.id: datetime.utcnow() - timedelta(hours=1)}, "a:1")
+
+    timed_out = queue.timeout_expired_tasks(max_age_seconds=0, inactivity_seconds=60)
+
+    assert [expired.id for expired in timed_out] == [task.id]
+    assert queue.renew_leases([task.id], "a:1", lease_seconds=60) == []
+    assert queue.get_task(task.id).status == TaskStatus.FAILED
+
+
+def test_recent_heartbeat_keeps_an_old_task_alive(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("slow but busy")
+    queue.claim_task(task.id, "a:1", lease_seconds=60)
+    queue.record_heartbeats({task.id: datetime.utcnow()}, "a:1")
+
+    assert queue.timeout_expired_tasks(max_age_seconds=0, inactivity_seconds=60) == []
+    assert queue.get_task(task.id).status == TaskStatus.IN_PROGRESS
+
+
+def test_heartbeat_of_another_worker_is_ignored(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("owned by a")
+    queue.claim_task(task.id, "a:1", lease_seconds=60)
+
+    assert queue.record_heartbeats({task.id: datetime.utcnow()}, "b:2") == 0
+
+
+def test_inactivity_cutoff_adds_one_lease_of_grace():
+    assert heartbeat_inactivity_cutoff(_config(task_inactivity_timeout_seconds=300, lease_seconds=90)) == 390
+    assert heartbeat_inactivity_cutoff(_config(task_inactivity_timeout_seconds=0)) == 0
@@ -0,0 +1,122 @@
+"""Named thread pools and the async facade over synchronous components."""
+
+import asyncio
+import contextvars
+import threading
+from types import SimpleNamespace
+
+from sleepless_agent.core.events import EventBus, TaskEvent
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.io_pools import BlockingIOPools
+from sleepless_agent.storage.checkpoints import CheckpointStore
+from sleepless_agent.storage.outbox import EventOutbox
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class Store:
+    name = "store"
+
+    def __init__(self):
+        self.threads = []
+
+    def save(self, value, suffix=""):
+        self.threads.append(threading.current_thread().name)
+        return f"{value}{suffix}"
+
+
+def test_calls_run_on_the_named_pool_with_context():
+    pools = BlockingIOPools()
+
+    async def scenario():
+        request_id.set("r-1")
+        thread = await pools.run("git", lambda: threading.current_thread().name)
+        seen = await pools.run("db", request_id.get)
+        return thread, seen
+
+    try:
+        thread, seen = asyncio.run(scenario())
+        stats = pools.get_stats()
+    finally:
+        pools.shutdown(wait=True)
+
+    assert thread.startswith("io-git")
+    assert seen == "r-1"
+    assert stats["git"] == {"size": 1, "pending": 0, "completed": 1}
+    assert set(stats) == {"git", "db"}
+
+
+def test_single_thread_pool_serializes_calls():
+    pools = BlockingIOPools()
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def step():
+        with lock:
+            active.append(1)
+            overlaps.append(len(active))
+        threading.Event().wait(0.01)
+        with lock:
+            active.pop()
+
+    async def scenario():
+        await asyncio.gather(*(pools.run("git", step) for _ in range(4)))
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pools.shutdown(wait=True)
+
+    assert max(overlaps) == 1
+
+
+def test_invalid_size_override_keeps_the_default():
+    pools = BlockingIOPools({"db": "many", "git": 0, "custom": 3})
+
+    assert pools.sizes["db"] == BlockingIOPools.DEFAULT_SIZES["db"]
+    assert pools.sizes["git"] == 1
+    assert pools.sizes["custom"] == 3
+
+
+def test_facade_runs_methods_off_the_loop():
+    pools = BlockingIOPools()
+    store = Store()
+    facade = pools.facade(store, "results")
+
+    async def scenario():
+        return await facade.save("a", suffix="!")
+
+    try:
+        result = asyncio.run(scenario())
+    finally:
+        pools.shutdown(wait=True)
+
+    assert result == "a!"
+    assert store.threads[0].startswith("io-results")
+    assert facade.name == "store"
+
+
+def test_executor_and_event_bus_use_the_shared_pools(tmp_path, db_path):
+    pools = BlockingIOPools()
+    executor = ClaudeCodeExecutor(
+        workspace_root=str(tmp_path / "workspace"), checkpoint_store=CheckpointStore(db_path), io_pools=pools
+    )
+    bus = EventBus(outbox=EventOutbox(db_path), io_pools=pools)
+
+    async def noop(event):
+        pass
+
+    bus.subscribe("task.finished", "noop", noop)
+
+    async def scenario():
+        await executor._load_checkpoints(1)
+        await bus.record(TaskEvent(kind="task.finished", task=SimpleNamespace(id=1)))
+
+    try:
+        asyncio.run(scenario())
+        stats = pools.get_stats()
+    finally:
+        pools.shutdown(wait=True)
+
+    assert stats["db"]["completed"] == 2
@@ -0,0 +1,117 @@
+"""Task leases: claiming, expiry, requeue after restart, the finish guard and the shared git lock."""
+
+import fcntl
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+from sleepless_agent.core.leases import default_worker_id, is_dead_local_worker
+from sleepless_agent.core.models import TaskStatus
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.storage.git import GitManager
+
+
+def _exited_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_claim_is_exclusive(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("write docs")
+
+    assert queue.claim_task(task.id, "a:1", lease_seconds=60) is not None
+    assert queue.claim_task(task.id, "b:2", lease_seconds=60) is None
+    assert queue.get_task(task.id).worker_id == "a:1"
+
+
+def test_expired_lease_is_reclaimed(db_path):
+    queue = TaskQueue(db_path)
+    live = queue.add_task("live")
+    stale = queue.add_task("stale")
+    queue.claim_task(live.id, "a:1", lease_seconds=60)
+    queue.claim_task(stale.id, "b:2", lease_seconds=-1)
+
+    reclaimed = queue.reclaim_expired_leases()
+
+    assert [task.id for task in reclaimed] == [stale.id]
+    stale = queue.get_task(stale.id)
+    assert stale.status == TaskStatus.PENDING
+    assert stale.worker_id is None
+    assert queue.get_task(live.id).status == TaskStatus.IN_PROGRESS
+
+
+def test_renew_leases_reports_lost_tasks(db_path):
+    queue = TaskQueue(db_path)
+    kept = queue.add_task("kept")
+    lost = queue.add_task("lost")
+    queue.claim_task(kept.id, "a:1", lease_seconds=60)
+    queue.claim_task(lost.id, "a:1", lease_seconds=-1)
+    queue.reclaim_expired_leases()
+    queue.claim_task(lost.id, "b:2", lease_seconds=60)
+
+    assert queue.renew_leases([kept.id, lost.id], "a:1", lease_seconds=60) == [kept.id]
+
+
+def test_requeue_leaves_live_leases_alone(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("elsewhere")
+    queue.claim_task(task.id, "other-host:1", lease_seconds=60)
+
+    assert queue.requeue_interrupted_tasks("me:2") == []
+    assert queue.get_task(task.id).status == TaskStatus.IN_PROGRESS
+
+
+def test_requeue_reclaims_tasks_of_dead_local_worker(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("interrupted")
+    previous_run = f"{socket.gethostname()}:{_exited_pid()}"
+    queue.claim_task(task.id, previous_run, lease_seconds=600)
+
+    requeued = queue.requeue_interrupted_tasks(default_worker_id(), dead_worker=is_dead_local_worker)
+
+    assert [requeued_task.id for requeued_task in requeued] == [task.id]
+    assert queue.get_task(task.id).status == TaskStatus.PENDING
+
+
+def test_is_dead_local_worker():
+    host = socket.gethostname()
+    assert is_dead_local_worker(f"{host}:{_exited_pid()}")
+    assert not is_dead_local_worker(f"{host}:{os.getpid()}")
+    assert not is_dead_local_worker(f"{host}:{os.getppid()}")
+    assert not is_dead_local_worker("some-other-host:1")
+    assert not is_dead_local_worker("custom-worker-name")
+
+
+def test_finish_requires_lease(db_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("contested")
+    queue.claim_task(task.id, "a:1", lease_seconds=-1)
+    queue.reclaim_expired_leases()
+    queue.claim_task(task.id, "b:2", lease_seconds=60)
+
+    assert queue.mark_completed(task.id, worker_id="a:1") is None
+    assert queue.mark_failed(task.id, "late", worker_id="a:1") is None
+    assert queue.get_task(task.id).status == TaskStatus.IN_PROGRESS
+
+    assert queue.mark_completed(task.id, worker_id="b:2").status == TaskStatus.COMPLETED
+
+
+def test_git_operations_wait_for_another_daemons_lock(tmp_path):
+    git = GitManager(str(tmp_path / "workspace"))
+    assert git.init_repo()
+    done = threading.Event()
+
+    with open(git.repo_path / ".git" / GitManager.LOCK_NAME, "a") as other_daemon:
+        fcntl.flock(other_daemon, fcntl.LOCK_EX)
+        worker = threading.Thread(target=lambda: (git.ensure_branch("project-a"), done.set()))
+        worker.start()
+        assert not done.wait(0.3)
+        fcntl.flock(other_daemon, fcntl.LOCK_UN)
+
+    worker.join(10)
+    assert done.is_set()
+    assert git._branch_exists("project-a")
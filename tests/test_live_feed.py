@@ -0,0 +1,106 @@
+"""Streaming live status changes to local subscribers."""
+
+import asyncio
+import json
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from sleepless_agent.utils.live_feed import SOCKET_NAME, LiveStatusFeed, watch_live_status
+from sleepless_agent.utils.live_status import LiveStatusHub
+
+
+@pytest.fixture
+def socket_dir():
+    # tmp_path can exceed the Unix socket path limit
+    with tempfile.TemporaryDirectory(prefix="feed-") as path:
+        yield Path(path)
+
+
+async def _subscribe(path, request):
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    return reader, writer
+
+
+async def _next(reader):
+    return json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+
+
+def test_subscriber_gets_snapshot_then_its_tasks_changes(socket_dir):
+    hub = LiveStatusHub(socket_dir / "live_status.json", flush_interval=60)
+    hub.update({"task_id": 1, "phase": "planner"})
+    hub.update({"task_id": 2, "phase": "worker"})
+    feed = LiveStatusFeed(hub, socket_dir / SOCKET_NAME)
+
+    async def scenario():
+        assert await feed.start()
+        reader, writer = await _subscribe(feed.socket_path, {"task_id": 1})
+        snapshot = await _next(reader)
+
+        hub.update({"task_id": 2, "phase": "evaluator"})
+        worker = threading.Thread(target=hub.update, args=({"task_id": 1, "phase": "worker"},))
+        worker.start()
+        worker.join()
+        update = await _next(reader)
+        hub.clear(1)
+        cleared = await _next(reader)
+
+        writer.close()
+        await feed.stop()
+        return snapshot, update, cleared
+
+    snapshot, update, cleared = asyncio.run(scenario())
+
+    assert snapshot["type"] == "snapshot"
+    assert [entry["task_id"] for entry in snapshot["entries"]] == [1]
+    assert update["entry"]["task_id"] == 1
+    assert update["entry"]["phase"] == "worker"
+    assert cleared == {"type": "clear", "task_id": 1}
+    assert not feed.socket_path.exists()
+
+
+def test_slow_subscriber_loses_oldest_events(socket_dir):
+    hub = LiveStatusHub(socket_dir / "live_status.json", flush_interval=60)
+    feed = LiveStatusFeed(hub, socket_dir / SOCKET_NAME, max_backlog=2)
+
+    async def scenario():
+        await feed.start()
+        reader, writer = await _subscribe(feed.socket_path, {})
+        await _next(reader)
+        # Nothing yields to the handler between these, so the queue overflows
+        for step in range(5):
+            hub.update({"task_id": 1, "phase": "worker", "answer_preview": str(step)})
+        received = [await _next(reader), await _next(reader)]
+        writer.close()
+        await feed.stop()
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert [event["entry"]["answer_preview"] for event in received] == ["3", "4"]
+    assert feed.get_stats()["dropped"] == 3
+
+
+def test_stale_socket_is_replaced(socket_dir):
+    path = socket_dir / SOCKET_NAME
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    feed = LiveStatusFeed(LiveStatusHub(socket_dir / "live_status.json"), path)
+
+    async def scenario():
+        started = await feed.start()
+        await feed.stop()
+        return started
+
+    assert asyncio.run(scenario())
+
+
+def test_watch_without_daemon_raises(socket_dir):
+    with pytest.raises(ConnectionError):
+        next(watch_live_status(socket_dir / SOCKET_NAME))
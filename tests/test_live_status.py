@@ -0,0 +1,93 @@
+"""In-memory live status with debounced writes to the shared JSON file."""
+
+import json
+
+from sleepless_agent.utils.live_status import LiveStatusHub, LiveStatusTracker, remove_worker_status_files
+
+
+def _on_disk(path):
+    return json.loads(path.read_text())
+
+
+def test_transitions_are_written_immediately_and_progress_is_coalesced(tmp_path):
+    path = tmp_path / "live_status.json"
+    hub = LiveStatusHub(path, flush_interval=60)
+
+    hub.update({"task_id": 1, "phase": "planner", "answer_preview": "a"})
+    for text in ("ab", "abc", "abcd"):
+        hub.update({"task_id": 1, "phase": "planner", "answer_preview": text})
+
+    assert _on_disk(path)["1"]["answer_preview"] == "a"
+    assert hub.entries()[0].answer_preview == "abcd"
+
+    hub.update({"task_id": 1, "phase": "worker", "answer_preview": ""})
+    assert _on_disk(path)["1"]["phase"] == "worker"
+
+    hub.update({"task_id": 1, "phase": "worker", "answer_preview": "done"})
+    hub.close()
+    assert _on_disk(path)["1"]["answer_preview"] == "done"
+
+    stats = hub.get_stats()
+    assert stats["updates"] == 6
+    assert stats["writes"] == 3
+    assert stats["coalesced"] == 3
+
+
+def test_file_stays_readable_by_the_plain_tracker(tmp_path):
+    path = tmp_path / "live_status.json"
+    hub = LiveStatusHub(path, flush_interval=0)
+    hub.update({"task_id": 4, "description": "x" * 500, "phase": "evaluator"})
+
+    entries = LiveStatusTracker(path).entries()
+
+    assert [entry.task_id for entry in entries] == [4]
+    assert entries[0].phase == "evaluator"
+    assert len(entries[0].description) == 240
+
+
+def test_clear_is_written_and_reported_to_listeners(tmp_path):
+    path = tmp_path / "live_status.json"
+    hub = LiveStatusHub(path, flush_interval=60)
+    events = []
+    hub.add_listener(events.append)
+
+    hub.update({"task_id": 1, "phase": "worker"})
+    hub.update({"task_id": 2, "phase": "worker"})
+    hub.clear(1)
+    hub.clear(99)
+
+    assert set(_on_disk(path)) == {"2"}
+    assert [event["type"] for event in events] == ["update", "update", "clear"]
+
+    hub.remove_listener(events.append)
+    hub.clear_all()
+    assert not path.exists()
+    assert hub.entries() == []
+    assert len(events) == 3
+
+
+def test_hub_starts_from_the_existing_file(tmp_path):
+    path = tmp_path / "live_status.json"
+    LiveStatusTracker(path).update({"task_id": 7, "phase": "worker"})
+
+    hub = LiveStatusHub(path)
+
+    assert [entry.task_id for entry in hub.entries()] == [7]
+
+
+def test_daemons_sharing_a_directory_keep_their_own_entries(tmp_path):
+    path = tmp_path / "live_status.json"
+    first = LiveStatusHub(path, flush_interval=0, worker_id="host:1")
+    first.clear_all()
+    first.update({"task_id": 1, "phase": "worker"})
+    second = LiveStatusHub(path, flush_interval=0, worker_id="host:2")
+    second.clear_all()
+    second.update({"task_id": 2, "phase": "planner"})
+    first.update({"task_id": 1, "phase": "evaluator"})
+
+    assert [entry.task_id for entry in first.entries()] == [1]
+    merged = {entry.task_id: entry.phase for entry in LiveStatusTracker(path).entries()}
+    assert merged == {1: "evaluator", 2: "planner"}
+
+    assert remove_worker_status_files(path, lambda worker_id: worker_id == "host:2") == 1
+    assert [entry.task_id for entry in LiveStatusTracker(path).entries()] == [1]
@@ -0,0 +1,61 @@
+"""Event-loop lag sampling and slow-callback reports."""
+
+import asyncio
+import time
+
+from sleepless_agent.monitoring.loop_monitor import EventLoopMonitor
+
+
+def _block_the_loop(seconds):
+    time.sleep(seconds)
+
+
+def test_blocking_call_is_measured_and_reported():
+    monitor = EventLoopMonitor(sample_interval_seconds=0.02, slow_callback_seconds=0.05)
+
+    async def scenario():
+        monitor.start()
+        await asyncio.sleep(0.1)
+        _block_the_loop(0.3)
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    asyncio.run(scenario())
+    snapshot = monitor.snapshot()
+
+    assert snapshot["samples"] > 1
+    assert snapshot["lag_max_ms"] >= 200
+    assert snapshot["slow_callbacks"] >= 1
+    assert "in _block_the_loop" in snapshot["last_slow_callback"]["culprit"]
+
+
+def test_idle_loop_is_ok():
+    monitor = EventLoopMonitor(sample_interval_seconds=0.01, slow_callback_seconds=0.5)
+
+    async def scenario():
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    asyncio.run(scenario())
+    snapshot = monitor.snapshot()
+
+    assert snapshot["status"] == "ok"
+    assert snapshot["slow_callbacks"] == 0
+    assert sum(snapshot["histogram"].values()) == snapshot["samples"]
+
+
+def test_histogram_buckets_and_percentiles():
+    monitor = EventLoopMonitor()
+    for lag_ms in (0.5, 3, 3, 40, 20000):
+        monitor._record(lag_ms)
+
+    snapshot = monitor.snapshot()
+
+    assert snapshot["histogram"]["le_1ms"] == 1
+    assert snapshot["histogram"]["le_5ms"] == 2
+    assert snapshot["histogram"]["le_50ms"] == 1
+    assert snapshot["histogram"]["gt_10000ms"] == 1
+    assert snapshot["lag_p50_ms"] == 3
+    assert snapshot["lag_max_ms"] == 20000
+    assert snapshot["status"] == "degraded"
@@ -0,0 +1,86 @@
+"""Workspace scanning and the persisted file manifest."""
+
+import os
+
+from sleepless_agent.storage.manifest import ManifestDiff, WorkspaceManifest, scan_workspace
+from sleepless_agent.utils.readme_manager import SIDECAR_NAME
+
+
+def _touch(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_scan_prunes_excluded_directories_and_files(tmp_path):
+    _touch(tmp_path / "src" / "app.py")
+    _touch(tmp_path / "node_modules" / "lib" / "index.js")
+    _touch(tmp_path / ".git" / "HEAD")
+    _touch(tmp_path / SIDECAR_NAME, "{}")
+    _touch(tmp_path / "README.md")
+
+    assert sorted(scan_workspace(tmp_path)) == ["README.md", "src/app.py"]
+
+
+def test_refresh_reports_added_modified_and_deleted(tmp_path):
+    workspace = tmp_path / "ws"
+    _touch(workspace / "keep.py")
+    _touch(workspace / "edit.py", "v1")
+    _touch(workspace / "gone.py")
+    manifest = WorkspaceManifest(workspace)
+
+    first = manifest.refresh()
+    assert first.added == {"keep.py", "edit.py", "gone.py"}
+
+    _touch(workspace / "edit.py", "version 2")
+    _touch(workspace / "new.py")
+    (workspace / "gone.py").unlink()
+    diff = manifest.refresh()
+
+    assert diff.added == {"new.py"}
+    assert diff.modified == {"edit.py"}
+    assert diff.deleted == {"gone.py"}
+    assert not manifest.refresh()
+
+
+def test_touch_without_content_change_is_not_reported_when_hashing(tmp_path):
+    _touch(tmp_path / "same.txt", "content")
+    manifest = WorkspaceManifest(tmp_path, hash_max_bytes=1024)
+    manifest.refresh()
+
+    stat = (tmp_path / "same.txt").stat()
+    os.utime(tmp_path / "same.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert manifest.refresh().modified == set()
+
+
+def test_manifest_persists_across_instances(tmp_path):
+    workspace = tmp_path / "ws"
+    store = tmp_path / "manifests"
+    _touch(workspace / "a.py")
+    WorkspaceManifest(workspace, store).refresh()
+
+    _touch(workspace / "b.py")
+    diff = WorkspaceManifest(workspace, store).refresh()
+
+    assert diff.added == {"b.py"}
+
+
+def test_apply_drops_deleted_paths_reported_through_a_symlink(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+    diff = ManifestDiff(added={"new.py"}, deleted={"old.py"})
+
+    merged = diff.apply([str(link / "old.py"), str(link / "kept.py"), "old.py"], link)
+
+    assert merged == {"new.py", "kept.py"}
+
+
+def test_apply_counts_a_reported_file_once(tmp_path):
+    diff = ManifestDiff(added={"new.py"}, modified={"a.py", "b.py"})
+    outside = tmp_path.parent / "elsewhere.py"
+
+    merged = diff.apply([str(tmp_path / "a.py"), "b.py", str(outside)], tmp_path)
+
+    assert merged == {"new.py", "a.py", "b.py", outside.as_posix()}
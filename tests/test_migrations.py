@@ -0,0 +1,62 @@
+"""Schema upgrades of databases created by earlier versions."""
+
+import sqlite3
+
+from sleepless_agent.core.models import init_db
+from sleepless_agent.storage.phase_usage import PhaseUsageStore
+from sleepless_agent.storage.token_usage import ModelTokens, TokenUsageStore
+
+PHASE_USAGE_V1 = """
+CREATE TABLE phase_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    phase VARCHAR(20) NOT NULL,
+    task_type VARCHAR(20),
+    priority VARCHAR(20),
+    project_id VARCHAR(255),
+    turns INTEGER,
+    max_turns INTEGER,
+    duration_ms INTEGER,
+    cost_usd TEXT,
+    success BOOLEAN NOT NULL,
+    outcome VARCHAR(20),
+    created_at DATETIME NOT NULL
+)
+"""
+
+
+def _old_database(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute(PHASE_USAGE_V1)
+        conn.execute(
+            "INSERT INTO phase_usage (task_id, phase, success, created_at) VALUES (1, 'worker', 1, '2026-01-01 00:00:00')"
+        )
+
+
+def _columns(path, table):
+    with sqlite3.connect(path) as conn:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _prompt_tokens(path):
+    with sqlite3.connect(path) as conn:
+        return [row[0] for row in conn.execute("SELECT prompt_tokens FROM phase_usage ORDER BY id")]
+
+
+def test_token_columns_and_table_are_added(tmp_path):
+    path = str(tmp_path / "tasks.db")
+    _old_database(path)
+
+    init_db(path).dispose()
+
+    columns = _columns(path, "phase_usage")
+    for name in ("prompt_tokens", "cache_read_tokens", "cache_creation_tokens"):
+        assert name in columns
+    assert _prompt_tokens(path) == [None]
+
+    PhaseUsageStore(path).record(
+        task_id=2, phase="worker", task_type=None, priority=None, project_id=None,
+        turns=3, max_turns=10, duration_ms=100, cost_usd=0.01, prompt_tokens=900,
+    )
+    TokenUsageStore(path).record(task_id=2, phase="worker", project_id=None, tokens=[ModelTokens("m", 10, 5)])
+    assert _prompt_tokens(path) == [None, 900]
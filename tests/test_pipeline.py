@@ -0,0 +1,130 @@
+"""Planning queued tasks ahead of time, and using or discarding those plans."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.pipeline import PlanPrefetcher
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.storage.checkpoints import CheckpointStore
+from sleepless_agent.storage.fingerprint import workspace_fingerprint
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.planned = []
+        self.prefetch_stats = {"used": 0, "discarded": 0}
+
+    def is_prefetching(self, task_id):
+        return False
+
+    async def prefetch_plan(self, task_id, **kwargs):
+        self.planned.append(task_id)
+        return {"planner_cost_usd": 0.25, "planner_turns": 3, "planner_output_tokens": 400}
+
+
+class FakeScheduler:
+    def __init__(self, paused=False):
+        self.paused = paused
+        self.usage = []
+
+    def get_pause_remaining_seconds(self):
+        return 60.0 if self.paused else None
+
+    def get_workspace_identifier(self, task):
+        return f"project:{task.project_id}" if task.project_id else f"task:{task.id}"
+
+    def record_task_usage(self, task_id, **kwargs):
+        self.usage.append((task_id, kwargs))
+
+
+def _prefetcher(db_path, executor, scheduler=None, busy=(), lookahead=4):
+    return PlanPrefetcher(
+        executor=executor,
+        task_queue=TaskQueue(db_path),
+        scheduler=scheduler or FakeScheduler(),
+        checkpoint_store=CheckpointStore(db_path),
+        busy_tasks=lambda: list(busy),
+        lookahead=lookahead,
+    )
+
+
+async def _run_pass(prefetcher, phase="worker"):
+    prefetcher.on_phase_start(1, phase)
+    if prefetcher._runner is not None:
+        await prefetcher._runner
+
+
+def test_worker_phase_prefetches_queued_tasks(db_path):
+    queue = TaskQueue(db_path)
+    running = queue.add_task("running", project_id="shared")
+    same_project = queue.add_task("next in the same project", project_id="shared")
+    other = queue.add_task("unrelated")
+    already = queue.add_task("planned earlier")
+    CheckpointStore(db_path).save(already.id, "planner", {"result": ["plan", {}]})
+    executor = FakeExecutor()
+    prefetcher = _prefetcher(db_path, executor, busy=[running])
+
+    asyncio.run(_run_pass(prefetcher, phase="planner"))
+    assert executor.planned == []
+
+    asyncio.run(_run_pass(prefetcher))
+
+    assert executor.planned == [other.id]
+    stats = prefetcher.get_stats()
+    assert stats["skipped_same_workspace"] == 2  # the running task and its project sibling
+    assert stats["skipped_already_planned"] == 1
+    assert same_project.id not in executor.planned
+
+
+def test_prefetched_planner_usage_is_recorded_when_the_plan_is_made(db_path):
+    task = TaskQueue(db_path).add_task("plan me", project_id="docs")
+    scheduler = FakeScheduler()
+    prefetcher = _prefetcher(db_path, FakeExecutor(), scheduler=scheduler)
+
+    asyncio.run(_run_pass(prefetcher))
+
+    [(task_id, usage)] = scheduler.usage
+    assert task_id == task.id
+    assert usage["total_cost_usd"] == 0.25
+    assert usage["num_turns"] == 3
+    assert usage["project_id"] == "docs"
+    assert usage["tokens"]["output_tokens"] == 400
+
+
+def test_paused_scheduler_prefetches_nothing(db_path):
+    TaskQueue(db_path).add_task("waiting")
+    executor = FakeExecutor()
+    prefetcher = _prefetcher(db_path, executor, scheduler=FakeScheduler(paused=True))
+
+    asyncio.run(_run_pass(prefetcher))
+
+    assert executor.planned == []
+
+
+def test_prefetched_plan_is_used_until_the_workspace_changes(tmp_path, db_path):
+    executor = ClaudeCodeExecutor(workspace_root=str(tmp_path / "workspace"), checkpoint_store=CheckpointStore(db_path))
+    workspace = executor.create_task_workspace(9, "add docs")
+    (workspace / "notes.md").write_text("draft\n")
+
+    def checkpoints(created_at):
+        meta = {
+            "fingerprint": workspace_fingerprint(workspace),
+            "workspace": str(workspace),
+            "created_at": created_at.isoformat(),
+        }
+        return {"planner": {"result": ["plan", {}], "prefetch": meta}}
+
+    now = datetime.utcnow()
+    fresh = asyncio.run(executor._validate_prefetched_plan(9, workspace, checkpoints(now), 3600))
+    expired = asyncio.run(
+        executor._validate_prefetched_plan(9, workspace, checkpoints(now - timedelta(hours=2)), 3600)
+    )
+    stale = checkpoints(now)
+    (workspace / "notes.md").write_text("edited by the previous task\n")
+    changed = asyncio.run(executor._validate_prefetched_plan(9, workspace, stale, 3600))
+
+    assert "planner" in fresh
+    assert "planner" not in expired
+    assert "planner" not in changed
+    assert executor.prefetch_stats == {"used": 1, "discarded": 2}
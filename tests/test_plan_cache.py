@@ -0,0 +1,43 @@
+"""Planner output cache."""
+
+from sleepless_agent.storage.plan_cache import PlanCache, normalize_description
+
+
+def test_normalize_description():
+    assert normalize_description("**[REFINE:#12]** Fix the   Parser! (see #3)") == "fix the parser see"
+
+
+def test_fresh_near_and_miss(db_path):
+    cache = PlanCache(db_path)
+    cache.store("Add a CLI flag for verbose output", "fp1", "new", "1. add flag", {"planner_cost_usd": 0.5})
+
+    fresh = cache.lookup("add a CLI flag for verbose output.", "fp1", "new")
+    assert fresh.fresh and fresh.plan_text == "1. add flag"
+
+    near = cache.lookup("Add a CLI flag for verbose outputs", "fp1", "new")
+    assert near is not None and not near.fresh and near.similarity < 1.0
+
+    assert cache.lookup("Rewrite the scheduler", "fp1", "new") is None
+    assert cache.lookup("Add a CLI flag for verbose output", "fp1", "refine") is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["saved_cost_usd"] == 0.5
+
+
+def test_expired_entry_is_only_a_near_hit(db_path):
+    cache = PlanCache(db_path, max_age_seconds=-1)
+    cache.store("Add logging", "fp1", "new", "plan")
+
+    hit = cache.lookup("Add logging", "fp1", "new")
+
+    assert hit is not None and not hit.fresh
+
+
+def test_least_recently_used_entries_are_pruned(db_path):
+    cache = PlanCache(db_path, max_entries=2)
+    for name in ("one", "two", "three"):
+        cache.store(f"task {name}", name, "new", f"plan {name}")
+
+    assert cache.lookup("task one", "one", "new") is None
+    assert cache.lookup("task three", "three", "new").fresh
@@ -0,0 +1,56 @@
+"""Phase prompts: a stable prefix followed by per-task text."""
+
+import os
+
+from sleepless_agent.core import prompts
+from sleepless_agent.core.verdict import VERDICT_INSTRUCTIONS
+
+
+def _shared_prefix(first, second):
+    return os.path.commonprefix([first, second])
+
+
+def test_prompts_for_different_tasks_share_the_whole_prefix():
+    planners = [
+        prompts.planner_prompt("add a CLI flag", "## Workspace Contents (1 files)", "refine"),
+        prompts.planner_prompt("write docs", "Empty workspace", "new", prior_plan="1. outline"),
+    ]
+    workers = [prompts.worker_prompt("add a CLI flag", "1. edit cli.py"), prompts.worker_prompt("write docs", "1. x")]
+    evaluators = [
+        prompts.evaluator_prompt("add a CLI flag", "1. edit cli.py", "done", 1, 2),
+        prompts.evaluator_prompt("write docs", "1. x", "wrote README", 3, 0),
+    ]
+
+    assert _shared_prefix(*planners).startswith(prompts.PLANNER_PREFIX)
+    assert _shared_prefix(*workers).startswith(prompts.WORKER_PREFIX)
+    assert _shared_prefix(*evaluators).startswith(prompts.EVALUATOR_PREFIX)
+    assert VERDICT_INSTRUCTIONS in prompts.EVALUATOR_PREFIX
+
+
+def test_variable_parts_follow_the_prefix_from_least_to_most_variable():
+    planner = prompts.planner_prompt("TASK", "CONTEXT", "refine", prior_plan="PRIOR")
+    evaluator = prompts.evaluator_prompt("TASK", "PLAN", "OUTPUT", 4, 5)
+
+    order = [planner.index(marker) for marker in ("REFINE TASK", "TASK\n", "CONTEXT", "PRIOR")]
+    assert order == sorted(order)
+    order = [evaluator.index(marker) for marker in ("TASK", "PLAN", "OUTPUT", "Files Modified: 4")]
+    assert order == sorted(order)
+    assert evaluator.index("Commands Executed: 5") > evaluator.index("OUTPUT")
+
+
+def test_optional_planner_sections_are_left_out():
+    planner = prompts.planner_prompt("TASK", "CONTEXT", workspace_task_type="unknown")
+
+    assert "## Prior Plan" not in planner
+    assert not any(note in planner for note in prompts.TASK_TYPE_NOTES.values())
+
+
+def test_session_prompts_omit_what_the_session_already_holds():
+    worker = prompts.worker_session_prompt()
+    evaluator = prompts.evaluator_session_prompt(2, 7)
+
+    assert prompts.WORKER_INSTRUCTIONS in worker
+    assert "## Plan to Execute" not in worker
+    assert prompts.EVALUATOR_INSTRUCTIONS in evaluator
+    assert "## Worker Output" not in evaluator
+    assert "Files Modified: 2" in evaluator and "Commands Executed: 7" in evaluator
@@ -0,0 +1,82 @@
+"""In-memory README documents and their sidecar summary."""
+
+import json
+import os
+
+from sleepless_agent.utils.readme_manager import (
+    SIDECAR_NAME,
+    ReadmeDocument,
+    parse_sections,
+    read_readme_summary,
+)
+
+TEMPLATE = """# Task 1
+
+## Status: IN_PROGRESS
+
+## Plan
+_pending_
+
+## Outstanding Items
+- write tests
+
+## Recommendations
+
+## Execution History
+"""
+
+
+def test_unmodified_document_renders_byte_for_byte():
+    text = "intro\n\n# Title\n```\n# not a heading\n```\n## Section\nbody\n"
+    sections = parse_sections(text)
+
+    assert [section.title for section in sections if section.level] == ["Title", "Section"]
+    assert "".join(section.render() for section in sections) == text
+
+
+def test_edits_are_saved_with_sidecar(tmp_path):
+    (tmp_path / "README.md").write_text(TEMPLATE)
+    document = ReadmeDocument.load(tmp_path)
+
+    assert not document.save()
+    document.set_status("COMPLETE")
+    document.replace_body("Plan", "1. do it", only_if="_pending_")
+    document.add_entry("Execution History", "Execution 2026-01-01", "- Status: COMPLETE\n- Files Modified: 2")
+    assert document.save()
+
+    text = (tmp_path / "README.md").read_text()
+    assert "## Status: COMPLETE" in text
+    assert "## Plan\n1. do it\n" in text
+    summary = json.loads((tmp_path / SIDECAR_NAME).read_text())
+    assert summary["status"] == "COMPLETE"
+    assert summary["outstanding_items"] == ["write tests"]
+    assert summary["executions"][0]["files_modified"] == "2"
+
+
+def test_concurrent_disk_edits_are_kept(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.write_text(TEMPLATE)
+    document = ReadmeDocument.load(tmp_path)
+    document.set_status("PARTIAL")
+
+    readme.write_text(TEMPLATE.replace("- write tests", "- write tests\n- fix lint"))
+    stat = readme.stat()
+    os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    document.save()
+
+    text = readme.read_text()
+    assert "## Status: PARTIAL" in text
+    assert "- fix lint" in text
+
+
+def test_summary_falls_back_to_parsing_stale_sidecar(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.write_text(TEMPLATE)
+    document = ReadmeDocument.load(tmp_path)
+    document.set_status("COMPLETE")
+    document.save()
+
+    readme.write_text(TEMPLATE.replace("IN_PROGRESS", "FAILED"))
+
+    assert read_readme_summary(tmp_path)["status"] == "FAILED"
+    assert read_readme_summary(tmp_path / "missing") is None
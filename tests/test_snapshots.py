@@ -0,0 +1,67 @@
+"""Snapshot store link modes and copy-on-write unsharing."""
+
+import os
+
+import pytest
+
+from sleepless_agent.storage.snapshots import SnapshotStore
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "project"
+    (root / "src" / "__pycache__").mkdir(parents=True)
+    (root / "src" / "app.py").write_text("VALUE = 1\n")
+    (root / "src" / "__pycache__" / "app.cpython-311.pyc").write_bytes(b"\0")
+    (root / "README.md").write_text("# Project\n")
+    return root
+
+
+def _materialize(store, source, dest):
+    return store.materialize(source, ["src/", "README.md", "missing.txt"], dest, ["__pycache__"])
+
+
+def test_hardlinked_files_are_unshared_before_writes(tmp_path, source):
+    store = SnapshotStore(tmp_path / "store", link_mode="hardlink")
+    first, second = tmp_path / "ws1", tmp_path / "ws2"
+    _materialize(store, source, first)
+    stats = _materialize(store, source, second)
+
+    assert stats.files == 2
+    assert stats.hardlinked == 2
+    assert not (second / "src" / "__pycache__").exists()
+    target = first / "src" / "app.py"
+    assert os.stat(target).st_nlink > 1
+
+    assert store.break_link(target)
+    target.write_text("VALUE = 2\n")
+
+    assert os.stat(target).st_nlink == 1
+    assert (second / "src" / "app.py").read_text() == "VALUE = 1\n"
+    assert not store.break_link(target)
+
+
+def test_break_links_under_unshares_whole_workspace(tmp_path, source):
+    store = SnapshotStore(tmp_path / "store", link_mode="hardlink")
+    workspace = tmp_path / "ws"
+    _materialize(store, source, workspace)
+
+    assert store.break_links_under(workspace) == 2
+    assert all(os.stat(path).st_nlink == 1 for path in workspace.rglob("*") if path.is_file())
+
+
+@pytest.mark.parametrize("link_mode", ["auto", "copy"])
+def test_non_hardlink_modes_never_share_inodes(tmp_path, source, link_mode):
+    store = SnapshotStore(tmp_path / "store", link_mode=link_mode)
+    workspace = tmp_path / "ws"
+    stats = _materialize(store, source, workspace)
+
+    assert stats.hardlinked == 0
+    assert stats.reflinked + stats.copied == 2
+    assert os.stat(workspace / "src" / "app.py").st_nlink == 1
+    assert store.get_stats()["link_mode"] != "hardlink"
+
+
+def test_unknown_link_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotStore(tmp_path / "store", link_mode="symlink")
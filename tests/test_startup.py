@@ -0,0 +1,89 @@
+"""Dependency-ordered parallel startup."""
+
+import json
+import threading
+
+import pytest
+
+from sleepless_agent.core.startup import StartupGraph
+
+
+def test_steps_run_after_their_dependencies_and_in_parallel():
+    order = []
+    both_running = threading.Barrier(2, timeout=5)
+
+    def step(name, wait_for_sibling=False):
+        def run():
+            if wait_for_sibling:
+                both_running.wait()
+            order.append(name)
+        return run
+
+    graph = StartupGraph(max_workers=4)
+    graph.add("config", step("config"))
+    graph.add("db", step("db", wait_for_sibling=True), depends_on=["config"])
+    graph.add("git", step("git", wait_for_sibling=True), depends_on=["config"])
+    graph.add("runtime", step("runtime"), depends_on=["db", "git"])
+    graph.defer("claude_cli")
+    graph.run()
+
+    assert order[0] == "config"
+    assert set(order[1:3]) == {"db", "git"}
+    assert order[3] == "runtime"
+
+    timings = graph.timings()
+    assert [item["name"] for item in timings["steps"]][0] == "config"
+    assert timings["deferred"] == ["claude_cli"]
+    assert graph.critical_path()[0] == "config"
+    assert graph.critical_path()[-1] == "runtime"
+
+
+def test_failing_step_aborts_startup():
+    started = []
+
+    def broken():
+        raise RuntimeError("no database")
+
+    graph = StartupGraph()
+    graph.add("db", broken)
+    graph.add("runtime", lambda: started.append("runtime"), depends_on=["db"])
+
+    with pytest.raises(RuntimeError, match="no database"):
+        graph.run()
+    assert started == []
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        {"a": ["missing"]},
+        {"a": ["b"], "b": ["a"]},
+    ],
+)
+def test_invalid_graphs_are_rejected(steps):
+    graph = StartupGraph()
+    for name, deps in steps.items():
+        graph.add(name, lambda: None, depends_on=deps)
+
+    with pytest.raises(ValueError):
+        graph.run()
+
+
+def test_duplicate_step_is_rejected():
+    graph = StartupGraph()
+    graph.add("db", lambda: None)
+
+    with pytest.raises(ValueError):
+        graph.add("db", lambda: None)
+
+
+def test_write_report(tmp_path):
+    graph = StartupGraph()
+    graph.add("db", lambda: None)
+    graph.run()
+
+    report = graph.write_report(tmp_path / "startup.json", extra={"worker_id": "a:1"})
+
+    assert json.loads((tmp_path / "startup.json").read_text()) == report
+    assert report["worker_id"] == "a:1"
+    assert report["total_ms"] >= report["steps"][0]["duration_ms"]
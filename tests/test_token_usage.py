@@ -0,0 +1,49 @@
+"""Per-model token accounting."""
+
+import pytest
+
+from sleepless_agent.storage.token_usage import ModelTokens, TokenUsageStore, model_tokens
+
+
+def test_model_usage_is_preferred_over_aggregate():
+    tokens = model_tokens(
+        {"input_tokens": 1},
+        {"opus": {"inputTokens": 10, "outputTokens": 5, "cacheReadInputTokens": 100, "costUSD": 0.5}},
+        "sonnet",
+    )
+
+    assert tokens == [ModelTokens("opus", 10, 5, 100, 0, 0.5)]
+    assert tokens[0].prompt_tokens == 110
+
+
+def test_aggregate_usage_is_attributed_to_default_model():
+    tokens = model_tokens({"input_tokens": 3, "cache_creation_input_tokens": 7}, None, "sonnet")
+
+    assert tokens == [ModelTokens("sonnet", 3, 0, 0, 7)]
+    assert model_tokens(None, None, "sonnet") == []
+
+
+def test_aggregate_by_phase_and_model(db_path):
+    store = TokenUsageStore(db_path)
+    store.record(task_id=1, phase="planner", project_id="p", tokens=[ModelTokens("a", 10, 1, 0, 0, 0.1)])
+    store.record(
+        task_id=1,
+        phase="worker",
+        project_id="p",
+        tokens=[ModelTokens("a", 20, 2, 500, 0, 0.2), ModelTokens("b", 5, 1, 0, 0, None)],
+    )
+    store.record(task_id=2, phase="worker", project_id="q", tokens=[ModelTokens("b", 1, 1, 0, 0, 0.05)])
+
+    by_phase = store.aggregate("phase")
+    assert [row["key"] for row in by_phase] == ["worker", "planner"]
+    assert by_phase[0]["records"] == 3
+    assert by_phase[0]["cache_read_tokens"] == 500
+    assert by_phase[0]["cost_usd"] == pytest.approx(0.25)
+
+    by_model = {row["key"]: row for row in store.aggregate("model", project_id="p")}
+    assert by_model["a"]["input_tokens"] == 30
+    assert by_model["b"]["cost_usd"] is None
+
+    assert len(store.aggregate("day")) == 1
+    with pytest.raises(ValueError):
+        store.aggregate("week")
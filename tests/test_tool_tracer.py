@@ -0,0 +1,65 @@
+"""Tool call timing and histograms."""
+
+from claude_agent_sdk import ToolResultBlock, ToolUseBlock
+
+from sleepless_agent.core import tool_tracer
+from sleepless_agent.core.tool_tracer import ToolCallStats, ToolCallTracer, format_summary, payload_bytes
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_payload_bytes():
+    assert payload_bytes(None) == 0
+    assert payload_bytes("héllo") == 6
+    assert payload_bytes({"a": 1}) == len('{"a": 1}')
+
+
+def test_calls_are_paired_and_bucketed(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(tool_tracer.time, "monotonic", clock)
+    tracer = ToolCallTracer(task_id=1)
+
+    clock.now += 2.0
+    tracer.assistant_message()
+    tracer.start(ToolUseBlock("t1", "Bash", {"command": "pytest -q"}))
+    tracer.start(ToolUseBlock("t2", "Read", {"file_path": "a.py"}))
+    clock.now += 0.05
+    tracer.finish(ToolResultBlock("t2", "contents"))
+    clock.now += 0.95
+    tracer.finish(ToolResultBlock("t1", "1 failed", is_error=True))
+    assert tracer.finish(ToolResultBlock("unknown", "")) is None
+
+    summary = tracer.summary()
+
+    assert summary["calls"] == 2
+    assert summary["model_ms"] == 2000
+    assert summary["tools"]["Bash"]["buckets"]["<=1000ms"] == 1
+    assert summary["tools"]["Bash"]["errors"] == 1
+    assert summary["tools"]["Read"]["buckets"]["<=100ms"] == 1
+    assert summary["slowest"][0]["command"] == "pytest -q"
+    assert "`pytest -q`" in format_summary(summary)
+
+
+def test_stats_merge_task_summaries(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(tool_tracer.time, "monotonic", clock)
+    stats = ToolCallStats()
+    for _ in range(2):
+        tracer = ToolCallTracer()
+        tracer.start(ToolUseBlock("t", "Edit", {}))
+        clock.now += 0.2
+        tracer.finish(ToolResultBlock("t", "ok"))
+        stats.add(tracer.summary())
+
+    merged = stats.get_stats()
+
+    assert merged["tasks"] == 2
+    assert merged["tools"]["Edit"]["calls"] == 2
+    assert merged["tools"]["Edit"]["buckets"]["<=500ms"] == 2
+    assert format_summary({"tools": {}}) == ""
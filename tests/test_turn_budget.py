@@ -0,0 +1,63 @@
+"""Adaptive turn caps and deadlines."""
+
+import pytest
+
+from sleepless_agent.core.turn_budget import TurnBudgetAdvisor, percentile
+from sleepless_agent.storage.phase_usage import PhaseUsageStore
+
+
+def test_percentile():
+    assert percentile([4, 1, 3, 2], 0.5) == pytest.approx(2.5)
+    assert percentile([1, 2, 3], 1.0) == 3
+    assert percentile([5], 0.9) == 5
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+
+@pytest.fixture
+def store(db_path):
+    return PhaseUsageStore(db_path)
+
+
+def _record(store, turns_list, max_turns=30, task_type="new", duration_ms=60000):
+    for task_id, turns in enumerate(turns_list, start=1):
+        store.record(
+            task_id=task_id, phase="worker", task_type=task_type, priority="thought", project_id=None,
+            turns=turns, max_turns=max_turns, duration_ms=duration_ms, cost_usd=None,
+        )
+
+
+def test_default_cap_without_history(store):
+    budget = TurnBudgetAdvisor(store).advise("worker", 30, task_type="new", priority="thought")
+
+    assert (budget.max_turns, budget.source, budget.deadline_seconds) == (30, "default", None)
+
+
+def test_cap_follows_similar_runs(store):
+    _record(store, [4, 5, 6, 6, 7, 8, 8, 8])
+
+    budget = TurnBudgetAdvisor(store, {"percentile": 0.9, "headroom": 1.25}).advise(
+        "worker", 30, task_type="new", priority="thought"
+    )
+
+    assert budget.source == "type+priority"
+    assert budget.max_turns == 10
+    assert budget.deadline_seconds == pytest.approx(120)
+
+
+def test_censored_history_raises_cap(store):
+    _record(store, [10] * 8, max_turns=10)
+
+    budget = TurnBudgetAdvisor(store).advise("worker", 10, task_type="new", priority="thought")
+
+    assert budget.source.endswith(":censored")
+    assert budget.max_turns == 15
+
+
+def test_falls_back_to_less_specific_history(store):
+    _record(store, [5] * 8, task_type="refine")
+
+    budget = TurnBudgetAdvisor(store).advise("worker", 30, task_type="new", priority="thought")
+
+    assert budget.source == "phase"
+    assert budget.samples == 8
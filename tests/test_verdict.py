@@ -0,0 +1,100 @@
+"""Streaming evaluator verdict parsing."""
+
+import pytest
+
+from sleepless_agent.core.executor import ClaudeCodeExecutor
+from sleepless_agent.core.queue import parse_verdict
+from sleepless_agent.core.verdict import Verdict, VerdictParser, strip_verdict_block
+from sleepless_agent.utils.readme_manager import read_readme_summary
+
+
+def _feed(chunks, **kwargs):
+    parser = VerdictParser(**kwargs)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser
+
+
+def test_block_split_across_chunks():
+    text = 'Looks good.\n<verdict>{"status": "partial", "outstanding_items": ["add tests"]}</verdict>\n'
+    parser = _feed([text[i:i + 3] for i in range(0, len(text), 3)])
+
+    assert parser.verdict == Verdict("PARTIAL", ["add tests"], [])
+
+
+def test_fenced_block_and_string_items():
+    parser = _feed(['<verdict>\n```json\n{"status": "COMPLETE", "recommendations": "ship it"}\n```\n</verdict>'])
+
+    assert parser.verdict.status == "COMPLETE"
+    assert parser.verdict.recommendations == ["ship it"]
+
+
+def test_last_valid_block_wins():
+    parser = _feed([
+        '<verdict>{"status": "FAILED"}</verdict>',
+        '<verdict>{"status": "DONE"}</verdict>',
+        "<verdict>not json</verdict>",
+        '<verdict>{"status": "COMPLETE"}</verdict>',
+    ])
+
+    assert parser.verdict.status == "COMPLETE"
+    assert parser.invalid_blocks == 2
+
+
+def test_runaway_block_is_dropped():
+    parser = _feed(["<verdict>", "x" * 50, '{"status": "COMPLETE"}</verdict>'], max_block_chars=20)
+
+    assert parser.verdict is None
+    assert parser.invalid_blocks == 1
+
+
+def test_strip_verdict_block():
+    text = 'Summary\n<verdict>{"status": "COMPLETE"}</verdict>\nThanks'
+
+    assert strip_verdict_block(text) == "Summary\nThanks"
+    assert strip_verdict_block("Summary\n<verdict>{unterminated") == "Summary"
+
+
+def test_parse_stored_verdict():
+    assert parse_verdict('{"status": "COMPLETE"}') == {"status": "COMPLETE"}
+    assert parse_verdict("[1, 2]") is None
+    assert parse_verdict("{broken") is None
+    assert parse_verdict(None) is None
+
+
+BLOCK_OUTPUT = """All good apart from docs.
+<verdict>{"status": "PARTIAL", "outstanding_items": ["write docs"], "recommendations": ["add a CLI test"]}</verdict>
+"""
+
+TEXT_OUTPUT = """Status: PARTIAL
+
+Outstanding items:
+- write docs
+
+Recommendations:
+* add a CLI test
+"""
+
+
+@pytest.mark.parametrize("output", [BLOCK_OUTPUT, TEXT_OUTPUT], ids=["block", "text_fallback"])
+def test_verdict_items_round_trip_through_the_readme(tmp_path, output):
+    executor = ClaudeCodeExecutor(workspace_root=str(tmp_path / "root"))
+    workspace = tmp_path / "task"
+    workspace.mkdir()
+    readme = executor._open_readme(workspace, 1, "add docs", None, None)
+
+    verdict = _feed([output]).verdict
+    if verdict is None:
+        verdict = Verdict(
+            "PARTIAL",
+            executor._extract_outstanding_items(output),
+            executor._extract_recommendations(output),
+            source="text",
+        )
+    executor._update_readme_with_evaluation(readme, verdict.status, verdict.outstanding_items, verdict.recommendations)
+    executor._flush_readme(readme)
+
+    assert "## Outstanding Items\n- write docs\n" in (workspace / "README.md").read_text()
+    summary = read_readme_summary(workspace)
+    assert summary["outstanding_items"] == ["write docs"]
+    assert summary["recommendations"] == ["add a CLI test"]
@@ -0,0 +1,157 @@
+"""Bounded worker pool: slot limits, refills, crashes and cancellation."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sleepless_agent.core.queue import TaskQueue
+from sleepless_agent.core.task_runtime import TaskRuntime
+from sleepless_agent.core.worker_pool import TaskWorkerPool
+from sleepless_agent.monitoring.logging import get_logger
+from sleepless_agent.storage.results import ResultManager
+from sleepless_agent.utils.exceptions import PauseException
+
+
+def _task(task_id: int):
+    return SimpleNamespace(id=task_id, created_at=None)
+
+
+def test_pool_runs_at_most_max_parallel_tasks():
+    running = []
+    peak = []
+    release = {}
+
+    async def execute(task):
+        running.append(task.id)
+        peak.append(len(running))
+        await release[task.id].wait()
+        running.remove(task.id)
+
+    async def scenario():
+        pool = TaskWorkerPool(execute, max_parallel_tasks=2)
+        for task_id in (1, 2, 3):
+            release[task_id] = asyncio.Event()
+
+        assert pool.submit(_task(1))
+        assert pool.submit(_task(2))
+        assert not pool.submit(_task(3))
+        assert not pool.submit(_task(1))
+        await asyncio.sleep(0)
+        assert pool.available_slots == 0
+
+        release[1].set()
+        await pool.wait_for_slot(timeout=5)
+        assert pool.running_tasks()[0].id == 2
+        assert pool.submit(_task(3))
+
+        release[2].set()
+        release[3].set()
+        await pool.shutdown(timeout=5)
+        await asyncio.sleep(0)
+        return pool.get_stats()
+
+    stats = asyncio.run(scenario())
+
+    assert max(peak) == 2
+    assert stats["dispatched"] == 3
+    assert stats["peak_in_flight"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_crashed_task_frees_its_slot_and_calls_on_finished():
+    finished = []
+
+    async def execute(task):
+        raise RuntimeError("bug")
+
+    async def scenario():
+        pool = TaskWorkerPool(execute, max_parallel_tasks=1, on_finished=lambda task: finished.append(task.id))
+        pool.submit(_task(5))
+        await pool.wait_for_slot(timeout=5)
+        return pool
+
+    pool = asyncio.run(scenario())
+
+    assert finished == [5]
+    assert pool.available_slots == 1
+    assert pool.get_stats()["crashed"] == 1
+
+
+def test_task_cancelled_before_it_starts_frees_its_slot():
+    async def execute(task):
+        await asyncio.sleep(60)
+
+    async def scenario():
+        pool = TaskWorkerPool(execute, max_parallel_tasks=1)
+        pool.submit(_task(1))
+        await pool.shutdown(timeout=5)
+        await asyncio.sleep(0)
+        return pool
+
+    pool = asyncio.run(scenario())
+
+    assert pool.in_flight_count == 0
+    assert pool.available_slots == 1
+
+
+def test_cancel_stops_a_single_task():
+    cancelled = []
+
+    async def execute(task):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(task.id)
+            raise
+
+    async def scenario():
+        pool = TaskWorkerPool(execute, max_parallel_tasks=2)
+        pool.submit(_task(1))
+        pool.submit(_task(2))
+        await asyncio.sleep(0)
+
+        assert pool.cancel(1)
+        assert not pool.cancel(99)
+        await pool.wait_for_slot(timeout=5)
+        running = [task.id for task in pool.running_tasks()]
+        await pool.shutdown(timeout=5)
+        return running
+
+    running = asyncio.run(scenario())
+
+    assert running == [2]
+    assert cancelled == [1, 2]
+
+
+def test_usage_pause_halts_dispatch_without_holding_the_slot(db_path, tmp_path):
+    queue = TaskQueue(db_path)
+    task = queue.add_task("hits the usage limit")
+    paused_until = []
+    scheduler = SimpleNamespace(pause_until=lambda reset: paused_until.append(reset) or reset)
+    runtime = TaskRuntime(
+        config=None, task_queue=queue, scheduler=scheduler, claude=SimpleNamespace(clear_checkpoints=lambda _id: None),
+        results=ResultManager(db_path, str(tmp_path / "results")), git=None, monitor=None, perf_logger=None,
+        report_generator=None, bot=None, live_status_tracker=None,
+        worker_id="w:1",
+    )
+    reset_time = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=3)
+
+    async def scenario():
+        await asyncio.wait_for(
+            runtime._handle_pause_exception(
+                task=task,
+                task_log=get_logger("test"),
+                pause=PauseException("limit", reset_time, 99.0),
+                start_time=time.time(),
+                result_output="done",
+                files_modified=[],
+                commands_executed=[],
+                workspace=None,
+            ),
+            timeout=5,
+        )
+
+    asyncio.run(scenario())
+
+    assert paused_until == [reset_time]